@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+JPAPI API Benchmark
+Repeatable throughput benchmarks of list, pagination, detail, export,
+search and bulk-write paths against the local mock Jamf Pro server, or offline against
+cassettes recorded from a previous run
+"""
+
+import argparse
+import asyncio
+import contextlib
+import cProfile
+import json
+import os
+import sys
+import tempfile
+import time
+from argparse import Namespace
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(REPO_ROOT / "src"))
+sys.path.insert(0, str(REPO_ROOT))
+
+from core.auth.auth_session import AuthSession  # noqa: E402
+from core.auth.login_types import AuthCredentials  # noqa: E402
+from core.auth.token_manager import TokenManager  # noqa: E402
+from core.http import (  # noqa: E402
+    AsyncJamfClient,
+    CassettePlayer,
+    CassetteRecorder,
+    ConnectionPool,
+    JamfHttpClient,
+    RetryPolicy,
+    TokenBucketRateLimiter,
+    fetch_all_pages,
+    get_http_client,
+    run_sync,
+    set_http_client,
+)
+from tests.mock_jamf import DEFAULT_COUNTS, MockJamfServer, SyntheticTenant  # noqa: E402
+
+SCENARIOS = [
+    "list",
+    "list-stream",
+    "paginate-serial",
+    "paginate-parallel",
+    "details",
+    "export",
+    "export-profiles",
+    "search",
+    "search-classic",
+    "bulk",
+]
+REPLAY_URL = "https://replay.invalid"
+
+# Criteria for both search scenarios; the name prefix bounds the Classic
+# fallback to about a thousand detail calls on a default-sized tenant
+SEARCH_CRITERIA = {"name": "MAC-000*", "managed": "true"}
+
+
+class BenchmarkAuth:
+    """Auth object that sends jpapi's real request pipeline to the mock server"""
+
+    def __init__(self, url: str, offline: bool = False):
+        credentials = AuthCredentials(url=url, client_id="bench", client_secret="bench")
+        self.url = url
+        self.environment = "benchmark"
+        self.offline = offline
+        self.session = AuthSession(lambda: credentials, lambda c: True, TokenManager())
+
+    def api_request(self, method, endpoint, data=None, content_type="json", retry=None):
+        token = "replay"
+        if not self.offline:
+            token_result = self.session.get_token()
+            if not token_result.success:
+                raise Exception(f"Authentication failed: {token_result.message}")
+            token = token_result.token
+        return get_http_client().api_request(
+            method, f"{self.url}{endpoint}", token, data, content_type, retry=retry
+        )
+
+
+def scenario_list(auth: BenchmarkAuth, args: Namespace) -> int:
+    """One large Classic list response"""
+    return len(auth.api_request("GET", "/JSSResource/computers")["computers"])
+
+
+def scenario_list_stream(auth: BenchmarkAuth, args: Namespace) -> int:
+    """The same Classic list, parsed incrementally as it streams in"""
+    url = f"{auth.url}/JSSResource/computers"
+    token = "replay" if auth.offline else auth.session.get_token().token
+    return sum(1 for _ in get_http_client().iter_list(url, token, ("computers",)))
+
+
+def scenario_paginate_serial(auth: BenchmarkAuth, args: Namespace) -> int:
+    """Jamf Pro API collection, 100 items per page, one page at a time"""
+
+    async def walk() -> int:
+        async with AsyncJamfClient(auth, max_concurrency=1) as client:
+            return len([item async for item in client.iter_items("/api/v1/computers-inventory")])
+
+    return run_sync(walk())
+
+
+def scenario_paginate_parallel(auth: BenchmarkAuth, args: Namespace) -> int:
+    """Jamf Pro API collection via totalCount and concurrent pages"""
+    return len(
+        fetch_all_pages(auth, "/api/v1/computers-inventory", max_concurrency=args.concurrency)
+    )
+
+
+def scenario_details(auth: BenchmarkAuth, args: Namespace) -> int:
+    """Concurrent Classic detail fetches"""
+
+    async def fetch() -> int:
+        async with AsyncJamfClient(auth, max_concurrency=args.concurrency) as client:
+            details = await client.get_many(
+                "/JSSResource/policies/id/{id}", range(1, args.details + 1)
+            )
+            return len(details)
+
+    return run_sync(fetch())
+
+
+def scenario_export(auth: BenchmarkAuth, args: Namespace) -> int:
+    """ExportPolicies data fetch and formatting (per-policy files in a temp dir)"""
+    from cli.commands.export.export_policies import ExportPolicies
+
+    exporter = ExportPolicies(auth)
+    export_args = Namespace(
+        format="csv", filter=None, status="all", detailed=False, output=None
+    )
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir, contextlib.redirect_stdout(None):
+        os.chdir(workdir)
+        try:
+            data = exporter._fetch_data(export_args)
+            # Rows are produced lazily as (id, row) pairs
+            return sum(1 for _ in exporter._format_data(data, export_args))
+        finally:
+            os.chdir(cwd)
+
+
+def scenario_export_profiles(auth: BenchmarkAuth, args: Namespace) -> int:
+    """ExportProfiles fetch, payload analysis and per-profile files (in a temp dir)"""
+    from cli.commands.export.export_profiles import ExportProfiles
+
+    exporter = ExportProfiles(auth, "macos")
+    export_args = Namespace(format="csv", filter=None, env="benchmark", output=None)
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir, contextlib.redirect_stdout(None):
+        os.chdir(workdir)
+        try:
+            data = exporter._fetch_data(export_args)
+            return sum(1 for _ in exporter._format_data(data, export_args))
+        finally:
+            os.chdir(cwd)
+
+
+def scenario_search(auth: BenchmarkAuth, args: Namespace) -> int:
+    """Computer criteria search filtered server-side with RSQL"""
+    from lib.managers.computer_search_manager import ComputerSearchManager
+
+    return len(ComputerSearchManager(auth).search(SEARCH_CRITERIA))
+
+
+def scenario_search_classic(auth: BenchmarkAuth, args: Namespace) -> int:
+    """The same search through the Classic fallback (list, then details)"""
+    from cli.commands.search_command import SearchCommand
+
+    command = SearchCommand()
+    command._auth = auth
+    search_args = Namespace(
+        model=None, os_version=None, department=None, building=None, **SEARCH_CRITERIA
+    )
+    with contextlib.redirect_stdout(None):
+        return len(command._search_computers_classic(search_args) or [])
+
+
+def scenario_bulk(auth: BenchmarkAuth, args: Namespace) -> int:
+    """Concurrent PUTs of Classic policy updates"""
+    xml = "<policy><general><enabled>true</enabled></general></policy>"
+
+    async def update() -> int:
+        async with AsyncJamfClient(auth, max_concurrency=args.concurrency) as client:
+            results = await asyncio.gather(
+                *(
+                    client.request("PUT", f"/JSSResource/policies/id/{policy_id}", xml, "xml")
+                    for policy_id in range(1, args.details + 1)
+                )
+            )
+            return len(results)
+
+    return run_sync(update())
+
+
+RUNNERS: Dict[str, Callable[[BenchmarkAuth, Namespace], int]] = {
+    "list": scenario_list,
+    "list-stream": scenario_list_stream,
+    "paginate-serial": scenario_paginate_serial,
+    "paginate-parallel": scenario_paginate_parallel,
+    "details": scenario_details,
+    "export": scenario_export,
+    "export-profiles": scenario_export_profiles,
+    "search": scenario_search,
+    "search-classic": scenario_search_classic,
+    "bulk": scenario_bulk,
+}
+
+
+def build_client(args: Namespace, scenario: str) -> JamfHttpClient:
+    """HTTP client for the run: no response cache or rate limit unless asked for"""
+    client = JamfHttpClient.from_config()
+    if args.replay:
+        client.pool = CassettePlayer(cassette_path(args.replay, scenario), args.replay_timing)
+    elif args.record:
+        client.pool = CassetteRecorder(ConnectionPool(), cassette_path(args.record, scenario))
+    client.retry_policy = RetryPolicy(max_retries=args.retries, retry_delay=0.05)
+    if not args.cache:
+        client.response_cache = None
+    if args.no_compression:
+        client.accept_encoding = None
+    client.limiter_factory = None
+    if args.rate_limit:
+        client.limiter_factory = lambda: TokenBucketRateLimiter(args.rate_limit)
+    return client
+
+
+def cassette_path(directory: str, scenario: str) -> Path:
+    return Path(directory) / f"{scenario}.jsonl"
+
+
+def run_scenario(name: str, auth: BenchmarkAuth, args: Namespace) -> Dict[str, Any]:
+    """Run one scenario against a fresh client, optionally under cProfile"""
+    client = build_client(args, name)
+    set_http_client(client)
+    profiler = cProfile.Profile() if args.cprofile else None
+
+    started = time.perf_counter()
+    error = None
+    try:
+        if profiler:
+            profiler.enable()
+        items = RUNNERS[name](auth, args)
+    except Exception as e:
+        items = 0
+        error = str(e)
+    finally:
+        if profiler:
+            profiler.disable()
+    elapsed = time.perf_counter() - started
+
+    if profiler:
+        Path(args.cprofile).mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(str(Path(args.cprofile) / f"{name}.prof"))
+    transport = client.pool.get_stats()
+    client.close()
+    set_http_client(None)
+    return {
+        "scenario": name,
+        "seconds": round(elapsed, 3),
+        "items": items,
+        "transport": transport,
+        "error": error,
+    }
+
+
+def run_benchmarks(args: Namespace) -> List[Dict[str, Any]]:
+    """Run each scenario and collect timings"""
+    results = []
+
+    if args.replay:
+        auth = BenchmarkAuth(REPLAY_URL, offline=True)
+        for name in args.scenarios:
+            result = run_scenario(name, auth, args)
+            result["requests"] = result["transport"].get("played", 0)
+            results.append(result)
+        return results
+
+    counts = {kind: getattr(args, kind) for kind in DEFAULT_COUNTS}
+    tenant = SyntheticTenant(counts, seed=args.seed)
+
+    with MockJamfServer(
+        tenant,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        retry_after=0,
+        seed=args.seed,
+    ) as server:
+        auth = BenchmarkAuth(server.url)
+        for name in args.scenarios:
+            server.reset_stats()
+            result = run_scenario(name, auth, args)
+            result["requests"] = sum(
+                count for key, count in server.stats().items() if not key.startswith("POST /api/")
+            )
+            result["server_stats"] = server.stats()
+            results.append(result)
+
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark jpapi against a mock Jamf Pro server")
+    parser.add_argument(
+        "--scenarios",
+        default=",".join(SCENARIOS),
+        help=f"Comma-separated scenarios ({', '.join(SCENARIOS)})",
+    )
+    parser.add_argument("--latency", type=float, default=0.02, help="Server latency in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--details", type=int, default=500, help="Objects for details/bulk")
+    parser.add_argument("--retries", type=int, default=3)
+    parser.add_argument("--rate-limit", type=float, default=0, help="Requests/minute (0: off)")
+    parser.add_argument("--cache", action="store_true", help="Keep the response cache on")
+    parser.add_argument(
+        "--no-compression", action="store_true", help="Do not ask for gzip/deflate bodies"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", help="Write the results to this JSON file")
+    parser.add_argument("--record", help="Record each scenario to DIR/<scenario>.jsonl")
+    parser.add_argument("--replay", help="Replay cassettes from DIR instead of the server")
+    parser.add_argument(
+        "--replay-timing",
+        choices=["none", "original"],
+        default="none",
+        help="Answer replayed requests immediately or after their recorded latency",
+    )
+    parser.add_argument("--cprofile", help="Write a cProfile dump per scenario to DIR")
+    for kind, count in DEFAULT_COUNTS.items():
+        parser.add_argument(f"--{kind.replace('_', '-')}", type=int, default=count)
+    args = parser.parse_args()
+    args.scenarios = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+
+    unknown = [s for s in args.scenarios if s not in RUNNERS]
+    if unknown:
+        print(f"❌ Unknown scenarios: {', '.join(unknown)}")
+        return 1
+
+    if args.replay and args.record:
+        print("❌ --record and --replay cannot be combined")
+        return 1
+
+    if args.replay:
+        print(f"🧪 Replaying {len(args.scenarios)} scenarios from {args.replay}")
+    else:
+        print(f"🧪 Benchmarking {len(args.scenarios)} scenarios (latency {args.latency}s)")
+    results = run_benchmarks(args)
+    for result in results:
+        seconds = result["seconds"]
+        result["requests_per_second"] = (
+            round(result["requests"] / seconds, 1) if seconds else None
+        )
+
+    print(f"\n{'Scenario':<20} {'Seconds':>9} {'Items':>9} {'Requests':>9} {'Req/s':>8}")
+    print("-" * 59)
+    for result in results:
+        if result["error"]:
+            print(f"{result['scenario']:<20} ❌ {result['error']}")
+            continue
+        print(
+            f"{result['scenario']:<20} {result['seconds']:>9} {result['items']:>9} "
+            f"{result['requests']:>9} {result['requests_per_second']:>8}"
+        )
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n📊 Results written to {args.json}")
+
+    return 1 if any(r["error"] for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
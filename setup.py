@@ -64,6 +64,11 @@ setup(
             "dash>=2.14.0",
             "plotly>=5.15.0",
             "dash-bootstrap-components>=1.5.0",
+            "pyarrow>=10.0.0",
+        ],
+        "parquet": [
+            # Typed columnar exports: jpapi export ... --format parquet
+            "pyarrow>=10.0.0",
         ],
         "dev": [
             "pytest>=7.0.0",
@@ -88,6 +93,7 @@ setup(
             "uvicorn[standard]>=0.20.0",
             "pydantic>=2.0.0",
             "sqlalchemy>=2.0.0",
+            "pyarrow>=10.0.0",
         ],
     },
     # Direct entry point (no path hacks needed)
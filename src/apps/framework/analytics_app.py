@@ -233,7 +233,10 @@ class AnalyticsApp(JPAPIApplication):
         async def force_sync_object_type(object_type: str):
             """Force sync for a specific object type"""
             try:
-                self.analytics_engine._sync_object_type(object_type)
+                # Sync makes blocking JAMF API calls; keep the event loop free
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self.analytics_engine._sync_object_type, object_type
+                )
                 return {
                     "status": "sync_initiated",
                     "object_type": object_type,
@@ -256,12 +259,23 @@ class AnalyticsApp(JPAPIApplication):
                 export_commands = ["groups", "devices", "profiles"]
                 results = {}
 
-                for obj_type in export_commands:
-                    try:
-                        self.analytics_engine._sync_object_type(obj_type)
+                # Sync all types concurrently off the event loop
+                loop = asyncio.get_running_loop()
+                outcomes = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(
+                            None, self.analytics_engine._sync_object_type, obj_type
+                        )
+                        for obj_type in export_commands
+                    ),
+                    return_exceptions=True,
+                )
+
+                for obj_type, outcome in zip(export_commands, outcomes):
+                    if isinstance(outcome, Exception):
+                        results[obj_type] = f"error: {str(outcome)}"
+                    else:
                         results[obj_type] = "success"
-                    except Exception as e:
-                        results[obj_type] = f"error: {str(e)}"
 
                 return {
                     "status": "population_initiated",
@@ -385,8 +399,8 @@ class AnalyticsApp(JPAPIApplication):
         async def sync_with_jpapi():
             """Sync analytics with jpapi exports"""
             try:
-                sync_results = (
-                    self.analytics_engine.jpapi_integration.sync_with_jpapi_exports()
+                sync_results = await asyncio.get_running_loop().run_in_executor(
+                    None, self.analytics_engine.jpapi_integration.sync_with_jpapi_exports
                 )
                 return {
                     "status": "success",
@@ -10,6 +10,25 @@ from pathlib import Path
 import pandas as pd
 
 
+def with_parquet_patterns(patterns: List[str]) -> List[str]:
+    """CSV file patterns plus their Parquet (jpapi --format parquet) variants"""
+    parquet = [p[: -len(".csv")] + ".parquet" for p in patterns if p.endswith(".csv")]
+    return patterns + parquet
+
+
+def read_export_file(path: Path) -> pd.DataFrame:
+    """
+    Read a jpapi export file (CSV or Parquet)
+
+    Parquet exports keep their column types: IDs load as integers, dates
+    as datetimes and repeated strings as categoricals. Reading them needs
+    pyarrow.
+    """
+    if Path(path).suffix == ".parquet":
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
 class ObjectTypeManager:
     """Configuration-driven object type manager for maximum scalability"""
 
@@ -129,8 +148,10 @@ class ObjectTypeManager:
     def find_csv_files(
         self, object_type: str, environment: str, csv_dir: Path
     ) -> List[Path]:
-        """Find CSV files for object type using configuration patterns"""
-        patterns = self.get_file_patterns(object_type, environment)
+        """Find CSV and Parquet exports for object type using configuration patterns"""
+        patterns = with_parquet_patterns(
+            self.get_file_patterns(object_type, environment)
+        )
         files = []
 
         for pattern in patterns:
@@ -7,7 +7,10 @@ import streamlit as st
 import pandas as pd
 from typing import Dict, List, Any, Optional
 from pathlib import Path
-from ..config.object_type_manager import ObjectTypeManager
+from ..config.object_type_manager import (
+    ObjectTypeManager,
+    read_export_file,
+)
 
 
 class ScalableDataLoader:
@@ -21,7 +24,7 @@ class ScalableDataLoader:
     def load_data(self, object_type: str, environment: str = "sandbox") -> pd.DataFrame:
         """Load data for any object type using configuration"""
         try:
-            # Find CSV files using configuration patterns
+            # Find CSV and Parquet exports using configuration patterns
             files = self.object_manager.find_csv_files(
                 object_type, environment, self.csv_dir
             )
@@ -36,8 +39,8 @@ class ScalableDataLoader:
             # Get the most recent file
             latest_file = max(files, key=lambda x: x.stat().st_mtime)
 
-            # Load the CSV
-            df = pd.read_csv(latest_file)
+            # Load the export (Parquet keeps its column types)
+            df = read_export_file(latest_file)
 
             # Standardize the dataframe
             df = self.object_manager.standardize_dataframe(df, object_type)
@@ -93,7 +96,7 @@ class ScalableDataLoader:
     def find_latest_file_for_object_type(
         self, object_type: str, environment: str
     ) -> Optional[Path]:
-        """Find the latest CSV file for object type"""
+        """Find the latest CSV or Parquet export for object type"""
         files = self.object_manager.find_csv_files(
             object_type, environment, self.csv_dir
         )
@@ -109,7 +112,7 @@ class ScalableDataLoader:
 
         if latest_file:
             try:
-                df = pd.read_csv(latest_file)
+                df = read_export_file(latest_file)
                 return {
                     "file_name": latest_file.name,
                     "file_size": latest_file.stat().st_size,
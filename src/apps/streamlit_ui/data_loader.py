@@ -58,24 +58,28 @@ class CSVDataLoader(DataLoader):
 
 
 class FileDataLoader(DataLoader):
-    """Concrete implementation for loading from actual CSV files"""
+    """Concrete implementation for loading from actual CSV or Parquet exports"""
 
     def __init__(self, base_path: str = "storage/data/csv-exports"):
         self.base_path = base_path
 
     def load_data(self, object_type: str, environment: str) -> pd.DataFrame:
-        """Load data from CSV files with environment-specific patterns"""
+        """Load data from export files with environment-specific patterns"""
         try:
             # Get file patterns from object type manager
-            from core.config.object_type_manager import ObjectTypeManager
+            from core.config.object_type_manager import (
+                ObjectTypeManager,
+                read_export_file,
+                with_parquet_patterns,
+            )
 
             # Normalize environment name (dev→sandbox, prod→production)
             normalized_env = normalize_environment(environment)
 
             # Get patterns with environment already substituted
             object_manager = ObjectTypeManager()
-            file_patterns = object_manager.get_file_patterns(
-                object_type, normalized_env
+            file_patterns = with_parquet_patterns(
+                object_manager.get_file_patterns(object_type, normalized_env)
             )
 
             # Find matching files
@@ -90,7 +94,7 @@ class FileDataLoader(DataLoader):
 
             # Load the most recent file
             latest_file = max(all_files, key=os.path.getmtime)
-            data = pd.read_csv(latest_file)
+            data = read_export_file(latest_file)
 
             # Add clickable hyperlinks to ID column
             if "ID" in data.columns:
@@ -0,0 +1,531 @@
+#!/usr/bin/env python3
+"""
+CLI application for jpapi
+Modular command-based architecture; started by jpapi_main.main, either
+per invocation or once inside the `jpapi serve` daemon
+"""
+import sys
+import argparse
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# No sys.path hacks - proper package imports with pure src/ layout
+from cli.base import registry
+from core.auth.login_factory import get_best_auth
+from core.http import ApiProfiler, JamfHttpClient, get_http_client
+from lib.exports.manage_exports import generate_export_filename, get_export_directory
+from lib.utils.fan_out import merge_env_rows, parse_envs, run_across_envs
+from resources.config.central_config import central_config
+from cli.commands import (
+    ListCommand,
+    ExportCommand,
+    SearchCommand,
+    ToolsCommand,
+    DevicesCommand,
+    CreateCommand,
+    MoveCommand,
+    InfoCommand,
+    ExperimentalCommand,
+    ScriptsCommand,
+    UpdateCommand,
+    InstallomatorCommand,
+    PPPCCommand,
+    ManifestCommand,
+    CertificateCommand,
+    CrowdStrikeCommand,
+)
+from cli.commands.installomator_add_app_command import InstallomatorAddAppCommand
+from cli.commands.installomator_create_policy_command import (
+    InstallomatorCreatePolicyCommand,
+)
+from cli.commands.installomator_profiles_command import InstallomatorProfilesCommand
+from cli.commands.setup_command import SetupCommand
+from cli.commands.backup_command import BackupCommand
+from cli.commands.advanced_searches_command import AdvancedSearchesCommand
+from cli.commands.extension_attributes_command import ExtensionAttributesCommand
+from cli.commands.mobile_apps_command import MobileAppsCommand
+from cli.commands.packages_command import PackagesCommand
+from cli.commands.delete_command import DeleteCommand
+from cli.commands.profiles_scoped_command import ProfilesScopedCommand
+from cli.commands.safety_command import SafetyCommand
+from cli.commands.roles_command import RolesCommand
+from cli.commands.software_installation_command import SoftwareInstallationCommand
+from cli.commands.serve_command import ServeCommand
+
+# Read-only commands that --envs/--all-envs can run across environments
+FAN_OUT_COMMANDS = ("list", "search", "export", "devices")
+
+# Commands whose output can be saved as a (binary) Parquet file
+PARQUET_COMMANDS = ("list", "export")
+
+
+class JPAPIDevCLI:
+    """Main CLI application with modular command architecture"""
+
+    def __init__(self):
+        self.base_dir = Path(__file__).parent.parent.parent
+        # Built on first run and reused by the daemon for every command
+        self._parser: Optional[argparse.ArgumentParser] = None
+
+        # Register commands
+        self._register_commands()
+
+    def _register_commands(self):
+        """Register all available commands"""
+        # Register list command with aliases (including export)
+        # Note: 'export' alias automatically enables export mode
+        registry.register(ListCommand, aliases=["ls", "show", "export", "exp", "dump"])
+
+        # DEPRECATED: Export command kept for backward compatibility only
+        # Will be removed in future version - use 'list' instead
+        registry.register(ExportCommand, aliases=["export-data", "export-cmd"])
+
+        # Register search command with aliases
+        registry.register(SearchCommand, aliases=["find", "query"])
+
+        # Register tools command with aliases
+        registry.register(ToolsCommand, aliases=["tool", "util", "utils"])
+
+        # Register devices command with aliases
+        registry.register(DevicesCommand, aliases=["device", "dev"])
+
+        # Register create command with aliases
+        registry.register(CreateCommand, aliases=["add", "new"])
+
+        # Register delete command with aliases
+        registry.register(DeleteCommand, aliases=["del", "remove", "rm"])
+
+        # Register move command with aliases
+        registry.register(MoveCommand, aliases=["mv", "transfer"])
+
+        # Register info command with aliases
+        registry.register(InfoCommand, aliases=["help", "about"])
+
+        # Register experimental command with aliases
+        registry.register(ExperimentalCommand, aliases=["exp", "beta"])
+
+        # Register scripts command with aliases
+        registry.register(ScriptsCommand, aliases=["script", "download-scripts"])
+
+        # Register backup command with aliases
+        registry.register(BackupCommand, aliases=["backup-data", "backup-all"])
+
+        # Register update command with aliases
+        registry.register(UpdateCommand, aliases=["sync", "apply"])
+
+        # Register list profiles scoped command with aliases
+        registry.register(
+            ProfilesScopedCommand,
+            aliases=["list-scoped", "scoped-profiles", "profiles-scoped"],
+        )
+
+        # Register safety command with aliases
+        registry.register(SafetyCommand, aliases=["guard", "guardrails", "prod-safety"])
+
+        # Register roles command with aliases
+        registry.register(RolesCommand, aliases=["role", "permissions", "access"])
+
+        # Register software installation command with aliases
+        registry.register(
+            SoftwareInstallationCommand, 
+            aliases=["software-install", "install-software", "software", "install"]
+        )
+
+        # Register new Phase 1 commands
+        registry.register(
+            AdvancedSearchesCommand, aliases=["advanced-search", "searches"]
+        )
+        registry.register(
+            ExtensionAttributesCommand,
+            aliases=["extension-attributes", "ext-attributes", "attributes"],
+        )
+        registry.register(
+            MobileAppsCommand, aliases=["mobile-apps", "mobileapps", "apps"]
+        )
+
+        # Register Phase 2 commands
+        registry.register(PackagesCommand, aliases=["package", "pkg", "packages"])
+
+        # Register Installomator command with aliases
+        registry.register(
+            InstallomatorCommand, aliases=["installomator", "installer", "apps"]
+        )
+
+        # Register Installomator add app command
+        registry.register(
+            InstallomatorAddAppCommand, aliases=["add-app", "installomator-add"]
+        )
+
+        # Register Installomator create policy command
+        registry.register(
+            InstallomatorCreatePolicyCommand,
+            aliases=["create-policy", "installomator-create"],
+        )
+
+        # Register Installomator profiles command
+        registry.register(
+            InstallomatorProfilesCommand,
+            aliases=["profiles", "installomator-profiles"],
+        )
+
+        # Register PPPC command with aliases
+        registry.register(
+            PPPCCommand, aliases=["pppc", "privacy", "tcc", "pppc-scanner"]
+        )
+
+        # Register Manifest command with aliases
+        registry.register(
+            ManifestCommand, aliases=["manifest", "manifests", "profiles-manifest"]
+        )
+
+        # Register Certificate command with aliases
+        registry.register(
+            CertificateCommand, aliases=["cert", "certs", "certificate", "csr"]
+        )
+
+        # Register CrowdStrike command with aliases
+        registry.register(
+            CrowdStrikeCommand, aliases=["crowdstrike", "falcon", "cs", "security"]
+        )
+
+        # Register setup command with aliases
+        registry.register(SetupCommand, aliases=["configure", "config", "init"])
+
+        # Register serve command (warm daemon) with aliases
+        registry.register(ServeCommand, aliases=["daemon"])
+
+    def create_parser(self) -> argparse.ArgumentParser:
+        """Create the main argument parser"""
+        parser = argparse.ArgumentParser(
+            prog="jpapi",
+            description="📱 JAMF Pro API Development CLI - Modular Architecture",
+            epilog='Use "jpapi <command> --help" for more information on a specific command.',
+        )
+
+        # Global arguments
+        parser.add_argument(
+            "--env",
+            default="sandbox",
+            help="JAMF environment (sandbox, production, etc.)",
+        )
+        envs_group = parser.add_mutually_exclusive_group()
+        envs_group.add_argument(
+            "--envs",
+            metavar="ENV[,ENV...]",
+            help="Run list/search/export/devices against several environments "
+            "concurrently and merge the results",
+        )
+        envs_group.add_argument(
+            "--all-envs",
+            action="store_true",
+            help="Like --envs, for every environment with configured credentials",
+        )
+        parser.add_argument(
+            "--experimental", action="store_true", help="Enable experimental features"
+        )
+        parser.add_argument(
+            "--version", action="version", version="jpapi 2.0.0 (modular)"
+        )
+
+        # Add subparsers for commands
+        subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+        # Register only main commands in help
+        for command_name in registry.list_commands():
+            command_class = registry.get_command(command_name)
+            command_instance = command_class()
+
+            # Show aliases in the help text
+            aliases = [
+                alias
+                for alias, cmd in registry.list_aliases().items()
+                if cmd == command_name
+            ]
+            help_text = command_instance.description
+            if aliases:
+                help_text += f" (aliases: {', '.join(aliases[:3])}{'...' if len(aliases) > 3 else ''})"
+
+            # Create subparser for main command
+            command_parser = subparsers.add_parser(command_name, help=help_text)
+
+            # Add command-specific arguments
+            command_instance.add_arguments(command_parser)
+            command_instance.setup_profiling_args(command_parser)
+
+        return parser
+
+    def _print_throughput_summary(
+        self, command: str, client: Optional[JamfHttpClient] = None
+    ) -> None:
+        """Print API throughput for the command that just ran"""
+        client = client or get_http_client()
+        for host, stats in client.get_rate_limit_stats().items():
+            if not stats["requests"]:
+                continue
+            print(
+                f"📊 {command} → {host}: {stats['requests']} requests, "
+                f"{stats['requests_per_second']} req/s, "
+                f"{stats['wait_seconds']}s rate-limited, "
+                f"{stats['throttled_responses']} throttled "
+                f"(limit {stats['current_rate_per_minute']}/min)"
+            )
+
+        coalescing_stats = client.coalescer.get_stats()
+        if coalescing_stats["coalesced"]:
+            print(
+                f"📊 Coalesced requests: {coalescing_stats['coalesced']} of "
+                f"{coalescing_stats['calls']} GETs shared an in-flight call"
+            )
+        if client.response_cache is not None:
+            cache_stats = client.response_cache.get_stats()
+            print(
+                f"📊 Response cache: {cache_stats['hits']} hits, "
+                f"{cache_stats['revalidated']} revalidated, "
+                f"{cache_stats['misses']} misses"
+            )
+
+    def _start_api_profiler(self, parsed_args) -> Optional[ApiProfiler]:
+        """Attach an API profiler when --profile-api or a call budget was given"""
+        wanted = any(
+            hasattr(parsed_args, name)
+            for name in (
+                "profile_api",
+                "profile_api_report",
+                "api_call_budget",
+                "api_endpoint_budget",
+            )
+        )
+        if not wanted:
+            return None
+
+        profiler = ApiProfiler(
+            max_calls=getattr(parsed_args, "api_call_budget", None),
+            max_calls_per_endpoint=getattr(parsed_args, "api_endpoint_budget", None),
+        )
+        get_http_client().profiler = profiler
+        return profiler
+
+    def _finish_api_profiler(
+        self, profiler: ApiProfiler, parsed_args, result: int
+    ) -> int:
+        """Print and save the API profile; a blown budget fails the command"""
+        if getattr(parsed_args, "profile_api", False):
+            print()
+            for line in profiler.format_summary():
+                print(line)
+
+        report_path = getattr(parsed_args, "profile_api_report", None)
+        if report_path:
+            path = profiler.write_report(
+                report_path,
+                command=parsed_args.command,
+                environment=getattr(parsed_args, "env", None),
+            )
+            print(f"📊 API profile written to {path}")
+
+        if profiler.budget_exceeded is not None:
+            print(f"❌ {profiler.budget_exceeded}")
+            return result or 1
+        return result
+
+    def _fan_out_envs(self, parsed_args) -> Optional[List[str]]:
+        """Environments named by --envs/--all-envs (None for a single one)"""
+        if getattr(parsed_args, "all_envs", False):
+            return [
+                env
+                for env in central_config.environments.available
+                if get_best_auth(env).is_configured()
+            ]
+        envs = parse_envs(getattr(parsed_args, "envs", None))
+        if not envs:
+            return None
+        normalized = (central_config.normalize_environment(env) for env in envs)
+        return list(dict.fromkeys(normalized))
+
+    def _run_across_envs(self, command_class, parsed_args, envs: List[str]) -> int:
+        """
+        Run a read-only command against several environments concurrently
+
+        Each environment gets its own command, auth and HTTP client (so its
+        own connection pool and rate limiter); the rows every run outputs
+        are merged into one result with an Environment column.
+        """
+        profiler = get_http_client().profiler
+        clients: Dict[str, JamfHttpClient] = {}
+
+        def run(env: str) -> int:
+            client = JamfHttpClient.from_config()
+            client.profiler = profiler
+            clients[env] = client
+            command_instance = command_class()
+            command_instance.environment = env
+            command_instance.http_client = client
+            env_args = argparse.Namespace(**dict(vars(parsed_args), env=env))
+            return command_instance.execute(env_args)
+
+        print(
+            f"🌐 Running {parsed_args.command} across {len(envs)} environments: "
+            f"{', '.join(envs)}"
+        )
+        try:
+            runs = run_across_envs(envs, run)
+        finally:
+            for env, client in clients.items():
+                if getattr(parsed_args, "verbose", False):
+                    self._print_throughput_summary(
+                        f"{parsed_args.command} [{env}]", client
+                    )
+                client.close()
+
+        for env_run in runs:
+            if env_run.ok:
+                print(
+                    f"✅ {env_run.env}: {len(env_run.rows)} rows "
+                    f"in {env_run.duration:.1f}s"
+                )
+            else:
+                problem = env_run.error or f"exit code {env_run.exit_code}"
+                print(f"❌ {env_run.env}: {problem}")
+
+        rows = merge_env_rows(runs)
+        if rows:
+            self._save_merged_output(command_class(), parsed_args, rows)
+        return 0 if all(env_run.ok for env_run in runs) else 1
+
+    @staticmethod
+    def _parquet_problem(parsed_args) -> Optional[str]:
+        """Why --format parquet cannot be used by this command line, if not"""
+        if getattr(parsed_args, "format", None) != "parquet":
+            return None
+        if parsed_args.command not in PARQUET_COMMANDS:
+            return (
+                f"--format parquet works with {', '.join(PARQUET_COMMANDS)}, "
+                f"not {parsed_args.command}"
+            )
+        writes_file = parsed_args.command == "export" or any(
+            getattr(parsed_args, option, None)
+            for option in ("export_mode", "output", "download")
+        )
+        if not writes_file:
+            return "--format parquet writes a file; add --export-mode or --output"
+        return None
+
+    def _save_merged_output(self, command_instance, parsed_args, rows) -> None:
+        """Print or save the merged rows of a multi-environment run"""
+        output_format = getattr(parsed_args, "format", "csv")
+        output_path = getattr(parsed_args, "output", None)
+
+        # Exports always go to a file, named for all environments
+        exporting = parsed_args.command == "export" or getattr(
+            parsed_args, "export_mode", False
+        )
+        if exporting or output_format == "parquet":
+            if output_format == "table":
+                output_format = "csv"
+            if output_path is None:
+                object_type = (
+                    getattr(parsed_args, "target", None)
+                    or getattr(parsed_args, "subcommand", None)
+                    or parsed_args.command
+                )
+                export_dir = get_export_directory("all-envs")
+                export_dir.mkdir(parents=True, exist_ok=True)
+                filename = generate_export_filename(
+                    object_type, output_format, "all-envs"
+                )
+                output_path = str(export_dir / filename)
+
+        command_instance.save_rows(rows, output_format, output_path)
+
+    def run(self, args: Optional[List[str]] = None) -> int:
+        """Run the CLI application"""
+        # Handle alias resolution before parsing
+        if args is None:
+            args = sys.argv[1:]  # Get command line args if none provided
+
+        if args and len(args) > 0:
+            first_arg = args[0]
+            if first_arg in registry.list_aliases():
+                # Replace alias with actual command
+                actual_command = registry.list_aliases()[first_arg]
+                args = [actual_command] + args[1:]
+
+        if self._parser is None:
+            self._parser = self.create_parser()
+        parser = self._parser
+        parsed_args = parser.parse_args(args)
+
+        # Show help if no command specified
+        if not parsed_args.command:
+            parser.print_help()
+            return 0
+
+        try:
+            # Get command class and create instance
+            command_class = registry.get_command(parsed_args.command)
+            command_instance = command_class()
+
+            # Set environment on command instance
+            if hasattr(parsed_args, "env"):
+                command_instance.environment = parsed_args.env
+
+            parquet_problem = self._parquet_problem(parsed_args)
+            if parquet_problem:
+                print(f"❌ {parquet_problem}")
+                return 1
+
+            envs = self._fan_out_envs(parsed_args)
+            if envs is not None:
+                if parsed_args.command not in FAN_OUT_COMMANDS:
+                    print(
+                        f"❌ --envs/--all-envs work with "
+                        f"{', '.join(FAN_OUT_COMMANDS)}, not {parsed_args.command}"
+                    )
+                    return 1
+                if not envs:
+                    print("❌ No environments have credentials configured")
+                    print("   Run: jpapi setup")
+                    return 1
+
+            profiler = self._start_api_profiler(parsed_args)
+
+            # Execute command
+            try:
+                if envs is not None:
+                    result = self._run_across_envs(command_class, parsed_args, envs)
+                else:
+                    result = command_instance.execute(parsed_args)
+            finally:
+                if profiler is not None:
+                    get_http_client().profiler = None
+            if getattr(parsed_args, "verbose", False) and envs is None:
+                self._print_throughput_summary(parsed_args.command)
+            if profiler is not None:
+                result = self._finish_api_profiler(profiler, parsed_args, result)
+            return result
+
+        except ValueError as e:
+            print(f"❌ {e}")
+
+            # Suggest similar commands
+            available_commands = registry.list_commands()
+            aliases = registry.list_aliases()
+
+            print(f"\nAvailable commands: {', '.join(available_commands)}")
+            if aliases:
+                print(
+                    f"Command aliases: {', '.join(f'{alias}→{cmd}' for alias, cmd in aliases.items())}"
+                )
+
+            return 1
+        except KeyboardInterrupt:
+            print("\n❌ Operation cancelled by user")
+            return 1
+        except Exception as e:
+            print(f"❌ Unexpected error: {e}")
+            if "--debug" in sys.argv:
+                import traceback
+
+                traceback.print_exc()
+            return 1
+
@@ -2,7 +2,7 @@
 
 from .command import BaseCommand
 from .registry import CommandRegistry, registry
-from .output_formatter import OutputFormatter
+from .output_formatter import OutputFormatError, OutputFormatter
 from .safety_validator import SafetyValidator
 from .pattern_matcher import PatternMatcher, CommandPattern, SubcommandConfig
 from .validators import InputValidators
@@ -12,6 +12,7 @@ __all__ = [
     "BaseCommand",
     "CommandRegistry",
     "registry",
+    "OutputFormatError",
     "OutputFormatter",
     "SafetyValidator",
     "PatternMatcher",
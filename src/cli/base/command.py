@@ -5,15 +5,19 @@ Uses composition with extracted components for SRP compliance
 """
 
 from abc import ABC
-from typing import Optional
-from argparse import ArgumentParser, Namespace
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from argparse import SUPPRESS, ArgumentParser, Namespace, _SubParsersAction
 
 from core.auth.login_factory import get_best_auth
 from resources.config.central_config import central_config
 from core.auth.login_types import AuthInterface
 from core.logging.command_mixin import LoggingCommandMixin
+from lib.exports.stream_writers import write_rows
+from lib.utils.fan_out import collect_rows, collecting
+from lib.utils.field_projection import FieldCatalog, FieldError, resolve_fields
 
-from .output_formatter import OutputFormatter
+from .output_formatter import OutputFormatError, OutputFormatter
 from .safety_validator import SafetyValidator
 from .pattern_matcher import PatternMatcher, CommandPattern
 
@@ -26,6 +30,8 @@ class BaseCommand(ABC, LoggingCommandMixin):
         self.description = description
         self._auth: Optional[AuthInterface] = None
         self.environment = central_config.environments.default
+        # Own HTTP client for multi-environment runs (None: process-wide)
+        self.http_client = None
 
         # Composed components (SRP)
         self.output_formatter = OutputFormatter()
@@ -49,6 +55,8 @@ class BaseCommand(ABC, LoggingCommandMixin):
             raw_env = getattr(self, "environment", central_config.environments.default)
             environment = central_config.normalize_environment(raw_env)
             self._auth = get_best_auth(environment)
+            if self.http_client is not None:
+                self._auth.http_client = self.http_client
         return self._auth
 
     # Convenience methods that delegate to pattern_matcher
@@ -224,9 +232,12 @@ class BaseCommand(ABC, LoggingCommandMixin):
         """Add common arguments that all commands might need"""
         parser.add_argument(
             "--format",
-            choices=["table", "json", "csv"],
+            choices=["table", "json", "csv", "ndjson", "parquet"],
             default="csv",
-            help="Output format",
+            help=(
+                "Output format (ndjson: one JSON object per line; "
+                "parquet: typed columnar export file, needs pyarrow)"
+            ),
         )
         parser.add_argument("--output", help="Output file path")
         parser.add_argument(
@@ -241,6 +252,12 @@ class BaseCommand(ABC, LoggingCommandMixin):
             default="wildcard",
             help="Type of filtering to use",
         )
+        parser.add_argument(
+            "--fields",
+            metavar="FIELDS",
+            help="Comma-separated output columns, e.g. name,serial,os "
+            "(also limits what is fetched)",
+        )
         parser.add_argument(
             "--status",
             choices=["enabled", "disabled", "all"],
@@ -263,6 +280,53 @@ class BaseCommand(ABC, LoggingCommandMixin):
                 help="Skip production confirmation prompts (use with caution)",
             )
 
+    def setup_profiling_args(self, parser: ArgumentParser) -> None:
+        """
+        Add API profiling arguments to a command parser and its subcommands
+
+        Defaults are suppressed so a value given before a subcommand is not
+        reset by the subcommand parser.
+        """
+        if "--profile-api" not in parser._option_string_actions:
+            group = parser.add_argument_group("API profiling")
+            group.add_argument(
+                "--profile-api",
+                action="store_true",
+                default=SUPPRESS,
+                help="Print per-endpoint API call counts, bytes and latency",
+            )
+            group.add_argument(
+                "--profile-api-report",
+                metavar="PATH",
+                default=SUPPRESS,
+                help="Write the API profile as JSON to PATH",
+            )
+            group.add_argument(
+                "--api-call-budget",
+                type=int,
+                metavar="N",
+                default=SUPPRESS,
+                help="Abort once the command makes more than N API calls",
+            )
+            group.add_argument(
+                "--api-endpoint-budget",
+                type=int,
+                metavar="N",
+                default=SUPPRESS,
+                help="Abort once any single endpoint is called more than N times",
+            )
+
+        for action in parser._actions:
+            if isinstance(action, _SubParsersAction):
+                for subparser in action.choices.values():
+                    self.setup_profiling_args(subparser)
+
+    def resolve_fields(
+        self, args: Namespace, catalog: Optional[FieldCatalog] = None
+    ) -> Optional[List[str]]:
+        """Columns requested with --fields (None for the default columns)"""
+        return resolve_fields(getattr(args, "fields", None), catalog)
+
     def check_auth(self, args: Namespace) -> bool:
         """Check if authentication is configured"""
         if hasattr(args, "environment"):
@@ -279,19 +343,51 @@ class BaseCommand(ABC, LoggingCommandMixin):
     # Delegate output formatting to OutputFormatter
     def format_output(self, data, format_type: str = "table") -> str:
         """Format output data (delegates to OutputFormatter)"""
+        # Rows of a multi-environment run are merged and formatted once
+        if collect_rows(data):
+            return ""
         return self.output_formatter.format_output(data, format_type)
 
     def save_output(self, content: str, output_path: Optional[str] = None) -> None:
         """Save output to file or print (delegates to OutputFormatter)"""
+        if collecting():
+            return
         success, message = self.output_formatter.save_output(content, output_path)
         if message:
             print(message)
 
+    def save_rows(
+        self,
+        rows: List[Dict[str, Any]],
+        format_type: str,
+        output_path: Optional[str] = None,
+    ) -> None:
+        """
+        Format rows and save them to a file or print them
+
+        Parquet is binary, so it is streamed straight into output_path
+        instead of going through format_output.
+        """
+        if format_type != "parquet":
+            self.save_output(self.format_output(rows, format_type), output_path)
+            return
+        if collect_rows(rows):
+            return
+        if not output_path:
+            raise OutputFormatError(
+                "--format parquet writes a file; add --output or --export-mode"
+            )
+        writer = write_rows(Path(output_path), rows, "parquet")
+        print(f"✅ Output saved to: {output_path} ({writer.rows_written} rows)")
+
     def handle_api_error(self, error: Exception) -> int:
         """Handle API errors consistently"""
         error_msg = str(error)
 
-        if "401" in error_msg or "Authentication" in error_msg:
+        if isinstance(error, (FieldError, OutputFormatError)):
+            print(f"❌ {error_msg}")
+            return 1
+        elif "401" in error_msg or "Authentication" in error_msg:
             print("❌ Authentication failed. Please check your credentials.")
             print("   Run: jpapi auth setup")
             return 1
@@ -12,6 +12,10 @@ import csv
 import io
 
 
+class OutputFormatError(ValueError):
+    """Output format cannot be produced where it was asked for"""
+
+
 class OutputFormatter:
     """Handles output formatting for CLI commands"""
 
@@ -21,15 +25,23 @@ class OutputFormatter:
 
         Args:
             data: Data to format
-            format_type: Output format (json, csv, table)
+            format_type: Output format (json, ndjson, csv, table)
 
         Returns:
             Formatted string output
         """
         if format_type == "json":
             return self.format_json(data)
+        elif format_type == "ndjson":
+            return self.format_ndjson(data)
         elif format_type == "csv":
             return self.format_csv(data)
+        elif format_type == "parquet":
+            # Binary: written to export files by BaseCommand.save_rows
+            raise OutputFormatError(
+                "Parquet is a binary file format; use it with 'jpapi export "
+                "<type>', 'jpapi list <type> --export-mode' or --output"
+            )
         else:
             return self.format_table(data)
 
@@ -37,6 +49,12 @@ class OutputFormatter:
         """Format data as JSON"""
         return json.dumps(data, indent=2)
 
+    def format_ndjson(self, data: Any) -> str:
+        """Format data as newline-delimited JSON (one line per list item)"""
+        if isinstance(data, list):
+            return "\n".join(json.dumps(item) for item in data)
+        return json.dumps(data)
+
     def format_csv(self, data: Any) -> str:
         """Format data as CSV"""
         if isinstance(data, list) and data and isinstance(data[0], dict):
@@ -24,15 +24,22 @@ class DeviceMatcher:
         Returns:
             Tuple of (devices_to_lock, users_not_found)
         """
-        # Get all computers summary list
+        # Stream the computer list, keeping only the hostnames we look for
         print("🔄 Fetching computers from JAMF...")
-        all_computers_summary = self.computer_manager.get_all_computers()
-        print(f"   📊 Retrieved {len(all_computers_summary)} computers")
-
-        # Create lookup by hostname for quick matching
-        hostname_to_computer = {
-            c.get("name", "").upper(): c for c in all_computers_summary if c.get("name")
+        wanted_hostnames = {
+            u.get("hostname", "").upper() for u in users if u.get("hostname")
         }
+        hostname_to_computer = {}
+        total_computers = 0
+        try:
+            for computer in self.computer_manager.iter_computers():
+                total_computers += 1
+                hostname = computer.get("name", "").upper()
+                if hostname in wanted_hostnames:
+                    hostname_to_computer[hostname] = computer
+        except Exception as e:
+            print(f"   ❌ Error fetching computers: {e}")
+        print(f"   📊 Retrieved {total_computers} computers")
 
         devices_to_lock = []
         users_not_found = []
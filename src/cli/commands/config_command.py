@@ -505,6 +505,7 @@ class ConfigCommand(BaseCommand):
                 "rate_limit_burst_size": central_config.api.rate_limit_burst_size,
                 "auto_retry_failed_requests": central_config.api.auto_retry_failed_requests,
                 "cache_api_responses": central_config.api.cache_api_responses,
+                "cache_ttl_responses": central_config.api.cache_ttl_responses,
                 "follow_redirects": central_config.api.follow_redirects,
                 "verify_ssl": central_config.api.verify_ssl,
             }
@@ -13,8 +13,37 @@ from .common_imports import (
     BaseCommand,
 )
 from lib.managers import ComputerManager, MobileDeviceManager
+from lib.managers.computer_search_manager import (
+    INVENTORY_COLUMNS,
+    ComputerSearchManager,
+    endpoint_unsupported,
+)
+from lib.utils.field_projection import (
+    DETAIL,
+    SUMMARY,
+    FieldCatalog,
+    select_output_fields,
+)
 from pathlib import Path
 
+# Columns the Classic computer list entries carry (id and name only);
+# anything else is read from the Jamf Pro inventory sections it lives in
+COMPUTER_SUMMARY_COLUMNS = ("ID", "Name")
+
+# Mobile list entries carry name, model and serial; OS version and last
+# contact need a per-device detail call
+MOBILE_COLUMNS = FieldCatalog(
+    {
+        "ID": SUMMARY,
+        "Name": SUMMARY,
+        "Model": SUMMARY,
+        "Serial": SUMMARY,
+        "OS Version": DETAIL,
+        "Last Contact": DETAIL,
+    }
+)
+ALL_DEVICE_COLUMNS = FieldCatalog(dict({"Type": SUMMARY}, **MOBILE_COLUMNS.sources))
+
 
 class DevicesCommand(BaseCommand):
     """Improved devices command using existing libraries"""
@@ -139,24 +168,63 @@ class DevicesCommand(BaseCommand):
         """List computers using ComputerManager library"""
         try:
             print("🖥️  Listing computers...")
+            fields = self.resolve_fields(args, INVENTORY_COLUMNS)
+
+            formatted_data = None
+            if fields and not set(fields) <= set(COMPUTER_SUMMARY_COLUMNS):
+                # Page through only the inventory sections those columns need,
+                # plus the name and model --filter matches like the list path
+                filter_text = getattr(args, "filter", None)
+                columns = list(fields)
+                if filter_text:
+                    columns += [c for c in ("Name", "Model") if c not in columns]
+                try:
+                    formatted_data = ComputerSearchManager(self.auth).search(
+                        {}, columns
+                    )
+                except Exception as e:
+                    # Breaker, budget and auth errors are reported, not masked
+                    if not endpoint_unsupported(e):
+                        raise
+                    print(
+                        f"⚠️  Jamf Pro API inventory unavailable ({e}), "
+                        "using Classic API"
+                    )
+                else:
+                    if filter_text:
+                        formatted_data = select_output_fields(
+                            self._apply_device_filter(
+                                formatted_data, filter_text, "Name", "Model"
+                            ),
+                            fields,
+                        )
+                    if not formatted_data:
+                        print("❌ No computers found")
+                        return 1
 
-            computer_manager = ComputerManager(self.auth)
-            computers = computer_manager.get_all_computers()
+            if formatted_data is None:
+                computer_manager = ComputerManager(self.auth)
+                computers = computer_manager.get_all_computers()
 
-            if not computers:
-                print("❌ No computers found")
-                return 1
+                if not computers:
+                    print("❌ No computers found")
+                    return 1
 
-            # Apply filtering
-            if hasattr(args, "filter") and args.filter:
-                computers = self._apply_device_filter(computers, args.filter, "name")
+                # Apply filtering
+                if hasattr(args, "filter") and args.filter:
+                    computers = self._apply_device_filter(
+                        computers, args.filter, "name"
+                    )
+
+                # Format for display
+                formatted_data = select_output_fields(
+                    self._format_computers_for_display(computers, args), fields
+                )
 
-            # Format for display
-            formatted_data = self._format_computers_for_display(computers, args)
             output = self.format_output(formatted_data, args.format)
             self.save_output(output, args.output)
 
-            print(f"\n✅ Found {len(computers)} computers")
+            print(f"\n✅ Found {len(formatted_data)} computers")
             return 0
 
         except Exception as e:
@@ -168,9 +236,12 @@ class DevicesCommand(BaseCommand):
         """List mobile devices using MobileDeviceManager library"""
         try:
             print("📱 Listing mobile devices...")
+            fields = self.resolve_fields(args, MOBILE_COLUMNS)
 
             mobile_manager = MobileDeviceManager(self.auth)
-            devices = mobile_manager.get_all_mobile_devices()
+            devices = self._get_mobile_devices(
+                mobile_manager, MOBILE_COLUMNS.needs(fields, DETAIL)
+            )
 
             if not devices:
                 print("❌ No mobile devices found")
@@ -181,7 +252,9 @@ class DevicesCommand(BaseCommand):
                 devices = self._apply_device_filter(devices, args.filter, "name")
 
             # Format for display
-            formatted_data = self._format_mobile_devices_for_display(devices, args)
+            formatted_data = select_output_fields(
+                self._format_mobile_devices_for_display(devices, args), fields
+            )
             output = self.format_output(formatted_data, args.format)
             self.save_output(output, args.output)
 
@@ -195,6 +268,7 @@ class DevicesCommand(BaseCommand):
         """List all devices using both libraries"""
         try:
             print("📱🖥️  Listing all devices...")
+            fields = self.resolve_fields(args, ALL_DEVICE_COLUMNS)
 
             # Get computers
             computer_manager = ComputerManager(self.auth)
@@ -202,38 +276,38 @@ class DevicesCommand(BaseCommand):
 
             # Get mobile devices
             mobile_manager = MobileDeviceManager(self.auth)
-            mobile_devices = mobile_manager.get_all_mobile_devices()
+            mobile_devices = self._get_mobile_devices(
+                mobile_manager, ALL_DEVICE_COLUMNS.needs(fields, DETAIL)
+            )
 
             # Format and combine
             all_devices = []
 
             # Add computers
             for computer in computers:
+                general = computer.get("general") or computer
                 device_info = {
                     "Type": "Computer",
                     "ID": computer.get("id", ""),
-                    "Name": computer.get("general", {}).get("name", ""),
+                    "Name": general.get("name", ""),
                     "Model": computer.get("hardware", {}).get("model", ""),
-                    "OS Version": computer.get("general", {}).get("os_version", ""),
-                    "Serial": computer.get("general", {}).get("serial_number", ""),
-                    "Last Contact": computer.get("general", {}).get(
-                        "last_contact_time", ""
-                    ),
+                    "OS Version": general.get("os_version", ""),
+                    "Serial": general.get("serial_number", ""),
+                    "Last Contact": general.get("last_contact_time", ""),
                 }
                 all_devices.append(device_info)
 
-            # Add mobile devices
+            # Add mobile devices (list entries when no detail column is wanted)
             for device in mobile_devices:
+                general = device.get("general") or device
                 device_info = {
                     "Type": "Mobile",
                     "ID": device.get("id", ""),
-                    "Name": device.get("general", {}).get("name", ""),
-                    "Model": device.get("general", {}).get("model", ""),
-                    "OS Version": device.get("general", {}).get("os_version", ""),
-                    "Serial": device.get("general", {}).get("serial_number", ""),
-                    "Last Contact": device.get("general", {}).get(
-                        "last_inventory_update", ""
-                    ),
+                    "Name": general.get("name", ""),
+                    "Model": general.get("model", ""),
+                    "OS Version": general.get("os_version", ""),
+                    "Serial": general.get("serial_number", ""),
+                    "Last Contact": general.get("last_inventory_update", ""),
                 }
                 all_devices.append(device_info)
 
@@ -248,6 +322,7 @@ class DevicesCommand(BaseCommand):
                 )
 
             # Output
+            all_devices = select_output_fields(all_devices, fields)
             output = self.format_output(all_devices, args.format)
             self.save_output(output, args.output)
 
@@ -259,6 +334,14 @@ class DevicesCommand(BaseCommand):
         except Exception as e:
             return self.handle_api_error(e)
 
+    def _get_mobile_devices(
+        self, mobile_manager: MobileDeviceManager, detailed: bool
+    ) -> List[Dict[str, Any]]:
+        """Mobile devices, skipping per-device detail calls when not needed"""
+        if detailed:
+            return mobile_manager.get_all_mobile_devices()
+        return mobile_manager.get_mobile_device_summaries()
+
     def _update_computer(self, args: Namespace, pattern: Optional[Any] = None) -> int:
         """Update computer inventory using direct API call"""
         try:
@@ -673,7 +756,11 @@ Device Lock Summary:
         return None
 
     def _apply_device_filter(
-        self, devices: List[Dict[str, Any]], filter_text: str, name_field: str
+        self,
+        devices: List[Dict[str, Any]],
+        filter_text: str,
+        name_field: str,
+        model_field: str = "model",
     ) -> List[Dict[str, Any]]:
         """Apply filtering to device list"""
         if not filter_text:
@@ -692,7 +779,7 @@ Device Lock Summary:
                 else:
                     # Simple device structure
                     name = device.get(name_field, "")
-                    model = device.get("model", "")
+                    model = device.get(model_field, "")
             else:
                 continue
 
@@ -708,16 +795,16 @@ Device Lock Summary:
         """Format computers for display"""
         formatted = []
         for computer in computers:
+            # Detail objects nest under "general"; list entries are flat
+            general = computer.get("general") or computer
             formatted.append(
                 {
                     "ID": computer.get("id", ""),
-                    "Name": computer.get("general", {}).get("name", ""),
+                    "Name": general.get("name", ""),
                     "Model": computer.get("hardware", {}).get("model", ""),
-                    "Serial": computer.get("general", {}).get("serial_number", ""),
-                    "OS Version": computer.get("general", {}).get("os_version", ""),
-                    "Last Contact": computer.get("general", {}).get(
-                        "last_contact_time", ""
-                    ),
+                    "Serial": general.get("serial_number", ""),
+                    "OS Version": general.get("os_version", ""),
+                    "Last Contact": general.get("last_contact_time", ""),
                 }
             )
         return formatted
@@ -728,16 +815,16 @@ Device Lock Summary:
         """Format mobile devices for display"""
         formatted = []
         for device in devices:
+            # Detail objects nest under "general"; list entries are flat
+            general = device.get("general") or device
             formatted.append(
                 {
                     "ID": device.get("id", ""),
-                    "Name": device.get("general", {}).get("name", ""),
-                    "Model": device.get("general", {}).get("model", ""),
-                    "Serial": device.get("general", {}).get("serial_number", ""),
-                    "OS Version": device.get("general", {}).get("os_version", ""),
-                    "Last Contact": device.get("general", {}).get(
-                        "last_inventory_update", ""
-                    ),
+                    "Name": general.get("name", ""),
+                    "Model": general.get("model", ""),
+                    "Serial": general.get("serial_number", ""),
+                    "OS Version": general.get("os_version", ""),
+                    "Last Contact": general.get("last_inventory_update", ""),
                 }
             )
         return formatted
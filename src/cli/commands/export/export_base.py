@@ -4,34 +4,107 @@ Base Export Functions
 Common functions for exporting JAMF data
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Set, Tuple
 from argparse import Namespace
 import json
-import csv
-import io
 import time
+from itertools import chain
 from pathlib import Path
+from core.http.async_client import fetch_many
 from lib.utils import create_filter
+from lib.utils.fan_out import collect_rows, collecting
+from lib.utils.field_projection import (
+    DETAIL,
+    FieldCatalog,
+    match_columns,
+    resolve_fields,
+)
 from lib.exports.manage_exports import (
     generate_export_filename,
     get_export_directory,
 )
+from lib.exports.export_journal import ExportJournal
+from lib.exports.export_state import ExportStateStore, default_max_age
+from lib.exports.parquet_writer import require_pyarrow
+from lib.exports.stream_writers import (
+    COLUMN_SAMPLE_SIZE,
+    STREAM_FORMATS,
+    discover_columns,
+    peek_rows,
+    write_rows,
+)
 from core.logging.command_mixin import log_operation, LoggingCommandMixin
 
 
 class ExportBase(LoggingCommandMixin):
     """Base class for exporting JAMF data"""
 
+    # Export columns and whether each needs a per-item detail call; without
+    # a catalog --fields only selects columns
+    FIELD_COLUMNS: Optional[FieldCatalog] = None
+
+    # Detail requests in flight at once (None: connection_pool_size);
+    # --detail-concurrency overrides it per run
+    DETAIL_CONCURRENCY: Optional[int] = None
+    # Items whose details are fetched (and held in memory) at a time
+    DETAIL_BATCH_SIZE = 200
+
+    # Arguments that do not change the rows, so a run with other values can
+    # still --resume the journal
+    RESUME_IGNORED_ARGS = {
+        "resume",
+        "output",
+        "format",
+        "verbose",
+        "analysis",
+        "detail_concurrency",
+        "incremental",
+        "max_detail_age",
+        "envs",
+        "all_envs",
+        "force",
+        "dry_run",
+        "profile_api",
+        "profile_api_report",
+        "api_call_budget",
+        "api_endpoint_budget",
+    }
+
     def __init__(self, auth, data_type: str):
         self.auth = auth
         self.data_type = data_type
+        self.fields: Optional[List[str]] = None
+        self.detail_concurrency = self.DETAIL_CONCURRENCY
+        # Saved details of earlier runs (--incremental)
+        self.detail_state: Optional[ExportStateStore] = None
+        # Checkpoint journal of finished rows (--resume)
+        self.journal: Optional[ExportJournal] = None
+        # IDs of objects whose detail requests failed this run
+        self._failed_ids: Set[str] = set()
         # Initialize logging
         LoggingCommandMixin.__init__(self)
 
     @log_operation("Export Data")
     def export(self, args: Namespace) -> int:
-        """Export data to file"""
+        """
+        Export data to file
+
+        With --resume, finished rows are journaled as they are written, and
+        a rerun after a failed or interrupted run continues from the journal
+        instead of exporting every object again.
+        """
+        completed = False
+        self._failed_ids = set()
         try:
+            self.fields = resolve_fields(
+                getattr(args, "fields", None), self.FIELD_COLUMNS
+            )
+            if getattr(args, "detail_concurrency", None):
+                self.detail_concurrency = args.detail_concurrency
+            if getattr(args, "format", None) == "parquet":
+                require_pyarrow()  # Fail before fetching anything
+            self.detail_state = self._open_detail_state(args)
+
             # Get data from JAMF
             data = self._fetch_data(args)
 
@@ -41,17 +114,119 @@ class ExportBase(LoggingCommandMixin):
 
             self.log_success(f"Found {len(data)} {self.data_type} to export")
 
-            # Format data for saving
-            export_data = self._format_data(data, args)
+            # Objects finished by an interrupted run are not exported again
+            if getattr(args, "resume", False):
+                self.journal, data = self._open_journal(args, data)
+
+            # Format data for saving; rows are produced one at a time
+            export_rows: Iterable[Dict[str, Any]] = self._journaled(
+                self._format_data(data, args)
+            )
+            if self.journal is not None:
+                export_rows = chain(self.journal.rows(), export_rows)
 
-            # Save to file
+            # Save to file as the rows arrive
             self.log_info("Saving data")
-            self._save_output(export_data, args)
+            self._save_output(export_rows, args)
 
+            completed = True
             return 0
 
         except Exception as e:
             return self._handle_error(e)
+        finally:
+            if self.detail_state is not None:
+                self.detail_state.close()
+                self.detail_state = None
+            if self.journal is not None:
+                self._close_journal(completed)
+
+    def _open_journal(
+        self, args: Namespace, data: List[Dict[str, Any]]
+    ) -> Tuple[ExportJournal, List[Dict[str, Any]]]:
+        """
+        Continue the last journal of this export (--resume), or start one
+
+        Returns:
+            (journal, the objects still to export)
+        """
+        journal = ExportJournal(getattr(args, "env", None) or "sandbox", self.data_type)
+        options = {
+            key: value
+            for key, value in sorted(vars(args).items())
+            if key not in self.RESUME_IGNORED_ARGS
+            and isinstance(value, (str, int, float, bool, list, tuple, type(None)))
+        }
+        if journal.resume(options):
+            done = journal.completed_ids()
+            remaining = [item for item in data if str(item.get("id")) not in done]
+            print(
+                f"↩️  Resuming: {len(data) - len(remaining)} {self.data_type} "
+                f"already exported, {len(remaining)} to go"
+            )
+            return journal, remaining
+        print(
+            f"ℹ️  No unfinished {self.data_type} export with these options "
+            "to resume; journaling this run"
+        )
+        journal.start(options)
+        return journal, data
+
+    def _journaled(
+        self, rows: Iterable[Tuple[Any, Dict[str, Any]]]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Strip the object IDs from formatted rows, journaling them if resumable
+
+        An object's rows are recorded together once the next object's rows
+        begin (or the export ends), so an object cut short by a crash is
+        exported again on resume.
+        """
+        pending_id, pending = None, []
+        for object_id, row in rows:
+            if object_id != pending_id:
+                self._record(pending_id, pending)
+                pending_id, pending = object_id, []
+            pending.append(row)
+            yield row
+        self._record(pending_id, pending)
+
+    def _record(self, object_id: Any, rows: List[Dict[str, Any]]) -> None:
+        """Journal an object's rows unless its details failed (--resume redoes it)"""
+        if self.journal is None or object_id is None or not rows:
+            return
+        if str(object_id) not in self._failed_ids:
+            self.journal.record(object_id, rows)
+
+    def _close_journal(self, completed: bool) -> None:
+        """
+        Delete the journal of a finished export, keep it otherwise
+
+        An export whose detail requests partly failed still writes its file,
+        but keeps the journal so --resume fetches only the failed objects.
+        """
+        if completed and not self._failed_ids:
+            self.journal.discard()
+        else:
+            if self.journal.recorded:
+                print(
+                    f"💾 {self.journal.recorded} finished {self.data_type} are "
+                    "journaled; run the same command with --resume to continue"
+                )
+            self.journal.close()
+        self.journal = None
+
+    def _open_detail_state(self, args: Namespace) -> Optional[ExportStateStore]:
+        """State store for --incremental runs (None for full exports)"""
+        if not getattr(args, "incremental", False):
+            return None
+        max_age_hours = getattr(args, "max_detail_age", None)
+        if max_age_hours is not None:
+            max_age = max_age_hours * 3600
+        else:
+            max_age = default_max_age(getattr(self, "detail_endpoint", ""))
+        environment = getattr(args, "env", None) or "sandbox"
+        return ExportStateStore(environment, max_age=max_age)
 
     def _fetch_data(self, args: Namespace) -> List[Dict[str, Any]]:
         """Get data from JAMF - override in subclasses"""
@@ -65,10 +240,154 @@ class ExportBase(LoggingCommandMixin):
 
     def _format_data(
         self, data: List[Dict[str, Any]], args: Namespace
-    ) -> List[Dict[str, Any]]:
-        """Format data for saving - override in subclasses"""
+    ) -> Iterable[Tuple[Any, Dict[str, Any]]]:
+        """
+        Format data for saving - override in subclasses
+
+        Yield (object ID, row) pairs as rows are ready, so they are written
+        while the rest are still being formatted. The ID names the object a
+        row was formatted from, for the --resume journal; rows of one object
+        come together, and rows with a None ID are never journaled.
+        """
         raise NotImplementedError("Subclasses must implement _format_data")
 
+    def _needs_detail(self, column: Optional[str] = None) -> bool:
+        """
+        Whether the requested columns need per-item detail calls
+
+        Always true without --fields or a FIELD_COLUMNS catalog, so default
+        exports are unchanged.
+
+        Args:
+            column: Ask about this one column rather than any detail column
+        """
+        if self.fields is None or self.FIELD_COLUMNS is None:
+            return True
+        if column is not None:
+            return column in self.fields
+        return self.FIELD_COLUMNS.needs(self.fields, DETAIL)
+
+    def _iter_details(
+        self,
+        items: List[Dict[str, Any]],
+        endpoint_template: Optional[str] = None,
+        fetch: bool = True,
+        description: Optional[str] = None,
+    ) -> Iterator[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]:
+        """
+        Yield each item with its detail response, in item order
+
+        Requests run on a bounded worker pool (detail_concurrency) instead of
+        one round trip at a time, DETAIL_BATCH_SIZE items at a time so rows
+        can be written while later details are fetched and memory does not
+        grow with the export. A failed request is logged and leaves None for
+        its item without affecting the others. On --incremental runs only
+        new or changed objects are requested; the others reuse the details
+        saved by earlier exports (detail_state).
+
+        Args:
+            items: Summary objects; items without an "id" are not fetched
+            endpoint_template: Detail endpoint with an {id} placeholder
+                (default: detail_endpoint + "/id/{id}")
+            fetch: Yield None for every detail without making requests
+            description: Progress description
+
+        Yields:
+            (item, raw detail response or None)
+        """
+        if not fetch:
+            for item in items:
+                yield item, None
+            return
+
+        template = endpoint_template or f"{self.detail_endpoint}/id/{{id}}"
+        total = sum(1 for item in items if item.get("id"))
+        label = description or f"Fetching {self.data_type} details"
+        reused = 0
+        with self.progress_tracker(total, label) as tracker:
+            for start in range(0, len(items), self.DETAIL_BATCH_SIZE):
+                batch = items[start : start + self.DETAIL_BATCH_SIZE]
+                if self.detail_state is None:
+                    details = self._request_details(batch, template, tracker)
+                else:
+                    details, unchanged = self._incremental_details(
+                        batch, template, tracker
+                    )
+                    reused += unchanged
+                for item, detail in zip(batch, details):
+                    yield item, detail
+
+        if self.detail_state is not None:
+            self.log_info(
+                f"Incremental export: reused saved details for {reused} of "
+                f"{total} {self.data_type}, fetched {total - reused}"
+            )
+
+    def _incremental_details(
+        self, items: List[Dict[str, Any]], endpoint_template: str, tracker
+    ) -> Tuple[List[Optional[Dict[str, Any]]], int]:
+        """
+        Details of one batch, fetching only new or changed objects
+
+        Returns:
+            (details in item order, how many came from the state store)
+        """
+        positions = [i for i, item in enumerate(items) if item.get("id")]
+        saved = self.detail_state.lookup(
+            endpoint_template, [items[i] for i in positions]
+        )
+        details: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        changed = []
+        for position, detail in zip(positions, saved):
+            if detail is None:
+                changed.append(position)
+            else:
+                details[position] = detail
+        unchanged = len(positions) - len(changed)
+        tracker.update(advance=unchanged)
+
+        changed_items = [items[i] for i in changed]
+        fetched = self._request_details(changed_items, endpoint_template, tracker)
+        self.detail_state.save(endpoint_template, changed_items, fetched)
+        for position, detail in zip(changed, fetched):
+            details[position] = detail
+        return details, unchanged
+
+    def _request_details(
+        self, items: List[Dict[str, Any]], endpoint_template: str, tracker
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Fetch the detail responses of one batch of items concurrently"""
+        positions = [i for i, item in enumerate(items) if item.get("id")]
+        ids = [items[i]["id"] for i in positions]
+        details: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        if not ids:
+            return details
+
+        def on_result(index: int, result: Any) -> None:
+            if isinstance(result, Exception):
+                self._failed_ids.add(str(ids[index]))
+                self.log_error(
+                    f"Could not get details for {self.data_type} {ids[index]}",
+                    result,
+                )
+            tracker.update()
+
+        responses = fetch_many(
+            self.auth, endpoint_template, ids, self.detail_concurrency, on_result
+        )
+        for position, response in zip(positions, responses):
+            if isinstance(response, dict):
+                details[position] = response
+        return details
+
+    @staticmethod
+    def _unwrap_detail(response: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Main object of a Classic detail response ({"policy": {...}})"""
+        for key, value in (response or {}).items():
+            if key != "id" and isinstance(value, dict):
+                return value
+        return None
+
     def _get_detailed_info(
         self, item_id: str, endpoint: str
     ) -> Optional[Dict[str, Any]]:
@@ -76,63 +395,100 @@ class ExportBase(LoggingCommandMixin):
         try:
             response = self.auth.api_request("GET", f"{endpoint}/id/{item_id}")
             # Get main object from response
-            for key in response.keys():
-                if key != "id" and isinstance(response[key], dict):
-                    return response[key]
-            return None
+            return self._unwrap_detail(response)
         except Exception as e:
             print(f"   ⚠️  Could not get details for {self.data_type} {item_id}: {e}")
             return None
 
-    def _save_output(self, data: List[Dict[str, Any]], args: Namespace) -> None:
-        """Save data to file with optional analysis"""
-        if not data:
+    def _save_output(
+        self, data: Iterable[Dict[str, Any]], args: Namespace
+    ) -> None:
+        """
+        Save rows to file with optional analysis
+
+        CSV, JSON and NDJSON files are written row by row as the rows are
+        formatted, so memory stays flat and an interrupted export keeps the
+        rows it finished.
+        """
+        head, rows = peek_rows(data)
+        if not head:
+            return
+
+        columns = None
+        if self.fields:
+            # Matched against the first rows' columns, like select_output_fields
+            columns = match_columns(self.fields, discover_columns(head))
+            rows = ({column: row.get(column, "") for column in columns} for row in rows)
+
+        # Multi-environment runs merge every environment into one file
+        if collecting():
+            collect_rows(list(rows))
             return
 
         # Get environment from args or default to dev
         environment = getattr(args, "env", "sandbox")
 
-        if args.format == "csv":
-            output = self._generate_csv(data)
-            if args.output:
-                filename = args.output
-            else:
-                # Use the export management system for proper naming
-                filename = generate_export_filename(
-                    object_type=self.data_type.replace(" ", "-"),
-                    format="csv",
-                    environment=environment,
-                )
-                # Get the full path
-                export_dir = get_export_directory(environment)
-                filename = str(export_dir / filename)
-        elif args.format == "json":
-            output = json.dumps(data, indent=2)
+        if args.format not in STREAM_FORMATS:
+            data = list(rows)
+            output = self._format_table_output(data, args.format)
             if args.output:
-                filename = args.output
+                self._write_file(output, args.output)
+                if getattr(args, "analysis", False):
+                    self._generate_analysis_report(data, args.output)
             else:
-                # Use the export management system for proper naming
-                filename = generate_export_filename(
-                    object_type=self.data_type.replace(" ", "-"),
-                    format="json",
-                    environment=environment,
-                )
-                # Get the full path
-                export_dir = get_export_directory(environment)
-                filename = str(export_dir / filename)
-        else:
-            output = self._format_table_output(data, args.format)
+                print(output)
+            return
+
+        if args.output:
             filename = args.output
+        else:
+            # Use the export management system for proper naming
+            filename = generate_export_filename(
+                object_type=self.data_type.replace(" ", "-"),
+                format=args.format,
+                environment=environment,
+            )
+            # Get the full path
+            export_dir = get_export_directory(environment)
+            filename = str(export_dir / filename)
 
-        # Save or print output
-        if filename:
-            self._write_file(output, filename)
+        # The analysis needs every row; only then are rows kept in memory
+        analysed: List[Dict[str, Any]] = []
+        if getattr(args, "analysis", False):
+            rows = self._keep_rows(rows, analysed)
 
-            # Generate analysis if requested
-            if getattr(args, "analysis", False):
-                self._generate_analysis_report(data, filename)
-        else:
-            print(output)
+        try:
+            writer = write_rows(Path(filename), rows, args.format, columns)
+        except (Exception, KeyboardInterrupt):
+            print(f"⚠️ Export interrupted; rows finished so far are in {filename}")
+            raise
+        print(f"📁 Saved: {filename} ({writer.rows_written} rows)")
+
+        dropped = getattr(writer, "dropped_columns", None)
+        if dropped:
+            self.log_warning(
+                f"Columns first seen after the first {COLUMN_SAMPLE_SIZE} rows "
+                f"were left out of the {args.format.upper()}: {', '.join(dropped)}"
+            )
+        widened = getattr(writer, "widened_columns", None)
+        if widened:
+            self.log_warning(
+                f"Columns with values of more than one type were written as "
+                f"text: {', '.join(widened)}"
+            )
+
+        # Generate analysis if requested
+        if analysed:
+            self._generate_analysis_report(analysed, filename)
+
+    @staticmethod
+    def _keep_rows(
+        rows: Iterable[Dict[str, Any]], kept: List[Dict[str, Any]]
+    ) -> Iterator[Dict[str, Any]]:
+        """Pass rows through, appending each to kept"""
+        for row in rows:
+            kept.append(row)
+            yield row
 
     def _generate_analysis_report(
         self, data: List[Dict[str, Any]], filename: str
@@ -175,19 +531,6 @@ class ExportBase(LoggingCommandMixin):
         except Exception as e:
             print(f"⚠️ Could not generate analysis report: {e}")
 
-    def _generate_csv(self, data: List[Dict[str, Any]]) -> str:
-        """Generate CSV output"""
-        if not data:
-            return ""
-
-        # Use data as-is without adding analysis columns
-        # Analysis columns can be added with --analysis flag if needed
-        output = io.StringIO()
-        writer = csv.DictWriter(output, fieldnames=data[0].keys())
-        writer.writeheader()
-        writer.writerows(data)
-        return output.getvalue()
-
     def _add_analysis_columns(self, row: Dict[str, Any]) -> Dict[str, Any]:
         """Add analysis columns to a data row"""
         enhanced_row = row.copy()
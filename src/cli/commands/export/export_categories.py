@@ -4,7 +4,7 @@ Category Export Handler for jpapi CLI
 Handles export of JAMF categories
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from argparse import Namespace
 from .export_base import ExportBase
 import json
@@ -36,11 +36,9 @@ class ExportCategories(ExportBase):
 
     def _format_data(
         self, data: List[Dict[str, Any]], args: Namespace
-    ) -> List[Dict[str, Any]]:
-        """Format category data for export"""
-        export_data = []
-
-        for i, category in enumerate(data):
+    ) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+        """Format category data for export, yielding each row as it is ready"""
+        for i, (category, detail) in enumerate(self._iter_details(data)):
             print(
                 f"   Processing category {i+1}/{len(data)}: {category.get('name', 'Unknown')}"
             )
@@ -64,23 +62,17 @@ class ExportCategories(ExportBase):
 
             # Always create individual category JSON files for comprehensive export
             if category.get("id"):
-                category_file = self._download_category_file(category)
+                category_file = self._download_category_file(category, detail)
                 if category_file:
                     category_data["category_file"] = category_file
 
-            export_data.append(category_data)
-
-        return export_data
+            yield category.get("id"), category_data
 
-    def _download_category_file(self, category: Dict[str, Any]) -> str:
-        """Download individual category JSON file"""
+    def _download_category_file(
+        self, category: Dict[str, Any], detail_response: Optional[Dict[str, Any]]
+    ) -> str:
+        """Save individual category JSON file from its detail response"""
         try:
-            # Get detailed category info
-            category_id = category.get("id")
-            detail_response = self.auth.api_request(
-                "GET", f"{self.detail_endpoint}/id/{category_id}"
-            )
-
             if not detail_response:
                 return ""
 
@@ -4,12 +4,59 @@ Device Export Handler for jpapi CLI
 Handles export of iOS and macOS devices
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from argparse import Namespace
 from .export_base import ExportBase
 from core.logging.command_mixin import log_operation, with_progress
 import json
 from lib.utils import create_jamf_hyperlink
+from lib.utils.field_projection import DETAIL, SUMMARY, FieldCatalog
+
+MOBILE_SUMMARY_COLUMNS = (
+    "delete",
+    "ID",
+    "Name",
+    "Model",
+    "Serial Number",
+    "UDID",
+    "OS Version",
+    "Capacity",
+    "Available Space",
+)
+MOBILE_DETAIL_COLUMNS = (
+    "Last Inventory",
+    "Managed",
+    "Supervised",
+    "Battery Level",
+    "Carrier",
+    "WiFi MAC",
+)
+COMPUTER_SUMMARY_COLUMNS = (
+    "delete",
+    "ID",
+    "Name",
+    "Model",
+    "Serial Number",
+    "OS Version",
+    "OS Build",
+    "Processor Type",
+    "Total RAM",
+)
+COMPUTER_DETAIL_COLUMNS = (
+    "Last Check-in",
+    "IP Address",
+    "Managed",
+    "FileVault Enabled",
+    "SIP Status",
+)
+
+
+def _export_columns(summary, detailed) -> FieldCatalog:
+    """Catalog of list-entry columns, the device file and detail columns"""
+    sources = dict.fromkeys(summary, SUMMARY)
+    sources["device_file"] = DETAIL
+    sources.update(dict.fromkeys(detailed, DETAIL))
+    return FieldCatalog(sources)
 
 
 class ExportDevices(ExportBase):
@@ -28,6 +75,16 @@ class ExportDevices(ExportBase):
             if device_type == "mobile"
             else "/JSSResource/computers"
         )
+        if device_type == "mobile":
+            self.detail_columns = MOBILE_DETAIL_COLUMNS
+            self.FIELD_COLUMNS = _export_columns(
+                MOBILE_SUMMARY_COLUMNS, MOBILE_DETAIL_COLUMNS
+            )
+        else:
+            self.detail_columns = COMPUTER_DETAIL_COLUMNS
+            self.FIELD_COLUMNS = _export_columns(
+                COMPUTER_SUMMARY_COLUMNS, COMPUTER_DETAIL_COLUMNS
+            )
 
     @log_operation("Device Data Fetch")
     def _fetch_data(self, args: Namespace) -> List[Dict[str, Any]]:
@@ -55,11 +112,18 @@ class ExportDevices(ExportBase):
 
     def _format_data(
         self, data: List[Dict[str, Any]], args: Namespace
-    ) -> List[Dict[str, Any]]:
-        """Format device data for export"""
-        export_data = []
-
-        for i, device in enumerate(data):
+    ) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+        """Format device data for export, yielding each row as it is ready"""
+
+        # With --fields, detail calls are made only for the columns that need them
+        fetch_details = getattr(args, "detailed", False)
+        if self.fields is not None:
+            fetch_details = any(column in self.fields for column in self.detail_columns)
+        download_files = self._needs_detail("device_file")
+        # The detail columns and the device file share one request per device
+        devices = self._iter_details(data, fetch=fetch_details or download_files)
+
+        for i, (device, detail) in enumerate(devices):
             print(
                 f"   Processing {self.device_type} device {i+1}/{len(data)}: {device.get('name', 'Unknown')}"
             )
@@ -70,30 +134,26 @@ class ExportDevices(ExportBase):
             )
 
             # Add detailed info if requested
-            if args.detailed and device.get("id"):
-                detailed_data = self._get_detailed_device_data(device["id"])
+            if fetch_details and device.get("id"):
+                detailed_data = self._get_detailed_device_data(
+                    self._unwrap_detail(detail)
+                )
                 if detailed_data:
                     device_data.update(detailed_data)
 
-            # Always create individual device JSON files for comprehensive export
-            if device.get("id"):
-                device_file = self._download_device_file(device)
+            # Create individual device JSON files for comprehensive export
+            if download_files and device.get("id"):
+                device_file = self._download_device_file(device, detail)
                 if device_file:
                     device_data["device_file"] = device_file
 
-            export_data.append(device_data)
-
-        return export_data
+            yield device.get("id"), device_data
 
-    def _download_device_file(self, device: Dict[str, Any]) -> str:
-        """Download individual device JSON file"""
+    def _download_device_file(
+        self, device: Dict[str, Any], detail_response: Optional[Dict[str, Any]]
+    ) -> str:
+        """Save individual device JSON file from its detail response"""
         try:
-            # Get detailed device info
-            device_id = device.get("id")
-            detail_response = self.auth.api_request(
-                "GET", f"{self.detail_endpoint}/id/{device_id}"
-            )
-
             if not detail_response:
                 return ""
 
@@ -155,9 +215,10 @@ class ExportDevices(ExportBase):
                 "device_file": "",  # Will be set below
             }
 
-    def _get_detailed_device_data(self, device_id: str) -> Dict[str, Any]:
+    def _get_detailed_device_data(
+        self, detail: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
         """Get detailed device information"""
-        detail = self._get_detailed_info(device_id, self.detail_endpoint)
         if not detail:
             return {}
 
@@ -4,7 +4,7 @@ Group Export Handler for jpapi CLI
 Handles export of computer groups and advanced searches
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from argparse import Namespace
 from .export_base import ExportBase
 from core.logging.command_mixin import log_operation, with_progress
@@ -40,11 +40,9 @@ class ExportComputerGroups(ExportBase):
 
     def _format_data(
         self, data: List[Dict[str, Any]], args: Namespace
-    ) -> List[Dict[str, Any]]:
-        """Format computer group data for export"""
-        export_data = []
-
-        for i, group in enumerate(data):
+    ) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+        """Format computer group data for export, yielding each row"""
+        for i, (group, detail) in enumerate(self._iter_details(data)):
             print(
                 f"   Processing group {i+1}/{len(data)}: {group.get('name', 'Unknown')}"
             )
@@ -56,28 +54,24 @@ class ExportComputerGroups(ExportBase):
 
             # Get detailed info for all groups to make CSV more useful
             if group.get("id"):
-                detailed_data = self._get_detailed_group_data(group["id"])
+                detailed_data = self._get_detailed_group_data(
+                    self._unwrap_detail(detail)
+                )
                 if detailed_data:
                     group_data.update(detailed_data)
 
                 # Always create individual group JSON files for comprehensive export
-                group_file = self._download_group_file(group)
+                group_file = self._download_group_file(group, detail)
                 if group_file:
                     group_data["group_file"] = group_file
 
-            export_data.append(group_data)
-
-        return export_data
+            yield group.get("id"), group_data
 
-    def _download_group_file(self, group: Dict[str, Any]) -> str:
-        """Download individual group JSON file"""
+    def _download_group_file(
+        self, group: Dict[str, Any], detail_response: Optional[Dict[str, Any]]
+    ) -> str:
+        """Save individual group JSON file from its detail response"""
         try:
-            # Get detailed group info
-            group_id = group.get("id")
-            detail_response = self.auth.api_request(
-                "GET", f"{self.detail_endpoint}/id/{group_id}"
-            )
-
             if not detail_response:
                 return ""
 
@@ -123,9 +117,10 @@ class ExportComputerGroups(ExportBase):
             "group_file": "",  # Will be set below
         }
 
-    def _get_detailed_group_data(self, group_id: str) -> Dict[str, Any]:
+    def _get_detailed_group_data(
+        self, detail: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
         """Get detailed group information"""
-        detail = self._get_detailed_info(group_id, self.detail_endpoint)
         if not detail:
             return {"Criteria Count": 0, "Computers": "", "Criteria": ""}
 
@@ -168,14 +163,13 @@ class ExportAdvancedSearches(ExportBase):
 
     def _format_data(
         self, data: List[Dict[str, Any]], args: Namespace
-    ) -> List[Dict[str, Any]]:
-        """Format advanced search data for export"""
+    ) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+        """Format advanced search data for export, yielding each row"""
         # Apply filters if specified
         filtered_data = self._apply_filters(data, args)
+        searches = self._iter_details(filtered_data, fetch=args.detailed)
 
-        export_data = []
-
-        for i, search in enumerate(filtered_data):
+        for i, (search, detail) in enumerate(searches):
             print(
                 f"   Processing search {i+1}/{len(filtered_data)}: {search.get('name', 'Unknown')}"
             )
@@ -185,13 +179,13 @@ class ExportAdvancedSearches(ExportBase):
 
             # Add detailed info if requested
             if args.detailed and search.get("id"):
-                detailed_data = self._get_detailed_search_data(search["id"])
+                detailed_data = self._get_detailed_search_data(
+                    self._unwrap_detail(detail)
+                )
                 if detailed_data:
                     search_data.update(detailed_data)
 
-            export_data.append(search_data)
-
-        return export_data
+            yield search.get("id"), search_data
 
     def _apply_filters(
         self, data: List[Dict[str, Any]], args: Namespace
@@ -231,9 +225,10 @@ class ExportAdvancedSearches(ExportBase):
             "delete": "",  # Empty column for manual deletion tracking
         }
 
-    def _get_detailed_search_data(self, search_id: str) -> Dict[str, Any]:
+    def _get_detailed_search_data(
+        self, detail: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
         """Get detailed search information"""
-        detail = self._get_detailed_info(search_id, self.detail_endpoint)
         if not detail:
             return {
                 "criteria": "",
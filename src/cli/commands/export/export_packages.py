@@ -4,12 +4,13 @@ Package Export Handler for jpapi CLI
 Handles export of JAMF packages using the v1 API endpoints
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from argparse import Namespace
 from .export_base import ExportBase
 import json
 from lib.utils import create_jamf_hyperlink
 from lib.exports.manage_exports import get_export_directory
+from core.http import fetch_all_pages
 from core.logging.command_mixin import log_operation
 
 
@@ -26,40 +27,27 @@ class ExportPackages(ExportBase):
     @log_operation("Package Data Fetch")
     def _fetch_data(self, args: Namespace) -> List[Dict[str, Any]]:
         """Fetch package data from JAMF API with pagination"""
-        all_packages = []
-        page = 0
-        page_size = 100
-
         self.log_info("Starting package data fetch from JAMF API")
 
-        while True:
-            url = f"{self.endpoint}?page={page}&page-size={page_size}&sort=id"
-            self.log_info(f"Fetching page {page + 1}...")
-
-            try:
-                response = self.auth.api_request("GET", url)
-                if "results" in response:
-                    packages = response["results"]
-                    if not packages:
-                        self.log_info("No more packages found, pagination complete")
-                        break
-
-                    all_packages.extend(packages)
-                    self.log_success(
-                        f"Found {len(packages)} packages on page {page + 1} "
-                        f"(Total: {len(all_packages)})"
-                    )
+        def log_page(
+            page: int, packages: List[Dict[str, Any]], total: Optional[int]
+        ) -> None:
+            if total is None:
+                self.log_success(f"Found {len(packages)} packages on page {page + 1}")
+            else:
+                self.log_success(
+                    f"Found {len(packages)} packages on page {page + 1} "
+                    f"(Total available: {total})"
+                )
 
-                    if len(packages) < page_size:
-                        self.log_info("Last page reached")
-                        break
-                    page += 1
-                else:
-                    self.log_warning("No results in response, stopping pagination")
-                    break
-            except Exception as e:
-                self.log_error(f"Error fetching page {page + 1}", e)
-                break
+        try:
+            # Pages after the first are fetched concurrently once totalCount is known
+            all_packages = fetch_all_pages(self.auth, self.endpoint, on_page=log_page)
+        except Exception as e:
+            # Transient errors were already retried by the API client;
+            # returning what we have would silently export a partial list
+            self.log_error("Error fetching packages", e)
+            raise
 
         self.log_success(
             f"Package fetch complete: {len(all_packages)} total packages retrieved"
@@ -95,9 +83,9 @@ class ExportPackages(ExportBase):
 
     def _format_data(
         self, data: List[Dict[str, Any]], args: Namespace
-    ) -> List[Dict[str, Any]]:
-        """Format package data for export"""
-        export_data = []
+    ) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+        """Format package data for export, yielding each row as it is ready"""
+        exported = 0
         downloaded_files = []
 
         self.log_info(f"Starting data formatting for {len(data)} packages")
@@ -122,9 +110,16 @@ class ExportPackages(ExportBase):
                     f"Filtered by name from {original_count} to {len(data)} packages"
                 )
 
+        # Pro API detail paths have no /id/ segment
+        packages = self._iter_details(
+            data,
+            f"{self.detail_endpoint}/{{id}}",
+            fetch=getattr(args, "detailed", False),
+        )
+
         # Use progress tracker for package processing
         with self.progress_tracker(len(data), "Processing packages") as tracker:
-            for i, package in enumerate(data):
+            for i, (package, detailed_package) in enumerate(packages):
                 # Get package name for progress display
                 package_name = (
                     package.get("packageName")
@@ -133,21 +128,6 @@ class ExportPackages(ExportBase):
                 )
                 self.log_progress(i + 1, len(data), package_name, "Processing package")
 
-                # Get detailed package info if requested
-                detailed_package = None
-                if getattr(args, "detailed", False) and package.get("id"):
-                    try:
-                        tracker.update(
-                            description=f"Fetching details for: {package_name}"
-                        )
-                        detailed_package = self._get_detailed_package_info(
-                            package["id"]
-                        )
-                    except Exception as e:
-                        self.log_error(
-                            f"Could not get details for package {package.get('id')}", e
-                        )
-
                 # Extract basic package data
                 package_data = self._extract_basic_package_data(
                     package, detailed_package, getattr(args, "env", "sandbox")
@@ -177,31 +157,20 @@ class ExportPackages(ExportBase):
                                 package_files.get("downloaded_files", [])
                             )
 
-                export_data.append(package_data)
+                exported += 1
                 self.log_info(
-                    f"Added package {package_name} to export data (total: {len(export_data)})"
+                    f"Added package {package_name} to export data (total: {exported})"
                 )
                 tracker.update()
+                yield package.get("id"), package_data
 
         # Store downloaded files for summary
         if downloaded_files:
             self._downloaded_files = downloaded_files
 
         self.log_success(
-            f"Data formatting complete: {len(export_data)} packages processed"
+            f"Data formatting complete: {exported} packages processed"
         )
-        return export_data
-
-    def _get_detailed_package_info(self, package_id: str) -> Optional[Dict[str, Any]]:
-        """Get detailed package information"""
-        try:
-            response = self.auth.api_request(
-                "GET", f"{self.detail_endpoint}/{package_id}"
-            )
-            return response
-        except Exception as e:
-            self.log_error(f"Could not get detailed info for package {package_id}", e)
-            return None
 
     def _extract_basic_package_data(
         self,
@@ -4,18 +4,44 @@ Policy Export Handler for jpapi CLI
 Handles export of JAMF policies
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from argparse import Namespace
 from .export_base import ExportBase
 import json
 from lib.utils import create_jamf_hyperlink
 from lib.exports.manage_exports import get_export_directory
+from core.http import fetch_all_pages
 from core.logging.command_mixin import log_operation, with_progress
+from lib.utils.field_projection import DETAIL, SUMMARY, FieldCatalog
 
 
 class ExportPolicies(ExportBase):
     """Handler for exporting JAMF policies"""
 
+    # Columns answered by the policy list (the Jamf Pro API entries carry
+    # enabled, frequency and category) versus the Classic detail record
+    FIELD_COLUMNS = FieldCatalog(
+        {
+            "delete": SUMMARY,
+            "ID": SUMMARY,
+            "Name": SUMMARY,
+            "Description": DETAIL,
+            "Status": SUMMARY,
+            "Enabled": SUMMARY,
+            "Category": SUMMARY,
+            "Category Description": SUMMARY,
+            "Frequency": SUMMARY,
+            "Trigger": DETAIL,
+            "Event_Trigger": DETAIL,
+            "Script_Name": DETAIL,
+            "Script_Parameters": DETAIL,
+            "Script_Priority": DETAIL,
+            "Created_Date": DETAIL,
+            "Modified_Date": DETAIL,
+            "policy_file": DETAIL,
+        }
+    )
+
     def __init__(self, auth):
         super().__init__(auth, "policies")
         self.endpoint = "/api/v1/policies"
@@ -26,40 +52,27 @@ class ExportPolicies(ExportBase):
     @log_operation("Policy Data Fetch")
     def _fetch_data(self, args: Namespace) -> List[Dict[str, Any]]:
         """Fetch policy data from JAMF API with pagination"""
-        all_policies = []
-        page = 0
-        page_size = 100
-
         self.log_info("Starting policy data fetch from JAMF API")
 
-        while True:
-            url = f"{self.endpoint}?page={page}&page-size={page_size}&sort=id"
-            self.log_info(f"Fetching page {page + 1}...")
-
-            try:
-                response = self.auth.api_request("GET", url)
-                if "results" in response:
-                    policies = response["results"]
-                    if not policies:
-                        self.log_info("No more policies found, pagination complete")
-                        break
-
-                    all_policies.extend(policies)
-                    self.log_success(
-                        f"Found {len(policies)} policies on page {page + 1} "
-                        f"(Total: {len(all_policies)})"
-                    )
+        def log_page(
+            page: int, policies: List[Dict[str, Any]], total: Optional[int]
+        ) -> None:
+            if total is None:
+                self.log_success(f"Found {len(policies)} policies on page {page + 1}")
+            else:
+                self.log_success(
+                    f"Found {len(policies)} policies on page {page + 1} "
+                    f"(Total available: {total})"
+                )
 
-                    if len(policies) < page_size:
-                        self.log_info("Last page reached")
-                        break
-                    page += 1
-                else:
-                    self.log_warning("No results in response, stopping pagination")
-                    break
-            except Exception as e:
-                self.log_error(f"Error fetching page {page + 1}", e)
-                break
+        try:
+            # Pages after the first are fetched concurrently once totalCount is known
+            all_policies = fetch_all_pages(self.auth, self.endpoint, on_page=log_page)
+        except Exception as e:
+            # Transient errors were already retried by the API client;
+            # returning what we have would silently export a partial list
+            self.log_error("Error fetching policies", e)
+            raise
 
         self.log_success(
             f"Policy fetch complete: {len(all_policies)} total policies retrieved"
@@ -112,9 +125,9 @@ class ExportPolicies(ExportBase):
 
     def _format_data(
         self, data: List[Dict[str, Any]], args: Namespace
-    ) -> List[Dict[str, Any]]:
-        """Format policy data for export"""
-        export_data = []
+    ) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+        """Format policy data for export, yielding each row as it is ready"""
+        exported = 0
         downloaded_files = []
 
         self.log_info(f"Starting data formatting for {len(data)} policies")
@@ -139,30 +152,24 @@ class ExportPolicies(ExportBase):
                     f"Filtered by name from {original_count} to {len(data)} policies"
                 )
 
+        # With --fields covering list columns only, no detail calls are made
+        fetch_details = self._needs_detail()
+        policies = self._iter_details(data, fetch=fetch_details)
+
         # Use progress tracker for policy processing
         with self.progress_tracker(len(data), "Processing policies") as tracker:
-            for i, policy in enumerate(data):
+            for i, (policy, detail) in enumerate(policies):
                 policy_name = policy.get("name", "Unknown")
                 self.log_progress(i + 1, len(data), policy_name, "Processing policy")
 
                 # Get detailed policy info to check enabled status
-                enabled = False
-                detail_policy = None
-                try:
-                    tracker.update(description=f"Fetching details for: {policy_name}")
-                    detail_response = self.auth.api_request(
-                        "GET", f'{self.detail_endpoint}/id/{policy.get("id")}'
-                    )
-                    if "policy" in detail_response:
-                        detail_policy = detail_response["policy"]
-                        enabled = detail_policy.get("general", {}).get("enabled", False)
-                        # Handle both boolean and string values
-                        if isinstance(enabled, str):
-                            enabled = enabled.lower() in ["true", "1", "yes", "enabled"]
-                except Exception as e:
-                    self.log_error(
-                        f"Could not get details for policy {policy.get('id')}", e
-                    )
+                enabled = False if fetch_details else policy.get("enabled", False)
+                detail_policy = (detail or {}).get("policy")
+                if detail_policy:
+                    enabled = detail_policy.get("general", {}).get("enabled", False)
+                # Handle both boolean and string values
+                if isinstance(enabled, str):
+                    enabled = enabled.lower() in ["true", "1", "yes", "enabled"]
 
                 status = "Enabled" if enabled else "Disabled"
 
@@ -253,17 +260,17 @@ class ExportPolicies(ExportBase):
                         downloaded_files.append(policy_file)
                         self.log_success(f"Downloaded: {policy_name} → {policy_file}")
 
-                export_data.append(policy_data)
+                exported += 1
                 tracker.update()
+                yield policy.get("id"), policy_data
 
         # Store downloaded files for summary
         if downloaded_files:
             self._downloaded_files = downloaded_files
 
         self.log_success(
-            f"Data formatting complete: {len(export_data)} policies processed"
+            f"Data formatting complete: {exported} policies processed"
         )
-        return export_data
 
     def _extract_script_info(self, detail_policy: Dict[str, Any]) -> Dict[str, str]:
         """Extract script information from policy details"""
@@ -4,7 +4,7 @@ Profile Export Handler for jpapi CLI
 Handles export of macOS and iOS configuration profiles
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from argparse import Namespace
 from .export_base import ExportBase
 from core.logging.command_mixin import log_operation
@@ -52,9 +52,8 @@ class ExportProfiles(ExportBase):
 
     def _format_data(
         self, data: List[Dict[str, Any]], args: Namespace
-    ) -> List[Dict[str, Any]]:
-        """Format profile data for export"""
-        export_data = []
+    ) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+        """Format profile data for export, yielding each row as it is ready"""
         downloaded_files = []
 
         # Apply filtering if specified (before detailed processing)
@@ -77,7 +76,8 @@ class ExportProfiles(ExportBase):
                     f"🔍 Filtered by name from {original_count} to {len(data)} {self.profile_type} profiles"
                 )
 
-        for i, profile in enumerate(data):
+        # Every profile is exported in detail
+        for i, (profile, detail) in enumerate(self._iter_details(data)):
             print(
                 f"   Processing {self.profile_type} profile {i+1}/{len(data)}: {profile.get('name', 'Unknown')}"
             )
@@ -88,26 +88,26 @@ class ExportProfiles(ExportBase):
             )
 
             # Always add detailed info for config profiles (comprehensive analysis)
-            if profile.get("id"):
-                detailed_data = self._get_detailed_profile_data(profile["id"])
+            if detail:
+                detailed_data = self._get_detailed_profile_data(
+                    self._unwrap_detail(detail)
+                )
                 if detailed_data:
                     profile_data.update(detailed_data)
 
             # Always create individual profile JSON files for comprehensive export
-            if profile.get("id"):
-                profile_file = self._download_profile_file(profile)
+            if detail:
+                profile_file = self._download_profile_file(profile, detail)
                 if profile_file:
                     profile_data["profile_file"] = profile_file
                     downloaded_files.append(profile_file)
 
-            export_data.append(profile_data)
+            yield profile.get("id"), profile_data
 
         # Store downloaded files for summary
         if downloaded_files:
             self._downloaded_files = downloaded_files
 
-        return export_data
-
     def _get_category_details(self, category_id: Optional[Any]) -> Dict[str, Any]:
         """Get category details from API with caching"""
         if not category_id:
@@ -209,9 +209,10 @@ class ExportProfiles(ExportBase):
             "Has Full Disk Access": "",
         }
 
-    def _get_detailed_profile_data(self, profile_id: str) -> Dict[str, Any]:
+    def _get_detailed_profile_data(
+        self, detail: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
         """Get comprehensive detailed profile information from actual JSON data"""
-        detail = self._get_detailed_info(profile_id, self.detail_endpoint)
         if not detail:
             return {}
 
@@ -419,14 +420,11 @@ class ExportProfiles(ExportBase):
 
         return specific_data
 
-    def _download_profile_file(self, profile: Dict[str, Any]) -> str:
-        """Download individual profile file as JSON"""
+    def _download_profile_file(
+        self, profile: Dict[str, Any], detail_response: Dict[str, Any]
+    ) -> str:
+        """Save an individual profile file as JSON from its detail response"""
         try:
-            # Get detailed profile info
-            detail_response = self.auth.api_request(
-                "GET", f'{self.detail_endpoint}/id/{profile.get("id")}'
-            )
-
             if self.item_key in detail_response:
                 detail_profile = detail_response[self.item_key]
 
@@ -4,7 +4,7 @@ Script Export Handler for jpapi CLI
 Handles export and download of JAMF scripts
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from argparse import Namespace
 from .export_base import ExportBase
 from core.logging.command_mixin import log_operation, with_progress
@@ -93,19 +93,20 @@ class ExportScripts(ExportBase):
 
     def _format_data(
         self, data: List[Dict[str, Any]], args: Namespace
-    ) -> List[Dict[str, Any]]:
-        """Format script data for export"""
+    ) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+        """Format script data for export, yielding each row as it is ready"""
         self.log_info(f"Formatting {len(data)} scripts for export")
 
         # Apply filters if specified
         filtered_data = self._apply_filters(data, args)
         self.log_info(f"After filtering: {len(filtered_data)} scripts")
 
-        export_data = []
         downloaded_files = []
+        # One detail request per script serves both the content and the file
+        scripts = self._iter_details(filtered_data)
 
         with self.progress_tracker(len(filtered_data), "Processing scripts") as tracker:
-            for i, script in enumerate(filtered_data):
+            for i, (script, detail) in enumerate(scripts):
                 script_name = script.get("name", "Unknown")
                 self.log_progress(
                     i + 1, len(filtered_data), script_name, "Processing script"
@@ -118,28 +119,25 @@ class ExportScripts(ExportBase):
                 # Include script content if requested
                 if getattr(args, "include_content", False):
                     tracker.update(description=f"Fetching content for: {script_name}")
-                    detailed_data = self._get_detailed_script_data(script)
+                    detailed_data = self._get_detailed_script_data(detail)
                     if detailed_data:
                         script_data.update(detailed_data)
 
-                export_data.append(script_data)
-
                 # Always create individual script files for comprehensive export
                 tracker.update(description=f"Downloading: {script_name}")
-                script_file = self._download_script_file(script)
+                script_file = self._download_script_file(script, detail)
                 if script_file:
                     script_data["script_file"] = script_file
                     downloaded_files.append(script_file)
                     self.log_success(f"Downloaded: {script_name} → {script_file}")
 
                 tracker.update()
+                yield script.get("id"), script_data
 
         # Store downloaded files for summary
         if downloaded_files:
             self._downloaded_files = downloaded_files
 
-        return export_data
-
     def _apply_filters(
         self, data: List[Dict[str, Any]], args: Namespace
     ) -> List[Dict[str, Any]]:
@@ -196,37 +194,29 @@ class ExportScripts(ExportBase):
             "script_file": "",  # Will be set below
         }
 
-    def _get_detailed_script_data(self, script: Dict[str, Any]) -> Dict[str, Any]:
+    def _get_detailed_script_data(
+        self, detail_response: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
         """Get detailed script information including content"""
-        try:
-            detail_response = self.auth.api_request(
-                "GET", f'{self.detail_endpoint}/id/{script.get("id")}'
-            )
-            if "script" in detail_response:
-                detail_script = detail_response["script"]
-                return {
-                    "category": detail_script.get("category", ""),
-                    "priority": detail_script.get("priority", ""),
-                    "info": detail_script.get("info", ""),
-                    "parameters": detail_script.get("parameter4", ""),
-                    "os_requirements": detail_script.get("os_requirements", ""),
-                    "filename": detail_script.get("filename", ""),
-                }
-        except Exception as e:
-            print(
-                f"   ⚠️ Could not fetch detailed content for {script.get('name', '')}: {e}"
-            )
+        if detail_response and "script" in detail_response:
+            detail_script = detail_response["script"]
+            return {
+                "category": detail_script.get("category", ""),
+                "priority": detail_script.get("priority", ""),
+                "info": detail_script.get("info", ""),
+                "parameters": detail_script.get("parameter4", ""),
+                "os_requirements": detail_script.get("os_requirements", ""),
+                "filename": detail_script.get("filename", ""),
+            }
 
         return {}
 
-    def _download_script_file(self, script: Dict[str, Any]) -> str:
-        """Download individual script file"""
+    def _download_script_file(
+        self, script: Dict[str, Any], detail_response: Optional[Dict[str, Any]]
+    ) -> str:
+        """Save individual script file from its detail response"""
         try:
-            # Get detailed script info for content
-            detail_response = self.auth.api_request(
-                "GET", f'{self.detail_endpoint}/id/{script.get("id")}'
-            )
-            if "script" in detail_response:
+            if detail_response and "script" in detail_response:
                 detail_script = detail_response["script"]
                 script_content = detail_script.get("script_contents", "")
 
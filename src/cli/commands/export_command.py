@@ -82,6 +82,7 @@ class ExportCommand(BaseCommand):
         # Set auth using protected attribute
         self._list_command._auth = self._auth
         self._list_command.environment = self.environment
+        self._list_command.http_client = self.http_client
 
         # Delegate to list command
         return self._list_command.execute(args)
@@ -14,7 +14,8 @@ from .common_imports import (
     BaseCommand,
 )
 from core.logging.command_mixin import log_operation
-from lib.utils import create_filter
+from lib.utils import create_filter, select_output_fields
+from lib.utils.fan_out import collecting
 from cli.base.validators import InputValidators
 from cli.base.error_handler import APIErrorHandler, ErrorContext
 from resources.config.api_endpoints import APIRegistry
@@ -171,6 +172,35 @@ class ListCommand(BaseCommand):
             action="store_true",
             help="Export mode: save to file with instance prefix",
         )
+        parser.add_argument(
+            "--detail-concurrency",
+            type=int,
+            metavar="N",
+            help="Detail requests in flight at once when exporting "
+            "(default: connection pool size)",
+        )
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Fetch details only for objects that are new or changed since "
+            "earlier exports and reuse the saved details of the rest. Classic "
+            "API list entries carry only ID and name, so other edits to those "
+            "objects show up once their saved details expire",
+        )
+        parser.add_argument(
+            "--max-detail-age",
+            type=float,
+            metavar="HOURS",
+            help="With --incremental, fetch saved details older than HOURS "
+            "again (default: 24 for Classic API types, 168 otherwise)",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Journal the export's finished rows so a failed or interrupted "
+            "run can be continued; rerunning with --resume reuses them and "
+            "exports only the remaining objects",
+        )
         parser.add_argument(
             "--analysis",
             "-a",
@@ -346,8 +376,9 @@ class ListCommand(BaseCommand):
 
             # Format and output
             self.log_info("Formatting data for display")
-            formatted_data = self._format_objects_for_display(
-                objects, args, object_type
+            formatted_data = select_output_fields(
+                self._format_objects_for_display(objects, args, object_type),
+                self.resolve_fields(args),
             )
 
             self.log_info("Generating output")
@@ -358,10 +389,12 @@ class ListCommand(BaseCommand):
             if is_export_mode and output_format == "table":
                 output_format = "csv"
 
-            output = self.format_output(formatted_data, output_format)
-
             # Handle export mode - save to file with instance prefix
-            if getattr(args, "export_mode", False) and args.output is None:
+            if (
+                getattr(args, "export_mode", False)
+                and args.output is None
+                and not collecting()
+            ):
                 from lib.exports.manage_exports import (
                     generate_export_filename,
                     get_export_directory,
@@ -373,12 +406,12 @@ class ListCommand(BaseCommand):
                 export_dir = get_export_directory(self.environment)
                 export_dir.mkdir(parents=True, exist_ok=True)
                 output_path = export_dir / filename
-                self.save_output(output, str(output_path))
+                self.save_rows(formatted_data, output_format, str(output_path))
                 self.log_success(
                     f"Exported {len(objects)} {object_type} to {output_path}"
                 )
             else:
-                self.save_output(output, args.output)
+                self.save_rows(formatted_data, output_format, args.output)
 
             return 0
 
@@ -639,8 +672,7 @@ class ListCommand(BaseCommand):
 
             # Format and output
             formatted_data = self._format_user_groups_for_display(filtered_groups, args)
-            output = self.format_output(formatted_data, args.format)
-            self.save_output(output, args.output)
+            self.save_rows(formatted_data, args.format, args.output)
 
             self.log_success(f"Found {len(filtered_groups)} {group_type} user groups")
             return 0
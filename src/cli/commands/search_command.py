@@ -16,6 +16,12 @@ import re
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from base.command import BaseCommand
+from lib.managers.computer_search_manager import (
+    INVENTORY_COLUMNS,
+    ComputerSearchManager,
+    endpoint_unsupported,
+)
+from lib.utils.field_projection import select_output_fields
 
 class SearchCommand(BaseCommand):
     """Advanced search operations with criteria-based filtering"""
@@ -253,6 +259,7 @@ class SearchCommand(BaseCommand):
         mock_args.os_version = criteria.get('os_version')
         mock_args.format = getattr(args, 'format', 'table')
         mock_args.output = getattr(args, 'output', None)
+        mock_args.fields = getattr(args, 'fields', None)
         
         return self._search_computers_by_criteria(mock_args)
     
@@ -271,6 +278,7 @@ class SearchCommand(BaseCommand):
         mock_args.os_version = criteria.get('os_version')
         mock_args.format = getattr(args, 'format', 'table')
         mock_args.output = getattr(args, 'output', None)
+        mock_args.fields = getattr(args, 'fields', None)
         
         return self._search_mobile_by_criteria(mock_args)
     
@@ -355,32 +363,23 @@ class SearchCommand(BaseCommand):
         try:
             print("🔍 Searching Computers by Criteria...")
             
-            # Get all computers first
-            response = self.auth.api_request('GET', '/JSSResource/computers')
-            
-            if 'computers' not in response or 'computer' not in response['computers']:
-                print("❌ No computers found")
-                return 1
-            
-            computers = response['computers']['computer']
-            filtered_computers = []
-            
-            # Apply filters
-            for computer in computers:
-                if self._matches_computer_criteria(computer, args):
-                    # Get detailed info if we have specific criteria
-                    if any([args.department, args.building, args.managed]):
-                        try:
-                            detail_response = self.auth.api_request('GET', f'/JSSResource/computers/id/{computer["id"]}')
-                            if 'computer' in detail_response:
-                                computer_detail = detail_response['computer']
-                                if self._matches_detailed_computer_criteria(computer_detail, args):
-                                    filtered_computers.append(self._format_computer_result(computer_detail, detailed=True))
-                        except Exception:
-                            # Fall back to basic info if detailed fetch fails
-                            filtered_computers.append(self._format_computer_result(computer, detailed=False))
-                    else:
-                        filtered_computers.append(self._format_computer_result(computer, detailed=False))
+            fields = self.resolve_fields(args, INVENTORY_COLUMNS)
+            
+            # Filter server-side through the Jamf Pro API when it is available
+            try:
+                filtered_computers = ComputerSearchManager(self.auth).search(
+                    self._computer_criteria(args), fields
+                )
+            except Exception as e:
+                # Breaker, budget and other errors are not retried per computer
+                if not endpoint_unsupported(e):
+                    raise
+                print(f"⚠️  Jamf Pro API search unavailable ({e}), using Classic API")
+                filtered_computers = self._search_computers_classic(args)
+                if filtered_computers is None:
+                    print("❌ No computers found")
+                    return 1
+                filtered_computers = select_output_fields(filtered_computers, fields)
             
             if not filtered_computers:
                 print("❌ No computers match the specified criteria")
@@ -396,6 +395,42 @@ class SearchCommand(BaseCommand):
         except Exception as e:
             return self.handle_api_error(e)
     
+    def _computer_criteria(self, args: Namespace) -> Dict[str, Any]:
+        """Computer search criteria given on the command line"""
+        keys = ('name', 'model', 'os_version', 'department', 'building', 'managed')
+        return {key: getattr(args, key, None) for key in keys}
+    
+    def _search_computers_classic(self, args: Namespace) -> Optional[List[Dict[str, Any]]]:
+        """Search computers over the Classic API (one detail call per candidate)"""
+        response = self.auth.api_request('GET', '/JSSResource/computers')
+        
+        computers = response.get('computers')
+        if isinstance(computers, dict):
+            computers = computers.get('computer')
+        if not computers:
+            return None
+        
+        filtered_computers = []
+        
+        # Apply filters
+        for computer in computers:
+            if self._matches_computer_criteria(computer, args):
+                # Get detailed info if we have specific criteria
+                if any([args.department, args.building, args.managed]):
+                    try:
+                        detail_response = self.auth.api_request('GET', f'/JSSResource/computers/id/{computer["id"]}')
+                        if 'computer' in detail_response:
+                            computer_detail = detail_response['computer']
+                            if self._matches_detailed_computer_criteria(computer_detail, args):
+                                filtered_computers.append(self._format_computer_result(computer_detail, detailed=True))
+                    except Exception:
+                        # Fall back to basic info if detailed fetch fails
+                        filtered_computers.append(self._format_computer_result(computer, detailed=False))
+                else:
+                    filtered_computers.append(self._format_computer_result(computer, detailed=False))
+        
+        return filtered_computers
+    
     def _search_computers_by_query(self, args: Namespace) -> int:
         """Search computers using query syntax"""
         try:
@@ -405,13 +440,15 @@ class SearchCommand(BaseCommand):
             criteria = self._parse_query_string(args.query_string)
             
             # Convert to criteria format and search
-            mock_args = Namespace()
+            mock_args = Namespace(name=None, model=None, os_version=None,
+                                  department=None, building=None, managed=None)
             for key, value in criteria.items():
                 setattr(mock_args, key.replace('-', '_'), value)
             
             # Copy format and output settings
             mock_args.format = args.format
             mock_args.output = args.output
+            mock_args.fields = getattr(args, 'fields', None)
             
             return self._search_computers_by_criteria(mock_args)
             
@@ -470,6 +507,9 @@ class SearchCommand(BaseCommand):
                 return 1
             
             # Output results
+            filtered_devices = select_output_fields(
+                filtered_devices, self.resolve_fields(args)
+            )
             output = self.format_output(filtered_devices, args.format)
             self.save_output(output, args.output)
             
@@ -495,6 +535,7 @@ class SearchCommand(BaseCommand):
             # Copy format and output settings
             mock_args.format = args.format
             mock_args.output = args.output
+            mock_args.fields = getattr(args, 'fields', None)
             
             return self._search_mobile_by_criteria(mock_args)
             
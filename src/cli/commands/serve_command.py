@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Serve Command for jpapi CLI
+Runs the warm daemon that later jpapi invocations are forwarded to
+"""
+import os
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+
+from cli.base.command import BaseCommand
+from cli.daemon import SOCKET_ENV, JPAPIDaemon, default_socket_path, send_control
+
+
+class ServeCommand(BaseCommand):
+    """🔥 Warm daemon holding auth sessions, connections and caches"""
+
+    def __init__(self):
+        super().__init__(
+            name="serve",
+            description="🔥 Run a warm daemon that jpapi commands are forwarded to",
+        )
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        """Add serve command arguments"""
+        parser.add_argument(
+            "--socket",
+            metavar="PATH",
+            help=f"Socket to listen on (default: ${SOCKET_ENV} or "
+            "~/.jpapi/run/jpapi.sock; clients find it through the same setting)",
+        )
+        parser.add_argument(
+            "--idle-timeout",
+            type=float,
+            metavar="SECONDS",
+            help="Exit after SECONDS without a command",
+        )
+        control = parser.add_mutually_exclusive_group()
+        control.add_argument(
+            "--status", action="store_true", help="Show whether a daemon is running"
+        )
+        control.add_argument(
+            "--stop", action="store_true", help="Stop the running daemon"
+        )
+
+    def execute(self, args: Namespace) -> int:
+        """Start, query or stop the daemon (no authentication needed)"""
+        socket_path = (
+            Path(args.socket).expanduser() if args.socket else default_socket_path()
+        )
+
+        if args.status or args.stop:
+            reply = send_control("stop" if args.stop else "ping", socket_path)
+            if reply is None:
+                print(f"💤 No jpapi daemon running on {socket_path}")
+                return 1 if args.status else 0
+            action = "Stopping" if args.stop else "Running"
+            print(
+                f"🔥 {action} jpapi daemon (pid {reply.get('pid')}, "
+                f"{reply.get('commands', 0)} commands served) on {socket_path}"
+            )
+            return 0
+
+        # Imported here: the CLI application imports this module
+        from cli.app import JPAPIDevCLI
+        from core.auth.auth_session import reset_auth_sessions
+        from resources.config.central_config import central_config
+
+        daemon = JPAPIDaemon(
+            JPAPIDevCLI().run,
+            socket_path,
+            args.idle_timeout,
+            reset_sessions=reset_auth_sessions,
+            config_files=sorted(central_config.config_dir.glob("*.json")),
+        )
+        try:
+            daemon.bind()
+        except (RuntimeError, OSError) as e:
+            print(f"❌ {e}")
+            return 1
+
+        print(f"🔥 jpapi daemon listening on {socket_path} (pid {os.getpid()})")
+        print("   list/export/search/info now run here; stop with: jpapi serve --stop")
+        print("   Commands that can prompt, or other JPAPI_* settings, run locally")
+        print("   After jpapi setup the daemon reloads credentials on next use")
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        print(f"👋 jpapi daemon stopped after {daemon.commands_run} commands")
+        return 0
@@ -16,6 +16,7 @@ import json
 # Using proper package structure via pip install -e .
 
 from base.command import BaseCommand
+from core.http import get_http_client
 
 
 class ToolsCommand(BaseCommand):
@@ -466,6 +467,29 @@ class ToolsCommand(BaseCommand):
                         }
                     )
 
+            # Report circuit breaker state for each Jamf host contacted
+            for host, circuit in get_http_client().get_circuit_status().items():
+                if circuit["state"] == "closed":
+                    status = "✅ OK"
+                    details = f"Closed ({circuit['consecutive_failures']} recent failures)"
+                elif circuit["state"] == "half_open":
+                    status = "⚠️  PROBING"
+                    details = "Half-open, probing for recovery"
+                else:
+                    status = "❌ FAIL"
+                    details = (
+                        f"Open after {circuit['trips']} trip(s), retry in "
+                        f"{circuit['retry_in_seconds']}s: {circuit['last_error']}"
+                    )
+                health_data.append(
+                    {
+                        "Endpoint": f"Circuit Breaker ({host})",
+                        "Status": status,
+                        "Response Time": "N/A",
+                        "Details": details,
+                    }
+                )
+
             # Output results
             output = self.format_output(health_data, args.format)
             self.save_output(output, args.output)
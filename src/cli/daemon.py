@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+Warm daemon for jpapi
+`jpapi serve` keeps one process alive with commands imported, config
+loaded, auth sessions, connection pools and caches warm; the jpapi entry
+point forwards read-only command lines to it over a Unix domain socket
+and streams the output back. Only the standard library is imported here, so the client
+side stays cheap.
+"""
+
+import contextlib
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import traceback
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+SOCKET_ENV = "JPAPI_SOCKET"
+NO_DAEMON_ENV = "JPAPI_NO_DAEMON"
+CONNECT_TIMEOUT = 0.5
+
+# Read-only commands (and aliases) that never prompt. Only these are
+# forwarded: a forwarded command has no terminal to read answers from, so
+# setup, delete, production confirmations etc. always run in-process.
+FORWARDED_COMMANDS = frozenset(
+    {
+        "list",
+        "ls",
+        "show",
+        "export",
+        "dump",
+        "export-data",
+        "export-cmd",
+        "search",
+        "find",
+        "query",
+        "info",
+        "help",
+        "about",
+    }
+)
+
+# Commands (and aliases) that can store or clear credentials. They run
+# in-process, so afterwards a running daemon is told to drop the
+# credentials and tokens it holds in memory.
+CREDENTIAL_COMMANDS = frozenset({"setup", "configure", "config", "init"})
+
+
+def default_socket_path() -> Path:
+    """Daemon socket: $JPAPI_SOCKET or ~/.jpapi/run/jpapi.sock"""
+    configured = os.environ.get(SOCKET_ENV)
+    if configured:
+        return Path(configured).expanduser()
+    return Path.home() / ".jpapi" / "run" / "jpapi.sock"
+
+
+def command_environment(environ: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """JPAPI_* settings a command runs with (the daemon socket ones aside)"""
+    environ = os.environ if environ is None else environ
+    return {
+        name: value
+        for name, value in environ.items()
+        if name.startswith("JPAPI_") and name not in (SOCKET_ENV, NO_DAEMON_ENV)
+    }
+
+
+def _send(sock: socket.socket, message: Dict[str, Any]) -> None:
+    sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+
+def _connect(path: Path) -> Optional[socket.socket]:
+    """Connect to a listening daemon (None when there is none)"""
+    if not hasattr(socket, "AF_UNIX") or not path.exists():
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CONNECT_TIMEOUT)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        sock.close()
+        return None
+    sock.settimeout(None)
+    return sock
+
+
+def send_control(action: str, socket_path: Optional[Path] = None) -> Optional[Dict]:
+    """
+    Send a control request ("ping", "stop" or "reset") to the daemon
+
+    Returns:
+        The daemon's reply, or None when no daemon is listening
+    """
+    sock = _connect(socket_path or default_socket_path())
+    if sock is None:
+        return None
+    try:
+        with sock:
+            _send(sock, {"control": action})
+            line = sock.makefile("rb").readline()
+        return json.loads(line) if line else None
+    except (OSError, ValueError):
+        # Daemon shut down while we were connecting
+        return None
+
+
+def forward_to_daemon(
+    argv: List[str], socket_path: Optional[Path] = None
+) -> Optional[int]:
+    """
+    Run a jpapi command in the daemon, streaming its output to this process
+
+    Args:
+        argv: Command line arguments (without the program name)
+        socket_path: Daemon socket (default_socket_path() when None)
+
+    Returns:
+        The command's exit code, or None when the command should run
+        in-process: no daemon is listening, JPAPI_NO_DAEMON is set, the
+        command is not in FORWARDED_COMMANDS (it may prompt), this
+        shell's JPAPI_* settings differ from the daemon's, or the config
+        changed since the daemon started
+    """
+    if os.environ.get(NO_DAEMON_ENV) or not argv or argv[0] not in FORWARDED_COMMANDS:
+        return None
+    sock = _connect(socket_path or default_socket_path())
+    if sock is None:
+        return None
+
+    streams = {"stdout": sys.stdout, "stderr": sys.stderr}
+    try:
+        with sock:
+            _send(
+                sock,
+                {"argv": list(argv), "cwd": os.getcwd(), "env": command_environment()},
+            )
+            for line in sock.makefile("rb"):
+                message = json.loads(line)
+                if message.get("run_locally"):
+                    return None
+                if "exit" in message:
+                    return int(message["exit"])
+                for name, stream in streams.items():
+                    if name in message:
+                        stream.write(message[name])
+                        stream.flush()
+    except KeyboardInterrupt:
+        print("\n❌ Operation cancelled by user")
+        return 1
+    except (OSError, ValueError) as e:
+        print(f"❌ Lost connection to jpapi daemon: {e}", file=sys.stderr)
+        return 1
+    print("❌ jpapi daemon closed the connection", file=sys.stderr)
+    return 1
+
+
+def notify_daemon(argv: List[str], socket_path: Optional[Path] = None) -> None:
+    """
+    Tell a running daemon about a command that ran in-process
+
+    After a command that can change credentials (setup, logout) the daemon
+    drops its auth sessions, so forwarded commands load the new credentials
+    instead of the ones it held in memory.
+    """
+    if not argv or argv[0] not in CREDENTIAL_COMMANDS:
+        return
+    sock = _connect(socket_path or default_socket_path())
+    if sock is None:
+        return
+    # No reply awaited: the daemon may be busy with a forwarded command
+    with sock, contextlib.suppress(OSError):
+        _send(sock, {"control": "reset"})
+
+
+def _modified_times(paths: Sequence[Path]) -> Dict[Path, Optional[float]]:
+    """Modification time of each path (None when it does not exist)"""
+    times: Dict[Path, Optional[float]] = {}
+    for path in paths:
+        try:
+            times[path] = path.stat().st_mtime
+        except OSError:
+            times[path] = None
+    return times
+
+
+class _SocketStream(io.TextIOBase):
+    """Text stream that forwards every write to the client as it happens"""
+
+    def __init__(self, sock: socket.socket, name: str, lock: threading.Lock):
+        self.sock = sock
+        self.name = name
+        self.lock = lock
+        self.connected = True
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return False
+
+    def write(self, text: str) -> int:
+        if text and self.connected:
+            try:
+                with self.lock:
+                    _send(self.sock, {self.name: text})
+            except OSError:
+                # Client went away (e.g. Ctrl-C); let the command finish
+                self.connected = False
+        return len(text)
+
+
+class JPAPIDaemon:
+    """Unix socket server running forwarded jpapi commands in one process"""
+
+    def __init__(
+        self,
+        run_command: Callable[[List[str]], int],
+        socket_path: Optional[Path] = None,
+        idle_timeout: Optional[float] = None,
+        reset_sessions: Optional[Callable[[], None]] = None,
+        config_files: Sequence[Path] = (),
+    ):
+        """
+        Initialize daemon
+
+        Args:
+            run_command: Runs one command line and returns its exit code
+            socket_path: Socket to listen on (default_socket_path() when None)
+            idle_timeout: Exit after this many seconds without a request
+            reset_sessions: Drops cached credentials and tokens ("reset")
+            config_files: Files loaded at startup; once one changes,
+                commands run in-process until the daemon is restarted
+        """
+        self.run_command = run_command
+        self.socket_path = Path(socket_path or default_socket_path())
+        self.idle_timeout = idle_timeout
+        self.reset_sessions = reset_sessions
+        self.commands_run = 0
+        # Settings the warm clients and caches are built from
+        self.environment = command_environment()
+        self.config_files = [Path(path) for path in config_files]
+        self._config_times = _modified_times(self.config_files)
+        self._config_stale = False
+        self._server: Optional[socketserver.UnixStreamServer] = None
+        self._stopping = False
+
+    def bind(self) -> None:
+        """
+        Create the socket, readable only by the current user
+
+        Raises:
+            RuntimeError: Another daemon is already listening on the socket
+        """
+        if send_control("ping", self.socket_path) is not None:
+            raise RuntimeError(f"jpapi daemon already running on {self.socket_path}")
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        with contextlib.suppress(FileNotFoundError):
+            self.socket_path.unlink()  # Left behind by a daemon that died
+
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                daemon._handle(self.connection, self.rfile)
+
+        old_umask = os.umask(0o177)
+        try:
+            server = socketserver.UnixStreamServer(str(self.socket_path), Handler)
+        finally:
+            os.umask(old_umask)
+        server.timeout = self.idle_timeout
+        server.handle_timeout = self._on_idle
+        self._server = server
+
+    def serve_forever(self) -> None:
+        """
+        Handle requests one at a time until stopped or idle
+
+        Commands run serially: while one runs it owns the process's
+        stdout, working directory and argv.
+        """
+        if self._server is None:
+            self.bind()
+        self._stopping = False
+        try:
+            while not self._stopping:
+                self._server.handle_request()
+        finally:
+            self._server.server_close()
+            with contextlib.suppress(FileNotFoundError):
+                self.socket_path.unlink()
+
+    def stop(self) -> None:
+        """Stop serving from another thread"""
+        self._stopping = True
+        send_control("ping", self.socket_path)  # Wake the accept loop
+
+    def _on_idle(self) -> None:
+        self._stopping = True
+
+    def _handle(self, sock: socket.socket, rfile) -> None:
+        line = rfile.readline()
+        if not line:
+            return
+        try:
+            request = json.loads(line)
+        except ValueError:
+            _send(sock, {"stderr": "❌ Malformed daemon request\n"})
+            _send(sock, {"exit": 2})
+            return
+
+        control = request.get("control")
+        if control is not None:
+            if control == "reset" and self.reset_sessions is not None:
+                self.reset_sessions()
+            with contextlib.suppress(OSError):
+                # notify_daemon() does not wait for the reply
+                _send(
+                    sock, {"exit": 0, "pid": os.getpid(), "commands": self.commands_run}
+                )
+            if control == "stop":
+                self._stopping = True
+            return
+
+        if request.get("env", {}) != self.environment:
+            # e.g. JPAPI_CASSETTE or JPAPI_SERVER_URL set for one command
+            _send(sock, {"run_locally": True})
+            return
+
+        if self._config_changed():
+            # Loaded once at startup; only a restart picks the change up
+            _send(sock, {"run_locally": True})
+            return
+
+        exit_code = self._run(sock, request)
+        with contextlib.suppress(OSError):
+            _send(sock, {"exit": exit_code})
+
+    def _config_changed(self) -> bool:
+        """Whether a config file changed since the daemon started"""
+        if not self._config_stale and (
+            _modified_times(self.config_files) != self._config_times
+        ):
+            self._config_stale = True
+            print("⚠️  Configuration changed; restart jpapi serve to pick it up")
+        return self._config_stale
+
+    def _run(self, sock: socket.socket, request: Dict[str, Any]) -> int:
+        """Run one forwarded command with its output sent to the client"""
+        argv = [str(arg) for arg in request.get("argv", [])]
+        lock = threading.Lock()
+        stdout = _SocketStream(sock, "stdout", lock)
+        stderr = _SocketStream(sock, "stderr", lock)
+        saved_argv, saved_stdin, saved_cwd = sys.argv, sys.stdin, os.getcwd()
+        self.commands_run += 1
+        try:
+            # No terminal behind a forwarded command: prompts read EOF
+            sys.argv = ["jpapi"] + argv
+            sys.stdin = io.StringIO("")
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(
+                stderr
+            ):
+                try:
+                    # Relative paths (--output, exports) are the client's
+                    os.chdir(request.get("cwd") or saved_cwd)
+                    return self.run_command(argv) or 0
+                except SystemExit as e:
+                    # argparse --help and usage errors exit
+                    code = e.code
+                    return code if isinstance(code, int) else (0 if code is None else 1)
+                except Exception:
+                    traceback.print_exc()
+                    return 1
+        finally:
+            sys.argv, sys.stdin = saved_argv, saved_stdin
+            os.chdir(saved_cwd)
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Authentication Session for JAMF API access
+Keeps credentials and the current token in memory for the lifetime of the
+process so api_request does not hit the credential store on every call
+"""
+
+import os
+import threading
+import time
+from dataclasses import replace
+from typing import Callable, Dict, Optional, Tuple
+
+from ..http.cassette import REDACTED, replaying
+from .login_types import AuthCredentials, AuthResult
+from .token_manager import TokenManager
+from .token_provider import TokenProvider
+from .token_cache import SharedTokenCache
+
+CredentialLoader = Callable[[], Optional[AuthCredentials]]
+CredentialSaver = Callable[[AuthCredentials], bool]
+
+
+class AuthSession:
+    """Process-wide credential and token cache for one environment"""
+
+    def __init__(
+        self,
+        load: CredentialLoader,
+        store: CredentialSaver,
+        token_manager: Optional[TokenManager] = None,
+        proactive_refresh: bool = True,
+        shared_cache: Optional[SharedTokenCache] = None,
+    ):
+        """
+        Initialize session
+
+        Args:
+            load: Reads credentials from the backing store
+            store: Persists credentials to the backing store
+            token_manager: Token lifecycle manager
+            proactive_refresh: Refresh tokens in the background before expiry
+            shared_cache: On-disk token cache shared with other jpapi processes
+        """
+        self._load = load
+        self._store = store
+        self.token_manager = token_manager or TokenManager()
+
+        self._credentials: Optional[AuthCredentials] = None
+        self._lock = threading.RLock()
+
+        self.token_provider = TokenProvider(
+            self.token_manager,
+            self.load_credentials,
+            self._save_token,
+            proactive=proactive_refresh,
+            shared_cache=shared_cache,
+            reload_credentials=self.reload_credentials,
+        )
+
+    def load_credentials(self) -> Optional[AuthCredentials]:
+        """Get credentials, reading the backing store only on first use"""
+        with self._lock:
+            if self._credentials is None:
+                self._credentials = self._load()
+            return self._credentials
+
+    def reload_credentials(self) -> Optional[AuthCredentials]:
+        """Read credentials from the backing store again, replacing the cached copy"""
+        with self._lock:
+            self._credentials = self._load()
+            return self._credentials
+
+    def store_credentials(self, credentials: AuthCredentials) -> bool:
+        """Persist credentials if they differ from the cached copy"""
+        with self._lock:
+            if self._credentials is not None and credentials == self._credentials:
+                return True
+
+            if not self._store(credentials):
+                return False
+
+            self._credentials = credentials
+            return True
+
+    def invalidate(self) -> None:
+        """
+        Forget credentials and tokens when they are cleared (logout)
+
+        The next access reloads the credentials; the token held in memory
+        and the one shared with other jpapi processes are both dropped.
+        """
+        with self._lock:
+            self._credentials = None
+        self.token_provider.reset()
+
+    def get_token(self) -> AuthResult:
+        """Get a valid token without blocking while the current one is usable"""
+        return self.token_provider.get_token()
+
+    def refresh_token(self) -> AuthResult:
+        """Get a new token now, even if the current one is still valid"""
+        return self.token_provider.refresh_now()
+
+    def _save_token(self, credentials: AuthCredentials, token_result: AuthResult):
+        """Persist a token issued by the token provider"""
+        current = self.load_credentials() or credentials
+        self.store_credentials(
+            replace(
+                current,
+                token=token_result.token,
+                refresh_token=token_result.refresh_token or current.refresh_token,
+                token_expires=token_result.expires_at,
+            )
+        )
+
+
+_sessions: Dict[Tuple[str, str, bool], AuthSession] = {}
+_sessions_lock = threading.Lock()
+
+
+def get_auth_session(
+    environment: str,
+    backend: str,
+    load: CredentialLoader,
+    store: CredentialSaver,
+    token_manager: Optional[TokenManager] = None,
+) -> AuthSession:
+    """
+    Get the shared session for an environment and storage backend
+
+    The first caller's loader and saver are used; later callers share the
+    same cached credentials. While a cassette is replayed the session holds
+    a stand-in account and token instead, so replays need no credentials
+    and never request a token.
+    """
+    replay = replaying()
+    key = ((environment or "").lower(), backend, replay)
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None and replay:
+            session = AuthSession(
+                _replay_credentials, lambda credentials: True, proactive_refresh=False
+            )
+            _sessions[key] = session
+        elif session is None:
+            session = AuthSession(
+                load,
+                store,
+                token_manager,
+                proactive_refresh=_auto_refresh_enabled(),
+                shared_cache=_shared_token_cache(environment, backend),
+            )
+            _sessions[key] = session
+        return session
+
+
+def _replay_credentials() -> AuthCredentials:
+    """Stand-in account for cassette replay (cassettes ignore host and token)"""
+    return AuthCredentials(
+        url="https://cassette.invalid",
+        client_id="cassette",
+        client_secret=REDACTED,
+        token=REDACTED,
+        token_expires=str(int(time.time()) + 24 * 3600),
+    )
+
+
+def _shared_token_cache(environment: str, backend: str) -> SharedTokenCache:
+    """
+    Token file and refresh lock shared with other jpapi processes
+
+    Keychain users keep their token in the keychain only; the shared file
+    would be a plaintext bearer token on disk they never had before. They
+    share the lock alone, and the keychain is read again under it.
+    """
+    if backend == "keychain":
+        return SharedTokenCache(
+            environment, _token_cache_dir("locks"), store_tokens=False
+        )
+    return SharedTokenCache(environment, _token_cache_dir())
+
+
+def _auto_refresh_enabled() -> bool:
+    """Read Authentication.auto_refresh_tokens from central config"""
+    try:
+        from resources.config.central_config import central_config
+    except ImportError:
+        return True
+    return bool(central_config.authentication.auto_refresh_tokens)
+
+
+def _token_cache_dir(name: str = "tokens") -> Optional[str]:
+    """Shared token (or lock-only) directory under Paths.cache_dir"""
+    try:
+        from resources.config.central_config import central_config
+    except ImportError:
+        return None
+    return os.path.join(central_config.get_path("cache_dir"), name)
+
+
+def reset_auth_sessions() -> None:
+    """Forget all cached sessions"""
+    with _sessions_lock:
+        _sessions.clear()
@@ -5,15 +5,16 @@ Uses composition with TokenManager and CredentialStore
 """
 
 import os
-import urllib.request
-import urllib.error
-import json
 import getpass
-from typing import Dict, Optional, Any
+from typing import Any, Dict, Iterator, Optional, Sequence
 
-from .login_types import AuthInterface, AuthCredentials, AuthResult, AuthStatus
+from ..http.http_client import get_http_client
+from ..http.response_cache import credential_scope
+
+from .login_types import AuthInterface, AuthCredentials, AuthResult
 from .token_manager import TokenManager
 from .credential_store import CredentialStore
+from .auth_session import get_auth_session
 
 
 class JamfAuth(AuthInterface):
@@ -27,6 +28,15 @@ class JamfAuth(AuthInterface):
         self.token_manager = TokenManager()
         self.credential_store = CredentialStore(environment, backend)
 
+        # Process-wide session so credentials and tokens are loaded once
+        self.session = get_auth_session(
+            environment,
+            self.credential_store.backend,
+            self.credential_store.load_credentials,
+            self.credential_store.store_credentials,
+            self.token_manager,
+        )
+
         # Environment URLs - configure via jpapi setup or environment variables
         self.environment_urls = {
             "sandbox": os.environ.get("JPAPI_SANDBOX_URL", ""),
@@ -48,70 +58,25 @@ class JamfAuth(AuthInterface):
 
     def get_token(self) -> AuthResult:
         """Get a valid authentication token"""
-        credentials = self.load_credentials()
-        if not credentials:
-            return AuthResult(
-                success=False,
-                status=AuthStatus.NOT_CONFIGURED,
-                message="Authentication not configured. Run setup first.",
-            )
-
-        # Delegate token management to TokenManager
-        token_result = self.token_manager.get_token(credentials)
-
-        # Update stored credentials if token was refreshed
-        if token_result.success and token_result.token:
-            updated_creds = AuthCredentials(
-                url=credentials.url,
-                client_id=credentials.client_id,
-                client_secret=credentials.client_secret,
-                token=token_result.token,
-                refresh_token=token_result.refresh_token or credentials.refresh_token,
-                token_expires=token_result.expires_at,
-            )
-            self.store_credentials(updated_creds)
-
-        return token_result
+        # Delegate token caching and persistence to the shared session
+        return self.session.get_token()
 
     def refresh_token(self) -> AuthResult:
         """Refresh the current authentication token"""
-        credentials = self.load_credentials()
-        if not credentials:
-            return AuthResult(
-                success=False,
-                status=AuthStatus.NOT_CONFIGURED,
-                message="No credentials available",
-            )
-
-        # Delegate to TokenManager
-        refresh_result = self.token_manager.refresh_token(credentials)
-
-        # Update stored credentials if successful
-        if refresh_result.success:
-            updated_creds = AuthCredentials(
-                url=credentials.url,
-                client_id=credentials.client_id,
-                client_secret=credentials.client_secret,
-                token=refresh_result.token,
-                refresh_token=(
-                    refresh_result.refresh_token or credentials.refresh_token
-                ),
-                token_expires=refresh_result.expires_at,
-            )
-            self.store_credentials(updated_creds)
-
-        return refresh_result
+        # Forced refresh through the session's single-flight provider
+        return self.session.refresh_token()
 
     def store_credentials(self, credentials: AuthCredentials) -> bool:
         """Store authentication credentials securely"""
-        return self.credential_store.store_credentials(credentials)
+        return self.session.store_credentials(credentials)
 
     def load_credentials(self) -> Optional[AuthCredentials]:
         """Load stored authentication credentials"""
-        return self.credential_store.load_credentials()
+        return self.session.load_credentials()
 
     def clear_credentials(self) -> bool:
         """Clear stored authentication credentials"""
+        self.session.invalidate()
         return self.credential_store.clear_credentials()
 
     def api_request(
@@ -120,8 +85,14 @@ class JamfAuth(AuthInterface):
         endpoint: str,
         data: Optional[Dict[str, Any]] = None,
         content_type: str = "json",
+        retry: Optional[bool] = None,
     ) -> Dict[str, Any]:
-        """Make authenticated API request"""
+        """
+        Make authenticated API request
+
+        Transient failures of GET/PUT/DELETE are retried per APIConfiguration;
+        pass retry=True to opt a POST in.
+        """
         # Get valid token
         token_result = self.get_token()
         if not token_result.success:
@@ -134,42 +105,42 @@ class JamfAuth(AuthInterface):
 
         url = f"{credentials.url}{endpoint}"
 
-        # Create request
-        request_data = None
-        if data and method.upper() in ["POST", "PUT", "PATCH"]:
-            if content_type == "xml":
-                request_data = data.encode("utf-8")
-            else:
-                request_data = json.dumps(data).encode("utf-8")
-
-        request = urllib.request.Request(url, data=request_data, method=method.upper())
-        request.add_header("Authorization", f"Bearer {token_result.token}")
-        request.add_header("Accept", "application/json")
-
-        if request_data:
-            if content_type == "xml":
-                request.add_header("Content-Type", "application/xml")
-            else:
-                request.add_header("Content-Type", "application/json")
-
-        # Make request
-        try:
-            with urllib.request.urlopen(request, timeout=30) as response:
-                response_text = response.read().decode("utf-8")
-                if response_text:
-                    # Try to parse as JSON first
-                    try:
-                        return json.loads(response_text)
-                    except json.JSONDecodeError:
-                        # Return raw response for XML or other non-JSON responses
-                        return {"raw_response": response_text}
-                else:
-                    return {}
-        except urllib.error.HTTPError as e:
-            error_text = e.read().decode("utf-8") if e.fp else str(e)
-            raise Exception(f"API request failed ({e.code}): {error_text}")
-        except Exception as e:
-            raise Exception(f"API request failed: {str(e)}")
+        # Send over the shared keep-alive connection pool
+        # Cached responses belong to the account, not to this token
+        scope = credential_scope(
+            self.environment, credentials.url, credentials.client_id
+        )
+        return (self.http_client or get_http_client()).api_request(
+            method,
+            url,
+            token_result.token,
+            data,
+            content_type,
+            retry=retry,
+            cache_scope=scope,
+        )
+
+    def iter_api_list(
+        self, endpoint: str, path: Sequence[str] = ()
+    ) -> Iterator[Any]:
+        """
+        Stream the elements of a large list response as they arrive
+
+        Args:
+            endpoint: List endpoint, e.g. "/JSSResource/computers"
+            path: Keys leading to the list, e.g. ("computers",)
+        """
+        token_result = self.get_token()
+        if not token_result.success:
+            raise Exception(f"Authentication failed: {token_result.message}")
+
+        credentials = self.load_credentials()
+        if not credentials:
+            raise Exception("No credentials available")
+
+        return (self.http_client or get_http_client()).iter_list(
+            f"{credentials.url}{endpoint}", token_result.token, path
+        )
 
     def api_request_xml(
         self, method: str, endpoint: str, xml_data: str
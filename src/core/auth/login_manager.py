@@ -20,19 +20,17 @@ If you encounter issues, consider using the core CLI features instead.
 
 import os
 import subprocess
-import urllib.request
-import urllib.error
-import urllib.parse
 import json
-import base64
-import time
 import sys
 import getpass
-from datetime import datetime, timedelta
-from typing import Dict, Optional, Any
+from typing import Any, Dict, Iterator, Optional, Sequence
 from pathlib import Path
 
+from ..http.http_client import get_http_client
+from ..http.response_cache import credential_scope
+
 from .login_types import AuthInterface, AuthCredentials, AuthResult, AuthStatus
+from .auth_session import get_auth_session
 
 
 class UnifiedJamfAuth(AuthInterface):
@@ -60,14 +58,17 @@ class UnifiedJamfAuth(AuthInterface):
             "production": os.environ.get("JPAPI_PROD_URL", ""),
         }
 
-        # Cache
-        self._credentials_cache = {}
-        self._token_cache = None
-        self._token_expires = None
-
         # Initialize backend
         self._init_backend()
 
+        # Process-wide session so credentials and tokens are loaded once
+        self.session = get_auth_session(
+            environment,
+            self.backend,
+            self._load_from_backend,
+            self._store_to_backend,
+        )
+
     def _init_backend(self):
         """Initialize credential backend with fallback"""
         if self.backend == "keychain" and sys.platform != "darwin":
@@ -91,35 +92,8 @@ class UnifiedJamfAuth(AuthInterface):
     def get_token(self) -> AuthResult:
         """Get a valid authentication token"""
         try:
-            credentials = self.load_credentials()
-            if not credentials:
-                return AuthResult(
-                    success=False,
-                    status=AuthStatus.NOT_CONFIGURED,
-                    message="Authentication not configured. Run setup first.",
-                )
-
-            # Check if we have a valid cached token
-            if credentials.token and not self._is_token_expired(
-                credentials.token_expires
-            ):
-                return AuthResult(
-                    success=True,
-                    status=AuthStatus.AUTHENTICATED,
-                    token=credentials.token,
-                    message="Using cached valid token",
-                    expires_at=credentials.token_expires,
-                )
-
-            # Try refresh first if we have a refresh token
-            if credentials.refresh_token:
-                refresh_result = self._refresh_token_internal(credentials)
-                if refresh_result.success:
-                    return refresh_result
-
-            # Get new token
-            return self._request_new_token(credentials)
-
+            # Delegate token caching and persistence to the shared session
+            return self.session.get_token()
         except Exception as e:
             return AuthResult(
                 success=False,
@@ -130,12 +104,8 @@ class UnifiedJamfAuth(AuthInterface):
     def refresh_token(self) -> AuthResult:
         """Refresh the current authentication token"""
         try:
-            credentials = self.load_credentials()
-            if not credentials or not credentials.refresh_token:
-                return self.get_token()  # Fall back to new token
-
-            return self._refresh_token_internal(credentials)
-
+            # Forced refresh through the session's single-flight provider
+            return self.session.refresh_token()
         except Exception as e:
             return AuthResult(
                 success=False,
@@ -143,162 +113,29 @@ class UnifiedJamfAuth(AuthInterface):
                 message=f"Failed to refresh token: {str(e)}",
             )
 
-    def _refresh_token_internal(self, credentials: AuthCredentials) -> AuthResult:
-        """Internal token refresh implementation"""
-        try:
-            # Prepare refresh request
-            refresh_url = f"{credentials.url}/api/oauth/token"
-            refresh_data = {
-                "grant_type": "refresh_token",
-                "refresh_token": credentials.refresh_token,
-            }
-
-            # Create request
-            data = urllib.parse.urlencode(refresh_data).encode("utf-8")
-            request = urllib.request.Request(refresh_url, data=data, method="POST")
-
-            # Add authorization header
-            auth_string = f"{credentials.client_id}:{credentials.client_secret}"
-            auth_bytes = base64.b64encode(auth_string.encode("utf-8")).decode("ascii")
-            request.add_header("Authorization", f"Basic {auth_bytes}")
-            request.add_header("Content-Type", "application/x-www-form-urlencoded")
-
-            # Make request
-            with urllib.request.urlopen(request, timeout=30) as response:
-                response_data = json.loads(response.read().decode("utf-8"))
-
-            # Extract tokens
-            access_token = response_data.get("access_token")
-            new_refresh_token = response_data.get("refresh_token")
-            expires_in = response_data.get("expires_in", 3600)
-
-            if not access_token:
-                return AuthResult(
-                    success=False,
-                    status=AuthStatus.INVALID,
-                    message="No access token in refresh response",
-                )
-
-            # Calculate expiry
-            expires_at = (datetime.now() + timedelta(seconds=expires_in)).isoformat()
-
-            # Update credentials
-            updated_credentials = AuthCredentials(
-                url=credentials.url,
-                client_id=credentials.client_id,
-                client_secret=credentials.client_secret,
-                token=access_token,
-                refresh_token=new_refresh_token or credentials.refresh_token,
-                token_expires=expires_at,
-            )
-
-            # Store updated credentials
-            self.store_credentials(updated_credentials)
-
-            return AuthResult(
-                success=True,
-                status=AuthStatus.AUTHENTICATED,
-                token=access_token,
-                message="Token refreshed successfully",
-                expires_at=expires_at,
-            )
-
-        except Exception as e:
-            return AuthResult(
-                success=False,
-                status=AuthStatus.INVALID,
-                message=f"Token refresh failed: {str(e)}",
-            )
-
-    def _request_new_token(self, credentials: AuthCredentials) -> AuthResult:
-        """Request a new OAuth token"""
-        try:
-            # Prepare token request
-            token_url = f"{credentials.url}/api/oauth/token"
-            token_data = {
-                "grant_type": "client_credentials",
-                "client_id": credentials.client_id,
-                "client_secret": credentials.client_secret,
-            }
-
-            # Create request
-            data = urllib.parse.urlencode(token_data).encode("utf-8")
-            request = urllib.request.Request(token_url, data=data, method="POST")
-            request.add_header("Content-Type", "application/x-www-form-urlencoded")
-
-            # Make request
-            with urllib.request.urlopen(request, timeout=30) as response:
-                response_data = json.loads(response.read().decode("utf-8"))
-
-            # Extract tokens
-            access_token = response_data.get("access_token")
-            refresh_token = response_data.get("refresh_token")
-            expires_in = response_data.get("expires_in", 3600)
-
-            if not access_token:
-                return AuthResult(
-                    success=False,
-                    status=AuthStatus.INVALID,
-                    message="No access token in response",
-                )
-
-            # Calculate expiry (store as Unix timestamp for consistency with keychain)
-            expires_at = str(int(time.time()) + expires_in)
-
-            # Update credentials
-            updated_credentials = AuthCredentials(
-                url=credentials.url,
-                client_id=credentials.client_id,
-                client_secret=credentials.client_secret,
-                token=access_token,
-                refresh_token=refresh_token,
-                token_expires=expires_at,
-            )
-
-            # Store updated credentials
-            self.store_credentials(updated_credentials)
-
-            return AuthResult(
-                success=True,
-                status=AuthStatus.AUTHENTICATED,
-                token=access_token,
-                message="New token obtained successfully",
-                expires_at=expires_at,
-            )
-
-        except Exception as e:
-            return AuthResult(
-                success=False,
-                status=AuthStatus.INVALID,
-                message=f"Failed to get new token: {str(e)}",
-            )
+    def store_credentials(self, credentials: AuthCredentials) -> bool:
+        """Store authentication credentials securely"""
+        return self.session.store_credentials(credentials)
 
-    def _is_token_expired(self, expires_timestamp: Optional[str]) -> bool:
-        """Check if token is expired"""
-        if not expires_timestamp:
-            return True
+    def load_credentials(self) -> Optional[AuthCredentials]:
+        """Load stored authentication credentials"""
+        return self.session.load_credentials()
 
+    def clear_credentials(self) -> bool:
+        """Clear stored authentication credentials"""
+        self.session.invalidate()
         try:
-            # Handle both Unix timestamp and ISO format
-            if expires_timestamp.isdigit():
-                # Unix timestamp
-                expires_time = int(expires_timestamp)
-                current_time = int(time.time())
-                # Add 5 minute buffer (300 seconds)
-                return current_time > (expires_time - 300)
+            if self.backend == "keychain":
+                return self._clear_keychain()
+            elif self.backend == "file":
+                return self._clear_file()
             else:
-                # ISO format
-                expires_dt = datetime.fromisoformat(
-                    expires_timestamp.replace("Z", "+00:00")
-                )
-                # Add 5 minute buffer
-                buffer_time = expires_dt - timedelta(minutes=5)
-                return datetime.now() > buffer_time
+                return False
         except Exception:
-            return True
+            return False
 
-    def store_credentials(self, credentials: AuthCredentials) -> bool:
-        """Store authentication credentials securely"""
+    def _store_to_backend(self, credentials: AuthCredentials) -> bool:
+        """Write credentials to the configured storage backend"""
         try:
             if self.backend == "keychain":
                 return self._store_keychain(credentials)
@@ -309,8 +146,8 @@ class UnifiedJamfAuth(AuthInterface):
         except Exception:
             return False
 
-    def load_credentials(self) -> Optional[AuthCredentials]:
-        """Load stored authentication credentials"""
+    def _load_from_backend(self) -> Optional[AuthCredentials]:
+        """Read credentials from the configured storage backend"""
         try:
             if self.backend == "keychain":
                 return self._load_keychain()
@@ -325,18 +162,6 @@ class UnifiedJamfAuth(AuthInterface):
             traceback.print_exc()
             return None
 
-    def clear_credentials(self) -> bool:
-        """Clear stored authentication credentials"""
-        try:
-            if self.backend == "keychain":
-                return self._clear_keychain()
-            elif self.backend == "file":
-                return self._clear_file()
-            else:
-                return False
-        except Exception:
-            return False
-
     def _store_keychain(self, credentials: AuthCredentials) -> bool:
         """Store credentials in macOS keychain"""
         try:
@@ -545,8 +370,14 @@ class UnifiedJamfAuth(AuthInterface):
         endpoint: str,
         data: Optional[Dict[str, Any]] = None,
         content_type: str = "json",
+        retry: Optional[bool] = None,
     ) -> Dict[str, Any]:
-        """Make authenticated API request"""
+        """
+        Make authenticated API request
+
+        Transient failures of GET/PUT/DELETE are retried per APIConfiguration;
+        pass retry=True to opt a POST in.
+        """
         # Get valid token
         token_result = self.get_token()
         if not token_result.success:
@@ -559,42 +390,42 @@ class UnifiedJamfAuth(AuthInterface):
 
         url = f"{credentials.url}{endpoint}"
 
-        # Create request
-        request_data = None
-        if data and method.upper() in ["POST", "PUT", "PATCH"]:
-            if content_type == "xml":
-                request_data = data.encode("utf-8")
-            else:
-                request_data = json.dumps(data).encode("utf-8")
+        # Send over the shared keep-alive connection pool
+        # Cached responses belong to the account, not to this token
+        scope = credential_scope(
+            self.environment, credentials.url, credentials.client_id
+        )
+        return (self.http_client or get_http_client()).api_request(
+            method,
+            url,
+            token_result.token,
+            data,
+            content_type,
+            retry=retry,
+            cache_scope=scope,
+        )
 
-        request = urllib.request.Request(url, data=request_data, method=method.upper())
-        request.add_header("Authorization", f"Bearer {token_result.token}")
-        request.add_header("Accept", "application/json")
+    def iter_api_list(
+        self, endpoint: str, path: Sequence[str] = ()
+    ) -> Iterator[Any]:
+        """
+        Stream the elements of a large list response as they arrive
 
-        if request_data:
-            if content_type == "xml":
-                request.add_header("Content-Type", "application/xml")
-            else:
-                request.add_header("Content-Type", "application/json")
+        Args:
+            endpoint: List endpoint, e.g. "/JSSResource/computers"
+            path: Keys leading to the list, e.g. ("computers",)
+        """
+        token_result = self.get_token()
+        if not token_result.success:
+            raise Exception(f"Authentication failed: {token_result.message}")
 
-        # Make request
-        try:
-            with urllib.request.urlopen(request, timeout=30) as response:
-                response_text = response.read().decode("utf-8")
-                if response_text:
-                    # Try to parse as JSON first, fall back to raw text for XML responses
-                    try:
-                        return json.loads(response_text)
-                    except json.JSONDecodeError:
-                        # Return raw response for XML or other non-JSON responses
-                        return {"raw_response": response_text}
-                else:
-                    return {}
-        except urllib.error.HTTPError as e:
-            error_text = e.read().decode("utf-8") if e.fp else str(e)
-            raise Exception(f"API request failed ({e.code}): {error_text}")
-        except Exception as e:
-            raise Exception(f"API request failed: {str(e)}")
+        credentials = self.load_credentials()
+        if not credentials:
+            raise Exception("No credentials available")
+
+        return (self.http_client or get_http_client()).iter_list(
+            f"{credentials.url}{endpoint}", token_result.token, path
+        )
 
     def api_request_xml(
         self, method: str, endpoint: str, xml_data: str
@@ -60,6 +60,11 @@ class AuthResult:
 class AuthInterface(ABC):
     """Unified authentication interface for all JAMF auth implementations"""
 
+    # HTTP client for this auth's requests; None uses the process-wide
+    # client. Multi-environment runs give each environment its own, so
+    # tenants do not share connections or rate limits.
+    http_client: Optional[Any] = None
+
     def __init__(self, environment: str = "dev"):
         self.environment = environment
 
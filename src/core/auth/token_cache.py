@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Shared Token Cache for JAMF Authentication
+Stores the current OAuth token on disk per environment so concurrent jpapi
+processes reuse it, with an OS file lock so only one process refreshes.
+Keychain users get the lock only: their token stays in the keychain.
+"""
+
+import hashlib
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+from .login_types import AuthCredentials, AuthResult, AuthStatus
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+
+class SharedTokenCache:
+    """Per-environment token file shared between jpapi processes"""
+
+    def __init__(
+        self,
+        environment: str,
+        cache_dir: Optional[str] = None,
+        store_tokens: bool = True,
+    ):
+        """
+        Initialize shared token cache
+
+        Args:
+            environment: Environment name (sandbox, production, etc.)
+            cache_dir: Directory for token files (defaults to
+                ~/.jpapi/cache/tokens, or ~/.jpapi/cache/locks without tokens)
+            store_tokens: Keep the token in a file; when False only the
+                refresh lock is shared and read()/write()/clear() do nothing
+        """
+        self.environment = (environment or "default").lower()
+        self.store_tokens = store_tokens
+        default_dir = "tokens" if store_tokens else "locks"
+        base_dir = Path(cache_dir or Path.home() / ".jpapi" / "cache" / default_dir)
+        self.cache_dir = base_dir.expanduser()
+        self.token_file = self.cache_dir / f"token_{self.environment}.json"
+        self.lock_file = self.cache_dir / f"token_{self.environment}.lock"
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """Hold an exclusive cross-process lock for this environment"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True, mode=0o700)
+            handle = open(self.lock_file, "a+")
+        except OSError:
+            # Unwritable cache directory: behave like an uncached process
+            yield
+            return
+
+        try:
+            self._acquire(handle)
+            try:
+                yield
+            finally:
+                self._release(handle)
+        finally:
+            handle.close()
+
+    def read(self, credentials: AuthCredentials) -> Optional[AuthResult]:
+        """
+        Read the cached token for these credentials
+
+        Returns:
+            AuthResult with the cached token, or None if absent or issued
+            for a different server/client
+        """
+        if not self.store_tokens:
+            return None
+        try:
+            with open(self.token_file, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if data.get("fingerprint") != self._fingerprint(credentials):
+            return None
+        if not data.get("token"):
+            return None
+
+        return AuthResult(
+            success=True,
+            status=AuthStatus.AUTHENTICATED,
+            token=data["token"],
+            refresh_token=data.get("refresh_token"),
+            expires_at=data.get("token_expires"),
+            message="Using token shared by another jpapi process",
+        )
+
+    def write(self, credentials: AuthCredentials, token_result: AuthResult) -> bool:
+        """Atomically write a newly issued token"""
+        if not self.store_tokens:
+            return False
+        data = {
+            "fingerprint": self._fingerprint(credentials),
+            "token": token_result.token,
+            "refresh_token": token_result.refresh_token,
+            "token_expires": token_result.expires_at,
+        }
+        tmp_file = self.token_file.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True, mode=0o700)
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_file, self.token_file)
+            return True
+        except OSError:
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
+            return False
+
+    def clear(self) -> None:
+        """Remove the cached token"""
+        if not self.store_tokens:
+            return
+        try:
+            self.token_file.unlink()
+        except OSError:
+            pass
+
+    @staticmethod
+    def _fingerprint(credentials: AuthCredentials) -> str:
+        """Identify the server and API client a token belongs to"""
+        source = f"{credentials.url}|{credentials.client_id}"
+        return hashlib.sha256(source.encode("utf-8")).hexdigest()[:16]
+
+    @staticmethod
+    def _acquire(handle) -> None:
+        """Block until the file lock is held"""
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        elif msvcrt is not None:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+
+    @staticmethod
+    def _release(handle) -> None:
+        """Release the file lock"""
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+        elif msvcrt is not None:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
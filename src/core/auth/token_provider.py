@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Token Provider for JAMF Authentication
+Hands out the current token to any number of threads, refreshes it in the
+background shortly before expiry and coalesces concurrent refreshes into a
+single OAuth request
+"""
+
+import threading
+import time
+from contextlib import nullcontext
+from datetime import datetime
+from typing import Callable, Optional
+
+from .login_types import AuthCredentials, AuthResult, AuthStatus
+from .token_manager import TokenManager
+from .token_cache import SharedTokenCache
+
+CredentialGetter = Callable[[], Optional[AuthCredentials]]
+TokenSaver = Callable[[AuthCredentials, AuthResult], None]
+
+
+def get_expiry_timestamp(expires: Optional[str]) -> Optional[float]:
+    """
+    Convert a stored token expiry to a Unix timestamp
+
+    Args:
+        expires: Expiration as Unix timestamp or ISO format string
+
+    Returns:
+        Unix timestamp, or None if missing or unparseable
+    """
+    if not expires:
+        return None
+    try:
+        if expires.isdigit():
+            return float(expires)
+        return datetime.fromisoformat(expires.replace("Z", "+00:00")).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+class _RefreshFlight:
+    """A refresh in progress that other threads can wait on"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[AuthResult] = None
+
+
+class TokenProvider:
+    """Thread-safe token source with single-flight, proactive refresh"""
+
+    def __init__(
+        self,
+        token_manager: TokenManager,
+        get_credentials: CredentialGetter,
+        save_token: TokenSaver,
+        expiry_buffer: int = 300,
+        refresh_ahead: int = 120,
+        proactive: bool = True,
+        failure_backoff: int = 30,
+        shared_cache: Optional[SharedTokenCache] = None,
+        reload_credentials: Optional[CredentialGetter] = None,
+    ):
+        """
+        Initialize token provider
+
+        Args:
+            token_manager: Performs the OAuth requests
+            get_credentials: Returns the current credentials
+            save_token: Persists a newly issued token
+            expiry_buffer: Seconds before expiry a token stops being used
+            refresh_ahead: Seconds before the buffer to start a background refresh
+            proactive: Refresh in the background before the token expires
+            failure_backoff: Seconds to wait after a failed background refresh
+            shared_cache: On-disk token cache shared with other jpapi processes
+            reload_credentials: Re-reads the credential store, bypassing
+                any in-memory copy; used under a lock-only shared cache to
+                pick up a token another process stored there
+        """
+        self.token_manager = token_manager
+        self._get_credentials = get_credentials
+        self._save_token = save_token
+        self.expiry_buffer = expiry_buffer
+        self.refresh_ahead = refresh_ahead
+        self.proactive = proactive
+        self.failure_backoff = failure_backoff
+        self.shared_cache = shared_cache
+        self._reload_credentials = reload_credentials
+
+        self._lock = threading.Lock()
+        self._flight: Optional[_RefreshFlight] = None
+        self._last_failure = 0.0
+        # Bumped by reset(); refreshes started before it are not kept
+        self._generation = 0
+
+    def get_token(self) -> AuthResult:
+        """
+        Get a valid token
+
+        Returns the cached token while it is usable, starting a background
+        refresh when it is close to expiry. Only blocks when the token is
+        already unusable, and then shares a single refresh between threads.
+        """
+        credentials = self._get_credentials()
+        if not credentials:
+            return AuthResult(
+                success=False,
+                status=AuthStatus.NOT_CONFIGURED,
+                message="Authentication not configured. Run setup first.",
+            )
+
+        remaining = self._seconds_remaining(credentials)
+        if credentials.token and remaining > self.expiry_buffer:
+            if self.proactive and remaining <= self.expiry_buffer + self.refresh_ahead:
+                self._start_background_refresh()
+            return self._cached_result(credentials)
+
+        return self._refresh(wait=True)
+
+    def reset(self) -> None:
+        """
+        Forget issued tokens (logout)
+
+        Deletes the shared token file, so other jpapi processes cannot pick
+        the token up, and drops the result of a refresh still in flight.
+        """
+        with self._lock:
+            self._generation += 1
+            self._last_failure = 0.0
+        if self.shared_cache is not None:
+            with self.shared_cache.lock():
+                self.shared_cache.clear()
+
+    def refresh_now(self) -> AuthResult:
+        """Force a refresh, joining one that is already in progress"""
+        return self._refresh(wait=True, force=True)
+
+    def _refresh(self, wait: bool, force: bool = False) -> Optional[AuthResult]:
+        """Run or join the single in-flight refresh"""
+        threshold = self.expiry_buffer
+        if not wait:
+            threshold += self.refresh_ahead
+
+        with self._lock:
+            flight = self._flight
+            leader = flight is None
+            if leader:
+                credentials = self._get_credentials()
+                if not credentials:
+                    return AuthResult(
+                        success=False,
+                        status=AuthStatus.NOT_CONFIGURED,
+                        message="Authentication not configured. Run setup first.",
+                    )
+
+                # Another thread may have refreshed while we were waiting
+                if (
+                    not force
+                    and credentials.token
+                    and self._seconds_remaining(credentials) > threshold
+                ):
+                    return self._cached_result(credentials)
+
+                flight = _RefreshFlight()
+                self._flight = flight
+                generation = self._generation
+
+        if not leader:
+            if not wait:
+                return None
+            flight.done.wait()
+            return flight.result
+
+        result = None
+        try:
+            # Serialize refreshes across processes and reuse a token another
+            # process obtained while we waited for the lock
+            with self._shared_lock():
+                result = self._adopt_shared_token(credentials, threshold)
+                if result is None:
+                    result = self._fetch(credentials)
+                    # A logout (reset) while we fetched discards the token
+                    current = generation == self._generation
+                    if current and result.success and result.token:
+                        if self.shared_cache:
+                            self.shared_cache.write(credentials, result)
+
+                # Saved under the lock: without a token file (keychain) the
+                # credential store is where other processes find the token
+                if result.success and result.token:
+                    if generation == self._generation:
+                        self._save_token(credentials, result)
+
+            if not (result.success and result.token):
+                self._last_failure = time.time()
+        except Exception as e:
+            self._last_failure = time.time()
+            result = AuthResult(
+                success=False,
+                status=AuthStatus.INVALID,
+                message=f"Failed to get token: {str(e)}",
+            )
+        finally:
+            flight.result = result
+            with self._lock:
+                self._flight = None
+            flight.done.set()
+
+        return result
+
+    def _start_background_refresh(self) -> None:
+        """Refresh on a daemon thread unless one is running or recently failed"""
+        with self._lock:
+            if self._flight is not None:
+                return
+            if time.time() - self._last_failure < self.failure_backoff:
+                return
+
+        thread = threading.Thread(
+            target=self._refresh,
+            kwargs={"wait": False},
+            name="jpapi-token-refresh",
+            daemon=True,
+        )
+        thread.start()
+
+    def _shared_lock(self):
+        """Cross-process refresh lock, or a no-op without a shared cache"""
+        if self.shared_cache is None:
+            return nullcontext()
+        return self.shared_cache.lock()
+
+    def _adopt_shared_token(
+        self, credentials: AuthCredentials, threshold: float
+    ) -> Optional[AuthResult]:
+        """Return a usable token from the shared cache that we do not hold yet"""
+        if self.shared_cache is None:
+            return None
+
+        if self.shared_cache.store_tokens:
+            shared = self.shared_cache.read(credentials)
+        else:
+            shared = self._reload_stored_token(credentials)
+        if not shared or shared.token == credentials.token:
+            return None
+
+        expires_at = get_expiry_timestamp(shared.expires_at)
+        if expires_at is None or expires_at - time.time() <= threshold:
+            return None
+        return shared
+
+    def _reload_stored_token(
+        self, credentials: AuthCredentials
+    ) -> Optional[AuthResult]:
+        """Token in the credential store itself, e.g. saved by another process"""
+        if self._reload_credentials is None:
+            return None
+        stored = self._reload_credentials()
+        if not stored or not stored.token:
+            return None
+        if (stored.url, stored.client_id) != (credentials.url, credentials.client_id):
+            return None
+        return AuthResult(
+            success=True,
+            status=AuthStatus.AUTHENTICATED,
+            token=stored.token,
+            refresh_token=stored.refresh_token,
+            expires_at=stored.token_expires,
+            message="Using token stored by another jpapi process",
+        )
+
+    def _fetch(self, credentials: AuthCredentials) -> AuthResult:
+        """Request a fresh token, preferring the refresh token grant"""
+        if credentials.refresh_token:
+            refresh_result = self.token_manager.refresh_token(credentials)
+            if refresh_result.success:
+                return refresh_result
+        return self.token_manager.request_new_token(credentials)
+
+    @staticmethod
+    def _seconds_remaining(credentials: AuthCredentials) -> float:
+        """Seconds until the token expires (negative if unknown or expired)"""
+        expires_at = get_expiry_timestamp(credentials.token_expires)
+        if expires_at is None:
+            return float("-inf")
+        return expires_at - time.time()
+
+    @staticmethod
+    def _cached_result(credentials: AuthCredentials) -> AuthResult:
+        """Build a result for the token already held in memory"""
+        return AuthResult(
+            success=True,
+            status=AuthStatus.AUTHENTICATED,
+            token=credentials.token,
+            message="Using cached valid token",
+            expires_at=credentials.token_expires,
+        )
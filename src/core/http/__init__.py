@@ -0,0 +1,44 @@
+"""
+HTTP transport for JPAPI
+Shared connection pooling and request pipeline for JAMF API calls
+"""
+
+from .async_client import AsyncJamfClient, fetch_all_pages, fetch_many, run_sync
+from .cassette import CassetteMissError, CassettePlayer, CassetteRecorder
+from .circuit_breaker import CircuitBreaker, CircuitOpenError
+from .coalescing import RequestCoalescer
+from .connection_pool import ConnectionPool, HttpResponse, StreamingResponse
+from .http_client import JamfHttpClient, get_http_client, set_http_client
+from .instrumentation import ApiProfiler, CallBudgetExceeded, endpoint_template
+from .json_stream import iter_json_array, stream_list
+from .rate_limiter import TokenBucketRateLimiter, parse_retry_after
+from .response_cache import ResponseCache
+from .retry import RetryPolicy
+
+__all__ = [
+    "AsyncJamfClient",
+    "fetch_all_pages",
+    "fetch_many",
+    "CassetteMissError",
+    "CassettePlayer",
+    "CassetteRecorder",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "run_sync",
+    "ConnectionPool",
+    "HttpResponse",
+    "StreamingResponse",
+    "RequestCoalescer",
+    "JamfHttpClient",
+    "get_http_client",
+    "set_http_client",
+    "ApiProfiler",
+    "CallBudgetExceeded",
+    "endpoint_template",
+    "iter_json_array",
+    "stream_list",
+    "TokenBucketRateLimiter",
+    "parse_retry_after",
+    "ResponseCache",
+    "RetryPolicy",
+]
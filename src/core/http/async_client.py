@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+Async JAMF Client
+asyncio front end for any AuthInterface, overlapping requests up to a
+concurrency ceiling while sharing its token, connection pool, rate limiter,
+retries and response cache
+"""
+
+import asyncio
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+DEFAULT_CONCURRENCY = 10
+
+# Jamf Pro API page sizes: large pages where the endpoint accepts them,
+# falling back to the classic default when it rejects the size with a 400
+DEFAULT_PAGE_SIZE = 1000
+FALLBACK_PAGE_SIZE = 100
+
+# Called with (page index, page items, totalCount or None)
+PageCallback = Callable[[int, List[Dict[str, Any]], Optional[int]], None]
+
+# Called with (index, response or exception) as each request finishes
+ResultCallback = Callable[[int, Any], None]
+
+
+def _default_concurrency() -> int:
+    """Concurrency ceiling from APIConfiguration (one request per pooled connection)"""
+    try:
+        from resources.config.central_config import central_config
+
+        return max(1, central_config.api.connection_pool_size)
+    except (ImportError, AttributeError):
+        return DEFAULT_CONCURRENCY
+
+
+def run_sync(coroutine: Awaitable[T]) -> T:
+    """
+    Run a coroutine from synchronous code
+
+    Uses asyncio.run, or a helper thread when called while an event loop is
+    already running (Streamlit, FastAPI handlers).
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    result: Dict[str, Any] = {}
+
+    def runner():
+        try:
+            result["value"] = asyncio.run(coroutine)
+        except BaseException as e:
+            result["error"] = e
+
+    thread = threading.Thread(target=runner, name="jpapi-async-runner")
+    thread.start()
+    thread.join()
+    if "error" in result:
+        raise result["error"]
+    return result["value"]
+
+
+class AsyncJamfClient:
+    """Concurrent JAMF API access for asyncio code"""
+
+    def __init__(self, auth, max_concurrency: Optional[int] = None):
+        """
+        Initialize async client
+
+        Args:
+            auth: AuthInterface implementation (JamfAuth, UnifiedJamfAuth, ...)
+            max_concurrency: Requests in flight at once (defaults to connection_pool_size)
+        """
+        self.auth = auth
+        self.max_concurrency = max_concurrency or _default_concurrency()
+        # The worker count is the concurrency ceiling; extra requests queue
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="jpapi-async"
+        )
+
+    async def __aenter__(self) -> "AsyncJamfClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Any] = None,
+        content_type: str = "json",
+    ) -> Dict[str, Any]:
+        """
+        Make an authenticated API request without blocking the event loop
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint (e.g. /api/v1/policies)
+            data: Request payload
+            content_type: "json" or "xml"
+
+        Returns:
+            Parsed response, as from auth.api_request
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            lambda: self.auth.api_request(method, endpoint, data, content_type),
+        )
+
+    async def get(self, endpoint: str) -> Dict[str, Any]:
+        """GET an endpoint"""
+        return await self.request("GET", endpoint)
+
+    async def get_many(
+        self,
+        endpoint_template: str,
+        ids: Iterable[Any],
+        return_exceptions: bool = False,
+        on_result: Optional[ResultCallback] = None,
+    ) -> List[Any]:
+        """
+        GET one endpoint per ID concurrently
+
+        Args:
+            endpoint_template: Endpoint with an {id} placeholder,
+                e.g. /JSSResource/policies/id/{id}
+            ids: Object IDs
+            return_exceptions: Return failures in place instead of raising the first
+            on_result: Called as each request finishes, in completion order
+
+        Returns:
+            Responses in the same order as ids
+        """
+
+        async def get_one(index: int, object_id: Any) -> Any:
+            try:
+                result = await self.get(endpoint_template.format(id=object_id))
+            except Exception as e:
+                if on_result is not None:
+                    on_result(index, e)
+                raise
+            if on_result is not None:
+                on_result(index, result)
+            return result
+
+        return await asyncio.gather(
+            *(get_one(index, object_id) for index, object_id in enumerate(ids)),
+            return_exceptions=return_exceptions,
+        )
+
+    async def iter_pages(
+        self,
+        endpoint: str,
+        page_size: int = FALLBACK_PAGE_SIZE,
+        sort: Optional[str] = "id",
+        results_key: str = "results",
+        start_page: int = 0,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Iterate over the pages of a Jamf Pro API collection in sequence
+
+        Args:
+            endpoint: Collection endpoint (e.g. /api/v1/policies)
+            page_size: Items per page
+            sort: Sort expression, or None to leave unsorted
+            results_key: Key holding the page's items
+            start_page: First page to fetch
+
+        Yields:
+            Each non-empty page of items
+        """
+        page = start_page
+        while True:
+            response = await self.get(self._page_url(endpoint, page, page_size, sort))
+            items = response.get(results_key) or []
+            if not items:
+                return
+            yield items
+
+            if len(items) < page_size:
+                return
+            page += 1
+
+    async def get_all_pages(
+        self,
+        endpoint: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        sort: Optional[str] = "id",
+        results_key: str = "results",
+        on_page: Optional[PageCallback] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch a whole Jamf Pro API collection, pages in parallel
+
+        Page 0 is fetched first to read totalCount and the page size the
+        server actually serves; the remaining pages are then fetched
+        concurrently and reassembled in page order. Collections without
+        totalCount are walked in sequence.
+
+        Args:
+            endpoint: Collection endpoint (e.g. /api/v1/policies)
+            page_size: Items per page (drops to 100 if the endpoint rejects it)
+            sort: Sort expression; keep a stable sort so pages do not overlap
+            results_key: Key holding the page's items
+            on_page: Progress callback for each fetched page
+
+        Returns:
+            All items in order, without duplicates
+
+        Raises:
+            Exception: Fewer items than totalCount came back, even after
+                walking the pages past the last expected one
+        """
+        try:
+            first = await self.get(self._page_url(endpoint, 0, page_size, sort))
+        except Exception as e:
+            if page_size <= FALLBACK_PAGE_SIZE or "(400)" not in str(e):
+                raise
+            page_size = FALLBACK_PAGE_SIZE
+            first = await self.get(self._page_url(endpoint, 0, page_size, sort))
+
+        first_items = first.get(results_key) or []
+        total = first.get("totalCount")
+        if on_page:
+            on_page(0, first_items, total)
+
+        pages = [first_items]
+        if not isinstance(total, int):
+            if len(first_items) == page_size:
+                page = 1
+                async for items in self.iter_pages(
+                    endpoint, page_size, sort, results_key, start_page=1
+                ):
+                    if on_page:
+                        on_page(page, items, None)
+                    pages.append(items)
+                    page += 1
+            return _merge_pages(pages)
+
+        async def fetch_page(page: int) -> List[Dict[str, Any]]:
+            response = await self.get(self._page_url(endpoint, page, page_size, sort))
+            items = response.get(results_key) or []
+            if on_page:
+                on_page(page, items, total)
+            return items
+
+        # Servers may cap the page size; page by the size actually served
+        if 0 < len(first_items) < min(page_size, total):
+            page_size = len(first_items)
+        page_count = math.ceil(total / page_size)
+        pages.extend(
+            await asyncio.gather(*(fetch_page(page) for page in range(1, page_count)))
+        )
+        merged = _merge_pages(pages)
+
+        # Pages that came back short leave items for the pages after them
+        if len(merged) < total:
+            page = page_count
+            async for items in self.iter_pages(
+                endpoint, page_size, sort, results_key, start_page=page_count
+            ):
+                if on_page:
+                    on_page(page, items, total)
+                pages.append(items)
+                page += 1
+            merged = _merge_pages(pages)
+        if len(merged) < total:
+            raise Exception(
+                f"Paging {endpoint} returned {len(merged)} of {total} items"
+            )
+        return merged
+
+    async def iter_items(self, endpoint: str, **kwargs) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over every item of a paginated collection (see iter_pages)"""
+        async for items in self.iter_pages(endpoint, **kwargs):
+            for item in items:
+                yield item
+
+    def close(self) -> None:
+        """Shut down the worker threads"""
+        self._executor.shutdown(wait=False)
+
+    @staticmethod
+    def _page_url(endpoint: str, page: int, page_size: int, sort: Optional[str]) -> str:
+        """Build the URL for one page of a collection"""
+        separator = "&" if "?" in endpoint else "?"
+        url = f"{endpoint}{separator}page={page}&page-size={page_size}"
+        if sort:
+            url += f"&sort={sort}"
+        return url
+
+
+def _merge_pages(pages: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Concatenate pages, dropping items repeated across page boundaries"""
+    merged = []
+    seen_ids = set()
+    for items in pages:
+        for item in items:
+            item_id = item.get("id") if isinstance(item, dict) else None
+            if item_id is not None:
+                if item_id in seen_ids:
+                    continue
+                seen_ids.add(item_id)
+            merged.append(item)
+    return merged
+
+
+def fetch_all_pages(
+    auth,
+    endpoint: str,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    sort: Optional[str] = "id",
+    results_key: str = "results",
+    on_page: Optional[PageCallback] = None,
+    max_concurrency: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Fetch a whole Jamf Pro API collection from synchronous code
+
+    See AsyncJamfClient.get_all_pages.
+    """
+
+    async def fetch() -> List[Dict[str, Any]]:
+        async with AsyncJamfClient(auth, max_concurrency) as client:
+            return await client.get_all_pages(
+                endpoint, page_size, sort, results_key, on_page
+            )
+
+    return run_sync(fetch())
+
+
+def fetch_many(
+    auth,
+    endpoint_template: str,
+    ids: Sequence[Any],
+    max_concurrency: Optional[int] = None,
+    on_result: Optional[ResultCallback] = None,
+) -> List[Any]:
+    """
+    GET one endpoint per ID concurrently from synchronous code
+
+    A failed request does not affect the others: its exception is returned
+    in its place.
+
+    Args:
+        auth: AuthInterface implementation
+        endpoint_template: Endpoint with an {id} placeholder
+        ids: Object IDs
+        max_concurrency: Requests in flight at once (defaults to
+            connection_pool_size)
+        on_result: Called as each request finishes, for progress reporting
+
+    Returns:
+        Responses or exceptions, in the same order as ids
+    """
+    if not ids:
+        return []
+
+    async def fetch() -> List[Any]:
+        async with AsyncJamfClient(auth, max_concurrency) as client:
+            return await client.get_many(
+                endpoint_template, ids, return_exceptions=True, on_result=on_result
+            )
+
+    return run_sync(fetch())
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Cassette transport for JAMF API traffic
+Records the requests jpapi sends, with secrets redacted, and replays them
+later with their original timing or with no latency at all
+"""
+
+import base64
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import urllib.parse
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Deque, Dict, Optional, Tuple, Union
+
+from .compression import content_encoding, decode_body
+from .connection_pool import HttpResponse
+
+CASSETTE_VERSION = 1
+REDACTED = "REDACTED"
+
+# Keys, form fields, query parameters and XML elements whose values are secrets
+SECRET_FIELDS = (
+    "access_token",
+    "refresh_token",
+    "token",
+    "client_secret",
+    "clientsecret",
+    "password",
+    "passwd",
+    "secret",
+)
+# Response headers never written to a cassette
+DROPPED_HEADERS = ("set-cookie", "content-length", "transfer-encoding")
+
+TIMING_ORIGINAL = "original"
+TIMING_NONE = "none"
+
+_SECRET_HINT = re.compile(
+    "|".join(re.escape(f) for f in SECRET_FIELDS).encode("ascii"), re.IGNORECASE
+)
+_SECRET_XML = re.compile(
+    r"<(?P<tag>" + "|".join(SECRET_FIELDS) + r")>[^<]*</(?P=tag)>", re.IGNORECASE
+)
+
+Key = Tuple[str, str, str]
+
+
+class CassetteMissError(Exception):
+    """Raised when a replayed request was never recorded"""
+
+
+def redact_value(value: Any) -> Any:
+    """Redact secret fields anywhere in a decoded JSON value"""
+    if isinstance(value, dict):
+        return {
+            k: REDACTED if k.lower() in SECRET_FIELDS else redact_value(v)
+            for k, v in value.items()
+        }
+    if isinstance(value, list):
+        return [redact_value(item) for item in value]
+    return value
+
+
+def redact_body(body: Optional[bytes]) -> Optional[bytes]:
+    """
+    Redact secrets from a JSON, form-encoded or XML body
+
+    Bodies that mention no secret field are returned unchanged, so large
+    list responses are recorded byte for byte without being parsed.
+    """
+    if not body or not _SECRET_HINT.search(body):
+        return body
+
+    stripped = body.lstrip()
+    if stripped[:1] in (b"{", b"["):
+        try:
+            return json.dumps(redact_value(json.loads(body))).encode("utf-8")
+        except ValueError:
+            pass
+    elif stripped[:1] == b"<":
+        text = body.decode("utf-8", errors="replace")
+        return _SECRET_XML.sub(
+            lambda m: f"<{m.group('tag')}>{REDACTED}</{m.group('tag')}>", text
+        ).encode("utf-8")
+
+    try:
+        fields = urllib.parse.parse_qsl(body.decode("ascii"), keep_blank_values=True)
+    except (UnicodeDecodeError, ValueError):
+        return body
+    if not fields:
+        return body
+    return urllib.parse.urlencode(
+        [(k, REDACTED if k.lower() in SECRET_FIELDS else v) for k, v in fields]
+    ).encode("ascii")
+
+
+def redact_target(url: str) -> str:
+    """Path and query of a URL, without the host and with secret parameters redacted"""
+    parsed = urllib.parse.urlsplit(url)
+    target = parsed.path or "/"
+    if parsed.query:
+        query = urllib.parse.parse_qsl(parsed.query, keep_blank_values=True)
+        target += "?" + urllib.parse.urlencode(
+            [(k, REDACTED if k.lower() in SECRET_FIELDS else v) for k, v in query]
+        )
+    return target
+
+
+def _digest(redacted_body: Optional[bytes]) -> str:
+    if not redacted_body:
+        return ""
+    return hashlib.sha256(redacted_body).hexdigest()[:16]
+
+
+def request_key(method: str, url: str, body: Optional[bytes]) -> Key:
+    """Replay lookup key: method, redacted target and redacted body digest"""
+    return method.upper(), redact_target(url), _digest(redact_body(body))
+
+
+def _encode_body(body: bytes) -> Dict[str, str]:
+    try:
+        return {"body": body.decode("utf-8"), "encoding": "utf-8"}
+    except UnicodeDecodeError:
+        return {"body": base64.b64encode(body).decode("ascii"), "encoding": "base64"}
+
+
+def _decode_body(data: Dict[str, Any]) -> bytes:
+    if data.get("encoding") == "base64":
+        return base64.b64decode(data.get("body", ""))
+    return data.get("body", "").encode("utf-8")
+
+
+class CassetteRecorder:
+    """Transport wrapping a ConnectionPool that appends each exchange to a cassette"""
+
+    def __init__(self, pool, path: Union[str, Path]):
+        """
+        Initialize recorder
+
+        Args:
+            pool: Transport that sends the real requests (usually a ConnectionPool)
+            path: Cassette file to write (JSON lines, replaced if it exists)
+        """
+        self.pool = pool
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self._recorded = 0
+        fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        self._file = os.fdopen(fd, "w", encoding="utf-8")
+        self._write(
+            {
+                "cassette": CASSETTE_VERSION,
+                "recorded_at": datetime.now(timezone.utc).isoformat(),
+            }
+        )
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> HttpResponse:
+        """Send a request through the wrapped pool and record the exchange"""
+        started = time.monotonic()
+        response = self.pool.request(method, url, body, headers, timeout)
+        elapsed = time.monotonic() - started
+
+        redacted = redact_body(body)
+        request = {
+            "method": method.upper(),
+            "target": redact_target(url),
+            "digest": _digest(redacted),
+        }
+        if redacted:
+            request.update(_encode_body(redacted))
+
+        # Store bodies decoded so secrets inside compressed ones are redacted
+        response_body = response.body
+        encoding = content_encoding(response.headers)
+        if encoding:
+            response_body = decode_body(response_body, encoding)
+
+        stored = {
+            "status": response.status,
+            "reason": response.reason,
+            "headers": {
+                k: v
+                for k, v in response.headers.items()
+                if k not in DROPPED_HEADERS and k != "content-encoding"
+            },
+        }
+        stored.update(_encode_body(redact_body(response_body)))
+
+        self._write(
+            {
+                "offset": round(started - self._started, 6),
+                "elapsed": round(elapsed, 6),
+                "request": request,
+                "response": stored,
+            }
+        )
+        return response
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, separators=(",", ":"))
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.write(line + "\n")
+            self._file.flush()
+            if "request" in record:
+                self._recorded += 1
+
+    def close(self) -> None:
+        """Finish the cassette and close the wrapped pool"""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+        self.pool.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get recorder statistics"""
+        with self._lock:
+            return {"cassette": str(self.path), "recorded": self._recorded}
+
+
+class CassettePlayer:
+    """Transport that answers requests from a recorded cassette"""
+
+    def __init__(self, path: Union[str, Path], timing: str = TIMING_NONE):
+        """
+        Initialize player
+
+        Args:
+            path: Cassette written by CassetteRecorder
+            timing: "original" to sleep for each recorded response time,
+                "none" to answer immediately
+
+        Raises:
+            ValueError: Unknown timing mode or unsupported cassette file
+        """
+        if timing not in (TIMING_ORIGINAL, TIMING_NONE):
+            raise ValueError(f"Unknown cassette timing: {timing}")
+        self.path = Path(path).expanduser()
+        self.timing = timing
+
+        self._lock = threading.Lock()
+        self._interactions: Dict[Key, Deque[Dict[str, Any]]] = {}
+        self._played = 0
+        self._misses = 0
+        self._load()
+
+    def _load(self) -> None:
+        with open(self.path, encoding="utf-8") as f:
+            header = json.loads(f.readline() or "{}")
+            if header.get("cassette") != CASSETTE_VERSION:
+                raise ValueError(f"Not a jpapi cassette: {self.path}")
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                request = record["request"]
+                key = (request["method"], request["target"], request["digest"])
+                self._interactions.setdefault(key, deque()).append(record)
+
+    def __len__(self) -> int:
+        return sum(len(queue) for queue in self._interactions.values())
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> HttpResponse:
+        """
+        Answer a request with the next matching recorded response
+
+        Identical requests are answered in recorded order; once a request has
+        used up its recordings the last response is repeated.
+
+        Raises:
+            CassetteMissError: No recording matches the method, target and body
+        """
+        key = request_key(method, url, body)
+        with self._lock:
+            queue = self._interactions.get(key)
+            if not queue:
+                self._misses += 1
+                raise CassetteMissError(
+                    f"No recorded response for {key[0]} {key[1]} in {self.path}"
+                )
+            record = queue.popleft() if len(queue) > 1 else queue[0]
+            self._played += 1
+
+        if self.timing == TIMING_ORIGINAL and record.get("elapsed"):
+            time.sleep(record["elapsed"])
+
+        stored = record["response"]
+        return HttpResponse(
+            status=stored["status"],
+            reason=stored.get("reason", ""),
+            headers=dict(stored.get("headers", {})),
+            body=_decode_body(stored),
+        )
+
+    def close(self) -> None:
+        """Nothing to release; present for ConnectionPool compatibility"""
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get player statistics"""
+        with self._lock:
+            return {
+                "cassette": str(self.path),
+                "played": self._played,
+                "misses": self._misses,
+            }
+
+
+def replaying() -> bool:
+    """
+    Whether JPAPI_CASSETTE_MODE replays a cassette
+
+    Replayed runs never reach a server, so they need no credentials or token
+    (see auth_session.get_auth_session).
+    """
+    if not os.environ.get("JPAPI_CASSETTE"):
+        return False
+    mode = os.environ.get("JPAPI_CASSETTE_MODE", "record").lower()
+    return mode in ("replay", "replay-fast")
+
+
+def cassette_from_env(pool):
+    """
+    Wrap a pool for recording or replace it for replay based on the environment
+
+    JPAPI_CASSETTE names the cassette file; JPAPI_CASSETTE_MODE is "record",
+    "replay" (original timing) or "replay-fast" (no latency).
+
+    Returns:
+        The pool itself when no cassette is configured
+    """
+    path = os.environ.get("JPAPI_CASSETTE")
+    if not path:
+        return pool
+
+    mode = os.environ.get("JPAPI_CASSETTE_MODE", "record").lower()
+    if mode == "record":
+        return CassetteRecorder(pool, path)
+    if mode == "replay":
+        return CassettePlayer(path, timing=TIMING_ORIGINAL)
+    if mode == "replay-fast":
+        return CassettePlayer(path, timing=TIMING_NONE)
+    raise ValueError(f"Unknown JPAPI_CASSETTE_MODE: {mode}")
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Circuit Breaker for JAMF API requests
+Stops sending requests to a Jamf host after repeated timeouts or 5xx
+responses (other than 503 throttling), then lets a probe request through to detect recovery
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request to a host whose circuit is open"""
+
+    def __init__(self, host: str, retry_in: float):
+        self.host = host
+        self.retry_in = retry_in
+        super().__init__(
+            f"Circuit open for {host}: too many consecutive failures, "
+            f"next attempt in {retry_in:.0f}s"
+        )
+
+
+class CircuitBreaker:
+    """Thread-safe closed/open/half-open breaker for one host"""
+
+    def __init__(
+        self,
+        host: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30,
+    ):
+        """
+        Initialize circuit breaker
+
+        Args:
+            host: Host the breaker protects (used in messages)
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_timeout: Seconds to wait before a half-open probe
+        """
+        self.host = host
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.recovery_timeout = recovery_timeout
+
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+        # Statistics
+        self._trips = 0
+        self._rejected = 0
+        self._last_error: Optional[str] = None
+
+    @property
+    def state(self) -> str:
+        """Current state: closed, open or half_open"""
+        with self._lock:
+            return self._state
+
+    def before_request(self) -> None:
+        """
+        Check a request may be sent
+
+        Raises:
+            CircuitOpenError: The circuit is open, or a probe is already running
+        """
+        with self._lock:
+            if self._state == CLOSED:
+                return
+
+            now = time.monotonic()
+            retry_in = self._opened_at + self.recovery_timeout - now
+            if self._state == OPEN and retry_in <= 0:
+                self._state = HALF_OPEN
+
+            if self._state == HALF_OPEN and not self._probe_in_flight:
+                # Let exactly one probe through
+                self._probe_in_flight = True
+                return
+
+            self._rejected += 1
+            raise CircuitOpenError(self.host, max(0.0, retry_in))
+
+    def record_success(self) -> None:
+        """Record a healthy response and close the circuit"""
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self, error: Optional[str] = None) -> None:
+        """Record a timeout, connection error or non-throttle 5xx response"""
+        with self._lock:
+            self._failures += 1
+            self._last_error = error
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    self._trips += 1
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get breaker state for health reporting"""
+        with self._lock:
+            retry_in = None
+            if self._state == OPEN:
+                retry_in = max(
+                    0.0, self._opened_at + self.recovery_timeout - time.monotonic()
+                )
+            return {
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "trips": self._trips,
+                "rejected_requests": self._rejected,
+                "retry_in_seconds": round(retry_in, 1) if retry_in is not None else None,
+                "last_error": self._last_error,
+            }
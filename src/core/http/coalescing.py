@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Request Coalescing for JAMF API requests
+Identical GETs issued while one is already in flight wait for it and share
+its result instead of making their own network call
+"""
+
+import copy
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class _Flight:
+    """A request in progress that identical requests can wait on"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class RequestCoalescer:
+    """Thread-safe in-flight request map keyed by request identity"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, _Flight] = {}
+
+        # Statistics
+        self.calls = 0
+        self.coalesced = 0
+
+    def run(self, key: Hashable, call: Callable[[], Any]) -> Any:
+        """
+        Run call, or join an identical call already in flight
+
+        Every caller that shared a result gets its own deep copy, so callers
+        can keep mutating responses the way they do today.
+
+        Args:
+            key: Request identity (method, URL, credentials, ...)
+            call: Performs the request
+
+        Returns:
+            The call's result (errors are raised to every waiting caller)
+        """
+        with self._lock:
+            self.calls += 1
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._flights[key] = flight
+            else:
+                flight.waiters += 1
+                self.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return copy.deepcopy(flight.result)
+
+        try:
+            flight.result = call()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            # No new waiters can join once the flight leaves the map
+            with self._lock:
+                del self._flights[key]
+                shared = flight.waiters > 0
+            flight.done.set()
+
+        return copy.deepcopy(flight.result) if shared else flight.result
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get coalescing statistics"""
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._flights),
+            }
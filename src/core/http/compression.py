@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Compressed transfer for JAMF API responses
+Accept-Encoding negotiation and gzip/deflate decoding, in one piece or
+chunk by chunk for streamed bodies
+"""
+
+import time
+import zlib
+from typing import Callable, Iterable, Iterator, Optional
+
+ACCEPT_ENCODING = "gzip, deflate"
+SUPPORTED_ENCODINGS = ("gzip", "x-gzip", "deflate")
+
+# Called with (wire_bytes, decoded_bytes, decode_seconds) once a body is decoded
+DecodeCallback = Callable[[int, int, float], None]
+
+
+class _Decoder:
+    """Incremental gzip/deflate decoder"""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        # "deflate" is zlib-wrapped per the RFC, but some servers send raw deflate
+        wbits = 16 + zlib.MAX_WBITS if "gzip" in encoding else zlib.MAX_WBITS
+        self._inflater = zlib.decompressobj(wbits)
+        self._first = True
+
+    def decompress(self, data: bytes) -> bytes:
+        if self._first and self.encoding == "deflate":
+            self._first = False
+            try:
+                return self._inflater.decompress(data)
+            except zlib.error:
+                self._inflater = zlib.decompressobj(-zlib.MAX_WBITS)
+        return self._inflater.decompress(data)
+
+    def flush(self) -> bytes:
+        return self._inflater.flush()
+
+
+def content_encoding(headers) -> Optional[str]:
+    """Supported Content-Encoding of a response, or None for identity"""
+    value = (headers.get("content-encoding") or "").strip().lower()
+    return value if value in SUPPORTED_ENCODINGS else None
+
+
+def decode_body(
+    body: bytes, encoding: str, on_decoded: Optional[DecodeCallback] = None
+) -> bytes:
+    """
+    Decompress a complete response body
+
+    Raises:
+        zlib.error: The body is not valid for its Content-Encoding
+    """
+    started = time.perf_counter()
+    decoder = _Decoder(encoding)
+    decoded = decoder.decompress(body) + decoder.flush()
+    if on_decoded is not None:
+        on_decoded(len(body), len(decoded), time.perf_counter() - started)
+    return decoded
+
+
+def decode_chunks(
+    chunks: Iterable[bytes],
+    encoding: str,
+    on_decoded: Optional[DecodeCallback] = None,
+) -> Iterator[bytes]:
+    """Decompress a streamed body chunk by chunk"""
+    decoder = _Decoder(encoding)
+    wire = decoded = 0
+    seconds = 0.0
+    for chunk in chunks:
+        started = time.perf_counter()
+        data = decoder.decompress(chunk)
+        seconds += time.perf_counter() - started
+        wire += len(chunk)
+        decoded += len(data)
+        if data:
+            yield data
+    tail = decoder.flush()
+    decoded += len(tail)
+    if tail:
+        yield tail
+    if on_decoded is not None:
+        on_decoded(wire, decoded, seconds)
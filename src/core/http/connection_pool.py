@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Connection Pool for JAMF API requests
+Keeps HTTP(S) connections alive per Jamf host so repeated requests
+skip the TCP and TLS handshake
+"""
+
+import http.client
+import ssl
+import threading
+import urllib.parse
+import urllib.request
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+# Errors raised when a kept-alive connection was closed by the server
+# while it sat idle in the pool; the request is safe to resend once
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    ConnectionAbortedError,
+    BrokenPipeError,
+)
+
+PoolKey = Tuple[str, str, int]
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass
+class HttpResponse:
+    """Fully read HTTP response"""
+
+    status: int
+    reason: str
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+
+    def header(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """Get a response header (case-insensitive)"""
+        return self.headers.get(name.lower(), default)
+
+    def text(self) -> str:
+        """Decode the body as UTF-8"""
+        return self.body.decode("utf-8")
+
+
+class StreamingResponse(HttpResponse):
+    """Successful response whose body is read from the socket on demand"""
+
+    def __init__(
+        self,
+        status: int,
+        reason: str,
+        headers: Dict[str, str],
+        raw: http.client.HTTPResponse,
+        release: Callable[[bool], None],
+    ):
+        super().__init__(status=status, reason=reason, headers=headers)
+        self.bytes_read = 0
+        self._raw = raw
+        self._release = release
+        self._done = False
+        self._on_finish: List[Callable[[int], None]] = []
+
+    def on_finish(self, callback: Callable[[int], None]) -> None:
+        """Call callback(bytes_read) once the body has been consumed or dropped"""
+        self._on_finish.append(callback)
+
+    def iter_chunks(self, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Yield the body as it arrives
+
+        The connection goes back to the pool once the body is fully read;
+        abandoning the iterator early closes it instead.
+        """
+        completed = False
+        try:
+            while True:
+                chunk = self._raw.read(chunk_size)
+                if not chunk:
+                    completed = True
+                    break
+                self.bytes_read += len(chunk)
+                yield chunk
+        finally:
+            self._finish(reuse=completed)
+
+    def read_all(self) -> bytes:
+        """Read the rest of the body into memory"""
+        self.body = b"".join(self.iter_chunks())
+        return self.body
+
+    def close(self) -> None:
+        """Drop an unread body and its connection"""
+        self._finish(reuse=False)
+
+    def _finish(self, reuse: bool) -> None:
+        if self._done:
+            return
+        self._done = True
+        self._release(reuse)
+        for callback in self._on_finish:
+            callback(self.bytes_read)
+
+
+class ConnectionPool:
+    """Thread-safe pool of keep-alive connections keyed by scheme, host and port"""
+
+    def __init__(
+        self,
+        max_connections_per_host: int = 10,
+        timeout: float = 30,
+        verify_ssl: bool = True,
+    ):
+        """
+        Initialize connection pool
+
+        Args:
+            max_connections_per_host: Idle connections kept open per host
+            timeout: Default socket timeout in seconds
+            verify_ssl: Verify TLS certificates
+        """
+        self.max_connections_per_host = max(1, int(max_connections_per_host))
+        self.timeout = timeout
+        self.verify_ssl = verify_ssl
+
+        self._idle: Dict[PoolKey, List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self._ssl_context = self._create_ssl_context()
+
+        # Statistics
+        self._created = 0
+        self._reused = 0
+        self._discarded = 0
+
+    def _create_ssl_context(self) -> ssl.SSLContext:
+        """Create the TLS context shared by all HTTPS connections"""
+        context = ssl.create_default_context()
+        if not self.verify_ssl:
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        return context
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> HttpResponse:
+        """
+        Send a request over a pooled connection and read the full response
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            body: Encoded request body
+            headers: Request headers
+            timeout: Socket timeout override in seconds
+
+        Returns:
+            HttpResponse with status, headers and body
+        """
+        conn, key, response = self.open(method, url, body, headers, timeout)
+        try:
+            data = response.read()
+        except BaseException:
+            conn.close()
+            raise
+
+        result = HttpResponse(
+            status=response.status,
+            reason=response.reason,
+            headers={k.lower(): v for k, v in response.getheaders()},
+            body=data,
+        )
+        self.release(key, conn, response.will_close)
+        return result
+
+    def stream(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> HttpResponse:
+        """
+        Send a request, leaving a 2xx body on the socket to be streamed
+
+        Returns:
+            StreamingResponse for 2xx responses, otherwise a fully read
+            HttpResponse (error bodies are small and needed for messages)
+        """
+        conn, key, response = self.open(method, url, body, headers, timeout)
+        headers_out = {k.lower(): v for k, v in response.getheaders()}
+        if not 200 <= response.status < 300:
+            try:
+                data = response.read()
+            except BaseException:
+                conn.close()
+                raise
+            self.release(key, conn, response.will_close)
+            return HttpResponse(response.status, response.reason, headers_out, data)
+
+        def release(reuse: bool) -> None:
+            if reuse:
+                self.release(key, conn, response.will_close)
+            else:
+                conn.close()
+
+        return StreamingResponse(
+            response.status, response.reason, headers_out, response, release
+        )
+
+    def open(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Tuple[http.client.HTTPConnection, PoolKey, http.client.HTTPResponse]:
+        """
+        Send a request and return the response with its body still unread
+
+        Callers must read the body and hand the connection back with
+        release(). A stale idle connection is replaced and the request
+        resent once.
+
+        Returns:
+            Tuple of (connection, pool key, response)
+        """
+        parsed = urllib.parse.urlsplit(url)
+        scheme = parsed.scheme.lower()
+        if scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme: {parsed.scheme}")
+
+        host = parsed.hostname or ""
+        port = parsed.port or (443 if scheme == "https" else 80)
+        key = (scheme, host, port)
+        target = parsed.path or "/"
+        if parsed.query:
+            target = f"{target}?{parsed.query}"
+
+        proxy = self._get_proxy(scheme, host)
+        if proxy and scheme == "http":
+            # Plain HTTP proxies expect the absolute URL as request target
+            target = url
+
+        effective_timeout = self.timeout if timeout is None else timeout
+        request_headers = dict(headers or {})
+
+        conn, reused = self._acquire(key, proxy, effective_timeout)
+        try:
+            conn.request(method, target, body=body, headers=request_headers)
+            response = conn.getresponse()
+        except STALE_CONNECTION_ERRORS:
+            conn.close()
+            if not reused:
+                raise
+            conn = self._new_connection(key, proxy, effective_timeout)
+            try:
+                conn.request(method, target, body=body, headers=request_headers)
+                response = conn.getresponse()
+            except BaseException:
+                conn.close()
+                raise
+        except BaseException:
+            conn.close()
+            raise
+
+        return conn, key, response
+
+    def release(
+        self,
+        key: PoolKey,
+        conn: http.client.HTTPConnection,
+        will_close: bool = False,
+    ) -> None:
+        """Return a connection to the pool once its response was fully read"""
+        if will_close:
+            conn.close()
+            return
+
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_connections_per_host:
+                idle.append(conn)
+                return
+            self._discarded += 1
+        conn.close()
+
+    def _acquire(
+        self, key: PoolKey, proxy: Optional[str], timeout: float
+    ) -> Tuple[http.client.HTTPConnection, bool]:
+        """Get an idle connection for the host or open a new one"""
+        with self._lock:
+            idle = self._idle.get(key)
+            conn = idle.pop() if idle else None
+            if conn is not None:
+                self._reused += 1
+
+        if conn is None:
+            return self._new_connection(key, proxy, timeout), False
+
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+
+    def _new_connection(
+        self, key: PoolKey, proxy: Optional[str], timeout: float
+    ) -> http.client.HTTPConnection:
+        """Open a new connection, tunnelling through a proxy if configured"""
+        scheme, host, port = key
+        connect_host, connect_port = host, port
+
+        if proxy:
+            proxy_parts = urllib.parse.urlsplit(proxy)
+            connect_host = proxy_parts.hostname or host
+            connect_port = proxy_parts.port or (
+                443 if proxy_parts.scheme == "https" else 80
+            )
+
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(
+                connect_host,
+                connect_port,
+                timeout=timeout,
+                context=self._ssl_context,
+            )
+            if proxy:
+                conn.set_tunnel(host, port)
+        else:
+            conn = http.client.HTTPConnection(
+                connect_host, connect_port, timeout=timeout
+            )
+
+        with self._lock:
+            self._created += 1
+        return conn
+
+    def _get_proxy(self, scheme: str, host: str) -> Optional[str]:
+        """Resolve proxy settings the same way urllib does"""
+        proxies = urllib.request.getproxies()
+        proxy = proxies.get(scheme)
+        if not proxy:
+            return None
+        try:
+            if urllib.request.proxy_bypass(host):
+                return None
+        except OSError:
+            pass
+        return proxy
+
+    def close(self) -> None:
+        """Close all idle connections"""
+        with self._lock:
+            idle_connections = [c for conns in self._idle.values() for c in conns]
+            self._idle.clear()
+        for conn in idle_connections:
+            conn.close()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get pool statistics"""
+        with self._lock:
+            return {
+                "hosts": len(self._idle),
+                "idle_connections": sum(len(c) for c in self._idle.values()),
+                "connections_created": self._created,
+                "connections_reused": self._reused,
+                "connections_discarded": self._discarded,
+            }
@@ -0,0 +1,615 @@
+#!/usr/bin/env python3
+"""
+JAMF HTTP Client
+Shared request pipeline behind every api_request implementation
+"""
+
+import json
+import threading
+import time
+import urllib.parse
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence, Tuple
+
+from .cassette import cassette_from_env
+from .circuit_breaker import CircuitBreaker
+from .compression import (
+    ACCEPT_ENCODING,
+    content_encoding,
+    decode_body,
+    decode_chunks,
+)
+from .coalescing import RequestCoalescer
+from .connection_pool import ConnectionPool, HttpResponse, StreamingResponse
+from .instrumentation import ApiProfiler
+from .json_stream import iter_json_array
+from .rate_limiter import THROTTLE_STATUSES, TokenBucketRateLimiter, parse_retry_after
+from .response_cache import CACHE_STATUS_HEADER, ResponseCache
+from .retry import RetryPolicy
+
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+MAX_REDIRECTS = 5
+
+
+class JamfHttpClient:
+    """Process-wide HTTP client shared by all commands, exporters and managers"""
+
+    def __init__(
+        self,
+        pool: Optional[ConnectionPool] = None,
+        timeout: float = 30,
+        follow_redirects: bool = True,
+        limiter_factory: Optional[Callable[[], TokenBucketRateLimiter]] = None,
+        max_throttle_retries: int = 3,
+        retry_policy: Optional[RetryPolicy] = None,
+        response_cache: Optional[ResponseCache] = None,
+        breaker_factory: Optional[Callable[[str], CircuitBreaker]] = None,
+        profiler: Optional[ApiProfiler] = None,
+        accept_encoding: Optional[str] = ACCEPT_ENCODING,
+    ):
+        """
+        Initialize HTTP client
+
+        Args:
+            pool: Connection pool to send requests through
+            timeout: Default request timeout in seconds
+            follow_redirects: Follow redirects for GET/HEAD requests
+            limiter_factory: Creates the rate limiter for each Jamf host
+            max_throttle_retries: Resends of a request answered with 429/503
+            retry_policy: Backoff for transient errors (defaults to 3 retries)
+            response_cache: Revalidating GET cache (None disables caching)
+            breaker_factory: Creates the circuit breaker for each Jamf host
+            profiler: Records per-endpoint traffic and enforces call budgets
+            accept_encoding: Compressed encodings to ask for (None: identity only)
+        """
+        self.pool = pool or ConnectionPool(timeout=timeout)
+        self.timeout = timeout
+        self.follow_redirects = follow_redirects
+        self.limiter_factory = limiter_factory
+        self.max_throttle_retries = max_throttle_retries
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.response_cache = response_cache
+        self.coalescer = RequestCoalescer()
+        self.breaker_factory = breaker_factory
+        self.profiler = profiler
+        self.accept_encoding = accept_encoding
+
+        self._limiters: Dict[str, TokenBucketRateLimiter] = {}
+        self._limiters_lock = threading.Lock()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._breakers_lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls) -> "JamfHttpClient":
+        """Create a client sized from APIConfiguration"""
+        try:
+            from resources.config.central_config import central_config
+        except ImportError:
+            return cls()
+
+        api_config = central_config.api
+        pool = ConnectionPool(
+            max_connections_per_host=api_config.connection_pool_size,
+            timeout=api_config.request_timeout,
+            verify_ssl=api_config.verify_ssl,
+        )
+        transport = cassette_from_env(pool)
+
+        def make_limiter() -> TokenBucketRateLimiter:
+            return TokenBucketRateLimiter(
+                requests_per_minute=api_config.rate_limit_requests_per_minute,
+                burst_size=api_config.rate_limit_burst_size,
+            )
+
+        def make_breaker(host: str) -> CircuitBreaker:
+            return CircuitBreaker(
+                host,
+                failure_threshold=api_config.circuit_breaker_failure_threshold,
+                recovery_timeout=api_config.circuit_breaker_recovery_timeout,
+            )
+
+        return cls(
+            transport,
+            timeout=api_config.request_timeout,
+            follow_redirects=api_config.follow_redirects,
+            limiter_factory=make_limiter if api_config.rate_limit_enabled else None,
+            retry_policy=RetryPolicy.from_config(),
+            response_cache=ResponseCache.from_config(),
+            breaker_factory=(
+                make_breaker if api_config.circuit_breaker_enabled else None
+            ),
+            accept_encoding=ACCEPT_ENCODING if api_config.compress_responses else None,
+        )
+
+    def get_rate_limiter(self, url: str) -> Optional[TokenBucketRateLimiter]:
+        """Get the rate limiter for the URL's host (None when disabled)"""
+        if self.limiter_factory is None:
+            return None
+
+        host = urllib.parse.urlsplit(url).netloc.lower()
+        with self._limiters_lock:
+            limiter = self._limiters.get(host)
+            if limiter is None:
+                limiter = self.limiter_factory()
+                self._limiters[host] = limiter
+            return limiter
+
+    def get_circuit_breaker(self, url: str) -> Optional[CircuitBreaker]:
+        """Get the circuit breaker for the URL's host (None when disabled)"""
+        if self.breaker_factory is None:
+            return None
+
+        host = urllib.parse.urlsplit(url).netloc.lower()
+        with self._breakers_lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = self.breaker_factory(host)
+                self._breakers[host] = breaker
+            return breaker
+
+    def get_circuit_status(self) -> Dict[str, Dict[str, Any]]:
+        """Get circuit breaker state per Jamf host"""
+        with self._breakers_lock:
+            breakers = dict(self._breakers)
+        return {host: breaker.get_status() for host, breaker in breakers.items()}
+
+    def get_rate_limit_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get throughput statistics per Jamf host"""
+        with self._limiters_lock:
+            limiters = dict(self._limiters)
+        return {host: limiter.get_stats() for host, limiter in limiters.items()}
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        retry: Optional[bool] = None,
+        stream: bool = False,
+        cache_scope: Optional[str] = None,
+    ) -> HttpResponse:
+        """
+        Send a raw HTTP request over the connection pool
+
+        Transient failures (timeouts, connection resets, 5xx) are retried
+        with exponential backoff for idempotent methods. GETs go through the
+        response cache and successful writes invalidate it.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            body: Encoded request body
+            headers: Request headers
+            timeout: Timeout override in seconds
+            retry: True to retry a POST/PATCH, False to never retry
+            stream: Leave a 2xx body unread and return a StreamingResponse
+                (bypasses the response cache)
+            cache_scope: Account the response cache files GETs under
+
+        Returns:
+            HttpResponse (any status code)
+        """
+        method = method.upper()
+        timeout = self.timeout if timeout is None else timeout
+        cache = self.response_cache
+
+        if stream:
+            return self._send_with_retry(
+                method, url, body, headers, timeout, retry, stream=True
+            )
+
+        if cache is not None and method == "GET":
+            response = self._send_cached(url, headers, timeout, retry, cache_scope)
+            cache_status = response.header(CACHE_STATUS_HEADER)
+            if self.profiler is not None and cache_status == "hit":
+                self.profiler.record_cache_hit(method, url)
+            return response
+
+        response = self._send_with_retry(method, url, body, headers, timeout, retry)
+        if cache is not None and method not in ("HEAD", "OPTIONS") and response.status < 400:
+            cache.invalidate(url)
+        return response
+
+    def _send_cached(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        timeout: float,
+        retry: Optional[bool],
+        scope: Optional[str] = None,
+    ) -> HttpResponse:
+        """Serve a GET from the cache, revalidating or refetching as needed"""
+        cache = self.response_cache
+        entry = cache.lookup(url, headers, scope)
+
+        # Without validators the TTL is the only freshness signal we have
+        if entry is not None and not entry.has_validators() and cache.is_fresh(entry):
+            cache.record("hits")
+            return entry.to_response("hit")
+
+        request_headers = dict(headers or {})
+        if entry is not None and entry.has_validators():
+            request_headers.update(cache.conditional_headers(entry))
+
+        response = self._send_with_retry("GET", url, None, request_headers, timeout, retry)
+        if response.status == 304 and entry is not None:
+            cache.touch(url, headers, entry, scope)
+            cache.record("revalidated")
+            return entry.to_response("revalidated")
+
+        cache.record("misses")
+        cache.store(url, headers, response, scope)
+        return response
+
+    def _send_with_retry(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        headers: Optional[Dict[str, str]],
+        timeout: float,
+        retry: Optional[bool],
+        stream: bool = False,
+    ) -> HttpResponse:
+        """
+        Send a request, retrying transient failures per the retry policy
+
+        With a rate limiter, 429/503 were already resent by _send_throttled
+        and are returned as they are; the retry policy only handles them
+        when rate limiting is off.
+        """
+        policy = self.retry_policy
+        can_retry = policy.allows(method, retry)
+        breaker = self.get_circuit_breaker(url)
+        throttle_handled = self.get_rate_limiter(url) is not None
+
+        attempt = 0
+        while True:
+            # Fail fast (CircuitOpenError) while the host is known to be down
+            if breaker is not None:
+                breaker.before_request()
+
+            try:
+                response = self._send_throttled(
+                    method, url, body, headers, timeout, stream
+                )
+            except Exception as e:
+                if breaker is not None:
+                    breaker.record_failure(str(e))
+                if (
+                    not can_retry
+                    or attempt >= policy.max_retries
+                    or not policy.should_retry_error(e)
+                ):
+                    raise
+                delay = policy.get_delay(attempt + 1)
+            else:
+                if breaker is not None:
+                    # 429/503 throttling means the host is up but busy; it is
+                    # paced by the limiter/retry layer, not the breaker
+                    if (
+                        response.status >= 500
+                        and response.status not in THROTTLE_STATUSES
+                    ):
+                        breaker.record_failure(f"HTTP {response.status}")
+                    else:
+                        breaker.record_success()
+                if (
+                    not can_retry
+                    or attempt >= policy.max_retries
+                    or not policy.should_retry_status(response.status)
+                    or (throttle_handled and response.status in THROTTLE_STATUSES)
+                ):
+                    return response
+                delay = policy.get_delay(
+                    attempt + 1, parse_retry_after(response.header("retry-after"))
+                )
+
+            attempt += 1
+            time.sleep(delay)
+
+    def _send_throttled(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        headers: Optional[Dict[str, str]],
+        timeout: float,
+        stream: bool = False,
+    ) -> HttpResponse:
+        """Send a request, waiting out 429/503 responses per Retry-After"""
+        limiter = self.get_rate_limiter(url)
+
+        throttle_retries = 0
+        while True:
+            response = self._send_once(
+                method, url, body, headers, timeout, limiter, stream
+            )
+            if (
+                limiter is None
+                or response.status not in THROTTLE_STATUSES
+                or throttle_retries >= self.max_throttle_retries
+            ):
+                return response
+
+            # Pause every request to this host, then resend
+            limiter.on_throttled(parse_retry_after(response.header("retry-after")))
+            throttle_retries += 1
+
+    def _send_once(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        headers: Optional[Dict[str, str]],
+        timeout: float,
+        limiter: Optional[TokenBucketRateLimiter],
+        stream: bool = False,
+    ) -> HttpResponse:
+        """Send one request through the rate limiter, following redirects"""
+        if limiter is not None:
+            limiter.acquire()
+
+        response, elapsed = self._transmit(method, url, body, headers, timeout, stream)
+        if limiter is not None:
+            limiter.record_latency(elapsed)
+
+        redirects = 0
+        while (
+            self.follow_redirects
+            and method in ("GET", "HEAD")
+            and response.status in REDIRECT_STATUSES
+            and redirects < MAX_REDIRECTS
+        ):
+            location = response.header("location")
+            if not location:
+                break
+            url = urllib.parse.urljoin(url, location)
+            redirects += 1
+            response, _ = self._transmit(method, url, None, headers, timeout, stream)
+
+        return response
+
+    def _transmit(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        headers: Optional[Dict[str, str]],
+        timeout: float,
+        stream: bool = False,
+    ) -> Tuple[HttpResponse, float]:
+        """Send one request over the pool, timing it for the profiler"""
+        profiler = self.profiler
+        if self.accept_encoding and not any(
+            name.lower() == "accept-encoding" for name in headers or {}
+        ):
+            headers = dict(headers or {})
+            headers["Accept-Encoding"] = self.accept_encoding
+        # Transports without streaming (cassettes) return the whole body
+        send = getattr(self.pool, "stream", None) if stream else None
+        started = time.monotonic()
+        try:
+            response = (send or self.pool.request)(method, url, body, headers, timeout)
+        except Exception as e:
+            if profiler is not None:
+                profiler.record_error(method, url, e, time.monotonic() - started)
+            raise
+        elapsed = time.monotonic() - started
+
+        if profiler is not None:
+            profiler.record_response(
+                method,
+                url,
+                response.status,
+                len(body or b""),
+                len(response.body),
+                elapsed,
+            )
+            if isinstance(response, StreamingResponse):
+                response.on_finish(
+                    lambda size: profiler.record_bytes(method, url, size)
+                )
+
+        # Streamed bodies are decoded chunk by chunk as they are read
+        encoding = content_encoding(response.headers)
+        if encoding and not isinstance(response, StreamingResponse):
+            response.body = decode_body(
+                response.body, encoding, self._decode_recorder(method, url)
+            )
+            del response.headers["content-encoding"]
+        return response, elapsed
+
+    def _decode_recorder(self, method: str, url: str):
+        """Callback reporting decompression to the profiler, if any"""
+        profiler = self.profiler
+        if profiler is None:
+            return None
+        return lambda wire, decoded, seconds: profiler.record_decoded(
+            method, url, wire, decoded, seconds
+        )
+
+    def api_request(
+        self,
+        method: str,
+        url: str,
+        token: str,
+        data: Optional[Any] = None,
+        content_type: str = "json",
+        retry: Optional[bool] = None,
+        cache_scope: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Make an authenticated API request and parse the response
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            token: Bearer token
+            data: Request payload (dict for JSON, str for XML)
+            content_type: "json" or "xml"
+            retry: True to retry a POST/PATCH, False to never retry
+            cache_scope: Account the response cache files GETs under
+                (credential_scope(); default: the bearer token)
+
+        Returns:
+            Parsed JSON response, {"raw_response": text} for non-JSON
+            bodies, or {} for empty responses
+
+        Raises:
+            CallBudgetExceeded: The profiler's call budget is used up
+        """
+        method = method.upper()
+        if self.profiler is not None:
+            self.profiler.record_call(method, url)
+
+        # Identical concurrent GETs share one network call and parse
+        if method == "GET":
+            return self.coalescer.run(
+                (url, token),
+                lambda: self._api_request(
+                    method, url, token, data, content_type, retry, cache_scope
+                ),
+            )
+        return self._api_request(
+            method, url, token, data, content_type, retry, cache_scope
+        )
+
+    def _api_request(
+        self,
+        method: str,
+        url: str,
+        token: str,
+        data: Optional[Any],
+        content_type: str,
+        retry: Optional[bool],
+        cache_scope: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Build, send and parse one authenticated request"""
+        request_data = None
+        if data and method in ["POST", "PUT", "PATCH"]:
+            if content_type == "xml":
+                request_data = data.encode("utf-8")
+            else:
+                request_data = json.dumps(data).encode("utf-8")
+
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/json",
+        }
+        if request_data:
+            if content_type == "xml":
+                headers["Content-Type"] = "application/xml"
+            else:
+                headers["Content-Type"] = "application/json"
+
+        try:
+            response = self.send(
+                method, url, request_data, headers, retry=retry, cache_scope=cache_scope
+            )
+        except Exception as e:
+            raise Exception(f"API request failed: {str(e)}")
+
+        self._raise_for_status(response)
+        return self.parse_response(response)
+
+    def iter_list(
+        self,
+        url: str,
+        token: str,
+        path: Sequence[str] = (),
+        retry: Optional[bool] = None,
+    ) -> Iterator[Any]:
+        """
+        Stream the elements of a JSON list response as they are parsed
+
+        The first element is available as soon as it arrives, and the full
+        body is never held in memory. The request is sent on the first
+        next(); a transient failure before any element is yielded is retried
+        like api_request, a connection lost mid-body is not.
+
+        Args:
+            url: Absolute URL of a list endpoint
+            token: Bearer token
+            path: Keys leading to the list, e.g. ("computers",)
+            retry: True/False to override the retry policy
+
+        Yields:
+            List elements in response order
+        """
+        if self.profiler is not None:
+            self.profiler.record_call("GET", url)
+
+        headers = {"Authorization": f"Bearer {token}", "Accept": "application/json"}
+        try:
+            response = self.send("GET", url, None, headers, retry=retry, stream=True)
+        except Exception as e:
+            raise Exception(f"API request failed: {str(e)}")
+        self._raise_for_status(response)
+
+        if not isinstance(response, StreamingResponse):
+            yield from iter_json_array([response.body], path)
+            return
+        chunks = response.iter_chunks()
+        encoding = content_encoding(response.headers)
+        if encoding:
+            chunks = decode_chunks(chunks, encoding, self._decode_recorder("GET", url))
+        try:
+            yield from iter_json_array(chunks, path)
+            # Read the rest of the object so the connection can be reused
+            for _ in chunks:
+                pass
+        finally:
+            response.close()
+
+    @staticmethod
+    def _raise_for_status(response: HttpResponse) -> None:
+        """Raise the api_request error for a 4xx/5xx response"""
+        if response.status >= 400:
+            error_text = response.body.decode("utf-8", errors="replace") or (
+                f"HTTP Error {response.status}: {response.reason}"
+            )
+            raise Exception(f"API request failed ({response.status}): {error_text}")
+
+    @staticmethod
+    def parse_response(response: HttpResponse) -> Dict[str, Any]:
+        """Parse a response body the way api_request callers expect"""
+        response_text = response.text()
+        if not response_text:
+            return {}
+
+        # Try to parse as JSON first
+        try:
+            return json.loads(response_text)
+        except json.JSONDecodeError:
+            # Return raw response for XML or other non-JSON responses
+            return {"raw_response": response_text}
+
+    def close(self) -> None:
+        """Close pooled connections"""
+        self.pool.close()
+
+
+_default_client: Optional[JamfHttpClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_http_client() -> JamfHttpClient:
+    """Get the process-wide HTTP client"""
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = JamfHttpClient.from_config()
+    return _default_client
+
+
+def set_http_client(client: Optional[JamfHttpClient]) -> None:
+    """Replace the process-wide HTTP client (None rebuilds it from config)"""
+    global _default_client
+    with _default_client_lock:
+        previous = _default_client
+        _default_client = client
+    if previous is not None and previous is not client:
+        previous.close()
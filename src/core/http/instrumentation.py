@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+API Instrumentation for JAMF API requests
+Per-endpoint call counts, bytes, status codes and latency histograms, with
+optional call budgets that stop runaway request loops
+"""
+
+import json
+import re
+import threading
+import time
+import urllib.parse
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+# Upper bounds of the latency histogram buckets in milliseconds
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+_OBJECT_SEGMENT = re.compile(
+    r"/(?P<kind>id|name|serialnumber|udid|macaddress)/[^/]+"
+)
+_NUMERIC_SEGMENT = re.compile(r"/\d+(?=/|$)")
+_UUID_SEGMENT = re.compile(
+    r"/[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}(?=/|$)"
+)
+
+
+class CallBudgetExceeded(Exception):
+    """Raised instead of sending a request once a call budget is used up"""
+
+    def __init__(self, endpoint: str, limit: int, scope: str):
+        self.endpoint = endpoint
+        self.limit = limit
+        self.scope = scope
+        super().__init__(
+            f"API call budget exceeded: more than {limit} {scope} calls "
+            f"(last: {endpoint})"
+        )
+
+
+def endpoint_template(method: str, url: str) -> str:
+    """
+    Group a request URL with others that hit the same endpoint
+
+    Object identifiers become placeholders and query values are dropped:
+    "GET https://x/JSSResource/policies/id/5" -> "GET /JSSResource/policies/id/{id}",
+    "GET https://x/api/v1/computers-inventory?page=3" ->
+    "GET /api/v1/computers-inventory?page".
+    """
+    parsed = urllib.parse.urlsplit(url)
+    path = _OBJECT_SEGMENT.sub(
+        lambda m: f"/{m.group('kind')}/{{{m.group('kind')}}}", parsed.path or "/"
+    )
+    path = _UUID_SEGMENT.sub("/{uuid}", path)
+    path = _NUMERIC_SEGMENT.sub("/{id}", path)
+    if parsed.query:
+        names = sorted({name for name, _ in urllib.parse.parse_qsl(parsed.query)})
+        if names:
+            path += "?" + "&".join(names)
+    return f"{method.upper()} {path}"
+
+
+class _EndpointStats:
+    """Counters for one endpoint template"""
+
+    def __init__(self):
+        self.calls = 0
+        self.requests = 0
+        self.cache_hits = 0
+        self.errors: Dict[str, int] = {}
+        self.statuses: Dict[str, int] = {}
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.compressed_responses = 0
+        self.bytes_saved = 0
+        self.decode_seconds = 0.0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.histogram = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def add_latency(self, seconds: float) -> None:
+        self.latency_total += seconds
+        self.latency_max = max(self.latency_max, seconds)
+        millis = seconds * 1000
+        for index, bound in enumerate(LATENCY_BUCKETS_MS):
+            if millis <= bound:
+                self.histogram[index] += 1
+                return
+        self.histogram[-1] += 1
+
+    def percentile_ms(self, fraction: float) -> Optional[float]:
+        """Upper bound of the bucket holding the given fraction of requests"""
+        timed = sum(self.histogram)
+        if not timed:
+            return None
+        target = fraction * timed
+        seen = 0
+        for index, count in enumerate(self.histogram):
+            seen += count
+            if seen >= target:
+                if index < len(LATENCY_BUCKETS_MS):
+                    return float(LATENCY_BUCKETS_MS[index])
+                break
+        return round(self.latency_max * 1000, 1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        timed = sum(self.histogram)
+        labels = [f"<={bound}" for bound in LATENCY_BUCKETS_MS] + [
+            f">{LATENCY_BUCKETS_MS[-1]}"
+        ]
+        return {
+            "calls": self.calls,
+            "requests": self.requests,
+            "cache_hits": self.cache_hits,
+            "errors": dict(self.errors),
+            "statuses": dict(sorted(self.statuses.items())),
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "compressed_responses": self.compressed_responses,
+            "bytes_saved": self.bytes_saved,
+            "decode_seconds": round(self.decode_seconds, 4),
+            "latency": {
+                "total_seconds": round(self.latency_total, 3),
+                "mean_ms": round(self.latency_total / timed * 1000, 1) if timed else None,
+                "p50_ms": self.percentile_ms(0.5),
+                "p95_ms": self.percentile_ms(0.95),
+                "max_ms": round(self.latency_max * 1000, 1),
+                "histogram_ms": {
+                    label: count for label, count in zip(labels, self.histogram) if count
+                },
+            },
+        }
+
+
+class ApiProfiler:
+    """Thread-safe recorder of API traffic grouped by endpoint template"""
+
+    def __init__(
+        self,
+        max_calls: Optional[int] = None,
+        max_calls_per_endpoint: Optional[int] = None,
+    ):
+        """
+        Initialize profiler
+
+        Args:
+            max_calls: Budget for api_request calls in total (None: unlimited)
+            max_calls_per_endpoint: Budget per endpoint template (None: unlimited)
+        """
+        self.max_calls = max_calls
+        self.max_calls_per_endpoint = max_calls_per_endpoint
+
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, _EndpointStats] = {}
+        self._calls = 0
+        self._started = time.monotonic()
+        self._started_at = datetime.now(timezone.utc)
+        self.budget_exceeded: Optional[CallBudgetExceeded] = None
+
+    def _stats(self, template: str) -> _EndpointStats:
+        stats = self._endpoints.get(template)
+        if stats is None:
+            stats = self._endpoints[template] = _EndpointStats()
+        return stats
+
+    def record_call(self, method: str, url: str) -> None:
+        """
+        Count one api_request call against the budgets
+
+        Raises:
+            CallBudgetExceeded: The total or per-endpoint budget is used up
+        """
+        template = endpoint_template(method, url)
+        with self._lock:
+            stats = self._stats(template)
+            error = None
+            if self.max_calls is not None and self._calls >= self.max_calls:
+                error = CallBudgetExceeded(template, self.max_calls, "total")
+            elif (
+                self.max_calls_per_endpoint is not None
+                and stats.calls >= self.max_calls_per_endpoint
+            ):
+                error = CallBudgetExceeded(
+                    template, self.max_calls_per_endpoint, "per-endpoint"
+                )
+            if error is not None:
+                if self.budget_exceeded is None:
+                    self.budget_exceeded = error
+                raise error
+            self._calls += 1
+            stats.calls += 1
+
+    def record_response(
+        self,
+        method: str,
+        url: str,
+        status: int,
+        request_bytes: int,
+        response_bytes: int,
+        elapsed: float,
+    ) -> None:
+        """Record one request that reached the network"""
+        template = endpoint_template(method, url)
+        with self._lock:
+            stats = self._stats(template)
+            stats.requests += 1
+            stats.statuses[str(status)] = stats.statuses.get(str(status), 0) + 1
+            stats.request_bytes += request_bytes
+            stats.response_bytes += response_bytes
+            stats.add_latency(elapsed)
+
+    def record_bytes(self, method: str, url: str, response_bytes: int) -> None:
+        """Add the size of a streamed body once it has been read"""
+        with self._lock:
+            stats = self._stats(endpoint_template(method, url))
+            stats.response_bytes += response_bytes
+
+    def record_decoded(
+        self,
+        method: str,
+        url: str,
+        wire_bytes: int,
+        decoded_bytes: int,
+        seconds: float,
+    ) -> None:
+        """Record a compressed body: bytes saved on the wire and decode time"""
+        with self._lock:
+            stats = self._stats(endpoint_template(method, url))
+            stats.compressed_responses += 1
+            stats.bytes_saved += decoded_bytes - wire_bytes
+            stats.decode_seconds += seconds
+
+    def record_error(
+        self, method: str, url: str, error: BaseException, elapsed: float
+    ) -> None:
+        """Record a request that failed without a response"""
+        template = endpoint_template(method, url)
+        name = type(error).__name__
+        with self._lock:
+            stats = self._stats(template)
+            stats.requests += 1
+            stats.errors[name] = stats.errors.get(name, 0) + 1
+            stats.add_latency(elapsed)
+
+    def record_cache_hit(self, method: str, url: str) -> None:
+        """Record a response served from the response cache"""
+        with self._lock:
+            self._stats(endpoint_template(method, url)).cache_hits += 1
+
+    def get_report(self) -> Dict[str, Any]:
+        """Build the full report: totals plus per-endpoint statistics"""
+        with self._lock:
+            endpoints = {
+                template: stats.to_dict()
+                for template, stats in sorted(
+                    self._endpoints.items(), key=lambda item: -item[1].calls
+                )
+            }
+            exceeded = self.budget_exceeded
+
+        totals: Dict[str, Any] = {
+            key: sum(e[key] for e in endpoints.values())
+            for key in (
+                "calls",
+                "requests",
+                "cache_hits",
+                "request_bytes",
+                "response_bytes",
+                "compressed_responses",
+                "bytes_saved",
+            )
+        }
+        totals["decode_seconds"] = round(
+            sum(e["decode_seconds"] for e in endpoints.values()), 3
+        )
+        totals["errors"] = sum(sum(e["errors"].values()) for e in endpoints.values())
+        totals["network_seconds"] = round(
+            sum(e["latency"]["total_seconds"] for e in endpoints.values()), 3
+        )
+        return {
+            "started_at": self._started_at.isoformat(),
+            "duration_seconds": round(time.monotonic() - self._started, 3),
+            "totals": totals,
+            "budget": {
+                "max_calls": self.max_calls,
+                "max_calls_per_endpoint": self.max_calls_per_endpoint,
+                "exceeded": str(exceeded) if exceeded else None,
+            },
+            "endpoints": endpoints,
+        }
+
+    def write_report(self, path: Union[str, Path], **extra: Any) -> Path:
+        """Write the report as JSON, with any extra top-level fields"""
+        report = dict(extra)
+        report.update(self.get_report())
+        path = Path(path).expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+        return path
+
+    def format_summary(self, limit: int = 15) -> List[str]:
+        """Human-readable summary lines, busiest endpoints first"""
+        report = self.get_report()
+        totals = report["totals"]
+        lines = [
+            f"📊 API profile: {totals['calls']} calls, {totals['requests']} requests, "
+            f"{totals['cache_hits']} cache hits, {totals['errors']} errors, "
+            f"{totals['response_bytes'] / 1024:.1f} KiB received, "
+            f"{totals['network_seconds']}s on the network "
+            f"({report['duration_seconds']}s wall)"
+        ]
+        if totals["compressed_responses"]:
+            lines.append(
+                f"📊 Compression: {totals['compressed_responses']} responses, "
+                f"{totals['bytes_saved'] / 1024:.1f} KiB saved, "
+                f"{totals['decode_seconds']}s decoding"
+            )
+        lines.append(
+            f"   {'Endpoint':<58} {'Calls':>6} {'Reqs':>6} {'KiB':>9} "
+            f"{'p50ms':>7} {'p95ms':>7}"
+        )
+        for template, stats in list(report["endpoints"].items())[:limit]:
+            latency = stats["latency"]
+            lines.append(
+                f"   {template[:58]:<58} {stats['calls']:>6} {stats['requests']:>6} "
+                f"{stats['response_bytes'] / 1024:>9.1f} "
+                f"{latency['p50_ms'] if latency['p50_ms'] is not None else '-':>7} "
+                f"{latency['p95_ms'] if latency['p95_ms'] is not None else '-':>7}"
+            )
+        remaining = len(report["endpoints"]) - limit
+        if remaining > 0:
+            lines.append(f"   ... and {remaining} more endpoints")
+        return lines
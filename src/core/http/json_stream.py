@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Streaming JSON parsing for large JAMF list responses
+Yields the elements of a list response as they arrive instead of decoding
+the whole body into one giant dict first
+"""
+
+import codecs
+import json
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+# Consumed text kept in the buffer before it is trimmed
+_COMPACT_AT = 256 * 1024
+
+
+class _TextReader:
+    """Incrementally decoded text with a read position"""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._exhausted = False
+        self.text = ""
+        self.pos = 0
+
+    def fill(self) -> bool:
+        """Append the next chunk; False once the stream is exhausted"""
+        if self._exhausted:
+            return False
+        for chunk in self._chunks:
+            decoded = self._decoder.decode(chunk)
+            if decoded:
+                if self.pos >= _COMPACT_AT:
+                    self.text = self.text[self.pos:]
+                    self.pos = 0
+                self.text += decoded
+                return True
+        self._exhausted = True
+        self.text += self._decoder.decode(b"", final=True)
+        return False
+
+    def peek(self) -> str:
+        """Next non-whitespace character ("" at end of stream)"""
+        while True:
+            text, pos = self.text, self.pos
+            while pos < len(text) and text[pos] in _WHITESPACE:
+                pos += 1
+            self.pos = pos
+            if pos < len(text):
+                return text[pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise json.JSONDecodeError(
+                f"Expecting {char!r}, found {found or 'end of data'!r}",
+                self.text,
+                self.pos,
+            )
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value, reading more data as needed"""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self.text) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_array(
+    chunks: Iterable[bytes], path: Sequence[str] = ()
+) -> Iterator[Any]:
+    """
+    Yield the elements of a JSON array as they are parsed
+
+    Args:
+        chunks: Body bytes, in order (e.g. StreamingResponse.iter_chunks())
+        path: Object keys leading to the array, e.g. ("computers",) for
+            {"computers": [...]}; empty when the body is the array itself
+
+    Yields:
+        Each array element. A single object where the array was expected
+        (a Classic API quirk for one-item lists) is yielded as one element;
+        a missing key yields nothing.
+
+    Raises:
+        json.JSONDecodeError: The body is not valid JSON
+    """
+    reader = _TextReader(chunks)
+
+    for key in path:
+        if reader.peek() != "{":
+            reader.value()
+            return
+        reader.pos += 1
+        while True:
+            char = reader.peek()
+            if char == "}" or char == "":
+                return
+            name = reader.value()
+            reader.expect(":")
+            if name == key:
+                break
+            reader.value()
+            if reader.peek() == ",":
+                reader.pos += 1
+
+    if reader.peek() != "[":
+        value = reader.value()
+        if isinstance(value, dict):
+            yield value
+        return
+
+    reader.pos += 1
+    if reader.peek() == "]":
+        return
+    while True:
+        yield reader.value()
+        char = reader.peek()
+        if char == ",":
+            reader.pos += 1
+        elif char == "]":
+            return
+        else:
+            reader.expect("]")
+
+
+def stream_list(
+    auth: Any, endpoint: str, path: Sequence[str]
+) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate a list endpoint through any auth object
+
+    Auth objects with iter_api_list() stream from the socket; others fall
+    back to api_request() and walk the decoded response.
+
+    Args:
+        auth: Auth object (JamfAuth, UnifiedJamfAuth, ...)
+        endpoint: API endpoint, e.g. "/JSSResource/computers"
+        path: Keys leading to the list, e.g. ("computers",)
+    """
+    iter_api_list = getattr(auth, "iter_api_list", None)
+    if iter_api_list is not None:
+        yield from iter_api_list(endpoint, path)
+        return
+
+    value: Optional[Any] = auth.api_request("GET", endpoint)
+    for key in path:
+        value = value.get(key) if isinstance(value, dict) else None
+    if isinstance(value, list):
+        yield from value
+    elif isinstance(value, dict):
+        yield value
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Rate Limiter for JAMF API requests
+Thread-safe token bucket that honours Retry-After and slows down when the
+server's response times climb
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+THROTTLE_STATUSES = (429, 503)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header
+
+    Args:
+        value: Delay in seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if missing or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucketRateLimiter:
+    """Token bucket limiter with Retry-After pauses and latency-based backoff"""
+
+    def __init__(
+        self,
+        requests_per_minute: float = 60,
+        burst_size: int = 10,
+        adaptive: bool = True,
+        min_rate_fraction: float = 0.1,
+        latency_threshold: float = 2.0,
+    ):
+        """
+        Initialize rate limiter
+
+        Args:
+            requests_per_minute: Sustained request rate ceiling
+            burst_size: Requests allowed back-to-back before throttling
+            adaptive: Lower the rate when latency rises or the server throttles
+            min_rate_fraction: Lowest adaptive rate as a fraction of the ceiling
+            latency_threshold: Latency growth over baseline that triggers backoff
+        """
+        self.max_rate = max(requests_per_minute, 1) / 60.0
+        self.burst_size = max(1, int(burst_size))
+        self.adaptive = adaptive
+        self.min_rate = self.max_rate * min_rate_fraction
+        self.latency_threshold = latency_threshold
+
+        self._rate = self.max_rate
+        self._tokens = float(self.burst_size)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+        # Latency tracking (exponentially weighted moving average)
+        self._latency_avg: Optional[float] = None
+        self._latency_baseline: Optional[float] = None
+        self._last_adjustment = 0.0
+
+        # Statistics
+        self._requests = 0
+        self._throttled = 0
+        self._wait_time = 0.0
+        self._started = time.monotonic()
+
+    @property
+    def rate(self) -> float:
+        """Current allowed requests per second"""
+        return self._rate
+
+    def acquire(self) -> float:
+        """
+        Block until a request may be sent
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+
+                delay = self._paused_until - now
+                if delay <= 0:
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        self._requests += 1
+                        self._wait_time += waited
+                        return waited
+                    delay = (1 - self._tokens) / self._rate
+
+            time.sleep(delay)
+            waited += delay
+
+    def on_throttled(self, retry_after: Optional[float] = None) -> float:
+        """
+        Record a 429/503 response and pause all requests
+
+        Args:
+            retry_after: Seconds requested by the server, if provided
+
+        Returns:
+            Seconds until requests resume
+        """
+        with self._lock:
+            self._throttled += 1
+            if self.adaptive:
+                self._rate = max(self.min_rate, self._rate / 2)
+
+            pause = retry_after if retry_after is not None else 1.0 / self._rate
+            self._paused_until = max(self._paused_until, time.monotonic() + pause)
+            self._tokens = min(self._tokens, 0.0)
+            return pause
+
+    def record_latency(self, seconds: float) -> None:
+        """Feed an observed response time into the adaptive rate"""
+        if not self.adaptive:
+            return
+
+        with self._lock:
+            if self._latency_avg is None:
+                self._latency_avg = seconds
+            else:
+                self._latency_avg = 0.8 * self._latency_avg + 0.2 * seconds
+
+            if self._latency_baseline is None:
+                self._latency_baseline = self._latency_avg
+            else:
+                self._latency_baseline = min(self._latency_baseline, self._latency_avg)
+
+            # Adjust at most once per second
+            now = time.monotonic()
+            if now - self._last_adjustment < 1.0:
+                return
+            self._last_adjustment = now
+
+            if self._latency_avg > self._latency_baseline * self.latency_threshold:
+                self._rate = max(self.min_rate, self._rate * 0.9)
+            elif self._rate < self.max_rate:
+                self._rate = min(self.max_rate, self._rate + self.max_rate * 0.05)
+
+    def _refill(self, now: float) -> None:
+        """Add tokens for the time elapsed since the last refill"""
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(self.burst_size, self._tokens + elapsed * self._rate)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get throughput statistics"""
+        with self._lock:
+            elapsed = max(time.monotonic() - self._started, 1e-6)
+            return {
+                "requests": self._requests,
+                "throttled_responses": self._throttled,
+                "wait_seconds": round(self._wait_time, 3),
+                "requests_per_second": round(self._requests / elapsed, 2),
+                "current_rate_per_minute": round(self._rate * 60, 1),
+                "max_rate_per_minute": round(self.max_rate * 60, 1),
+                "latency_avg_ms": (
+                    round(self._latency_avg * 1000, 1)
+                    if self._latency_avg is not None
+                    else None
+                ),
+            }
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Response Cache for JAMF API requests
+Disk-backed GET cache that revalidates with ETag/Last-Modified; serving
+responses without validators for a TTL is opt-in (cache_ttl_responses)
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import urllib.parse
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from .connection_pool import HttpResponse
+
+# Header added to responses served from the cache ("hit" or "revalidated")
+CACHE_STATUS_HEADER = "x-jpapi-cache"
+
+# Response headers worth keeping with a cached body
+STORED_HEADERS = ("content-type", "etag", "last-modified")
+
+# Path segments that identify a single object (/id/5, /name/Foo, /5)
+_OBJECT_SEGMENT = re.compile(r"/(?:id|name|serialnumber|udid|macaddress)/[^/]+|/\d+(?=/|$)")
+
+
+def credential_scope(environment: str, url: str, client_id: str) -> str:
+    """Cache scope of one account, the same across token refreshes and runs"""
+    material = f"{environment}|{url}|{client_id}"
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()[:16]
+
+
+class CachedEntry:
+    """A cached response body with its validators"""
+
+    def __init__(self, url: str, headers: Dict[str, str], body: bytes, stored_at: float):
+        self.url = url
+        self.headers = headers
+        self.body = body
+        self.stored_at = stored_at
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.headers.get("etag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.headers.get("last-modified")
+
+    def has_validators(self) -> bool:
+        """Check whether the server can confirm this entry with a 304"""
+        return bool(self.etag or self.last_modified)
+
+    def to_response(self, cache_status: str) -> HttpResponse:
+        """Build the response returned to callers"""
+        headers = dict(self.headers)
+        headers[CACHE_STATUS_HEADER] = cache_status
+        return HttpResponse(200, "OK", headers, self.body)
+
+
+class ResponseCache:
+    """
+    Thread-safe on-disk cache of GET responses keyed by credential and URL
+
+    Entries are scoped to the account that made the request (a
+    credential_scope() the caller passes), so two accounts on one host
+    never share responses while token refreshes keep their entries.
+    Without a scope, the Authorization header stands in for it.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        list_ttl: float = 300,
+        detail_ttl: float = 1800,
+        max_entries: int = 20000,
+        ttl_serving: bool = False,
+    ):
+        """
+        Initialize response cache
+
+        Args:
+            cache_dir: Directory for cached responses (defaults to ~/.jpapi/cache/http)
+            list_ttl: Seconds a collection response without validators stays fresh
+            detail_ttl: Seconds a single-object response without validators stays fresh
+            max_entries: Entries kept before the oldest are evicted
+            ttl_serving: Serve responses without validators for their TTL
+                without asking the server; when False only responses with an
+                ETag or Last-Modified are kept, and always revalidated
+        """
+        base_dir = Path(cache_dir or Path.home() / ".jpapi" / "cache" / "http")
+        self.cache_dir = base_dir.expanduser()
+        self.list_ttl = list_ttl
+        self.detail_ttl = detail_ttl
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_serving = ttl_serving
+
+        self._lock = threading.Lock()
+        self._index: Optional[Dict[str, Tuple[str, float]]] = None
+
+        # Statistics
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    @classmethod
+    def from_config(cls) -> Optional["ResponseCache"]:
+        """Create a cache from CacheConfiguration (None when disabled)"""
+        try:
+            from resources.config.central_config import central_config
+        except ImportError:
+            return None
+
+        if not (central_config.api.cache_api_responses and central_config.cache.cache_enabled):
+            return None
+
+        cache_config = central_config.cache
+        return cls(
+            cache_dir=os.path.join(central_config.get_path("cache_dir"), "http"),
+            list_ttl=cache_config.api_cache_ttl,
+            detail_ttl=cache_config.object_detail_cache_ttl,
+            max_entries=central_config.api.response_cache_max_entries,
+            ttl_serving=central_config.api.cache_ttl_responses,
+        )
+
+    def lookup(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        scope: Optional[str] = None,
+    ) -> Optional[CachedEntry]:
+        """Get the stored entry for a request, fresh or not"""
+        key = self._key(url, headers, scope)
+        try:
+            with open(self._meta_path(key), "r") as f:
+                meta = json.load(f)
+            body = self._body_path(key).read_bytes()
+        except (OSError, ValueError):
+            return None
+
+        if meta.get("url") != url:
+            return None
+        return CachedEntry(url, meta.get("headers", {}), body, meta.get("stored_at", 0))
+
+    def is_fresh(self, entry: CachedEntry) -> bool:
+        """Check whether an entry without validators can be served as-is"""
+        if not self.ttl_serving:
+            return False
+        return time.time() - entry.stored_at < self.ttl_for(entry.url)
+
+    def ttl_for(self, url: str) -> float:
+        """Get the freshness lifetime for a URL"""
+        path = urllib.parse.urlsplit(url).path
+        return self.detail_ttl if _OBJECT_SEGMENT.search(path) else self.list_ttl
+
+    def conditional_headers(self, entry: CachedEntry) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers for revalidation"""
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def store(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        response: HttpResponse,
+        scope: Optional[str] = None,
+    ) -> None:
+        """Store a 200 response unless the server forbids it or it is unusable"""
+        if response.status != 200:
+            return
+        if "no-store" in (response.header("cache-control") or "").lower():
+            return
+        has_validators = response.header("etag") or response.header("last-modified")
+        if not (has_validators or self.ttl_serving):
+            return  # Could neither be revalidated nor served
+
+        key = self._key(url, headers, scope)
+        meta = {
+            "url": url,
+            "stored_at": time.time(),
+            "headers": {
+                name: response.headers[name]
+                for name in STORED_HEADERS
+                if name in response.headers
+            },
+        }
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True, mode=0o700)
+            self._write_atomic(self._body_path(key), response.body)
+            self._write_atomic(self._meta_path(key), json.dumps(meta).encode("utf-8"))
+        except OSError:
+            return
+
+        with self._lock:
+            index = self._load_index()
+            index[key] = (url, meta["stored_at"])
+            overflow = len(index) - self.max_entries
+            if overflow > 0:
+                # Evict a tenth at once so big exports do not sort every store
+                overflow += self.max_entries // 10
+                oldest = sorted(index, key=lambda k: index[k][1])[:overflow]
+                for old_key in oldest:
+                    del index[old_key]
+                    self._remove_files(old_key)
+
+    def touch(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        entry: CachedEntry,
+        scope: Optional[str] = None,
+    ) -> None:
+        """Restart an entry's TTL after a 304"""
+        key = self._key(url, headers, scope)
+        meta = {"url": url, "stored_at": time.time(), "headers": entry.headers}
+        try:
+            self._write_atomic(self._meta_path(key), json.dumps(meta).encode("utf-8"))
+        except OSError:
+            pass
+
+    def invalidate(self, url: str) -> int:
+        """
+        Drop cached responses for the collection a write touched
+
+        A PUT to /JSSResource/policies/id/5 drops every cached
+        /JSSResource/policies... response on the same host.
+
+        Returns:
+            Number of entries removed
+        """
+        parts = urllib.parse.urlsplit(url)
+        prefix = f"{parts.scheme}://{parts.netloc}{self._collection_path(parts.path)}"
+
+        removed = 0
+        with self._lock:
+            index = self._load_index()
+            for key, (cached_url, _) in list(index.items()):
+                if cached_url.startswith(prefix):
+                    del index[key]
+                    self._remove_files(key)
+                    removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """Remove every cached response"""
+        with self._lock:
+            for key in list(self._load_index()):
+                self._remove_files(key)
+            self._index = {}
+
+    def record(self, outcome: str) -> None:
+        """Count a lookup outcome ("hits", "revalidated" or "misses")"""
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache statistics"""
+        with self._lock:
+            entries = len(self._load_index())
+        return {
+            "entries": entries,
+            "hits": self.hits,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+        }
+
+    @staticmethod
+    def _collection_path(path: str) -> str:
+        """Strip the object part of a path (/policies/id/5 -> /policies)"""
+        match = _OBJECT_SEGMENT.search(path)
+        return path[: match.start()] if match else path.split("?")[0]
+
+    def _load_index(self) -> Dict[str, Tuple[str, float]]:
+        """Build the key -> (url, stored_at) index on first use (lock held)"""
+        if self._index is None:
+            self._index = {}
+            try:
+                meta_files = list(self.cache_dir.glob("*.json"))
+            except OSError:
+                meta_files = []
+            for meta_file in meta_files:
+                try:
+                    with open(meta_file, "r") as f:
+                        meta = json.load(f)
+                    self._index[meta_file.stem] = (meta["url"], meta.get("stored_at", 0))
+                except (OSError, ValueError, KeyError):
+                    continue
+        return self._index
+
+    @staticmethod
+    def _key(
+        url: str, headers: Optional[Dict[str, str]], scope: Optional[str] = None
+    ) -> str:
+        """Cache key for a URL, the representation and the credential"""
+        vary = {"accept": "", "authorization": ""}
+        for name, value in (headers or {}).items():
+            if name.lower() in vary:
+                vary[name.lower()] = value
+        credential = vary["authorization"] if scope is None else scope
+        material = f"{credential}|{vary['accept']}|{url}"
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()[:32]
+
+    def _meta_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _body_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.body"
+
+    def _remove_files(self, key: str) -> None:
+        for path in (self._meta_path(key), self._body_path(key)):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Retry Policy for JAMF API requests
+Exponential backoff with jitter for transient failures, retrying only
+requests that are safe to repeat
+"""
+
+import http.client
+import random
+from typing import Optional
+
+# Methods that can be repeated without side effects
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+
+# Gateway/server errors worth another attempt
+RETRY_STATUSES = (408, 429, 500, 502, 503, 504)
+
+# Transport errors worth another attempt (socket timeouts are OSErrors)
+RETRY_EXCEPTIONS = (OSError, http.client.HTTPException)
+
+
+class RetryPolicy:
+    """Decides whether and when to retry a failed request"""
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        max_delay: float = 30.0,
+        retry_non_idempotent: bool = False,
+    ):
+        """
+        Initialize retry policy
+
+        Args:
+            max_retries: Retries after the first attempt (0 disables retrying)
+            retry_delay: Base delay in seconds, doubled on every retry
+            max_delay: Upper bound for a single delay
+            retry_non_idempotent: Also retry POST/PATCH by default
+        """
+        self.max_retries = max(0, int(max_retries))
+        self.retry_delay = max(0.0, float(retry_delay))
+        self.max_delay = max_delay
+        self.retry_non_idempotent = retry_non_idempotent
+
+    @classmethod
+    def from_config(cls) -> "RetryPolicy":
+        """Create a policy from APIConfiguration"""
+        try:
+            from resources.config.central_config import central_config
+        except ImportError:
+            return cls()
+
+        api_config = central_config.api
+        if not api_config.auto_retry_failed_requests:
+            return cls(max_retries=0)
+        return cls(max_retries=api_config.max_retries, retry_delay=api_config.retry_delay)
+
+    def allows(self, method: str, retry: Optional[bool] = None) -> bool:
+        """
+        Check whether a request may be retried at all
+
+        Args:
+            method: HTTP method
+            retry: Per-request override (True opts POST/PATCH in, False opts out)
+        """
+        if self.max_retries == 0 or retry is False:
+            return False
+        if retry or self.retry_non_idempotent:
+            return True
+        return method.upper() in IDEMPOTENT_METHODS
+
+    def should_retry_status(self, status: int) -> bool:
+        """Check whether a response status is transient"""
+        return status in RETRY_STATUSES
+
+    def should_retry_error(self, error: Exception) -> bool:
+        """Check whether a transport error is transient"""
+        return isinstance(error, RETRY_EXCEPTIONS)
+
+    def get_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Get the delay before a retry
+
+        Args:
+            attempt: Retry number, starting at 1
+            retry_after: Server-requested delay, used as a lower bound
+
+        Returns:
+            Seconds to wait (half fixed, half random to spread out clients)
+        """
+        ceiling = min(self.max_delay, self.retry_delay * (2 ** (attempt - 1)))
+        delay = ceiling / 2 + random.uniform(0, ceiling / 2)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
@@ -9,10 +9,20 @@ from .manage_exports import (
     get_instance_prefix,
     clean_old_exports,
 )
+from .export_journal import ExportJournal
+from .export_state import ExportStateStore
+from .parquet_writer import ParquetStreamWriter
+from .stream_writers import STREAM_FORMATS, create_stream_writer, write_rows
 
 __all__ = [
     "generate_export_filename",
     "get_export_directory",
     "get_instance_prefix",
     "clean_old_exports",
+    "ExportJournal",
+    "ExportStateStore",
+    "ParquetStreamWriter",
+    "STREAM_FORMATS",
+    "create_stream_writer",
+    "write_rows",
 ]
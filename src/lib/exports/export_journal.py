@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Export Checkpoint Journal
+Append-only record of the rows an export has finished, one JSON line per
+object, so an interrupted export can resume where it stopped instead of
+starting over
+"""
+
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+
+def default_journal_dir() -> Path:
+    """Journals of unfinished exports: ~/.jpapi/state/journals"""
+    return Path.home() / ".jpapi" / "state" / "journals"
+
+
+def options_fingerprint(options: Dict[str, Any]) -> str:
+    """Hash of the options that shape an export's rows"""
+    canonical = json.dumps(options, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+class ExportJournal:
+    """
+    Checkpoint journal of one export (an environment and object type)
+
+    The first line describes the export's options; every other line holds
+    a finished object's ID and all of its formatted rows. Lines are flushed as they are
+    written, and a line cut short by a crash is ignored on reading.
+    """
+
+    def __init__(
+        self, environment: str, export_name: str, directory: Optional[Path] = None
+    ):
+        safe_name = re.sub(r"[^A-Za-z0-9_-]+", "-", f"{environment}-{export_name}")
+        self.path = Path(directory or default_journal_dir()) / f"{safe_name}.jsonl"
+        self.recorded = 0
+        self._file = None
+
+    def start(self, options: Dict[str, Any]) -> None:
+        """Begin a new journal, replacing any earlier one"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._write({"options": options_fingerprint(options)})
+        self.recorded = 0
+
+    def resume(self, options: Dict[str, Any]) -> bool:
+        """
+        Continue the earlier journal of an export with the same options
+
+        Returns:
+            False (and nothing is opened) when there is no journal or it was
+            written with different options; call start() instead
+        """
+        header = next(self._entries(), None)
+        if header is None or header.get("options") != options_fingerprint(options):
+            return False
+        self.recorded = len(self.completed_ids())
+        with open(self.path, "rb") as f:
+            f.seek(-1, 2)
+            cut_short = f.read(1) != b"\n"
+        self._file = open(self.path, "a", encoding="utf-8")
+        if cut_short:
+            self._file.write("\n")  # End the line a crash left unfinished
+        return True
+
+    def completed_ids(self) -> Set[str]:
+        """IDs of the objects the journal has rows for"""
+        return {str(entry["id"]) for entry in self._entries() if "id" in entry}
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        """Journaled rows in the order they were written"""
+        for entry in self._entries():
+            yield from entry.get("rows", [])
+
+    def record(self, object_id: Any, rows: List[Dict[str, Any]]) -> None:
+        """Record a finished object's rows"""
+        self._write({"id": str(object_id), "rows": rows})
+        self.recorded += 1
+
+    def close(self) -> None:
+        """Close the journal, keeping it for a later resume"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def discard(self) -> None:
+        """Close and delete the journal once the export has finished"""
+        self.close()
+        if self.path.exists():
+            self.path.unlink()
+
+    def _write(self, entry: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(entry, default=str) + "\n")
+        self._file.flush()
+
+    def _entries(self) -> Iterator[Dict[str, Any]]:
+        if not self.path.exists():
+            return
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue  # Cut short by a crash mid-write
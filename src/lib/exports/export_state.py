@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Export State Store
+Remembers each exported object's summary fingerprint and detail response in
+SQLite, so incremental exports only fetch details for new or changed objects
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+# Cached details older than this are fetched again (a week)
+DEFAULT_MAX_AGE = 7 * 24 * 3600
+# Classic API list entries carry only id and name, so their fingerprints
+# miss most edits; those details are fetched again after a day instead
+CLASSIC_MAX_AGE = 24 * 3600
+
+# Stay below SQLite's limit on query parameters
+_LOOKUP_CHUNK = 500
+
+
+def default_state_path() -> Path:
+    """State database shared by every export: ~/.jpapi/state/exports.db"""
+    return Path.home() / ".jpapi" / "state" / "exports.db"
+
+
+def default_max_age(source: str) -> float:
+    """Default max_age for details from a detail endpoint (template)"""
+    return CLASSIC_MAX_AGE if source.startswith("/JSSResource/") else DEFAULT_MAX_AGE
+
+
+def fingerprint(item: Dict[str, Any]) -> str:
+    """
+    Content hash of an object's summary (list) entry
+
+    Modification markers in the entry (modified dates, report dates) are
+    part of the hash, so any change to them counts as a change.
+    """
+    canonical = json.dumps(item, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ExportStateStore:
+    """Per-object fingerprints and detail responses from earlier exports"""
+
+    def __init__(
+        self,
+        environment: str,
+        db_path: Optional[Path] = None,
+        max_age: Optional[float] = DEFAULT_MAX_AGE,
+    ):
+        """
+        Open (creating if needed) the state database
+
+        Args:
+            environment: Environment the objects belong to
+            db_path: Database file (default_state_path() when None)
+            max_age: Seconds a saved detail stays usable (None: forever)
+        """
+        self.environment = environment
+        self.db_path = Path(db_path or default_state_path())
+        self.max_age = max_age
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path))
+        self._init_db()
+
+    def _init_db(self) -> None:
+        """Initialize SQLite database schema"""
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS export_objects
+                (
+                    environment TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    object_id TEXT NOT NULL,
+                    fingerprint TEXT NOT NULL,
+                    detail TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    PRIMARY KEY (environment, source, object_id)
+                )
+            """
+            )
+
+    def lookup(
+        self, source: str, items: Sequence[Dict[str, Any]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Saved details for items whose summary is unchanged
+
+        Args:
+            source: What the details came from (the detail endpoint template)
+            items: Summary objects with an "id"
+
+        Returns:
+            The saved detail response, or None when the object is new,
+            changed or its detail is older than max_age; in items order
+        """
+        saved: Dict[str, Any] = {}
+        ids = [str(item.get("id")) for item in items]
+        for start in range(0, len(ids), _LOOKUP_CHUNK):
+            chunk = ids[start : start + _LOOKUP_CHUNK]
+            cursor = self._conn.execute(
+                "SELECT object_id, fingerprint, detail, fetched_at "
+                "FROM export_objects WHERE environment = ? AND source = ? "
+                f"AND object_id IN ({', '.join('?' * len(chunk))})",
+                [self.environment, source, *chunk],
+            )
+            for object_id, digest, detail, fetched_at in cursor:
+                saved[object_id] = (digest, detail, fetched_at)
+
+        oldest = time.time() - self.max_age if self.max_age is not None else None
+        details: List[Optional[Dict[str, Any]]] = []
+        for object_id, item in zip(ids, items):
+            entry = saved.get(object_id)
+            if (
+                entry is None
+                or entry[0] != fingerprint(item)
+                or (oldest is not None and entry[2] < oldest)
+            ):
+                details.append(None)
+            else:
+                details.append(json.loads(entry[1]))
+        return details
+
+    def save(
+        self,
+        source: str,
+        items: Sequence[Dict[str, Any]],
+        details: Sequence[Optional[Dict[str, Any]]],
+    ) -> None:
+        """Record freshly fetched details (items whose fetch failed are skipped)"""
+        now = time.time()
+        rows = [
+            (
+                self.environment,
+                source,
+                str(item.get("id")),
+                fingerprint(item),
+                json.dumps(detail),
+                now,
+            )
+            for item, detail in zip(items, details)
+            if detail is not None
+        ]
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO export_objects "
+                "(environment, source, object_id, fingerprint, detail, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def close(self) -> None:
+        """Close the database"""
+        self._conn.close()
+
+    def __enter__(self) -> "ExportStateStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Parquet export writer
+Columnar export output with typed columns: booleans, integer IDs, numbers,
+dates and timestamps keep their type, and strings that repeat (categories,
+departments, sites) are dictionary-encoded. Requires pyarrow.
+"""
+
+import json
+import re
+import shutil
+import tempfile
+from datetime import date, datetime
+from typing import IO, Any, Callable, Dict, List, Optional, Sequence
+
+from .stream_writers import StreamWriter, discover_columns
+
+# Rows per Parquet row group; the first group decides the initial column types
+ROW_GROUP_SIZE = 10000
+
+# String columns with at most this share of distinct values are
+# dictionary-encoded
+DICTIONARY_RATIO = 0.5
+
+_HYPERLINK = re.compile(r'^=HYPERLINK\("[^"]*","(.*)"\)$')
+_INTEGER = re.compile(r"^-?(0|[1-9]\d{0,17})$")
+_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_DATETIME = re.compile(
+    r"^(\d{4}-\d{2}-\d{2})[T ](\d{2}:\d{2}(?::\d{2})?)(?:\.(\d{1,6})\d*)?"
+    r"(Z|[+-]\d{2}:?\d{2})?$"
+)
+_INT64_MAX = 2**63 - 1
+
+
+def unwrap_hyperlink(value: Any) -> Any:
+    """Label of a spreadsheet =HYPERLINK() formula (other values unchanged)"""
+    if isinstance(value, str):
+        match = _HYPERLINK.match(value)
+        if match:
+            return match.group(1)
+    return value
+
+
+def parse_datetime(value: str) -> Optional[datetime]:
+    """
+    Parse the ISO 8601 timestamps Jamf returns
+
+    Accepts "2024-01-15 10:23:45", "2024-01-15T10:23:45.123Z" and
+    "...+0000" style offsets. Returns None for anything else.
+    """
+    match = _DATETIME.match(value)
+    if not match:
+        return None
+    day, clock, fraction, offset = match.groups()
+    text = f"{day}T{clock}"
+    if fraction:
+        text += "." + fraction.ljust(6, "0")
+    if offset == "Z":
+        text += "+00:00"
+    elif offset:
+        text += offset if ":" in offset else f"{offset[:3]}:{offset[3:]}"
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        return None
+
+
+def _is_null(value: Any) -> bool:
+    return value is None or value == ""
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    raise ValueError(value)
+
+
+def _to_int(value: Any) -> int:
+    if isinstance(value, int) and not isinstance(value, bool):
+        if abs(value) <= _INT64_MAX:
+            return value
+    elif isinstance(value, str) and _INTEGER.match(value):
+        return int(value)
+    raise ValueError(value)
+
+
+def _to_float(value: Any) -> float:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    raise ValueError(value)
+
+
+def _to_date(value: Any) -> date:
+    if isinstance(value, str) and _DATE.match(value):
+        return date.fromisoformat(value)
+    raise ValueError(value)
+
+
+def _to_timestamp(aware: bool) -> Callable[[Any], datetime]:
+    def convert(value: Any) -> datetime:
+        parsed = parse_datetime(value) if isinstance(value, str) else None
+        if parsed is None or (parsed.tzinfo is not None) != aware:
+            raise ValueError(value)
+        return parsed
+
+    return convert
+
+
+def _to_string(value: Any) -> str:
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str)
+    return str(value)
+
+
+_CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    "bool": _to_bool,
+    "int": _to_int,
+    "float": _to_float,
+    "date": _to_date,
+    "timestamp": _to_timestamp(aware=False),
+    "timestamp_utc": _to_timestamp(aware=True),
+    "string": _to_string,
+    "dictionary": _to_string,
+}
+
+
+def infer_column_type(values: Sequence[Any]) -> str:
+    """
+    Column type for a sample of values (hyperlink formulas already unwrapped)
+
+    Returns:
+        One of "bool", "int", "float", "date", "timestamp" (naive),
+        "timestamp_utc" (with offsets), "dictionary" (repeated strings) or
+        "string". Empty strings and None are nulls and do not count.
+    """
+    present = [value for value in values if not _is_null(value)]
+    if not present:
+        return "string"
+    for kind in ("bool", "int", "float", "date", "timestamp", "timestamp_utc"):
+        try:
+            for value in present:
+                _CONVERTERS[kind](value)
+        except ValueError:
+            continue
+        return kind
+    distinct = {_to_string(value) for value in present}
+    if len(present) > 1 and len(distinct) <= len(present) * DICTIONARY_RATIO:
+        return "dictionary"
+    return "string"
+
+
+def require_pyarrow():
+    """pyarrow and pyarrow.parquet, or ImportError with an install hint"""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("pyarrow required for Parquet export: pip install pyarrow")
+    return pyarrow, pyarrow.parquet
+
+
+class ParquetStreamWriter(StreamWriter):
+    """
+    Rows written to a Parquet file one row group at a time
+
+    Column types are inferred from the first row group. A later value that
+    does not fit its column's type widens the column to string
+    (widened_columns), and columns first seen later are added, null in
+    earlier rows. Given fieldnames are kept as they are: other columns are
+    left out (dropped_columns), like the CSV writer. Spreadsheet
+    =HYPERLINK() formulas are stored as their label, so ID columns are
+    integers.
+
+    Row groups are spooled to a temporary file and copied to the stream by
+    close(); when the schema changed on the way, close() rewrites the earlier
+    row groups to the final schema. An interrupted export still closes the
+    writer, keeping finished row groups. A file is written even without
+    rows, with the known columns (or none).
+    """
+
+    def __init__(
+        self,
+        stream: IO[bytes],
+        fieldnames: Optional[Sequence[str]] = None,
+        row_group_size: int = ROW_GROUP_SIZE,
+    ):
+        self._pa, self._pq = require_pyarrow()
+        super().__init__(stream)
+        self.fieldnames = list(fieldnames) if fieldnames else None
+        self.row_group_size = row_group_size
+        self.column_types: Dict[str, str] = {}
+        self.dropped_columns: List[str] = []
+        self.widened_columns: List[str] = []
+        self._fixed_columns = self.fieldnames is not None
+        self._pending: List[Dict[str, Any]] = []
+        self._segments: List[IO[bytes]] = []
+        self._schema = None
+        self._writer = None
+        self._closed = False
+
+    def write(self, row: Dict[str, Any]) -> None:
+        self._pending.append(row)
+        self.rows_written += 1
+        if len(self._pending) >= self.row_group_size:
+            self._flush()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if self._pending:
+                self._flush()
+            if self._writer is None:
+                self._write_empty()
+            else:
+                self._writer.close()
+                self._write_segments()
+        finally:
+            for segment in self._segments:
+                segment.close()
+            self._segments = []
+        super().close()
+
+    def _flush(self) -> None:
+        rows = [
+            {column: unwrap_hyperlink(value) for column, value in row.items()}
+            for row in self._pending
+        ]
+        self._pending = []
+        if not self.fieldnames:
+            self.fieldnames = discover_columns(rows)
+            if not self.fieldnames:
+                return  # Nothing to write yet: no rows and no columns
+
+        changed = self._writer is None
+        for column in discover_columns(rows):
+            if column in self.fieldnames or column in self.dropped_columns:
+                continue
+            if self._fixed_columns:
+                self.dropped_columns.append(column)
+            else:
+                self.fieldnames.append(column)
+        for column in self.fieldnames:
+            if column not in self.column_types:
+                self.column_types[column] = infer_column_type(
+                    [row.get(column) for row in rows]
+                )
+                changed = True
+
+        arrays = []
+        for column in self.fieldnames:
+            values = [row.get(column) for row in rows]
+            try:
+                arrays.append(self._column_array(column, values))
+            except ValueError:
+                self.column_types[column] = "string"
+                self.widened_columns.append(column)
+                changed = True
+                arrays.append(self._column_array(column, values))
+
+        if changed:
+            self._schema = self._pa.schema(
+                [
+                    (column, self._arrow_type(self.column_types[column]))
+                    for column in self.fieldnames
+                ]
+            )
+            self._open_segment()
+        self._writer.write_table(
+            self._pa.Table.from_arrays(arrays, schema=self._schema)
+        )
+
+    def _open_segment(self) -> None:
+        """Start a spool file for row groups with the current schema"""
+        if self._writer is not None:
+            self._writer.close()
+        segment = tempfile.TemporaryFile()
+        self._segments.append(segment)
+        self._writer = self._pq.ParquetWriter(segment, self._schema)
+
+    def _write_segments(self) -> None:
+        """Copy the spooled row groups to the stream in the final schema"""
+        if len(self._segments) == 1:
+            segment = self._segments[0]
+            segment.seek(0)
+            shutil.copyfileobj(segment, self.stream)
+            return
+        writer = self._pq.ParquetWriter(self.stream, self._schema)
+        try:
+            for segment in self._segments:
+                segment.seek(0)
+                spooled = self._pq.ParquetFile(segment)
+                for index in range(spooled.num_row_groups):
+                    writer.write_table(
+                        self._conform(spooled.read_row_group(index))
+                    )
+        finally:
+            writer.close()
+
+    def _write_empty(self) -> None:
+        """Write a valid file with no rows and the known columns"""
+        string = self._arrow_type("string")
+        schema = self._pa.schema(
+            [(column, string) for column in self.fieldnames or []]
+        )
+        self._pq.write_table(schema.empty_table(), self.stream)
+
+    def _conform(self, table):
+        """Row group from an earlier segment, cast to the final schema"""
+        pa = self._pa
+        arrays = []
+        for field in self._schema:
+            if field.name not in table.column_names:
+                arrays.append(pa.nulls(table.num_rows, type=field.type))
+                continue
+            column = table.column(field.name)
+            if column.type != field.type:
+                if pa.types.is_boolean(column.type):
+                    # Match _to_string for values written after the widening
+                    column = pa.array(
+                        [None if v is None else str(v) for v in column.to_pylist()],
+                        type=field.type,
+                    )
+                else:
+                    column = column.cast(field.type)
+            arrays.append(column)
+        return pa.Table.from_arrays(arrays, schema=self._schema)
+
+    def _arrow_type(self, kind: str):
+        pa = self._pa
+        return {
+            "bool": pa.bool_(),
+            "int": pa.int64(),
+            "float": pa.float64(),
+            "date": pa.date32(),
+            "timestamp": pa.timestamp("us"),
+            "timestamp_utc": pa.timestamp("us", tz="UTC"),
+            "string": pa.string(),
+            "dictionary": pa.dictionary(pa.int32(), pa.string()),
+        }[kind]
+
+    def _column_array(self, column: str, values: List[Any]):
+        """
+        Arrow array for a column's values
+
+        Raises:
+            ValueError: A value does not fit the column's type
+        """
+        kind = self.column_types[column]
+        convert = _CONVERTERS[kind]
+        textual = kind in ("string", "dictionary")
+        converted = [
+            None if value is None or (value == "" and not textual) else convert(value)
+            for value in values
+        ]
+        if kind == "dictionary":
+            strings = self._pa.array(converted, type=self._pa.string())
+            return strings.dictionary_encode()
+        return self._pa.array(converted, type=self._arrow_type(kind))
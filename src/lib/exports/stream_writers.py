@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Streaming export writers
+Write export rows to a file as they are produced instead of rendering the
+whole export in memory first. Every row is flushed as it is written, so an
+interrupted export keeps the rows it finished.
+"""
+
+import csv
+import json
+from itertools import islice
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# Rows used to discover columns when none are given up front
+COLUMN_SAMPLE_SIZE = 100
+
+STREAM_FORMATS = ("csv", "json", "ndjson", "parquet")
+
+
+def discover_columns(rows: Iterable[Dict[str, Any]]) -> List[str]:
+    """Union of row keys in first-seen order"""
+    columns: Dict[str, None] = {}
+    for row in rows:
+        columns.update(dict.fromkeys(row))
+    return list(columns)
+
+
+def peek_rows(
+    rows: Iterable[Dict[str, Any]], count: int = COLUMN_SAMPLE_SIZE
+) -> Tuple[List[Dict[str, Any]], Iterator[Dict[str, Any]]]:
+    """
+    Read the first rows of a stream without losing them
+
+    Returns:
+        (first rows, iterator over all rows including the first ones)
+    """
+    iterator = iter(rows)
+    head = list(islice(iterator, count))
+
+    def chained() -> Iterator[Dict[str, Any]]:
+        yield from head
+        yield from iterator
+
+    return head, chained()
+
+
+class StreamWriter:
+    """Base class: write rows one at a time, finish with close()"""
+
+    def __init__(self, stream: IO[str]):
+        self.stream = stream
+        self.rows_written = 0
+
+    def write(self, row: Dict[str, Any]) -> None:
+        """Write one row"""
+        raise NotImplementedError
+
+    def write_rows(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """Write every row of an iterable, returning how many were written"""
+        for row in rows:
+            self.write(row)
+        return self.rows_written
+
+    def close(self) -> None:
+        """Finish the output (the stream itself is left open)"""
+        self.stream.flush()
+
+    def __enter__(self) -> "StreamWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        # Also on errors and Ctrl-C: finished rows stay readable
+        self.close()
+
+
+class CSVStreamWriter(StreamWriter):
+    """
+    CSV rows with a stable header
+
+    The header is the given fieldnames, or the union of the columns of
+    the first rows (buffered until COLUMN_SAMPLE_SIZE rows have arrived).
+    Columns that first appear after the header is written are left out and
+    listed in dropped_columns; missing values are written empty.
+    """
+
+    def __init__(
+        self,
+        stream: IO[str],
+        fieldnames: Optional[Sequence[str]] = None,
+        sample_size: int = COLUMN_SAMPLE_SIZE,
+    ):
+        super().__init__(stream)
+        self.fieldnames = list(fieldnames) if fieldnames else None
+        self.sample_size = sample_size
+        self.dropped_columns: List[str] = []
+        self._pending: List[Dict[str, Any]] = []
+        self._writer: Optional[csv.DictWriter] = None
+
+    def write(self, row: Dict[str, Any]) -> None:
+        if self._writer is None:
+            self._pending.append(row)
+            if self.fieldnames or len(self._pending) >= self.sample_size:
+                self._start()
+            return
+        self._write_row(row)
+
+    def close(self) -> None:
+        if self._writer is None and self._pending:
+            self._start()
+        super().close()
+
+    def _start(self) -> None:
+        if not self.fieldnames:
+            self.fieldnames = discover_columns(self._pending)
+        self._writer = csv.DictWriter(
+            self.stream, fieldnames=self.fieldnames, restval="", extrasaction="ignore"
+        )
+        self._known = set(self.fieldnames)
+        self._writer.writeheader()
+        pending, self._pending = self._pending, []
+        for row in pending:
+            self._write_row(row)
+
+    def _write_row(self, row: Dict[str, Any]) -> None:
+        for column in row:
+            if column not in self._known:
+                self._known.add(column)
+                self.dropped_columns.append(column)
+        self._writer.writerow(row)
+        self.stream.flush()
+        self.rows_written += 1
+
+
+class NDJSONStreamWriter(StreamWriter):
+    """One JSON object per line"""
+
+    def write(self, row: Dict[str, Any]) -> None:
+        self.stream.write(json.dumps(row, default=str) + "\n")
+        self.stream.flush()
+        self.rows_written += 1
+
+
+class JSONArrayStreamWriter(StreamWriter):
+    """
+    A JSON array written element by element
+
+    The output is identical to json.dumps(rows, indent=2); close() writes
+    the closing bracket, so an interrupted export is still valid JSON.
+    """
+
+    def write(self, row: Dict[str, Any]) -> None:
+        element = json.dumps(row, indent=2, default=str).replace("\n", "\n  ")
+        self.stream.write(("[\n  " if not self.rows_written else ",\n  ") + element)
+        self.stream.flush()
+        self.rows_written += 1
+
+    def close(self) -> None:
+        self.stream.write("\n]" if self.rows_written else "[]")
+        super().close()
+
+
+def create_stream_writer(
+    stream: IO, format: str, fieldnames: Optional[Sequence[str]] = None
+) -> StreamWriter:
+    """
+    Create the streaming writer for an export format
+
+    Args:
+        stream: Stream to write to (binary for Parquet, text otherwise)
+        format: One of STREAM_FORMATS
+        fieldnames: CSV/Parquet columns (discovered from the rows when None)
+
+    Raises:
+        ValueError: Format cannot be streamed
+    """
+    if format == "csv":
+        return CSVStreamWriter(stream, fieldnames)
+    if format == "ndjson":
+        return NDJSONStreamWriter(stream)
+    if format == "json":
+        return JSONArrayStreamWriter(stream)
+    if format == "parquet":
+        from .parquet_writer import ParquetStreamWriter
+
+        return ParquetStreamWriter(stream, fieldnames)
+    raise ValueError(f"Cannot stream '{format}' output; use one of {STREAM_FORMATS}")
+
+
+def write_rows(
+    path: Path,
+    rows: Iterable[Dict[str, Any]],
+    format: str,
+    fieldnames: Optional[Sequence[str]] = None,
+) -> StreamWriter:
+    """
+    Stream rows into a file, creating its directory
+
+    Returns:
+        The closed writer (rows_written; dropped_columns for CSV and
+        Parquet; widened_columns for Parquet)
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if format == "parquet":
+        stream = open(path, "wb")
+    else:
+        newline = "" if format == "csv" else None
+        stream = open(path, "w", encoding="utf-8", newline=newline)
+    with stream:
+        with create_stream_writer(stream, format, fieldnames) as writer:
+            writer.write_rows(rows)
+    return writer
@@ -4,9 +4,11 @@ Implements managers for various JAMF Pro operations
 """
 
 from .computer_manager import ComputerManager
+from .computer_search_manager import ComputerSearchManager
 from .mobile_device_manager import MobileDeviceManager
 
 __all__ = [
     "ComputerManager",
+    "ComputerSearchManager",
     "MobileDeviceManager",
 ]
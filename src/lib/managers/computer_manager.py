@@ -7,9 +7,11 @@ import json
 import csv
 import os
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Union
 from pathlib import Path
 
+from core.http.json_stream import stream_list
+
 class ComputerManager:
     """
     Comprehensive computer management with export/sync capabilities
@@ -37,6 +39,31 @@ class ComputerManager:
         Returns:
             List of computer objects with enhanced data
         """
+        try:
+            return list(self.iter_computers(use_cache, cache_ttl_minutes))
+        except Exception as e:
+            print(f"❌ Error fetching computers: {e}")
+            # If it's a 401 error, it might mean no computers exist or no permission
+            if "401" in str(e):
+                print("ℹ️  No computers found or insufficient permissions for computer management")
+            return []
+    
+    def iter_computers(self, use_cache: bool = True, cache_ttl_minutes: int = 30) -> Iterator[Dict]:
+        """
+        Iterate all computers, streaming them from the API as they arrive
+        
+        The computer list is parsed incrementally, so the first computer is
+        available before the whole (multi-megabyte) response has been read.
+        The cache file is written alongside and only replaces the old one
+        once the list has been read completely.
+        
+        Args:
+            use_cache: Whether to use cached data
+            cache_ttl_minutes: Cache TTL in minutes
+            
+        Yields:
+            Computer objects with enhanced data
+        """
         cache_file = self.cache_dir / "computers.json"
         
         # Check cache validity
@@ -45,41 +72,33 @@ class ComputerManager:
             if cache_age < timedelta(minutes=cache_ttl_minutes):
                 try:
                     with open(cache_file, 'r') as f:
-                        return json.load(f)
-                except:
+                        cached = json.load(f)
+                    yield from cached
+                    return
+                except (OSError, ValueError):
                     pass
         
-        # Fetch from API
+        # Stream from API, enhancing and caching each computer as it is parsed
+        print("🔄 Streaming /JSSResource/computers")
+        partial_file = cache_file.with_suffix(".json.partial")
+        completed = False
         try:
-            print("🔄 Getting fresh token for /JSSResource/computers")
-            response = self.auth.api_request('GET', "/JSSResource/computers")
-            print(f"🔍 Debug: Response type: {type(response)}")
-            if response:
-                print(f"🔍 Debug: Response keys: {list(response.keys()) if isinstance(response, dict) else 'Not a dict'}")
-            
-            if response and 'computers' in response:
-                computers = response['computers']
-                
-                # Enhance each computer with additional data
-                enhanced_computers = []
-                for computer in computers:
+            with open(partial_file, 'w') as f:
+                f.write("[")
+                for index, computer in enumerate(
+                    stream_list(self.auth, "/JSSResource/computers", ("computers",))
+                ):
                     enhanced_computer = self._enhance_computer_data(computer)
-                    enhanced_computers.append(enhanced_computer)
-                
-                # Cache the results
-                with open(cache_file, 'w') as f:
-                    json.dump(enhanced_computers, f, indent=2)
-                
-                return enhanced_computers
+                    f.write(("," if index else "") + "\n" + json.dumps(enhanced_computer))
+                    yield enhanced_computer
+                f.write("\n]\n")
+            completed = True
+        finally:
+            # Only a complete list replaces the cache
+            if completed:
+                partial_file.replace(cache_file)
             else:
-                return []
-                
-        except Exception as e:
-            print(f"❌ Error fetching computers: {e}")
-            # If it's a 401 error, it might mean no computers exist or no permission
-            if "401" in str(e):
-                print("ℹ️  No computers found or insufficient permissions for computer management")
-            return []
+                partial_file.unlink(missing_ok=True)
     
     def get_all_computer_groups(self, use_cache: bool = True, cache_ttl_minutes: int = 60) -> List[Dict]:
         """
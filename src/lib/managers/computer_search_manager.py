@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Computer Search Manager for JPAPI
+Criteria searches against the Jamf Pro computers-inventory endpoint, with
+the filters pushed server-side as RSQL so only matching computers (and only
+the requested inventory sections) come back
+"""
+
+import re
+import urllib.parse
+from typing import Any, Dict, List, Optional, Sequence
+
+from core.http.async_client import fetch_all_pages
+from lib.utils.field_projection import SUMMARY, FieldCatalog, select_fields
+
+INVENTORY_ENDPOINT = "/api/v1/computers-inventory"
+DEPARTMENTS_ENDPOINT = "/api/v1/departments"
+BUILDINGS_ENDPOINT = "/api/v1/buildings"
+
+INVENTORY_SECTIONS = ("GENERAL", "HARDWARE", "OPERATING_SYSTEM", "USER_AND_LOCATION")
+
+# Result columns and the inventory section each one is read from
+INVENTORY_COLUMNS = FieldCatalog(
+    {
+        "ID": SUMMARY,
+        "Name": "GENERAL",
+        "Model": "HARDWARE",
+        "Serial": "HARDWARE",
+        "OS Version": "OPERATING_SYSTEM",
+        "Department": "USER_AND_LOCATION",
+        "Building": "USER_AND_LOCATION",
+        "Managed": "GENERAL",
+        "Last Contact": "GENERAL",
+    }
+)
+BASIC_COLUMNS = ("ID", "Name", "Model", "Serial", "OS Version")
+DETAILED_COLUMNS = INVENTORY_COLUMNS.columns
+
+# Search criteria -> computers-inventory RSQL field
+INVENTORY_FIELDS = {
+    "name": "general.name",
+    "model": "hardware.model",
+    "os_version": "operatingSystem.version",
+    "managed": "general.remoteManagement.managed",
+    "department": "userAndLocation.departmentId",
+    "building": "userAndLocation.buildingId",
+}
+
+
+# Statuses of a server without computers-inventory (or its RSQL filter);
+# only these make a search fall back to the Classic API
+UNSUPPORTED_STATUSES = ("400", "404")
+_FAILED_STATUS = re.compile(r"API request failed \((\d{3})\)")
+
+
+def endpoint_unsupported(error: Exception) -> bool:
+    """Whether a search error means the Jamf Pro API search is not available"""
+    match = _FAILED_STATUS.match(str(error))
+    return bool(match) and match.group(1) in UNSUPPORTED_STATUSES
+
+
+def rsql_quote(value: str) -> str:
+    """Quote an RSQL argument, escaping quotes and backslashes"""
+    escaped = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def _contains(field: str, value: str) -> str:
+    """Case-insensitive substring match, as the Classic search does"""
+    return f"{field}=={rsql_quote(f'*{value}*')}"
+
+
+def build_inventory_filter(
+    criteria: Dict[str, Any],
+    department_ids: Optional[Sequence[str]] = None,
+    building_ids: Optional[Sequence[str]] = None,
+) -> str:
+    """
+    Build the RSQL filter for a computer criteria search
+
+    Matching follows the Classic search: names with * are prefix patterns
+    and plain names, models and versions match substrings; versions also
+    take >=, <= and = comparisons.
+
+    Args:
+        criteria: name, model, os_version and managed ("true"/"false")
+        department_ids: Department IDs to match (None for any)
+        building_ids: Building IDs to match (None for any)
+
+    Returns:
+        RSQL expression ("" when nothing is filtered)
+    """
+    clauses = []
+
+    name = criteria.get("name")
+    if name:
+        if "*" in name:
+            pattern = name if name.endswith("*") else f"{name}*"
+            clauses.append(f"{INVENTORY_FIELDS['name']}=={rsql_quote(pattern)}")
+        else:
+            clauses.append(_contains(INVENTORY_FIELDS["name"], name))
+
+    if criteria.get("model"):
+        clauses.append(_contains(INVENTORY_FIELDS["model"], criteria["model"]))
+
+    version = criteria.get("os_version")
+    if version:
+        field = INVENTORY_FIELDS["os_version"]
+        for operator in (">=", "<=", "="):
+            if version.startswith(operator):
+                rsql_operator = "==" if operator == "=" else operator
+                value = version[len(operator):]
+                clauses.append(f"{field}{rsql_operator}{rsql_quote(value)}")
+                break
+        else:
+            clauses.append(_contains(field, version))
+
+    if criteria.get("managed"):
+        clauses.append(f"{INVENTORY_FIELDS['managed']}=={criteria['managed']}")
+
+    for key, ids in (("department", department_ids), ("building", building_ids)):
+        if ids is not None:
+            clauses.append(f"{INVENTORY_FIELDS[key]}=in=({','.join(ids)})")
+
+    return ";".join(clauses)
+
+
+class ComputerSearchManager:
+    """Server-side filtered computer searches over the Jamf Pro API"""
+
+    def __init__(self, auth, page_size: int = 1000):
+        """
+        Initialize search manager
+
+        Args:
+            auth: Auth object for API calls
+            page_size: computers-inventory page size
+        """
+        self.auth = auth
+        self.page_size = page_size
+
+    def search(
+        self, criteria: Dict[str, Any], fields: Optional[Sequence[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Search computers by criteria
+
+        Department and building names are matched (by substring) against
+        the small departments/buildings collections first, so the inventory
+        query itself filters on their IDs. Only the inventory sections the
+        result columns are read from are requested.
+
+        Args:
+            criteria: name, model, os_version, department, building and
+                managed; missing or empty values are not filtered on
+            fields: Result columns (see INVENTORY_COLUMNS); by default the
+                basic columns, plus location and management columns when
+                the search used department, building or managed
+
+        Returns:
+            Result rows
+
+        Raises:
+            Exception: The Jamf Pro API request failed; endpoint_unsupported()
+                tells a Jamf Pro version without computers-inventory apart
+                from other failures (missing privileges, an open circuit)
+        """
+        columns = list(fields or ())
+        if not columns:
+            detailed = any(
+                criteria.get(key) for key in ("department", "building", "managed")
+            )
+            columns = list(DETAILED_COLUMNS if detailed else BASIC_COLUMNS)
+
+        departments: Dict[str, str] = {}
+        buildings: Dict[str, str] = {}
+        if criteria.get("department") or "Department" in columns:
+            departments = self._names_by_id(DEPARTMENTS_ENDPOINT)
+        if criteria.get("building") or "Building" in columns:
+            buildings = self._names_by_id(BUILDINGS_ENDPOINT)
+        department_ids = self._matching_ids(departments, criteria.get("department"))
+        building_ids = self._matching_ids(buildings, criteria.get("building"))
+        if department_ids == [] or building_ids == []:
+            return []
+
+        rsql = build_inventory_filter(criteria, department_ids, building_ids)
+        # Jamf Pro returns GENERAL when no section is given, so always name one
+        sections = INVENTORY_COLUMNS.sections(columns, INVENTORY_SECTIONS)
+        computers = fetch_all_pages(
+            self.auth,
+            self.inventory_query(rsql, sections or ("GENERAL",)),
+            page_size=self.page_size,
+        )
+        return select_fields(
+            (self._format_result(c, departments, buildings) for c in computers),
+            columns,
+        )
+
+    @staticmethod
+    def inventory_query(rsql: str, sections: Sequence[str]) -> str:
+        """computers-inventory endpoint with section and filter parameters"""
+        params = [("section", section) for section in sections]
+        if rsql:
+            params.append(("filter", rsql))
+        return f"{INVENTORY_ENDPOINT}?{urllib.parse.urlencode(params)}"
+
+    def _names_by_id(self, endpoint: str) -> Dict[str, str]:
+        """All names of a small collection, keyed by ID"""
+        items = fetch_all_pages(self.auth, endpoint, page_size=self.page_size)
+        return {str(item.get("id")): item.get("name", "") for item in items}
+
+    @staticmethod
+    def _matching_ids(
+        names: Dict[str, str], value: Optional[str]
+    ) -> Optional[List[str]]:
+        """IDs whose name contains value (None when not filtering)"""
+        if not value:
+            return None
+        value = value.lower()
+        return [object_id for object_id, name in names.items() if value in name.lower()]
+
+    @staticmethod
+    def _format_result(
+        computer: Dict[str, Any],
+        departments: Dict[str, str],
+        buildings: Dict[str, str],
+    ) -> Dict[str, Any]:
+        """Result row with the same columns as the Classic search"""
+        general = computer.get("general") or {}
+        hardware = computer.get("hardware") or {}
+        location = computer.get("userAndLocation") or {}
+        return {
+            "ID": computer.get("id", ""),
+            "Name": general.get("name", ""),
+            "Model": hardware.get("model", ""),
+            "Serial": hardware.get("serialNumber", ""),
+            "OS Version": (computer.get("operatingSystem") or {}).get("version", ""),
+            "Department": departments.get(str(location.get("departmentId")), ""),
+            "Building": buildings.get(str(location.get("buildingId")), ""),
+            "Managed": (general.get("remoteManagement") or {}).get("managed", False),
+            "Last Contact": general.get("lastContactTime", ""),
+        }
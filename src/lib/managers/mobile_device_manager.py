@@ -10,6 +10,10 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Union
 from pathlib import Path
 
+from core.http.async_client import AsyncJamfClient, run_sync
+from core.http.json_stream import stream_list
+
+
 class MobileDeviceManager:
     """
     Comprehensive mobile device management with export/sync capabilities
@@ -50,35 +54,35 @@ class MobileDeviceManager:
                     pass
         
         try:
-            # Get basic device list
-            devices_response = self.auth.api_request('GET', '/JSSResource/mobiledevices')
-            if not devices_response or 'mobile_devices' not in devices_response:
+            # Get basic device list, parsed as it streams in
+            device_summaries = [
+                d
+                for d in stream_list(self.auth, '/JSSResource/mobiledevices', ('mobile_devices',))
+                if d.get('id')
+            ]
+            if not device_summaries:
                 return []
-            
-            devices = devices_response['mobile_devices']
             enhanced_devices = []
             
+            # Fetch device details concurrently
+            detail_responses = run_sync(self._fetch_device_details(device_summaries))
+            
             # Enhance each device with detailed information
-            for device_summary in devices:
-                try:
-                    device_id = device_summary.get('id')
-                    if device_id:
-                        # Get detailed device info
-                        detail_response = self.auth.api_request('GET', f'/JSSResource/mobiledevices/id/{device_id}')
-                        if detail_response and 'mobile_device' in detail_response:
-                            device_detail = detail_response['mobile_device']
-                            
-                            # Enhance with summary data and computed fields
-                            device_detail['_summary'] = device_summary
-                            device_detail['_device_type'] = self._determine_device_type(device_detail)
-                            device_detail['_os_version_clean'] = self._clean_os_version(device_detail)
-                            device_detail['_last_contact_relative'] = self._get_relative_time(device_detail)
-                            device_detail['_security_status'] = self._assess_security_status(device_detail)
-                            
-                            enhanced_devices.append(device_detail)
-                except Exception as e:
-                    # Continue processing other devices if one fails
+            for device_summary, detail_response in zip(device_summaries, detail_responses):
+                # Continue processing other devices if one fails
+                if isinstance(detail_response, Exception):
                     continue
+                if detail_response and 'mobile_device' in detail_response:
+                    device_detail = detail_response['mobile_device']
+                    
+                    # Enhance with summary data and computed fields
+                    device_detail['_summary'] = device_summary
+                    device_detail['_device_type'] = self._determine_device_type(device_detail)
+                    device_detail['_os_version_clean'] = self._clean_os_version(device_detail)
+                    device_detail['_last_contact_relative'] = self._get_relative_time(device_detail)
+                    device_detail['_security_status'] = self._assess_security_status(device_detail)
+                    
+                    enhanced_devices.append(device_detail)
             
             # Cache the results
             try:
@@ -92,6 +96,32 @@ class MobileDeviceManager:
         except Exception as e:
             return []
     
+    def get_mobile_device_summaries(self) -> List[Dict]:
+        """
+        Get mobile device list entries without per-device detail calls
+        
+        Returns:
+            Summary objects (id, name, model, serial_number, udid, ...)
+        """
+        try:
+            return [
+                d
+                for d in stream_list(self.auth, '/JSSResource/mobiledevices', ('mobile_devices',))
+                if d.get('id')
+            ]
+        except Exception as e:
+            print(f"❌ Error fetching mobile devices: {e}")
+            return []
+    
+    async def _fetch_device_details(self, device_summaries: List[Dict]) -> List:
+        """Fetch device details concurrently, returning failures in place"""
+        async with AsyncJamfClient(self.auth) as client:
+            return await client.get_many(
+                '/JSSResource/mobiledevices/id/{id}',
+                [d['id'] for d in device_summaries],
+                return_exceptions=True,
+            )
+    
     def get_all_mobile_groups(self, use_cache: bool = True, cache_ttl_minutes: int = 60) -> List[Dict]:
         """
         Get all mobile device groups with relationship data
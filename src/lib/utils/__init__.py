@@ -7,6 +7,13 @@ from .manage_filters import create_filter, FilterField
 from .manage_urls import create_jamf_hyperlink
 from .analyze_stats import StatsAnalyzer
 from .cache_file import FileCache
+from .fan_out import EnvRun, collect_rows, merge_env_rows, run_across_envs
+from .field_projection import (
+    FieldCatalog,
+    FieldError,
+    resolve_fields,
+    select_output_fields,
+)
 
 __all__ = [
     "create_filter",
@@ -14,4 +21,12 @@ __all__ = [
     "create_jamf_hyperlink",
     "StatsAnalyzer",
     "FileCache",
+    "EnvRun",
+    "collect_rows",
+    "merge_env_rows",
+    "run_across_envs",
+    "FieldCatalog",
+    "FieldError",
+    "resolve_fields",
+    "select_output_fields",
 ]
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Multi-environment fan-out for read-only commands
+Runs one command per Jamf environment concurrently and merges the rows
+each run produced into a single result tagged with its environment
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+ENV_COLUMN = "Environment"
+
+# Environments run at once; each has its own connections and rate limiter,
+# so this mostly bounds local threads and sockets
+MAX_PARALLEL_ENVS = 8
+
+_local = threading.local()
+
+
+@dataclass
+class EnvRun:
+    """Outcome of running a command against one environment"""
+
+    env: str
+    exit_code: int = 0
+    rows: List[Dict[str, Any]] = field(default_factory=list)
+    error: Optional[str] = None
+    duration: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.exit_code == 0 and self.error is None
+
+
+def parse_envs(spec: Optional[str]) -> List[str]:
+    """Split an --envs value ("sandbox,prod") into unique names, in order"""
+    envs: List[str] = []
+    for env in (spec or "").split(","):
+        env = env.strip()
+        if env and env not in envs:
+            envs.append(env)
+    return envs
+
+
+def collecting() -> bool:
+    """Whether output in this thread is being collected for a fan-out"""
+    return getattr(_local, "rows", None) is not None
+
+
+def collect_rows(data: Any) -> bool:
+    """
+    Hand a command's output rows to the fan-out running in this thread
+
+    Output paths call this before formatting; when it returns True the
+    rows were taken and nothing should be printed or written.
+    """
+    rows = getattr(_local, "rows", None)
+    if rows is None:
+        return False
+    if isinstance(data, dict):
+        data = [data]
+    rows.extend(row for row in data or () if isinstance(row, dict))
+    return True
+
+
+def _run_one(env: str, run: Callable[[str], int]) -> EnvRun:
+    result = EnvRun(env)
+    _local.rows = result.rows
+    started = time.monotonic()
+    try:
+        result.exit_code = run(env) or 0
+    except Exception as e:
+        result.exit_code = 1
+        result.error = str(e) or type(e).__name__
+    finally:
+        _local.rows = None
+        result.duration = time.monotonic() - started
+    return result
+
+
+def run_across_envs(
+    envs: Sequence[str],
+    run: Callable[[str], int],
+    max_workers: Optional[int] = None,
+) -> List[EnvRun]:
+    """
+    Run a command against several environments concurrently
+
+    Args:
+        envs: Environment names
+        run: Runs the command for one environment and returns its exit
+            code; rows it outputs are collected instead of printed
+        max_workers: Environments run at once (default MAX_PARALLEL_ENVS)
+
+    Returns:
+        One EnvRun per environment, in the order given; a failing
+        environment does not stop the others
+    """
+    if not envs:
+        return []
+    workers = max(1, min(len(envs), max_workers or MAX_PARALLEL_ENVS))
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="jpapi-env"
+    ) as pool:
+        futures = [pool.submit(_run_one, env, run) for env in envs]
+        return [future.result() for future in futures]
+
+
+def merge_env_rows(runs: Sequence[EnvRun]) -> List[Dict[str, Any]]:
+    """
+    Merge the rows of all runs, each tagged with its environment
+
+    Columns are the union across environments, in first-seen order, so
+    rows from tenants with different data still line up.
+    """
+    columns: Dict[str, None] = {ENV_COLUMN: None}
+    for env_run in runs:
+        for row in env_run.rows:
+            columns.update(dict.fromkeys(row))
+
+    merged = []
+    for env_run in runs:
+        for row in env_run.rows:
+            tagged = {column: row.get(column, "") for column in columns}
+            tagged[ENV_COLUMN] = env_run.env
+            merged.append(tagged)
+    return merged
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Field projection for list, search and export output
+Resolves --fields column names and tells callers which API data those
+columns need, so narrow reports skip detail calls and unused sections
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set
+
+# Column sources: the list/summary response, a per-object detail call, or
+# (for Jamf Pro API inventory endpoints) the name of an inventory section
+SUMMARY = "summary"
+DETAIL = "detail"
+
+
+class FieldError(ValueError):
+    """A requested field does not name an available column"""
+
+
+def _normalize(name: str) -> str:
+    return re.sub(r"[^a-z0-9]", "", name.lower())
+
+
+def parse_fields(spec: Optional[str]) -> Optional[List[str]]:
+    """Split a --fields value ("name,serial,os") into names; None if empty"""
+    if not spec:
+        return None
+    names = [name.strip() for name in spec.split(",") if name.strip()]
+    return names or None
+
+
+def match_columns(requested: Sequence[str], available: Iterable[str]) -> List[str]:
+    """
+    Map requested field names onto column names
+
+    Matching ignores case, spaces and punctuation ("os_version" matches
+    "OS Version"); a name may also be an unambiguous prefix ("serial" for
+    "Serial Number").
+
+    Raises:
+        FieldError: A name matches no column, or several
+    """
+    columns = list(available)
+    normalized = {_normalize(column): column for column in columns}
+    matched: List[str] = []
+    for name in requested:
+        key = _normalize(name)
+        column = normalized.get(key)
+        if column is None:
+            candidates = [c for k, c in normalized.items() if key and k.startswith(key)]
+            if len(candidates) != 1:
+                problem = "is ambiguous" if candidates else "is not available"
+                choices = candidates or columns
+                raise FieldError(
+                    f"Field '{name}' {problem}; choose from: {', '.join(choices)}"
+                )
+            column = candidates[0]
+        if column not in matched:
+            matched.append(column)
+    return matched
+
+
+def select_fields(
+    rows: Iterable[Dict[str, Any]], columns: Optional[Sequence[str]]
+) -> List[Dict[str, Any]]:
+    """Keep only the given columns, in order (all columns when None)"""
+    if not columns:
+        return list(rows)
+    return [{column: row.get(column, "") for column in columns} for row in rows]
+
+
+class FieldCatalog:
+    """Output columns of a report and where the data for each comes from"""
+
+    def __init__(self, sources: Mapping[str, str]):
+        """
+        Initialize catalog
+
+        Args:
+            sources: Column name -> SUMMARY, DETAIL or an inventory section,
+                in default column order
+        """
+        self.sources = dict(sources)
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self.sources)
+
+    def resolve(self, spec: Optional[str]) -> Optional[List[str]]:
+        """
+        Resolve a --fields value to column names (None when not given)
+
+        Raises:
+            FieldError: A name matches no column, or several
+        """
+        requested = parse_fields(spec)
+        if requested is None:
+            return None
+        return match_columns(requested, self.columns)
+
+    def sources_for(self, columns: Optional[Sequence[str]]) -> Set[str]:
+        """Sources needed for the columns (all of them when None)"""
+        selected = self.columns if columns is None else columns
+        return {self.sources[column] for column in selected if column in self.sources}
+
+    def needs(self, columns: Optional[Sequence[str]], source: str) -> bool:
+        """Whether any of the columns come from source (always, when None)"""
+        return source in self.sources_for(columns)
+
+    def sections(
+        self, columns: Optional[Sequence[str]], known: Sequence[str]
+    ) -> List[str]:
+        """Inventory sections from known that the columns need, in known order"""
+        needed = self.sources_for(columns)
+        return [section for section in known if section in needed]
+
+
+def resolve_fields(
+    spec: Optional[str], catalog: Optional[FieldCatalog] = None
+) -> Optional[List[str]]:
+    """
+    Resolve a --fields value against a catalog
+
+    Without a catalog the names are returned as given and are matched
+    against the output columns later, by select_output_fields().
+    """
+    if catalog is not None:
+        return catalog.resolve(spec)
+    return parse_fields(spec)
+
+
+def select_output_fields(
+    rows: List[Dict[str, Any]], fields: Optional[Sequence[str]]
+) -> List[Dict[str, Any]]:
+    """
+    Project formatted rows onto the requested fields
+
+    Field names are matched against the columns present in the rows, so
+    this works for output without a catalog.
+
+    Raises:
+        FieldError: A name matches no column, or several
+    """
+    if not fields or not rows:
+        return rows
+    available: Dict[str, None] = {}
+    for row in rows[:100]:
+        available.update(dict.fromkeys(row))
+    return select_fields(rows, match_columns(fields, available))
@@ -266,7 +266,14 @@ class ExportConfiguration:
 
     def __post_init__(self):
         if self.available_formats is None:
-            self.available_formats = ["csv", "json", "xlsx", "xml", "yaml"]
+            self.available_formats = [
+                "csv",
+                "json",
+                "xlsx",
+                "xml",
+                "yaml",
+                "parquet",
+            ]
 
 
 @dataclass
@@ -281,14 +288,26 @@ class APIConfiguration:
 
     # Rate limiting
     rate_limit_enabled: bool = True
-    rate_limit_requests_per_minute: int = 60
-    rate_limit_burst_size: int = 10
+    rate_limit_requests_per_minute: int = 1200
+    rate_limit_burst_size: int = 20
+
+    # Circuit breaker
+    circuit_breaker_enabled: bool = True
+    circuit_breaker_failure_threshold: int = 5
+    circuit_breaker_recovery_timeout: int = 30
 
     # API behavior
     auto_retry_failed_requests: bool = True
     cache_api_responses: bool = True
+    # Serve responses without ETag/Last-Modified for api_cache_ttl /
+    # object_detail_cache_ttl without asking the server (may be stale).
+    # Classic API responses never have validators, so while this is off
+    # the response cache does nothing for Classic-only exports
+    cache_ttl_responses: bool = False
+    response_cache_max_entries: int = 20000
     follow_redirects: bool = True
     verify_ssl: bool = True
+    compress_responses: bool = True
     
     # Object ID limits
     max_object_id: int = 999999
@@ -0,0 +1,13 @@
+"""
+Mock Jamf Pro server for offline tests and benchmarks
+Synthetic large-tenant fixtures behind Classic and Jamf Pro API endpoints
+"""
+
+from .fixtures import DEFAULT_COUNTS, SyntheticTenant
+from .server import MockJamfServer
+
+__all__ = [
+    "DEFAULT_COUNTS",
+    "MockJamfServer",
+    "SyntheticTenant",
+]
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Run the mock Jamf Pro server standalone
+
+    python -m tests.mock_jamf --port 8765 --computers 100000 --latency 0.05
+
+Point a jpapi environment at the printed URL with any client ID/secret.
+"""
+
+import argparse
+
+from .fixtures import DEFAULT_COUNTS, SyntheticTenant
+from .server import MockJamfServer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Mock Jamf Pro server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds per response")
+    parser.add_argument("--latency-jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of 502s")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of 429s")
+    parser.add_argument("--retry-after", type=int, default=1)
+    for kind, count in DEFAULT_COUNTS.items():
+        parser.add_argument(f"--{kind.replace('_', '-')}", type=int, default=count)
+    args = parser.parse_args()
+
+    tenant = SyntheticTenant(
+        {kind: getattr(args, kind) for kind in DEFAULT_COUNTS}, seed=args.seed
+    )
+    server = MockJamfServer(
+        tenant,
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+    )
+    print(f"🧪 Mock Jamf Pro server listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Stopping mock server")
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
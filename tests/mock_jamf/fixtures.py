@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+"""
+Synthetic Jamf Pro tenant fixtures
+Deterministic objects generated on demand from their ID, so a 100k-computer
+tenant costs no memory until its objects are requested
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+DEFAULT_COUNTS = {
+    "computers": 100_000,
+    "mobile_devices": 10_000,
+    "policies": 5_000,
+    "computer_groups": 2_000,
+    "packages": 2_000,
+    "profiles": 500,
+    "scripts": 300,
+    "categories": 50,
+    "departments": 6,
+    "buildings": 3,
+}
+
+# Classic endpoint -> (fixture kind, list key, detail key)
+CLASSIC_RESOURCES = {
+    "computers": ("computers", "computers", "computer"),
+    "mobiledevices": ("mobile_devices", "mobile_devices", "mobile_device"),
+    "policies": ("policies", "policies", "policy"),
+    "computergroups": ("computer_groups", "computer_groups", "computer_group"),
+    "packages": ("packages", "packages", "package"),
+    "osxconfigurationprofiles": (
+        "profiles",
+        "os_x_configuration_profiles",
+        "os_x_configuration_profile",
+    ),
+    "scripts": ("scripts", "scripts", "script"),
+    "categories": ("categories", "categories", "category"),
+}
+
+# Jamf Pro API collection path -> fixture kind
+PRO_RESOURCES = {
+    "/api/v1/computers-inventory": "computers",
+    "/api/v1/mobile-devices": "mobile_devices",
+    "/api/v2/mobile-devices": "mobile_devices",
+    "/api/v1/policies": "policies",
+    "/api/v1/computer-groups": "computer_groups",
+    "/api/v1/packages": "packages",
+    "/api/v1/scripts": "scripts",
+    "/api/v1/categories": "categories",
+    "/api/v1/departments": "departments",
+    "/api/v1/buildings": "buildings",
+}
+
+# Jamf Pro API inventory section -> item key
+PRO_SECTIONS = {
+    "GENERAL": "general",
+    "HARDWARE": "hardware",
+    "OPERATING_SYSTEM": "operatingSystem",
+    "USER_AND_LOCATION": "userAndLocation",
+    "APPLICATIONS": "applications",
+    "EXTENSION_ATTRIBUTES": "extensionAttributes",
+}
+
+MODELS = [
+    "MacBook Pro (14-inch, 2023)",
+    "MacBook Air (M2, 2022)",
+    "iMac (24-inch, M3)",
+    "Mac mini (2023)",
+]
+OS_VERSIONS = ["13.6.4", "14.3.1", "14.4", "14.5", "15.0"]
+DEPARTMENTS = ["Engineering", "Finance", "Marketing", "Sales", "IT", "Legal"]
+BUILDINGS = ["HQ", "Annex", "Remote"]
+FREQUENCIES = [
+    "Once per computer",
+    "Ongoing",
+    "Once every day",
+    "Once per user per computer",
+]
+BASE_TIME = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class SyntheticTenant:
+    """A fake Jamf Pro tenant whose objects are derived from (seed, kind, id)"""
+
+    def __init__(self, counts: Optional[Dict[str, int]] = None, seed: int = 42):
+        """
+        Initialize tenant
+
+        Args:
+            counts: Object counts per kind (missing kinds use DEFAULT_COUNTS)
+            seed: Seed making every generated object reproducible
+        """
+        self.counts = dict(DEFAULT_COUNTS)
+        self.counts.update(counts or {})
+        self.seed = seed
+
+    def count(self, kind: str) -> int:
+        """Number of objects of a kind (IDs are 1..count)"""
+        return self.counts.get(kind, 0)
+
+    def exists(self, kind: str, object_id: int) -> bool:
+        return 1 <= object_id <= self.count(kind)
+
+    def name(self, kind: str, object_id: int) -> str:
+        named = {"departments": DEPARTMENTS, "buildings": BUILDINGS}.get(kind)
+        if named:
+            return named[(object_id - 1) % len(named)]
+        prefix = {
+            "computers": "MAC",
+            "mobile_devices": "IPAD",
+            "policies": "Policy",
+            "computer_groups": "Smart Group",
+            "packages": "Package",
+            "profiles": "Profile",
+            "scripts": "Script",
+            "categories": "Category",
+        }.get(kind, kind)
+        return f"{prefix}-{object_id:06d}"
+
+    # Classic API -------------------------------------------------------
+
+    def classic_summary(self, kind: str, object_id: int) -> Dict[str, Any]:
+        """Entry in a Classic list response"""
+        summary = {"id": object_id, "name": self.name(kind, object_id)}
+        if kind == "computer_groups":
+            summary["is_smart"] = object_id % 4 != 0
+        return summary
+
+    def classic_detail(self, kind: str, object_id: int) -> Dict[str, Any]:
+        """Body of a Classic /id/{id} response (without the wrapper key)"""
+        rng = self._rng(kind, object_id)
+        name = self.name(kind, object_id)
+
+        if kind == "computers":
+            # Drawn in the same order as pro_item, so both APIs agree
+            last_contact = self._timestamp(rng)
+            report_date = self._timestamp(rng)
+            managed = rng.random() > 0.05
+            return {
+                "general": {
+                    "id": object_id,
+                    "name": name,
+                    "serial_number": self._serial(object_id),
+                    "udid": self._udid(kind, object_id),
+                    "mac_address": self._mac(object_id),
+                    "ip_address": self._ip(object_id),
+                    "last_contact_time": last_contact,
+                    "report_date": report_date,
+                    "managed": managed,
+                    "remote_management": {"managed": managed},
+                },
+                "location": self._location(rng),
+                "hardware": {
+                    "model": rng.choice(MODELS),
+                    "os_name": "macOS",
+                    "os_version": rng.choice(OS_VERSIONS),
+                    "total_ram": rng.choice([8192, 16384, 32768]),
+                    "processor_type": "Apple M2",
+                },
+                "extension_attributes": [
+                    {"id": ea, "name": f"EA {ea}", "value": str(rng.randint(0, 100))}
+                    for ea in range(1, 6)
+                ],
+            }
+
+        if kind == "mobile_devices":
+            return {
+                "general": {
+                    "id": object_id,
+                    "name": name,
+                    "serial_number": self._serial(object_id),
+                    "udid": self._udid(kind, object_id),
+                    "model": rng.choice(["iPad Pro", "iPad Air", "iPhone 15"]),
+                    "os_version": rng.choice(["17.4", "17.5", "18.0"]),
+                    "last_inventory_update": self._timestamp(rng),
+                    "managed": True,
+                    "supervised": rng.random() > 0.1,
+                },
+                "location": self._location(rng),
+            }
+
+        if kind == "policies":
+            category_id = self._category_id(rng)
+            return {
+                "general": {
+                    "id": object_id,
+                    "name": name,
+                    "enabled": rng.random() > 0.2,
+                    "frequency": rng.choice(FREQUENCIES),
+                    "trigger_checkin": rng.random() > 0.5,
+                    "category": {
+                        "id": category_id,
+                        "name": self.name("categories", category_id),
+                    },
+                },
+                "scope": {
+                    "all_computers": rng.random() > 0.9,
+                    "computer_groups": [
+                        self.classic_summary("computer_groups", group_id)
+                        for group_id in self._sample(rng, "computer_groups", 3)
+                    ],
+                },
+                "package_configuration": {
+                    "packages": [
+                        self.classic_summary("packages", package_id)
+                        for package_id in self._sample(rng, "packages", 2)
+                    ]
+                },
+                "scripts": [
+                    self.classic_summary("scripts", script_id)
+                    for script_id in self._sample(rng, "scripts", 1)
+                ],
+                "self_service": {"use_for_self_service": rng.random() > 0.5},
+            }
+
+        if kind == "computer_groups":
+            is_smart = object_id % 4 != 0
+            return {
+                "id": object_id,
+                "name": name,
+                "is_smart": is_smart,
+                "criteria": (
+                    [
+                        {
+                            "name": "Operating System Version",
+                            "priority": 0,
+                            "and_or": "and",
+                            "search_type": "less than",
+                            "value": rng.choice(OS_VERSIONS),
+                        }
+                    ]
+                    if is_smart
+                    else []
+                ),
+                "computers": [
+                    self.classic_summary("computers", computer_id)
+                    for computer_id in self._sample(rng, "computers", 10)
+                ],
+            }
+
+        if kind == "packages":
+            return {
+                "id": object_id,
+                "name": name,
+                "filename": f"{name}.pkg",
+                "category": self.name("categories", self._category_id(rng)),
+                "info": "",
+                "priority": rng.randint(1, 20),
+                "reboot_required": rng.random() > 0.9,
+            }
+
+        if kind == "profiles":
+            return {
+                "general": {
+                    "id": object_id,
+                    "name": name,
+                    "description": f"Synthetic configuration profile {object_id}",
+                    "distribution_method": "Install Automatically",
+                    "payloads": (
+                        '<?xml version="1.0" encoding="UTF-8"?><plist version="1.0"><dict>'
+                        f"<key>PayloadDisplayName</key><string>{name}</string>"
+                        "</dict></plist>"
+                    ),
+                },
+                "scope": {
+                    "computer_groups": [
+                        self.classic_summary("computer_groups", group_id)
+                        for group_id in self._sample(rng, "computer_groups", 2)
+                    ]
+                },
+            }
+
+        if kind == "scripts":
+            return {
+                "id": object_id,
+                "name": name,
+                "priority": "After",
+                "script_contents": f"#!/bin/bash\necho 'script {object_id}'\n",
+            }
+
+        if kind == "categories":
+            return {"id": object_id, "name": name, "priority": rng.randint(1, 20)}
+
+        return {"id": object_id, "name": name}
+
+    # Jamf Pro API ------------------------------------------------------
+
+    def pro_item(self, kind: str, object_id: int) -> Dict[str, Any]:
+        """Entry in a Jamf Pro API collection response"""
+        rng = self._rng(kind, object_id)
+        name = self.name(kind, object_id)
+
+        if kind == "computers":
+            return {
+                "id": str(object_id),
+                "udid": self._udid(kind, object_id),
+                "general": {
+                    "name": name,
+                    "lastIpAddress": self._ip(object_id),
+                    "lastContactTime": self._timestamp(rng),
+                    "reportDate": self._timestamp(rng),
+                    "platform": "Mac",
+                    "remoteManagement": {"managed": rng.random() > 0.05},
+                },
+                "hardware": {
+                    "model": rng.choice(MODELS),
+                    "serialNumber": self._serial(object_id),
+                    "macAddress": self._mac(object_id),
+                },
+                "operatingSystem": {"name": "macOS", "version": rng.choice(OS_VERSIONS)},
+                "userAndLocation": {
+                    "username": f"user{object_id}",
+                    "email": f"user{object_id}@example.com",
+                    "departmentId": str(self._pick_id(rng, "departments")),
+                    "buildingId": str(self._pick_id(rng, "buildings")),
+                },
+            }
+
+        if kind == "mobile_devices":
+            return {
+                "id": str(object_id),
+                "name": name,
+                "serialNumber": self._serial(object_id),
+                "udid": self._udid(kind, object_id),
+                "model": rng.choice(["iPad Pro", "iPad Air", "iPhone 15"]),
+                "osVersion": rng.choice(["17.4", "17.5", "18.0"]),
+                "managed": True,
+            }
+
+        if kind == "packages":
+            return {
+                "id": str(object_id),
+                "packageName": name,
+                "fileName": f"{name}.pkg",
+                "categoryId": str(self._category_id(rng)),
+                "priority": rng.randint(1, 20),
+                "rebootRequired": rng.random() > 0.9,
+            }
+
+        if kind == "policies":
+            return {
+                "id": str(object_id),
+                "name": name,
+                "enabled": rng.random() > 0.2,
+                "categoryId": str(self._category_id(rng)),
+                "frequency": rng.choice(FREQUENCIES),
+            }
+
+        if kind == "computer_groups":
+            return {"id": str(object_id), "name": name, "smartGroup": object_id % 4 != 0}
+
+        if kind in ("departments", "buildings"):
+            return {"id": str(object_id), "name": name}
+
+        return {"id": str(object_id), "name": name, "priority": rng.randint(1, 20)}
+
+    def pro_detail(self, kind: str, object_id: int) -> Dict[str, Any]:
+        """Body of a Jamf Pro API detail response"""
+        item = self.pro_item(kind, object_id)
+        if kind == "computers":
+            rng = self._rng(kind, object_id)
+            item["applications"] = [
+                {"name": f"App {app}.app", "version": f"{rng.randint(1, 20)}.0"}
+                for app in range(1, 21)
+            ]
+            item["extensionAttributes"] = [
+                {
+                    "definitionId": str(ea),
+                    "name": f"EA {ea}",
+                    "values": [str(rng.randint(0, 100))],
+                }
+                for ea in range(1, 6)
+            ]
+        return item
+
+    def pro_page(self, kind: str, page: int, page_size: int) -> List[Dict[str, Any]]:
+        """Items on one page of a Jamf Pro API collection (sorted by id)"""
+        first = page * page_size + 1
+        last = min(self.count(kind), first + page_size - 1)
+        return [self.pro_item(kind, object_id) for object_id in range(first, last + 1)]
+
+    def pro_matches(
+        self, kind: str, predicate: Callable[[Dict[str, Any]], bool]
+    ) -> List[int]:
+        """IDs of the collection items a filter predicate accepts"""
+        return [
+            object_id
+            for object_id in range(1, self.count(kind) + 1)
+            if predicate(self.pro_item(kind, object_id))
+        ]
+
+    # Helpers -----------------------------------------------------------
+
+    def _rng(self, kind: str, object_id: int) -> random.Random:
+        return random.Random(f"{self.seed}-{kind}-{object_id}")
+
+    def _category_id(self, rng: random.Random) -> int:
+        return self._pick_id(rng, "categories")
+
+    def _pick_id(self, rng: random.Random, kind: str) -> int:
+        return rng.randint(1, max(1, self.count(kind)))
+
+    def _sample(self, rng: random.Random, kind: str, size: int) -> List[int]:
+        total = self.count(kind)
+        if total == 0:
+            return []
+        return sorted(rng.sample(range(1, total + 1), min(size, total)))
+
+    @staticmethod
+    def _serial(object_id: int) -> str:
+        return f"C02{object_id:08X}"
+
+    def _udid(self, kind: str, object_id: int) -> str:
+        value = f"{self.seed:04X}{len(kind):04X}{object_id:024X}"
+        return f"{value[:8]}-{value[8:12]}-{value[12:16]}-{value[16:20]}-{value[20:32]}"
+
+    @staticmethod
+    def _ip(object_id: int) -> str:
+        return f"10.{object_id // 65536 % 256}.{object_id // 256 % 256}.{object_id % 256}"
+
+    @staticmethod
+    def _mac(object_id: int) -> str:
+        raw = f"{object_id:012X}"
+        return ":".join(raw[i : i + 2] for i in range(0, 12, 2))
+
+    @staticmethod
+    def _timestamp(rng: random.Random) -> str:
+        moment = BASE_TIME + timedelta(minutes=rng.randint(0, 525_600))
+        return moment.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+    @staticmethod
+    def _location(rng: random.Random) -> Dict[str, Any]:
+        user_id = rng.randint(1, 50_000)
+        return {
+            "username": f"user{user_id}",
+            "email_address": f"user{user_id}@example.com",
+            "department": rng.choice(DEPARTMENTS),
+            "building": rng.choice(BUILDINGS),
+        }
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Minimal RSQL evaluator for the mock server's Jamf Pro API filters
+Supports ; (and), , (or), parentheses, ==/!= with * wildcards,
+</<=/>/>= (version-aware) and =in=/=out=
+"""
+
+import fnmatch
+import re
+from typing import Any, Callable, Dict, List
+
+Predicate = Callable[[Dict[str, Any]], bool]
+
+_COMPARISON = re.compile(
+    r"\s*(?P<field>[A-Za-z0-9_.]+)\s*"
+    r"(?P<op>==|!=|=in=|=out=|=ge=|=le=|=gt=|=lt=|>=|<=|>|<)\s*"
+)
+_ALIASES = {"=ge=": ">=", "=le=": "<=", "=gt=": ">", "=lt=": "<"}
+
+
+def compile_filter(expression: str) -> Predicate:
+    """
+    Compile an RSQL expression into a predicate over Jamf Pro API items
+
+    Raises:
+        ValueError: The expression is not valid RSQL
+    """
+    parser = _Parser(expression)
+    predicate = parser.parse_or()
+    if parser.pos != len(expression):
+        raise ValueError(f"Unexpected {expression[parser.pos:]!r} in filter")
+    return predicate
+
+
+def _lookup(item: Dict[str, Any], field: str) -> Any:
+    value: Any = item
+    for key in field.split("."):
+        value = value.get(key) if isinstance(value, dict) else None
+    return value
+
+
+def _text(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return "" if value is None else str(value)
+
+
+def _version_key(value: str):
+    parts = value.split(".")
+    if all(part.isdigit() for part in parts):
+        return (0, tuple(int(part) for part in parts))
+    return (1, value.lower())
+
+
+class _Parser:
+    """Recursive-descent parser building predicates"""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.pos = 0
+
+    def parse_or(self) -> Predicate:
+        terms = [self.parse_and()]
+        while self._take(","):
+            terms.append(self.parse_and())
+        return lambda item: any(term(item) for term in terms)
+
+    def parse_and(self) -> Predicate:
+        terms = [self.parse_term()]
+        while self._take(";"):
+            terms.append(self.parse_term())
+        return lambda item: all(term(item) for term in terms)
+
+    def parse_term(self) -> Predicate:
+        if self._take("("):
+            predicate = self.parse_or()
+            if not self._take(")"):
+                raise ValueError("Unclosed ( in filter")
+            return predicate
+
+        match = _COMPARISON.match(self.text, self.pos)
+        if not match:
+            raise ValueError(f"Expected a comparison at {self.text[self.pos:]!r}")
+        self.pos = match.end()
+        field = match.group("field")
+        op = _ALIASES.get(match.group("op"), match.group("op"))
+
+        if op in ("=in=", "=out="):
+            if not self._take("("):
+                raise ValueError(f"{op} needs a (list)")
+            values = [self._value()]
+            while self._take(","):
+                values.append(self._value())
+            if not self._take(")"):
+                raise ValueError(f"Unclosed {op} list")
+            wanted = {value.lower() for value in values}
+            inside = op == "=in="
+            return lambda item: (
+                _text(_lookup(item, field)).lower() in wanted
+            ) == inside
+
+        value = self._value()
+        if op in ("==", "!="):
+            pattern = value.lower()
+            equal = op == "=="
+            return lambda item: (
+                fnmatch.fnmatchcase(_text(_lookup(item, field)).lower(), pattern)
+                == equal
+            )
+
+        target = _version_key(value)
+        compare = {
+            ">=": lambda a: a >= target,
+            "<=": lambda a: a <= target,
+            ">": lambda a: a > target,
+            "<": lambda a: a < target,
+        }[op]
+        return lambda item: compare(_version_key(_text(_lookup(item, field))))
+
+    def _value(self) -> str:
+        self._skip_space()
+        if self._take('"') or self._take("'"):
+            quote = self.text[self.pos - 1]
+            chars: List[str] = []
+            while self.pos < len(self.text) and self.text[self.pos] != quote:
+                if self.text[self.pos] == "\\":
+                    self.pos += 1
+                chars.append(self.text[self.pos])
+                self.pos += 1
+            if not self._take(quote):
+                raise ValueError("Unterminated quoted value in filter")
+            return "".join(chars)
+
+        start = self.pos
+        while self.pos < len(self.text) and self.text[self.pos] not in ";,()":
+            self.pos += 1
+        value = self.text[start:self.pos].strip()
+        if not value:
+            raise ValueError("Missing value in filter")
+        return value
+
+    def _take(self, char: str) -> bool:
+        self._skip_space()
+        if self.text.startswith(char, self.pos):
+            self.pos += len(char)
+            return True
+        return False
+
+    def _skip_space(self) -> None:
+        while self.pos < len(self.text) and self.text[self.pos] == " ":
+            self.pos += 1
@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+"""
+Mock Jamf Pro server
+Local HTTP stand-in for the Classic and Jamf Pro APIs jpapi uses, with
+OAuth token issuance, gzip responses, RSQL filters and injectable latency,
+errors and 429 throttling
+"""
+
+import gzip
+import hashlib
+import json
+import random
+import re
+import secrets
+import threading
+import time
+import urllib.parse
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+from .fixtures import CLASSIC_RESOURCES, PRO_RESOURCES, PRO_SECTIONS, SyntheticTenant
+from .rsql import compile_filter
+
+MAX_PAGE_SIZE = 2000
+TOKEN_LIFETIME = 1200
+# Smallest body worth gzipping, as on Jamf Cloud's front end
+GZIP_MIN_SIZE = 1024
+
+_CLASSIC_PATH = re.compile(r"^/JSSResource/(?P<resource>[a-z]+)(?:/id/(?P<id>\d+))?/?$")
+_PRO_DETAIL_PATH = re.compile(
+    r"^(?P<collection>/api/v\d/[a-z-]+?)(?:-detail)?/(?P<id>\d+)$"
+)
+
+
+class MockJamfServer:
+    """Threaded mock Jamf Pro server for tests and benchmarks"""
+
+    def __init__(
+        self,
+        tenant: Optional[SyntheticTenant] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: int = 1,
+        seed: int = 0,
+        compression: bool = True,
+    ):
+        """
+        Initialize mock server
+
+        Args:
+            tenant: Synthetic objects to serve (defaults to a large tenant)
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            latency: Seconds added to every response
+            latency_jitter: Extra random latency, up to this many seconds
+            error_rate: Fraction of API requests answered with a 502
+            throttle_rate: Fraction of API requests answered with a 429
+            retry_after: Retry-After seconds sent with injected 429s
+            seed: Seed for the injection randomness
+            compression: Gzip bodies for clients sending Accept-Encoding: gzip
+        """
+        self.tenant = tenant or SyntheticTenant()
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.compression = compression
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._tokens: Dict[str, float] = {}
+        self._list_bodies: Dict[Tuple[str, bool], bytes] = {}
+        self._filter_matches: Dict[Tuple[str, str], List[int]] = {}
+        self._counts: Counter = Counter()
+        self.writes = []
+
+        handler = type("MockJamfHandler", (_Handler,), {"mock": self})
+        self._httpd = ThreadingHTTPServer((host, port), handler)
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockJamfServer":
+        """Serve requests on a background thread"""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="mock-jamf", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve requests on the calling thread"""
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        """Stop serving and close the socket"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "MockJamfServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    def issue_token(self) -> Tuple[str, int]:
+        """Create a bearer token"""
+        token = secrets.token_urlsafe(24)
+        with self._lock:
+            self._tokens[token] = time.time() + TOKEN_LIFETIME
+        return token, TOKEN_LIFETIME
+
+    def token_valid(self, authorization: Optional[str]) -> bool:
+        if not authorization or not authorization.startswith("Bearer "):
+            return False
+        with self._lock:
+            expires = self._tokens.get(authorization[len("Bearer "):])
+        return expires is not None and expires > time.time()
+
+    def count(self, key: str) -> None:
+        with self._lock:
+            self._counts[key] += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Request counts by method and endpoint template, plus injections"""
+        with self._lock:
+            return dict(self._counts)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._counts.clear()
+            self.writes.clear()
+
+    def inject(self) -> Optional[int]:
+        """Pick an injected failure status for this request, if any"""
+        with self._lock:
+            roll = self._random.random()
+        if roll < self.throttle_rate:
+            return 429
+        if roll < self.throttle_rate + self.error_rate:
+            return 502
+        return None
+
+    def delay(self) -> None:
+        if self.latency or self.latency_jitter:
+            with self._lock:
+                jitter = self._random.uniform(0, self.latency_jitter)
+            time.sleep(self.latency + jitter)
+
+    def classic_list_body(self, resource: str, gzipped: bool = False) -> bytes:
+        """Encoded Classic list response (cached; these are large)"""
+        with self._lock:
+            body = self._list_bodies.get((resource, gzipped))
+        if body is None:
+            if gzipped:
+                body = gzip.compress(self.classic_list_body(resource), 6)
+            else:
+                kind, list_key, _ = CLASSIC_RESOURCES[resource]
+                items = [
+                    self.tenant.classic_summary(kind, object_id)
+                    for object_id in range(1, self.tenant.count(kind) + 1)
+                ]
+                body = json.dumps({list_key: items}).encode("utf-8")
+            with self._lock:
+                self._list_bodies[(resource, gzipped)] = body
+        return body
+
+    def filter_matches(self, kind: str, expression: str) -> List[int]:
+        """IDs matching an RSQL filter (cached across the pages of a query)"""
+        with self._lock:
+            matches = self._filter_matches.get((kind, expression))
+        if matches is None:
+            matches = self.tenant.pro_matches(kind, compile_filter(expression))
+            with self._lock:
+                self._filter_matches[(kind, expression)] = matches
+        return matches
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Routes requests to the owning MockJamfServer"""
+
+    protocol_version = "HTTP/1.1"
+    mock: MockJamfServer
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_PATCH(self):
+        self._dispatch("PATCH")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def log_message(self, format, *args):
+        pass
+
+    def _dispatch(self, method: str) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        parts = urllib.parse.urlsplit(self.path)
+        path = parts.path.rstrip("/") or "/"
+        params = urllib.parse.parse_qsl(parts.query)
+        query = dict(params)
+        sections = [value for name, value in params if name == "section"]
+
+        mock = self.mock
+        mock.delay()
+
+        if path in ("/api/oauth/token", "/api/v1/auth/token") and method == "POST":
+            mock.count(f"POST {path}")
+            return self._issue_token(path)
+
+        if not mock.token_valid(self.headers.get("Authorization")):
+            mock.count("401")
+            return self._send_json(401, {"httpStatus": 401, "errors": []})
+
+        injected = mock.inject()
+        if injected == 429:
+            mock.count("injected 429")
+            return self._send(
+                429, b"Too Many Requests", {"Retry-After": str(mock.retry_after)}
+            )
+        if injected == 502:
+            mock.count("injected 502")
+            return self._send(502, b"Bad Gateway")
+
+        if path.startswith("/JSSResource/"):
+            return self._classic(method, path, body)
+        if path.startswith("/api/"):
+            return self._pro(method, path, query, sections)
+        mock.count(f"{method} 404")
+        self._send(404, b"Not Found")
+
+    def _issue_token(self, path: str) -> None:
+        token, lifetime = self.mock.issue_token()
+        if path == "/api/oauth/token":
+            payload = {
+                "access_token": token,
+                "token_type": "Bearer",
+                "scope": "api-role:jpapi",
+                "expires_in": lifetime,
+            }
+        else:
+            expires = time.strftime(
+                "%Y-%m-%dT%H:%M:%S.000Z", time.gmtime(time.time() + lifetime)
+            )
+            payload = {"token": token, "expires": expires}
+        self._send_json(200, payload)
+
+    def _classic(self, method: str, path: str, body: bytes) -> None:
+        mock = self.mock
+        match = _CLASSIC_PATH.match(path)
+        resource = match.group("resource") if match else None
+        if resource not in CLASSIC_RESOURCES:
+            mock.count(f"{method} 404")
+            return self._send(404, b"Not Found")
+
+        kind, _, detail_key = CLASSIC_RESOURCES[resource]
+        object_id = match.group("id")
+        template = f"/JSSResource/{resource}" + ("/id/{id}" if object_id else "")
+        mock.count(f"{method} {template}")
+
+        if method != "GET":
+            with mock._lock:
+                mock.writes.append((method, path, body))
+            new_id = object_id or str(mock.tenant.count(kind) + len(mock.writes))
+            xml = (
+                '<?xml version="1.0" encoding="UTF-8"?>'
+                f"<{detail_key}><id>{new_id}</id></{detail_key}>"
+            )
+            status = 200 if method == "DELETE" else 201
+            return self._send(status, xml.encode("utf-8"), {"Content-Type": "text/xml"})
+
+        if object_id is None:
+            headers = {"Content-Type": "application/json"}
+            gzipped = self._accepts_gzip()
+            if gzipped:
+                headers["Content-Encoding"] = "gzip"
+            return self._send(
+                200, mock.classic_list_body(resource, gzipped), headers, encoded=True
+            )
+
+        object_id = int(object_id)
+        if not mock.tenant.exists(kind, object_id):
+            return self._send(
+                404, b"The server has not found anything matching the request URI"
+            )
+        self._send_json(200, {detail_key: mock.tenant.classic_detail(kind, object_id)})
+
+    def _pro(
+        self, method: str, path: str, query: Dict[str, str], sections: List[str]
+    ) -> None:
+        mock = self.mock
+        tenant = mock.tenant
+
+        if path == "/api/v1/auth/current":
+            mock.count("GET /api/v1/auth/current")
+            return self._send_json(
+                200, {"account": {"id": "1", "username": "mock-api-client"}}
+            )
+        if path == "/api/v1/jamf-pro-version":
+            mock.count("GET /api/v1/jamf-pro-version")
+            return self._send_json(200, {"version": "11.9.0-mock"})
+
+        if path in PRO_RESOURCES:
+            mock.count(f"{method} {path}")
+            if method != "GET":
+                with mock._lock:
+                    mock.writes.append((method, path, b""))
+                new_id = tenant.count(PRO_RESOURCES[path]) + 1
+                return self._send_json(201, {"id": str(new_id)})
+            return self._pro_page(PRO_RESOURCES[path], query, sections)
+
+        match = _PRO_DETAIL_PATH.match(path)
+        if match and match.group("collection") in PRO_RESOURCES:
+            kind = PRO_RESOURCES[match.group("collection")]
+            template = path[: match.start("id")] + "{id}"
+            mock.count(f"{method} {template}")
+            object_id = int(match.group("id"))
+            if not tenant.exists(kind, object_id):
+                return self._send_json(404, {"httpStatus": 404, "errors": []})
+            if method != "GET":
+                with mock._lock:
+                    mock.writes.append((method, path, b""))
+                return self._send(204 if method == "DELETE" else 200, b"")
+            return self._send_json(200, tenant.pro_detail(kind, object_id), etag=True)
+
+        mock.count(f"{method} 404")
+        self._send_json(404, {"httpStatus": 404, "errors": []})
+
+    def _pro_page(
+        self, kind: str, query: Dict[str, str], sections: List[str]
+    ) -> None:
+        try:
+            page = int(query.get("page", 0))
+            page_size = int(query.get("page-size", 100))
+        except ValueError:
+            return self._send_error(400, "INVALID_PAGE")
+        if page < 0 or not 1 <= page_size <= MAX_PAGE_SIZE:
+            return self._send_error(400, "INVALID_PAGE_SIZE")
+
+        tenant = self.mock.tenant
+        expression = query.get("filter")
+        if expression:
+            try:
+                matches = self.mock.filter_matches(kind, expression)
+            except ValueError:
+                return self._send_error(400, "INVALID_RSQL_FILTER")
+            page_ids = matches[page * page_size : (page + 1) * page_size]
+            payload = {
+                "totalCount": len(matches),
+                "results": [tenant.pro_item(kind, object_id) for object_id in page_ids],
+            }
+        else:
+            payload = {
+                "totalCount": tenant.count(kind),
+                "results": tenant.pro_page(kind, page, page_size),
+            }
+
+        if sections:
+            keys = {PRO_SECTIONS.get(section) for section in sections}
+            unknown = set(PRO_SECTIONS.values()) - keys
+            payload["results"] = [
+                {key: value for key, value in item.items() if key not in unknown}
+                for item in payload["results"]
+            ]
+        self._send_json(200, payload, etag=True)
+
+    def _send_error(self, status: int, code: str) -> None:
+        self._send_json(status, {"httpStatus": status, "errors": [{"code": code}]})
+
+    def _send_json(self, status: int, payload: Any, etag: bool = False) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+        if etag:
+            tag = '"' + hashlib.sha1(body).hexdigest() + '"'
+            if self.headers.get("If-None-Match") == tag:
+                self.mock.count("304")
+                return self._send(304, b"", {"ETag": tag})
+            headers["ETag"] = tag
+        self._send(status, body, headers)
+
+    def _accepts_gzip(self) -> bool:
+        accepted = self.headers.get("Accept-Encoding") or ""
+        return self.mock.compression and "gzip" in accepted.lower()
+
+    def _send(
+        self,
+        status: int,
+        body: bytes,
+        headers: Optional[Dict[str, str]] = None,
+        encoded: bool = False,
+    ) -> None:
+        if not encoded and len(body) >= GZIP_MIN_SIZE and self._accepts_gzip():
+            body = gzip.compress(body, 6)
+            headers = dict(headers or {}, **{"Content-Encoding": "gzip"})
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
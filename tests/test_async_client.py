@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""Tests for AsyncJamfClient"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.core.http.async_client import AsyncJamfClient, fetch_many, run_sync
+
+
+class _SlowAuth:
+    """Auth stub whose api_request sleeps like a network call"""
+
+    def __init__(self, delay=0.05, total=250):
+        self.delay = delay
+        self.total = total
+        self.in_flight = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def api_request(self, method, endpoint, data=None, content_type="json"):
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+
+        if "page=" in endpoint:
+            page = int(endpoint.split("page=")[1].split("&")[0])
+            size = int(endpoint.split("page-size=")[1].split("&")[0])
+            ids = range(page * size, min(self.total, (page + 1) * size))
+            return {"totalCount": self.total, "results": [{"id": i} for i in ids]}
+        if endpoint.endswith("/id/13"):
+            raise Exception("API request failed (404): not found")
+        return {"endpoint": endpoint}
+
+
+def test_get_many_overlaps_requests():
+    """Test get_many runs up to max_concurrency requests at once, in order"""
+    auth = _SlowAuth()
+
+    async def run():
+        async with AsyncJamfClient(auth, max_concurrency=5) as client:
+            return await client.get_many(
+                "/JSSResource/policies/id/{id}", range(100, 120)
+            )
+
+    started = time.monotonic()
+    results = asyncio.run(run())
+    elapsed = time.monotonic() - started
+
+    assert [r["endpoint"] for r in results] == [
+        f"/JSSResource/policies/id/{i}" for i in range(100, 120)
+    ]
+    assert auth.peak == 5
+    assert elapsed < 20 * auth.delay / 2
+
+
+def test_get_many_return_exceptions():
+    """Test failures can be returned in place"""
+
+    async def run():
+        async with AsyncJamfClient(_SlowAuth(delay=0)) as client:
+            return await client.get_many(
+                "/JSSResource/policies/id/{id}", [12, 13], return_exceptions=True
+            )
+
+    ok, failed = asyncio.run(run())
+    assert ok["endpoint"].endswith("/12")
+    assert isinstance(failed, Exception)
+
+
+def test_fetch_many_isolates_failures_and_reports_progress():
+    """Test fetch_many keeps order, bounds concurrency and isolates failures"""
+    auth = _SlowAuth(delay=0.02)
+    finished = []
+
+    results = fetch_many(
+        auth,
+        "/JSSResource/scripts/id/{id}",
+        list(range(10, 30)),
+        max_concurrency=4,
+        on_result=lambda index, result: finished.append(index),
+    )
+
+    assert isinstance(results[3], Exception)
+    assert [r["endpoint"] for i, r in enumerate(results) if i != 3] == [
+        f"/JSSResource/scripts/id/{i}" for i in range(10, 30) if i != 13
+    ]
+    assert sorted(finished) == list(range(20))
+    assert auth.peak == 4
+    assert fetch_many(auth, "/JSSResource/scripts/id/{id}", []) == []
+
+
+def test_iter_items_paginates():
+    """Test the async iterator walks every page"""
+
+    async def run():
+        async with AsyncJamfClient(_SlowAuth(delay=0)) as client:
+            return [item["id"] async for item in client.iter_items("/api/v1/policies")]
+
+    assert asyncio.run(run()) == list(range(250))
+
+
+def test_run_sync_inside_running_loop():
+    """Test run_sync works from code already running in an event loop"""
+
+    async def inner():
+        return 42
+
+    async def outer():
+        return run_sync(inner())
+
+    assert run_sync(inner()) == 42
+    assert asyncio.run(outer()) == 42
+
+
+def test_get_all_pages_parallel_in_order():
+    """Test pages after the first are fetched concurrently and reassembled"""
+    auth = _SlowAuth(total=2050)
+    pages_seen = []
+
+    async def run():
+        async with AsyncJamfClient(auth, max_concurrency=8) as client:
+            return await client.get_all_pages(
+                "/api/v1/policies",
+                page_size=100,
+                on_page=lambda page, items, total: pages_seen.append(page),
+            )
+
+    started = time.monotonic()
+    items = asyncio.run(run())
+    elapsed = time.monotonic() - started
+
+    assert [item["id"] for item in items] == list(range(2050))
+    assert sorted(pages_seen) == list(range(21))
+    assert auth.peak > 1
+    assert elapsed < 21 * auth.delay / 2
+
+
+def test_get_all_pages_falls_back_on_rejected_page_size():
+    """Test a 400 for a large page size retries with 100"""
+
+    class _StrictAuth(_SlowAuth):
+        def api_request(self, method, endpoint, data=None, content_type="json"):
+            if "page-size=1000" in endpoint:
+                raise Exception("API request failed (400): page-size too large")
+            return super().api_request(method, endpoint, data, content_type)
+
+    async def run():
+        async with AsyncJamfClient(_StrictAuth(delay=0, total=150)) as client:
+            return await client.get_all_pages("/api/v1/packages")
+
+    assert len(asyncio.run(run())) == 150
+
+
+class _CappedAuth(_SlowAuth):
+    """Auth stub for a server that serves at most 100 items per page"""
+
+    def __init__(self, total=250, count=None):
+        super().__init__(delay=0, total=total)
+        self.count = total if count is None else count
+
+    def api_request(self, method, endpoint, data=None, content_type="json"):
+        size = int(endpoint.split("page-size=")[1].split("&")[0])
+        endpoint = endpoint.replace(f"page-size={size}", f"page-size={min(size, 100)}")
+        response = super().api_request(method, endpoint, data, content_type)
+        response["totalCount"] = self.count
+        return response
+
+
+def test_get_all_pages_follows_capped_page_size():
+    """Test a server capping the page size still returns every item"""
+
+    async def run(auth):
+        async with AsyncJamfClient(auth) as client:
+            return await client.get_all_pages("/api/v1/computers-inventory")
+
+    assert [item["id"] for item in asyncio.run(run(_CappedAuth()))] == list(range(250))
+
+    with pytest.raises(Exception, match="returned 240 of 260 items"):
+        asyncio.run(run(_CappedAuth(total=240, count=260)))
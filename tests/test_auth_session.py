@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""Tests for AuthSession"""
+
+import threading
+import time
+
+from src.core.auth.auth_session import (
+    AuthSession,
+    get_auth_session,
+    reset_auth_sessions,
+)
+from src.core.auth.login_types import AuthCredentials, AuthResult, AuthStatus
+from src.core.auth.token_cache import SharedTokenCache
+
+
+class _FakeStore:
+    def __init__(self, credentials):
+        self.credentials = credentials
+        self.loads = 0
+        self.stores = 0
+
+    def load(self):
+        self.loads += 1
+        return self.credentials
+
+    def store(self, credentials):
+        self.stores += 1
+        self.credentials = credentials
+        return True
+
+
+class _FakeTokenManager:
+    def __init__(self):
+        self.requests = 0
+
+    def refresh_token(self, credentials):
+        return AuthResult(success=False, status=AuthStatus.INVALID)
+
+    def request_new_token(self, credentials):
+        self.requests += 1
+        return AuthResult(
+            success=True,
+            status=AuthStatus.AUTHENTICATED,
+            token="cached",
+            expires_at=str(int(time.time()) + 3600),
+        )
+
+
+def _credentials(**kwargs):
+    return AuthCredentials(url="https://jamf", client_id="id", client_secret="s", **kwargs)
+
+
+def test_credentials_loaded_once():
+    """Test the backing store is read only once"""
+    store = _FakeStore(_credentials())
+    session = AuthSession(store.load, store.store, _FakeTokenManager())
+    for _ in range(5):
+        assert session.load_credentials().url == "https://jamf"
+    assert store.loads == 1
+
+
+def test_token_persisted_only_when_changed():
+    """Test repeated get_token calls do not rewrite the store"""
+    store = _FakeStore(_credentials())
+    token_manager = _FakeTokenManager()
+    session = AuthSession(store.load, store.store, token_manager)
+
+    for _ in range(5):
+        result = session.get_token()
+        assert result.success
+        assert result.token == "cached"
+
+    assert token_manager.requests == 1
+    assert store.stores == 1
+
+
+def test_not_configured():
+    """Test missing credentials report NOT_CONFIGURED"""
+    store = _FakeStore(None)
+    session = AuthSession(store.load, store.store, _FakeTokenManager())
+    assert session.get_token().status == AuthStatus.NOT_CONFIGURED
+
+
+def test_invalidate_reloads():
+    """Test invalidate forces a reload"""
+    store = _FakeStore(_credentials())
+    session = AuthSession(store.load, store.store, _FakeTokenManager())
+    session.load_credentials()
+    session.invalidate()
+    session.load_credentials()
+    assert store.loads == 2
+
+
+def test_invalidate_drops_shared_token(tmp_path):
+    """Test logging out deletes the token other processes would reuse"""
+    store = _FakeStore(_credentials())
+    shared = SharedTokenCache("sandbox", str(tmp_path))
+    session = AuthSession(
+        store.load, store.store, _FakeTokenManager(), shared_cache=shared
+    )
+    assert session.get_token().token == "cached"
+    assert shared.token_file.exists()
+
+    store.credentials = None  # Cleared from the backing store
+    session.invalidate()
+    assert not shared.token_file.exists()
+    assert session.get_token().status == AuthStatus.NOT_CONFIGURED
+
+
+def test_keychain_sessions_keep_tokens_off_disk():
+    """Test only file-backed sessions share their token through a file"""
+    reset_auth_sessions()
+    try:
+        keychain = get_auth_session("sandbox", "keychain", None, None)
+        file_backed = get_auth_session("sandbox", "file", None, None)
+        assert keychain.token_provider.shared_cache.store_tokens is False
+        assert keychain.token_provider.shared_cache.cache_dir.name == "locks"
+        assert file_backed.token_provider.shared_cache.store_tokens is True
+    finally:
+        reset_auth_sessions()
+
+
+def test_keychain_processes_share_one_token_request(tmp_path):
+    """Test keychain sessions serialize refreshes and reuse the stored token"""
+
+    class _SlowTokenManager(_FakeTokenManager):
+        def request_new_token(self, credentials):
+            time.sleep(0.2)
+            return super().request_new_token(credentials)
+
+    keychain = _FakeStore(_credentials())
+    managers = [_SlowTokenManager(), _SlowTokenManager()]
+    # One session per process, sharing only the keychain and the lock
+    sessions = [
+        AuthSession(
+            keychain.load,
+            keychain.store,
+            manager,
+            proactive_refresh=False,
+            shared_cache=SharedTokenCache(
+                "sandbox", str(tmp_path), store_tokens=False
+            ),
+        )
+        for manager in managers
+    ]
+    results = [None, None]
+
+    def get_token(index):
+        results[index] = sessions[index].get_token()
+
+    threads = [threading.Thread(target=get_token, args=(i,)) for i in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [result.token for result in results] == ["cached", "cached"]
+    assert sum(manager.requests for manager in managers) == 1
+    assert keychain.stores == 1
+    assert [path.name for path in tmp_path.iterdir()] == ["token_sandbox.lock"]
+
+
+def test_refresh_token_forces_new_token():
+    """Test refresh_token replaces a still-valid token and persists it"""
+    store = _FakeStore(_credentials())
+    token_manager = _FakeTokenManager()
+    session = AuthSession(store.load, store.store, token_manager)
+    session.get_token()
+
+    result = session.refresh_token()
+    assert result.success and result.token == "cached"
+    assert token_manager.requests == 2
+    assert store.credentials.token == "cached"
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Tests for cassette record/replay of JAMF API traffic"""
+
+import json
+import time
+
+import pytest
+
+from src.core.http.cassette import (
+    TIMING_ORIGINAL,
+    CassetteMissError,
+    CassettePlayer,
+    CassetteRecorder,
+    redact_body,
+)
+from src.core.http.connection_pool import ConnectionPool
+from src.core.http.http_client import JamfHttpClient
+from tests.mock_jamf import MockJamfServer, SyntheticTenant
+
+
+def test_redact_body_formats():
+    """Test secrets are redacted from JSON, form and XML bodies"""
+    token = json.loads(redact_body(b'{"access_token": "abc", "expires_in": 1200}'))
+    assert token == {"access_token": "REDACTED", "expires_in": 1200}
+
+    form = redact_body(b"client_id=jpapi&client_secret=s3cret&grant_type=client_credentials")
+    assert b"s3cret" not in form and b"client_id=jpapi" in form
+
+    xml = redact_body(b"<account><name>a</name><password>hunter2</password></account>")
+    assert xml == b"<account><name>a</name><password>REDACTED</password></account>"
+
+    plain = b'{"computers": [{"id": 1, "name": "MAC-000001"}]}'
+    assert redact_body(plain) is plain
+
+
+def test_record_then_replay(tmp_path):
+    """Test a recorded session replays offline without secrets on disk"""
+    cassette = tmp_path / "session.jsonl"
+    with MockJamfServer(SyntheticTenant({"policies": 30}), latency=0.05) as server:
+        token, _ = server.issue_token()
+        recorder = CassetteRecorder(ConnectionPool(), cassette)
+        client = JamfHttpClient(recorder)
+        listing = client.api_request("GET", f"{server.url}/JSSResource/policies", token)
+        detail = client.api_request("GET", f"{server.url}/JSSResource/policies/id/3", token)
+        client.api_request(
+            "POST", f"{server.url}/JSSResource/policies/id/0", token, "<policy/>", "xml"
+        )
+        client.close()
+
+    recorded = cassette.read_text()
+    assert token not in recorded
+    assert server.url not in recorded
+    assert recorder.get_stats()["recorded"] == 3
+
+    replay = JamfHttpClient(CassettePlayer(cassette))
+    base = "https://other.example.com"
+    started = time.monotonic()
+    assert replay.api_request("GET", f"{base}/JSSResource/policies", "t") == listing
+    assert replay.api_request("GET", f"{base}/JSSResource/policies/id/3", "t") == detail
+    assert time.monotonic() - started < 0.05
+
+    with pytest.raises(CassetteMissError):
+        replay.send("GET", f"{base}/JSSResource/policies/id/4")
+
+
+def test_replay_original_timing(tmp_path):
+    """Test original timing sleeps for the recorded response time"""
+    cassette = tmp_path / "slow.jsonl"
+    with MockJamfServer(SyntheticTenant({"categories": 5}), latency=0.1) as server:
+        token, _ = server.issue_token()
+        client = JamfHttpClient(CassetteRecorder(ConnectionPool(), cassette))
+        client.api_request("GET", f"{server.url}/JSSResource/categories", token)
+        client.close()
+
+    player = CassettePlayer(cassette, timing=TIMING_ORIGINAL)
+    started = time.monotonic()
+    player.request("GET", "https://jamf.example.com/JSSResource/categories")
+    assert time.monotonic() - started >= 0.1
+
+
+def test_replay_export_without_credentials(tmp_path, monkeypatch):
+    """Test a replayed export needs no credentials, token or network"""
+    pytest.importorskip("rich")
+    from tests.test_parquet_export_command import _ConfiguredAuth, _export
+
+    from core.auth.auth_session import reset_auth_sessions
+    from core.auth.jamf_auth import JamfAuth
+    from core.http.http_client import JamfHttpClient as SharedClient
+    from core.http.http_client import set_http_client
+
+    cassette = tmp_path / "export.jsonl"
+    recorded_csv = tmp_path / "recorded.csv"
+    with MockJamfServer(SyntheticTenant({"policies": 25})) as server:
+        auth = _ConfiguredAuth(server)
+        auth.client = JamfHttpClient(CassetteRecorder(ConnectionPool(), cassette))
+        assert _export(server, ["policies", "--output", str(recorded_csv)], auth) == 0
+        auth.client.close()
+
+    # No server, no stored credentials and no token endpoint from here on
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.setenv("JPAPI_CASSETTE", str(cassette))
+    monkeypatch.setenv("JPAPI_CASSETTE_MODE", "replay-fast")
+    reset_auth_sessions()
+    set_http_client(SharedClient.from_config())
+    try:
+        replayed_csv = tmp_path / "replayed.csv"
+        auth = JamfAuth("sandbox", backend="file")
+        argv = ["policies", "--output", str(replayed_csv)]
+        assert _export(None, argv, auth) == 0
+    finally:
+        reset_auth_sessions()
+        set_http_client(None)
+
+    assert replayed_csv.read_text() == recorded_csv.read_text()
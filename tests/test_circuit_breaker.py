@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Tests for CircuitBreaker and fail-fast requests"""
+
+import time
+
+import pytest
+
+from src.core.http.circuit_breaker import CircuitBreaker, CircuitOpenError
+from src.core.http.connection_pool import HttpResponse
+from src.core.http.http_client import JamfHttpClient
+from src.core.http.retry import RetryPolicy
+
+
+def test_trips_after_threshold():
+    """Test the circuit opens after consecutive failures"""
+    breaker = CircuitBreaker("jamf", failure_threshold=3, recovery_timeout=60)
+    for _ in range(3):
+        breaker.before_request()
+        breaker.record_failure("timed out")
+
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError, match="Circuit open for jamf"):
+        breaker.before_request()
+    assert breaker.get_status()["rejected_requests"] == 1
+
+
+def test_half_open_probe():
+    """Test one probe is allowed after the recovery timeout"""
+    breaker = CircuitBreaker("jamf", failure_threshold=1, recovery_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+
+    breaker.before_request()
+    assert breaker.state == "half_open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+    breaker.before_request()
+
+
+def test_failed_probe_reopens():
+    """Test a failed probe opens the circuit again"""
+    breaker = CircuitBreaker("jamf", failure_threshold=1, recovery_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    breaker.before_request()
+    breaker.record_failure("HTTP 502")
+    assert breaker.state == "open"
+    assert breaker.get_status()["trips"] == 2
+
+
+def test_client_fails_fast_when_open():
+    """Test the client stops calling a host once its circuit opens"""
+    client = JamfHttpClient(
+        retry_policy=RetryPolicy(max_retries=0),
+        breaker_factory=lambda host: CircuitBreaker(host, failure_threshold=2),
+    )
+    calls = []
+
+    def bad_gateway(*args, **kwargs):
+        calls.append(args)
+        return HttpResponse(502, "Bad Gateway")
+
+    client.pool.request = bad_gateway
+    for _ in range(2):
+        with pytest.raises(Exception, match="502"):
+            client.api_request("GET", "https://jamf.example/api/v1/policies", "t")
+
+    with pytest.raises(Exception, match="Circuit open for jamf.example"):
+        client.api_request("GET", "https://jamf.example/api/v1/policies", "t")
+    assert len(calls) == 2
+    assert client.get_circuit_status()["jamf.example"]["state"] == "open"
+
+
+def test_throttle_responses_do_not_trip():
+    """Test 503 responses with Retry-After leave the circuit closed"""
+    client = JamfHttpClient(
+        retry_policy=RetryPolicy(max_retries=0),
+        breaker_factory=lambda host: CircuitBreaker(host, failure_threshold=2),
+    )
+    calls = []
+
+    def throttled(*args, **kwargs):
+        calls.append(args)
+        return HttpResponse(
+            503, "Service Unavailable", headers={"retry-after": "0"}
+        )
+
+    client.pool.request = throttled
+    for _ in range(5):
+        with pytest.raises(Exception, match="503"):
+            client.api_request("GET", "https://jamf.example/api/v1/policies", "t")
+
+    assert len(calls) == 5
+    status = client.get_circuit_status()["jamf.example"]
+    assert status["state"] == "closed"
+    assert status["consecutive_failures"] == 0
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Tests for compressed transfer negotiation and decoding"""
+
+import gzip
+import zlib
+
+import pytest
+
+from src.core.http.compression import decode_body, decode_chunks
+from src.core.http.http_client import JamfHttpClient
+from src.core.http.instrumentation import ApiProfiler
+from tests.mock_jamf import MockJamfServer, SyntheticTenant
+
+PAYLOAD = b'{"computers": [' + b",".join(b'{"id": %d}' % i for i in range(2000)) + b"]}"
+
+
+@pytest.mark.parametrize(
+    "encoding,compress",
+    [
+        ("gzip", lambda data: gzip.compress(data)),
+        ("deflate", lambda data: zlib.compress(data)),
+        ("deflate", lambda data: zlib.compress(data)[2:-4]),  # raw deflate
+    ],
+)
+def test_decode_whole_and_chunked(encoding, compress):
+    """Test gzip, zlib deflate and raw deflate decode whole or in chunks"""
+    wire = compress(PAYLOAD)
+    seen = []
+    assert decode_body(wire, encoding, lambda *args: seen.append(args)) == PAYLOAD
+    assert seen[0][:2] == (len(wire), len(PAYLOAD))
+
+    chunks = [wire[i : i + 100] for i in range(0, len(wire), 100)]
+    assert b"".join(decode_chunks(chunks, encoding)) == PAYLOAD
+
+
+def test_client_negotiates_gzip():
+    """Test responses arrive gzipped, are decoded and reported as savings"""
+    profiler = ApiProfiler()
+    with MockJamfServer(SyntheticTenant({"computers": 2000})) as server:
+        token, _ = server.issue_token()
+        url = f"{server.url}/JSSResource/computers"
+
+        client = JamfHttpClient(profiler=profiler)
+        computers = client.api_request("GET", url, token)["computers"]
+        client.close()
+
+        plain = JamfHttpClient(accept_encoding=None, profiler=ApiProfiler())
+        assert plain.api_request("GET", url, token)["computers"] == computers
+        plain_stats = plain.profiler.get_report()["totals"]
+        plain.close()
+
+    totals = profiler.get_report()["totals"]
+    assert len(computers) == 2000
+    assert totals["compressed_responses"] == 1
+    assert totals["response_bytes"] * 3 < plain_stats["response_bytes"]
+    assert totals["bytes_saved"] == plain_stats["response_bytes"] - totals["response_bytes"]
+    assert plain_stats["compressed_responses"] == 0
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Tests for server-side filtered computer searches"""
+
+import sys
+import urllib.parse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from lib.managers.computer_search_manager import (  # noqa: E402
+    ComputerSearchManager,
+    build_inventory_filter,
+    endpoint_unsupported,
+    rsql_quote,
+)
+from src.core.http.circuit_breaker import CircuitOpenError  # noqa: E402
+from src.core.http.http_client import JamfHttpClient  # noqa: E402
+from src.core.http.instrumentation import CallBudgetExceeded  # noqa: E402
+from tests.mock_jamf import MockJamfServer, SyntheticTenant  # noqa: E402
+from tests.mock_jamf.rsql import compile_filter  # noqa: E402
+
+
+class _Auth:
+    """Auth object with a fixed token against the mock server"""
+
+    def __init__(self, server):
+        self.url = server.url
+        self.token, _ = server.issue_token()
+        self.client = JamfHttpClient()
+
+    def api_request(self, method, endpoint, data=None, content_type="json"):
+        return self.client.api_request(
+            method, f"{self.url}{endpoint}", self.token, data, content_type
+        )
+
+
+def test_build_inventory_filter():
+    """Test criteria translate to the same matching as the Classic search"""
+    assert build_inventory_filter({}) == ""
+    assert rsql_quote('say "hi"\\') == '"say \\"hi\\"\\\\"'
+
+    criteria = {"name": "MAC-00*", "model": "Air", "os_version": ">=14.4"}
+    rsql = build_inventory_filter(
+        dict(criteria, managed="true"), department_ids=["2", "5"]
+    )
+    assert rsql.split(";") == [
+        'general.name=="MAC-00*"',
+        'hardware.model=="*Air*"',
+        'operatingSystem.version>="14.4"',
+        "general.remoteManagement.managed==true",
+        "userAndLocation.departmentId=in=(2,5)",
+    ]
+    assert build_inventory_filter({"name": "book", "os_version": "=15.0"}) == (
+        'general.name=="*book*";operatingSystem.version=="15.0"'
+    )
+
+    computer = {
+        "general": {"name": "MAC-000042"},
+        "operatingSystem": {"version": "14.10"},
+    }
+    for criteria, matches in (
+        ({"name": "mac-*"}, True),
+        ({"os_version": ">=14.4"}, True),
+        ({"os_version": "<=14.4"}, False),
+    ):
+        assert compile_filter(build_inventory_filter(criteria))(computer) is matches
+
+
+def test_department_search_is_paged_not_per_computer():
+    """Test a department search costs a few paged calls and matches a full scan"""
+    tenant = SyntheticTenant({"computers": 3000})
+    with MockJamfServer(tenant) as server:
+        auth = _Auth(server)
+        manager = ComputerSearchManager(auth, page_size=500)
+        results = manager.search({"department": "engineer", "managed": "true"})
+        stats = server.stats()
+        auth.client.close()
+
+    items = [tenant.pro_item("computers", object_id) for object_id in range(1, 3001)]
+    engineering = {
+        item["id"]
+        for item in items
+        if item["userAndLocation"]["departmentId"] == "1"
+        and item["general"]["remoteManagement"]["managed"]
+    }
+    assert {row["ID"] for row in results} == engineering
+    assert {row["Department"] for row in results} == {"Engineering"}
+    assert all(row["Managed"] is True and row["Building"] for row in results)
+
+    expected_pages = -(-len(engineering) // 500)
+    assert stats["GET /api/v1/computers-inventory"] == expected_pages
+    assert stats["GET /api/v1/departments"] == 1
+    assert "GET /JSSResource/computers/id/{id}" not in stats
+
+
+def test_search_requests_only_needed_sections():
+    """Test basic searches skip location data and unknown names return nothing"""
+    with MockJamfServer(SyntheticTenant({"computers": 200})) as server:
+        auth = _Auth(server)
+        manager = ComputerSearchManager(auth)
+        query = urllib.parse.urlsplit(manager.inventory_query("", ("GENERAL",))).query
+        assert urllib.parse.parse_qsl(query) == [("section", "GENERAL")]
+
+        rows = manager.search({"name": "MAC-0001*"})
+        assert [row["ID"] for row in rows] == [str(i) for i in range(100, 200)]
+        assert set(rows[0]) == {"ID", "Name", "Model", "Serial", "OS Version"}
+        assert rows[0]["Serial"] and rows[0]["OS Version"]
+
+        assert manager.search({"building": "no such building"}) == []
+        assert server.stats()["GET /api/v1/computers-inventory"] == 1
+        auth.client.close()
+
+
+def test_only_unsupported_endpoint_falls_back():
+    """Test only a missing inventory endpoint sends searches to the Classic API"""
+    assert endpoint_unsupported(Exception("API request failed (404): Not Found"))
+    assert endpoint_unsupported(Exception("API request failed (400): bad filter"))
+    assert not endpoint_unsupported(Exception("API request failed (401): denied"))
+    assert not endpoint_unsupported(Exception("API request failed (503): busy"))
+
+    circuit_open = CircuitOpenError("jamf.example.com", 30)
+    assert not endpoint_unsupported(circuit_open)
+    assert not endpoint_unsupported(Exception(f"API request failed: {circuit_open}"))
+    budget = CallBudgetExceeded("GET /api/v1/computers-inventory", 10, "total")
+    assert not endpoint_unsupported(budget)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Tests for ConnectionPool and JamfHttpClient"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.core.http.connection_pool import ConnectionPool
+from src.core.http.http_client import JamfHttpClient
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path == "/missing":
+            body = b"not found"
+            self.send_response(404)
+        elif self.path == "/moved":
+            body = b""
+            self.send_response(302)
+            self.send_header("Location", "/JSSResource/policies")
+        else:
+            body = json.dumps({"path": self.path}).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_connections_are_reused(server_url):
+    """Test keep-alive connections are reused per host"""
+    pool = ConnectionPool(max_connections_per_host=2)
+    for _ in range(5):
+        response = pool.request("GET", f"{server_url}/JSSResource/policies")
+        assert response.status == 200
+
+    stats = pool.get_stats()
+    assert stats["connections_created"] == 1
+    assert stats["connections_reused"] == 4
+    pool.close()
+
+
+def test_api_request_parses_json(server_url):
+    """Test api_request returns parsed JSON"""
+    client = JamfHttpClient(ConnectionPool())
+    result = client.api_request("GET", f"{server_url}/api/v1/policies", "token")
+    assert result == {"path": "/api/v1/policies"}
+
+
+def test_api_request_follows_redirects(server_url):
+    """Test GET redirects are followed"""
+    client = JamfHttpClient(ConnectionPool())
+    result = client.api_request("GET", f"{server_url}/moved", "token")
+    assert result == {"path": "/JSSResource/policies"}
+
+
+def test_api_request_raises_on_error_status(server_url):
+    """Test HTTP errors keep the existing message format"""
+    client = JamfHttpClient(ConnectionPool())
+    with pytest.raises(Exception, match=r"API request failed \(404\): not found"):
+        client.api_request("GET", f"{server_url}/missing", "token")
+
+
+def test_concurrent_identical_gets_are_coalesced(server_url):
+    """Test identical in-flight GETs share one call and get separate copies"""
+    client = JamfHttpClient()
+    release = threading.Event()
+    calls = []
+    original = client._api_request
+
+    def slow_api_request(*args):
+        calls.append(args)
+        release.wait(5)
+        return original(*args)
+
+    client._api_request = slow_api_request
+    url = f"{server_url}/JSSResource/policies"
+    results = []
+
+    def fetch():
+        results.append(client.api_request("GET", url, "t"))
+
+    threads = [threading.Thread(target=fetch) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    while client.coalescer.get_stats()["coalesced"] < 4:
+        time.sleep(0.01)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len(results) == 5
+    assert all(r == {"path": "/JSSResource/policies"} for r in results)
+    assert len({id(r) for r in results}) == 5
+    client.close()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""Tests for the warm jpapi daemon and its thin client"""
+
+import os
+import socket
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from cli.daemon import (  # noqa: E402
+    JPAPIDaemon,
+    forward_to_daemon,
+    notify_daemon,
+    send_control,
+)
+from core.auth.auth_session import (  # noqa: E402
+    get_auth_session,
+    reset_auth_sessions,
+)
+from core.auth.login_types import AuthCredentials  # noqa: E402
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="needs Unix sockets"
+)
+
+
+@pytest.fixture
+def socket_path():
+    # AF_UNIX paths are limited to ~100 bytes, too short for pytest tmp_path
+    with tempfile.TemporaryDirectory(prefix="jpapi") as directory:
+        yield Path(directory) / "jpapi.sock"
+
+
+def _serve(daemon):
+    daemon.bind()
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    return thread
+
+
+def test_forwards_commands_to_warm_process(socket_path, tmp_path, capsys):
+    """Test commands run in the daemon's process with output streamed back"""
+    state = {"calls": 0}
+
+    def run_command(argv):
+        state["calls"] += 1  # Survives between commands: the process is warm
+        if argv == ["help"]:
+            raise SystemExit(0)
+        if argv == ["search", "boom"]:
+            raise RuntimeError("exploded")
+        print(f"call {state['calls']}: {' '.join(argv)} in {os.getcwd()}")
+        print("warning", file=sys.stderr)
+        return 3
+
+    daemon = JPAPIDaemon(run_command, socket_path)
+    thread = _serve(daemon)
+    cwd = os.getcwd()
+    try:
+        assert oct(socket_path.stat().st_mode & 0o777) == "0o600"
+        os.chdir(tmp_path)
+        assert forward_to_daemon(["list", "policies"], socket_path) == 3
+        assert forward_to_daemon(["help"], socket_path) == 0
+        assert forward_to_daemon(["search", "boom"], socket_path) == 1
+        assert forward_to_daemon(["serve"], socket_path) is None
+        with pytest.raises(RuntimeError, match="already running"):
+            JPAPIDaemon(run_command, socket_path).bind()
+        assert send_control("ping", socket_path)["commands"] == 3
+    finally:
+        os.chdir(cwd)
+        daemon.stop()
+        thread.join(timeout=5)
+
+    out, err = capsys.readouterr()
+    assert f"call 1: list policies in {tmp_path}" in out
+    assert "warning" in err and "RuntimeError: exploded" in err
+    assert state["calls"] == 3
+    assert not thread.is_alive() and not socket_path.exists()
+    assert forward_to_daemon(["list"], socket_path) is None
+
+
+def test_stop_and_idle_timeout(socket_path):
+    """Test the daemon stops on request, after idling, and replaces stale sockets"""
+    socket_path.touch()  # Stale socket file from a daemon that died
+    daemon = JPAPIDaemon(lambda argv: 0, socket_path)
+    thread = _serve(daemon)
+    assert forward_to_daemon(["list"], socket_path) == 0
+    assert send_control("stop", socket_path)["pid"] == os.getpid()
+    thread.join(timeout=5)
+    assert not thread.is_alive() and send_control("ping", socket_path) is None
+
+    idle = JPAPIDaemon(lambda argv: 0, socket_path, idle_timeout=0.2)
+    thread = _serve(idle)
+    thread.join(timeout=5)
+    assert not thread.is_alive() and not socket_path.exists()
+
+
+def test_prompting_commands_and_other_settings_run_locally(socket_path, monkeypatch):
+    """Test commands that may prompt, or need other JPAPI_* settings, stay local"""
+    calls = []
+    daemon = JPAPIDaemon(lambda argv: calls.append(argv) or 0, socket_path)
+    thread = _serve(daemon)
+    try:
+        for argv in (["setup"], ["delete", "policy", "7"], ["config", "reset"], []):
+            assert forward_to_daemon(argv, socket_path) is None
+        assert forward_to_daemon(["ls", "scripts"], socket_path) == 0
+
+        monkeypatch.setenv("JPAPI_CASSETTE", "replay.json")
+        assert forward_to_daemon(["list", "policies"], socket_path) is None
+        monkeypatch.setenv("JPAPI_SOCKET", str(socket_path))  # Not a setting
+        monkeypatch.delenv("JPAPI_CASSETTE")
+        assert forward_to_daemon(["list", "policies"], socket_path) == 0
+    finally:
+        daemon.stop()
+        thread.join(timeout=5)
+    assert calls == [["ls", "scripts"], ["list", "policies"]]
+
+
+def test_local_logout_reaches_daemon(socket_path, capsys):
+    """Test the daemon drops its cached credentials after a local setup/logout"""
+    store = {
+        "credentials": AuthCredentials(
+            url="https://old.jamf", client_id="old", client_secret="s"
+        )
+    }
+
+    def run_command(argv):
+        # Keychain sessions have no shared token file to notice changes by
+        session = get_auth_session(
+            "daemon-test",
+            "keychain",
+            lambda: store["credentials"],
+            lambda credentials: True,
+        )
+        credentials = session.load_credentials()
+        print(credentials.client_id if credentials else "logged out")
+        return 0
+
+    reset_auth_sessions()
+    daemon = JPAPIDaemon(run_command, socket_path, reset_sessions=reset_auth_sessions)
+    thread = _serve(daemon)
+    try:
+        assert forward_to_daemon(["list", "policies"], socket_path) == 0
+
+        # `jpapi setup` clears the keychain entry in its own process
+        store["credentials"] = None
+        assert forward_to_daemon(["list", "policies"], socket_path) == 0
+        notify_daemon(["list", "policies"], socket_path)  # Not a credential change
+        assert forward_to_daemon(["list", "policies"], socket_path) == 0
+        notify_daemon(["setup", "auth"], socket_path)
+        assert forward_to_daemon(["list", "policies"], socket_path) == 0
+    finally:
+        daemon.stop()
+        thread.join(timeout=5)
+        reset_auth_sessions()
+
+    assert capsys.readouterr().out.split() == ["old", "old", "old", "logged", "out"]
+
+
+def test_config_change_runs_locally(socket_path, tmp_path):
+    """Test commands stop being forwarded once a config file changes"""
+    config = tmp_path / "authentication.json"
+    config.write_text("{}")
+    daemon = JPAPIDaemon(lambda argv: 0, socket_path, config_files=[config])
+    thread = _serve(daemon)
+    try:
+        assert forward_to_daemon(["list", "policies"], socket_path) == 0
+        os.utime(config, (config.stat().st_atime, config.stat().st_mtime + 5))
+        assert forward_to_daemon(["list", "policies"], socket_path) is None
+    finally:
+        daemon.stop()
+        thread.join(timeout=5)
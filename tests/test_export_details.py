@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Tests for concurrent detail fetching in export handlers"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+pytest.importorskip("rich")
+
+from cli.commands.export.export_base import ExportBase  # noqa: E402
+from lib.exports.export_state import ExportStateStore  # noqa: E402
+
+
+class _DetailAuth:
+    """Auth stub answering detail requests, later IDs first"""
+
+    def __init__(self, delay=0.02, failing=()):
+        self.delay = delay
+        self.failing = set(failing)
+        self.requested = []
+        self.finished = []
+        self.in_flight = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def api_request(self, method, endpoint, data=None, content_type="json"):
+        object_id = int(endpoint.rsplit("/", 1)[1])
+        with self.lock:
+            self.requested.append(object_id)
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.delay / object_id)
+        with self.lock:
+            self.in_flight -= 1
+            self.finished.append(object_id)
+        if object_id in self.failing:
+            raise Exception(f"API request failed (500): policy {object_id}")
+        return {"policy": {"id": object_id}}
+
+
+class _Export(ExportBase):
+    def __init__(self, auth, batch_size=200):
+        super().__init__(auth, "policies")
+        self.detail_endpoint = "/JSSResource/policies"
+        self.detail_concurrency = 8
+        self.DETAIL_BATCH_SIZE = batch_size
+
+
+def _items(count):
+    return [{"id": i, "name": f"Policy {i}"} for i in range(1, count + 1)]
+
+
+def _detail_ids(pairs):
+    return [detail and detail["policy"]["id"] for _, detail in pairs]
+
+
+def test_details_keep_item_order():
+    """Test details come back in item order though later IDs finish first"""
+    auth = _DetailAuth()
+    pairs = list(_Export(auth)._iter_details(_items(8)))
+
+    assert [item["id"] for item, _ in pairs] == list(range(1, 9))
+    assert _detail_ids(pairs) == list(range(1, 9))
+    assert auth.finished != sorted(auth.finished)  # Completed out of order
+    assert 1 < auth.peak <= 8
+
+
+def test_failed_detail_leaves_neighbours():
+    """Test a failing ID yields None while the others still succeed"""
+    pairs = list(_Export(_DetailAuth(failing={4}))._iter_details(_items(6)))
+    assert _detail_ids(pairs) == [1, 2, 3, None, 5, 6]
+
+
+def test_fetch_false_makes_no_requests():
+    """Test fetch=False yields every item with no detail and no calls"""
+    auth = _DetailAuth()
+    items = _items(5) + [{"name": "No ID"}]
+    pairs = list(_Export(auth)._iter_details(items, fetch=False))
+
+    assert [item for item, _ in pairs] == items
+    assert all(detail is None for _, detail in pairs)
+    assert auth.requested == []
+
+
+def test_details_fetched_one_batch_at_a_time():
+    """Test DETAIL_BATCH_SIZE bounds the requests made ahead of the rows"""
+    auth = _DetailAuth(delay=0)
+    items = _items(7)
+    items.insert(3, {"name": "No ID"})  # Counts toward its batch, never fetched
+    details = _Export(auth, batch_size=3)._iter_details(items)
+
+    next(details)
+    assert sorted(auth.requested) == [1, 2, 3]
+    for _ in range(2):
+        next(details)
+    assert sorted(auth.requested) == [1, 2, 3]
+    next(details)  # The item without an ID starts the second batch
+    assert sorted(auth.requested) == [1, 2, 3, 4, 5]
+
+    rest = list(details)
+    assert len(rest) == 4 and rest[-1][1] == {"policy": {"id": 7}}
+    assert sorted(auth.requested) == list(range(1, 8))
+
+
+def test_incremental_details_reuse_saved(tmp_path):
+    """Test --incremental runs fetch only objects the store does not have"""
+    auth = _DetailAuth(delay=0)
+    export = _Export(auth)
+    with ExportStateStore("sandbox", tmp_path / "state.db") as store:
+        export.detail_state = store
+        list(export._iter_details(_items(4)))
+        auth.requested.clear()
+
+        changed = _items(5)
+        changed[1]["name"] = "Renamed"
+        pairs = list(export._iter_details(changed))
+
+    assert _detail_ids(pairs) == [1, 2, 3, 4, 5]
+    assert sorted(auth.requested) == [2, 5]
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""Tests for the export checkpoint journal"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from lib.exports.export_journal import ExportJournal  # noqa: E402
+
+OPTIONS = {"filter": None, "detailed": True}
+
+
+def test_resume_continues_interrupted_journal(tmp_path):
+    """Test finished rows survive a crash and later rows are appended"""
+    journal = ExportJournal("sandbox", "macos profiles", tmp_path)
+    journal.start(OPTIONS)
+    journal.record(1, [{"Name": "Wi-Fi"}])
+    journal.record(2, [{"Name": "VPN"}, {"Name": "VPN (2)"}])
+    journal.close()
+    with open(journal.path, "a", encoding="utf-8") as f:
+        f.write('{"id": "3", "rows": [{"Na')  # Killed mid-write
+
+    resumed = ExportJournal("sandbox", "macos profiles", tmp_path)
+    assert resumed.resume(OPTIONS)
+    assert resumed.completed_ids() == {"1", "2"} and resumed.recorded == 2
+    resumed.record(3, [{"Name": "Restrictions"}])
+    resumed.close()
+
+    names = [row["Name"] for row in resumed.rows()]
+    assert names == ["Wi-Fi", "VPN", "VPN (2)", "Restrictions"]
+    assert resumed.path.name == "sandbox-macos-profiles.jsonl"
+
+
+def test_resume_requires_same_options(tmp_path):
+    """Test a journal is only resumed by an export with the same options"""
+    journal = ExportJournal("prod", "scripts", tmp_path)
+    assert not journal.resume(OPTIONS)  # Nothing to resume
+
+    journal.start(OPTIONS)
+    journal.record(5, [{"Name": "cleanup.sh"}])
+    journal.close()
+    assert not ExportJournal("prod", "scripts", tmp_path).resume({"filter": "a*"})
+
+    journal.discard()
+    assert not journal.path.exists()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Tests for the incremental export state store"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from lib.exports.export_state import (  # noqa: E402
+    CLASSIC_MAX_AGE,
+    DEFAULT_MAX_AGE,
+    ExportStateStore,
+    default_max_age,
+    fingerprint,
+)
+
+SOURCE = "/JSSResource/policies/id/{id}"
+
+
+def _policies(*names):
+    return [{"id": i + 1, "name": name} for i, name in enumerate(names)]
+
+
+def test_reuses_details_only_for_unchanged_objects(tmp_path):
+    """Test saved details come back until the summary entry changes"""
+    db_path = tmp_path / "state.db"
+    items = _policies("Install Chrome", "Install Zoom")
+    with ExportStateStore("sandbox", db_path) as store:
+        assert store.lookup(SOURCE, items) == [None, None]
+        store.save(SOURCE, items, [{"policy": {"id": 1}}, None])  # 2 failed
+
+    # A later run: policy 2 is new to the store, 1 renamed, 3 created
+    with ExportStateStore("sandbox", db_path) as store:
+        assert store.lookup(SOURCE, items) == [{"policy": {"id": 1}}, None]
+        changed = _policies("Install Chrome (beta)", "Install Zoom", "Slack")
+        assert store.lookup(SOURCE, changed) == [None, None, None]
+        # Environments and detail sources are kept apart
+        assert store.lookup("/JSSResource/scripts/id/{id}", items)[0] is None
+    with ExportStateStore("prod", db_path) as store:
+        assert store.lookup(SOURCE, items)[0] is None
+
+
+def test_saved_details_expire(tmp_path):
+    """Test details older than max_age are fetched again"""
+    items = _policies("Install Chrome")
+    with ExportStateStore("sandbox", tmp_path / "state.db", max_age=60) as store:
+        store.save(SOURCE, items, [{"policy": {"id": 1}}])
+        assert store.lookup(SOURCE, items) == [{"policy": {"id": 1}}]
+        store.max_age = 0
+        time.sleep(0.01)
+        assert store.lookup(SOURCE, items) == [None]
+
+    # Classic list entries hide most edits, so their details expire sooner
+    assert default_max_age(SOURCE) == CLASSIC_MAX_AGE < DEFAULT_MAX_AGE
+    assert default_max_age("/api/v1/packages/{id}") == DEFAULT_MAX_AGE
+
+
+def test_fingerprint_includes_modification_markers():
+    """Test the fingerprint ignores key order but not any value"""
+    item = {"id": 7, "name": "Zoom", "modified": "2024-01-01"}
+    assert fingerprint(item) == fingerprint(dict(reversed(list(item.items()))))
+    assert fingerprint(item) != fingerprint({**item, "modified": "2024-01-02"})
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Tests for multi-environment fan-out"""
+
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from lib.utils.fan_out import (  # noqa: E402
+    ENV_COLUMN,
+    collect_rows,
+    collecting,
+    merge_env_rows,
+    parse_envs,
+    run_across_envs,
+)
+from src.core.http.json_stream import stream_list  # noqa: E402
+from tests.mock_jamf import MockJamfServer, SyntheticTenant  # noqa: E402
+from tests.test_computer_search import _Auth  # noqa: E402
+
+
+def test_parse_envs():
+    """Test --envs values split into unique names"""
+    assert parse_envs(None) == []
+    assert parse_envs(" sandbox,prod,,sandbox ") == ["sandbox", "prod"]
+
+
+def test_runs_concurrently_and_merges_tagged_rows():
+    """Test each tenant runs at once on its own client and rows merge tagged"""
+    servers = {
+        "sandbox": MockJamfServer(SyntheticTenant({"computers": 30})).start(),
+        "prod": MockJamfServer(SyntheticTenant({"computers": 50}, seed=2)).start(),
+    }
+    started = threading.Barrier(2, timeout=5)
+    clients = {}
+
+    def run(env):
+        auth = _Auth(servers[env])
+        clients[env] = auth.client
+        started.wait()  # Fails unless both environments run at the same time
+        computers = list(stream_list(auth, "/JSSResource/computers", ("computers",)))
+        collect_rows([{"ID": c["id"], "Name": c["name"]} for c in computers])
+        return 0
+
+    def broken(env):
+        collect_rows([{"ID": 1}])
+        raise RuntimeError("token rejected")
+
+    try:
+        runs = run_across_envs(["sandbox", "prod"], run)
+        failed = run_across_envs(["sandbox"], broken)
+    finally:
+        for env, server in servers.items():
+            clients[env].close()
+            server.stop()
+
+    assert [env_run.env for env_run in runs] == ["sandbox", "prod"]
+    assert all(env_run.ok for env_run in runs)
+    assert clients["sandbox"].pool is not clients["prod"].pool
+    assert not collecting() and collect_rows([{"ID": 1}]) is False
+
+    merged = merge_env_rows(runs)
+    assert len(merged) == 80
+    assert list(merged[0]) == [ENV_COLUMN, "ID", "Name"]
+    assert [row[ENV_COLUMN] for row in merged].count("prod") == 50
+
+    assert not failed[0].ok and failed[0].error == "token rejected"
+    assert failed[0].rows == [{"ID": 1}]
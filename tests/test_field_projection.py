@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Tests for --fields projection"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from lib.managers.computer_search_manager import (  # noqa: E402
+    INVENTORY_COLUMNS,
+    ComputerSearchManager,
+)
+from lib.utils.field_projection import (  # noqa: E402
+    DETAIL,
+    SUMMARY,
+    FieldCatalog,
+    FieldError,
+    match_columns,
+    resolve_fields,
+    select_output_fields,
+)
+from tests.mock_jamf import MockJamfServer, SyntheticTenant  # noqa: E402
+from tests.test_computer_search import _Auth  # noqa: E402
+
+
+class _RecordingAuth(_Auth):
+    """Mock server auth that remembers the endpoints it called"""
+
+    def __init__(self, server):
+        super().__init__(server)
+        self.endpoints = []
+
+    def api_request(self, method, endpoint, data=None, content_type="json"):
+        self.endpoints.append(endpoint)
+        return super().api_request(method, endpoint, data, content_type)
+
+
+def test_match_columns():
+    """Test names match ignoring case and punctuation, or by unique prefix"""
+    columns = ["ID", "Name", "Serial Number", "OS Version", "OS Build"]
+    assert match_columns(["name", "os_version", "serial", "ID", "id"], columns) == [
+        "Name",
+        "OS Version",
+        "Serial Number",
+        "ID",
+    ]
+    with pytest.raises(FieldError, match="ambiguous; choose from: OS Version, OS"):
+        match_columns(["os"], columns)
+    with pytest.raises(FieldError, match="not available"):
+        match_columns(["color"], columns)
+
+    assert resolve_fields(None) is None
+    assert resolve_fields(" name, ,serial ") == ["name", "serial"]
+    rows = [{"ID": 1, "Name": "a", "Model": "m"}]
+    assert select_output_fields(rows, ["model", "id"]) == [{"Model": "m", "ID": 1}]
+    assert select_output_fields(rows, None) is rows
+
+
+def test_catalog_sources():
+    """Test catalogs report the detail calls and sections the fields need"""
+    catalog = FieldCatalog({"ID": SUMMARY, "Name": SUMMARY, "OS": DETAIL})
+    assert catalog.resolve("name") == ["Name"]
+    assert not catalog.needs(["ID", "Name"], DETAIL)
+    assert catalog.needs(["Name", "OS"], DETAIL)
+    assert catalog.needs(None, DETAIL)
+
+    known = ("GENERAL", "HARDWARE", "OPERATING_SYSTEM", "USER_AND_LOCATION")
+    assert INVENTORY_COLUMNS.sections(["ID", "Serial"], known) == ["HARDWARE"]
+    assert INVENTORY_COLUMNS.sections(None, known) == list(known)
+
+
+def test_search_fetches_only_projected_sections():
+    """Test a narrow search requests one section and no lookup collections"""
+    with MockJamfServer(SyntheticTenant({"computers": 300})) as server:
+        auth = _RecordingAuth(server)
+        fields = INVENTORY_COLUMNS.resolve("id,serial")
+        rows = ComputerSearchManager(auth).search({"model": "Air"}, fields)
+        stats = server.stats()
+        auth.client.close()
+
+    assert rows and all(list(row) == ["ID", "Serial"] for row in rows)
+    assert all(row["Serial"] for row in rows)
+    assert stats["GET /api/v1/computers-inventory"] == 1
+    assert "GET /api/v1/departments" not in stats
+    assert "GET /api/v1/buildings" not in stats
+    assert "section=HARDWARE" in auth.endpoints[0]
+    assert "section=GENERAL" not in auth.endpoints[0]
+
+
+def test_device_fields_keep_filter_semantics(tmp_path):
+    """Test --fields with --filter matches name or model, like the plain list"""
+    pytest.importorskip("rich")
+    import json
+    from argparse import Namespace
+
+    from cli.commands.devices_command import DevicesCommand
+
+    path = tmp_path / "computers.json"
+    with MockJamfServer(SyntheticTenant({"computers": 200})) as server:
+        everything = ComputerSearchManager(_Auth(server)).search(
+            {}, ["ID", "Name", "Model"]
+        )
+        command = DevicesCommand()
+        command._auth = _Auth(server)
+        args = Namespace(fields="id,serial", filter="air", format="json", output=path)
+        assert command._list_computers(args) == 0
+
+    rows = json.loads(path.read_text())
+    expected = [row["ID"] for row in everything if "air" in row["Model"].lower()]
+    assert expected and [row["ID"] for row in rows] == expected
+    assert all(list(row) == ["ID", "Serial"] for row in rows)
+
+
+def test_device_fields_fall_back_to_classic(tmp_path, monkeypatch):
+    """Test --fields lists through Classic when computers-inventory is missing"""
+    pytest.importorskip("rich")
+    import json
+    from argparse import Namespace
+
+    from cli.commands.devices_command import DevicesCommand
+
+    def unsupported(self, criteria, fields=None):
+        raise Exception("API request failed (404): Not Found")
+
+    monkeypatch.setattr(ComputerSearchManager, "search", unsupported)
+    # ComputerManager caches under a relative tmp/cache directory
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "computers.json"
+    with MockJamfServer(SyntheticTenant({"computers": 20})) as server:
+        command = DevicesCommand()
+        command._auth = _Auth(server)
+        args = Namespace(fields="id,serial", filter=None, format="json", output=path)
+        assert command._list_computers(args) == 0
+
+    rows = json.loads(path.read_text())
+    assert len(rows) == 20
+    assert all(list(row) == ["ID", "Serial"] for row in rows)
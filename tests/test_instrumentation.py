@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Tests for per-endpoint API instrumentation and call budgets"""
+
+import json
+
+import pytest
+
+from src.core.http.http_client import JamfHttpClient
+from src.core.http.instrumentation import (
+    ApiProfiler,
+    CallBudgetExceeded,
+    endpoint_template,
+)
+from tests.mock_jamf import MockJamfServer, SyntheticTenant
+
+
+def test_endpoint_template():
+    """Test identifiers and query values collapse into one template"""
+    base = "https://jamf.example.com"
+    assert (
+        endpoint_template("get", f"{base}/JSSResource/policies/id/42")
+        == "GET /JSSResource/policies/id/{id}"
+    )
+    assert (
+        endpoint_template("GET", f"{base}/JSSResource/computers/serialnumber/C02X")
+        == "GET /JSSResource/computers/serialnumber/{serialnumber}"
+    )
+    assert (
+        endpoint_template("GET", f"{base}/api/v1/computers-inventory?page=3&page-size=100")
+        == "GET /api/v1/computers-inventory?page&page-size"
+    )
+    assert endpoint_template("DELETE", f"{base}/api/v1/scripts/7") == "DELETE /api/v1/scripts/{id}"
+
+
+def test_profiler_records_traffic(tmp_path):
+    """Test counts, statuses, bytes and latency per endpoint template"""
+    profiler = ApiProfiler()
+    with MockJamfServer(SyntheticTenant({"policies": 20}), latency=0.02) as server:
+        token, _ = server.issue_token()
+        client = JamfHttpClient(profiler=profiler)
+        client.api_request("GET", f"{server.url}/JSSResource/policies", token)
+        for policy_id in (1, 2, 3):
+            client.api_request("GET", f"{server.url}/JSSResource/policies/id/{policy_id}", token)
+        with pytest.raises(Exception, match="404"):
+            client.api_request("GET", f"{server.url}/JSSResource/policies/id/99", token)
+        client.close()
+
+    report = profiler.get_report()
+    detail = report["endpoints"]["GET /JSSResource/policies/id/{id}"]
+    assert detail["calls"] == 4
+    assert detail["statuses"] == {"200": 3, "404": 1}
+    assert detail["response_bytes"] > 0
+    assert detail["latency"]["p50_ms"] >= 25.0
+    assert "<=10" not in detail["latency"]["histogram_ms"]
+    assert sum(detail["latency"]["histogram_ms"].values()) == 4
+    assert report["totals"]["calls"] == 5
+
+    path = profiler.write_report(tmp_path / "profile.json", command="list")
+    saved = json.loads(path.read_text())
+    assert saved["command"] == "list"
+    assert saved["totals"]["requests"] == 5
+    assert profiler.format_summary()[0].startswith("📊 API profile: 5 calls")
+
+
+def test_call_budgets_abort_before_sending():
+    """Test total and per-endpoint budgets stop requests from being sent"""
+    with MockJamfServer(SyntheticTenant({"policies": 20})) as server:
+        token, _ = server.issue_token()
+        client = JamfHttpClient(profiler=ApiProfiler(max_calls_per_endpoint=2))
+        url = f"{server.url}/JSSResource/policies/id/{{}}"
+        client.api_request("GET", url.format(1), token)
+        client.api_request("GET", url.format(2), token)
+        with pytest.raises(CallBudgetExceeded, match="per-endpoint"):
+            client.api_request("GET", url.format(3), token)
+        assert server.stats()["GET /JSSResource/policies/id/{id}"] == 2
+
+        client.profiler = ApiProfiler(max_calls=1)
+        client.api_request("GET", f"{server.url}/JSSResource/policies", token)
+        with pytest.raises(CallBudgetExceeded, match="more than 1 total"):
+            client.api_request("GET", url.format(1), token)
+        assert client.profiler.budget_exceeded is not None
+        client.close()
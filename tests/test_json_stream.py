@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Tests for streaming JSON list parsing"""
+
+import json
+
+import pytest
+
+from src.core.http.http_client import JamfHttpClient
+from src.core.http.instrumentation import ApiProfiler
+from src.core.http.json_stream import iter_json_array, stream_list
+from tests.mock_jamf import MockJamfServer, SyntheticTenant
+
+
+def _chunks(payload, size):
+    data = json.dumps(payload).encode("utf-8")
+    return (data[i : i + size] for i in range(0, len(data), size))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_iter_json_array_any_chunking(chunk_size):
+    """Test elements parse identically however the body is split"""
+    items = [
+        {"id": i, "name": f"MAC-{i} ünïcode", "tags": [1.5, None, True], "n": 10**i}
+        for i in range(1, 40)
+    ]
+    payload = {"meta": {"skip": [1, {"x": "]"}]}, "computers": items, "after": 1}
+    assert list(iter_json_array(_chunks(payload, chunk_size), ("computers",))) == items
+    assert list(iter_json_array(_chunks(items, chunk_size))) == items
+
+
+def test_iter_json_array_shapes():
+    """Test nested paths, missing keys, one-item objects and bad JSON"""
+    nested = {"computers": {"computer": [{"id": 1}, {"id": 2}]}}
+    path = ("computers", "computer")
+    assert list(iter_json_array(_chunks(nested, 3), path)) == [{"id": 1}, {"id": 2}]
+    assert list(iter_json_array(_chunks({"other": []}, 3), ("computers",))) == []
+    assert list(iter_json_array(_chunks({"computers": []}, 3), ("computers",))) == []
+    single = {"computers": {"id": 1}}
+    assert list(iter_json_array(_chunks(single, 3), ("computers",))) == [{"id": 1}]
+
+    with pytest.raises(ValueError):
+        list(iter_json_array([b'{"computers": [{"id": 1}, {"id": '], ("computers",)))
+
+
+def test_iter_list_streams_from_server():
+    """Test the client streams a Classic list and returns the connection"""
+    profiler = ApiProfiler()
+    with MockJamfServer(SyntheticTenant({"computers": 3000})) as server:
+        token, _ = server.issue_token()
+        client = JamfHttpClient(profiler=profiler)
+        url = f"{server.url}/JSSResource/computers"
+
+        stream = client.iter_list(url, token, ("computers",))
+        assert next(stream) == {"id": 1, "name": "MAC-000001"}
+        rest = list(stream)
+        assert len(rest) == 2999 and rest[-1]["id"] == 3000
+
+        # Abandoning a stream early drops its connection instead of reusing it
+        partial = client.iter_list(url, token, ("computers",))
+        next(partial)
+        partial.close()
+        assert len(list(client.iter_list(url, token, ("computers",)))) == 3000
+
+        with pytest.raises(Exception, match="404"):
+            list(client.iter_list(f"{server.url}/JSSResource/nothing", token))
+        stats = client.pool.get_stats()
+        client.close()
+
+    assert stats["connections_reused"] >= 1
+    listing = profiler.get_report()["endpoints"]["GET /JSSResource/computers"]
+    assert listing["calls"] == 3
+    assert listing["response_bytes"] > 0
+    assert listing["compressed_responses"] >= 2 and listing["bytes_saved"] > 0
+
+
+def test_stream_list_falls_back_to_api_request():
+    """Test auth objects without iter_api_list still work"""
+
+    class _Auth:
+        def api_request(self, method, endpoint):
+            return {"mobile_devices": [{"id": 1}, {"id": 2}]}
+
+    assert list(stream_list(_Auth(), "/JSSResource/mobiledevices", ("mobile_devices",))) == [
+        {"id": 1},
+        {"id": 2},
+    ]
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Tests for the mock Jamf Pro server against the real request pipeline"""
+
+import pytest
+
+from src.core.auth.auth_session import AuthSession
+from src.core.auth.login_types import AuthCredentials
+from src.core.auth.token_manager import TokenManager
+from src.core.http.async_client import fetch_all_pages
+from src.core.http.http_client import JamfHttpClient
+from src.core.http.retry import RetryPolicy
+from tests.mock_jamf import MockJamfServer, SyntheticTenant
+
+SMALL_TENANT = {"computers": 2500, "policies": 120, "computer_groups": 40}
+
+
+class _MockAuth:
+    """Minimal auth object using the real token and HTTP pipeline"""
+
+    def __init__(self, url, client):
+        credentials = AuthCredentials(url=url, client_id="bench", client_secret="bench")
+        self.url = url
+        self.client = client
+        self.session = AuthSession(lambda: credentials, lambda c: True, TokenManager())
+
+    def api_request(self, method, endpoint, data=None, content_type="json"):
+        token = self.session.get_token()
+        assert token.success, token.message
+        return self.client.api_request(
+            method, f"{self.url}{endpoint}", token.token, data, content_type
+        )
+
+
+@pytest.fixture
+def server():
+    with MockJamfServer(SyntheticTenant(SMALL_TENANT)) as mock:
+        yield mock
+
+
+def test_fixtures_are_deterministic():
+    """Test the same seed yields the same objects"""
+    first = SyntheticTenant(seed=7).classic_detail("policies", 42)
+    second = SyntheticTenant(seed=7).classic_detail("policies", 42)
+    assert first == second
+    assert SyntheticTenant(seed=8).classic_detail("policies", 42) != first
+
+
+def test_oauth_and_classic_endpoints(server):
+    """Test token issuance, Classic lists and details"""
+    auth = _MockAuth(server.url, JamfHttpClient())
+    policies = auth.api_request("GET", "/JSSResource/policies")["policies"]
+    assert len(policies) == 120
+
+    detail = auth.api_request("GET", "/JSSResource/policies/id/5")["policy"]
+    assert detail["general"]["name"] == "Policy-000005"
+    assert server.stats()["POST /api/oauth/token"] == 1
+
+    with pytest.raises(Exception, match="404"):
+        auth.api_request("GET", "/JSSResource/policies/id/999")
+
+
+def test_pro_pagination(server):
+    """Test totalCount paging over the Jamf Pro API"""
+    auth = _MockAuth(server.url, JamfHttpClient())
+    computers = fetch_all_pages(auth, "/api/v1/computers-inventory", page_size=500)
+    assert [c["id"] for c in computers] == [str(i) for i in range(1, 2501)]
+    assert server.stats()["GET /api/v1/computers-inventory"] == 5
+
+
+def test_injected_failures_are_absorbed(server):
+    """Test 429/502 injection is handled by the client's retry layers"""
+    server.throttle_rate = 0.2
+    server.error_rate = 0.2
+    server.retry_after = 0
+    client = JamfHttpClient(retry_policy=RetryPolicy(max_retries=6, retry_delay=0.001))
+    auth = _MockAuth(server.url, client)
+
+    for object_id in range(1, 31):
+        assert auth.api_request("GET", f"/JSSResource/computergroups/id/{object_id}")
+
+    stats = server.stats()
+    assert stats.get("injected 429", 0) + stats.get("injected 502", 0) > 0
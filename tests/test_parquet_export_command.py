@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Tests for `jpapi export <type> --format parquet`"""
+
+import sys
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from tests.mock_jamf import MockJamfServer, SyntheticTenant  # noqa: E402
+from tests.test_computer_search import _Auth  # noqa: E402
+
+
+class _ConfiguredAuth(_Auth):
+    def is_configured(self):
+        return True
+
+
+def _export(server, argv, auth=None):
+    from cli.commands.export_command import ExportCommand
+
+    command = ExportCommand()
+    command._auth = auth or _ConfiguredAuth(server)
+    parser = ArgumentParser()
+    command.add_arguments(parser)
+    return command.execute(parser.parse_args(argv))
+
+
+def test_export_writes_parquet_file(tmp_path):
+    """Test the list-backed export path writes a real, typed Parquet file"""
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    path = tmp_path / "sandbox-policies-export.parquet"
+    with MockJamfServer(SyntheticTenant({"policies": 40})) as server:
+        argv = ["policies", "--format", "parquet", "--output", str(path)]
+        assert _export(server, argv) == 0
+
+    table = pq.read_table(path)
+    assert table.num_rows == 40
+    assert table.schema.field("ID").type == pa.int64()
+    assert table.column("ID").to_pylist() == list(range(1, 41))
+
+
+def test_parquet_is_rejected_without_a_file():
+    """Test commands that only print cannot be asked for Parquet"""
+    pytest.importorskip("pyarrow")
+    from cli.app import JPAPIDevCLI
+    from cli.base.output_formatter import OutputFormatError, OutputFormatter
+
+    problem = JPAPIDevCLI._parquet_problem
+    assert problem(Namespace(command="list", format="csv")) is None
+    assert problem(Namespace(command="export", format="parquet")) is None
+    assert "--export-mode" in problem(Namespace(command="list", format="parquet"))
+    assert "not info" in problem(Namespace(command="info", format="parquet"))
+
+    with pytest.raises(OutputFormatError):
+        OutputFormatter().format_output([{"ID": 1}], "parquet")
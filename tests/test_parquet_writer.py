@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Tests for the Parquet export writer"""
+
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from lib.exports.parquet_writer import (  # noqa: E402
+    infer_column_type,
+    parse_datetime,
+    unwrap_hyperlink,
+)
+from lib.exports.stream_writers import write_rows  # noqa: E402
+
+
+def test_infers_column_types():
+    """Test typed columns are only inferred when every value fits"""
+    assert infer_column_type([True, False, None]) == "bool"
+    assert infer_column_type([12, "345", ""]) == "int"
+    assert infer_column_type(["007", "12"]) == "string"  # Leading zeros kept
+    assert infer_column_type([1, 2.5]) == "float"
+    assert infer_column_type(["14.2", "13.6"]) == "string"  # Versions stay text
+    assert infer_column_type(["2024-01-15", "2023-12-01"]) == "date"
+    assert infer_column_type(["2024-01-15 10:23:45", ""]) == "timestamp"
+    assert infer_column_type(["2024-01-15T10:23:45.1Z"]) == "timestamp_utc"
+    assert infer_column_type(["Apps", "Apps", "Security", "Apps"]) == "dictionary"
+    assert infer_column_type(["Zoom", "Slack", "Chrome"]) == "string"
+    assert infer_column_type([None, ""]) == "string"
+
+
+def test_parses_jamf_timestamps():
+    """Test the timestamp spellings of the Classic and Pro APIs"""
+    utc = datetime(2024, 1, 15, 10, 23, 45, 120000, tzinfo=timezone.utc)
+    assert parse_datetime("2024-01-15T10:23:45.12Z") == utc
+    assert parse_datetime("2024-01-15T10:23:45.120+0000") == utc
+    assert parse_datetime("2024-01-15 10:23") == datetime(2024, 1, 15, 10, 23)
+    assert parse_datetime("Jan 15, 2024") is None
+    assert unwrap_hyperlink('=HYPERLINK("https://jamf/p.html?id=7","7")') == "7"
+
+
+def test_writes_typed_parquet(tmp_path):
+    """Test a Parquet export keeps IDs, booleans, dates and categories typed"""
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    rows = [
+        {
+            "ID": f'=HYPERLINK("https://jamf/policies.html?id={i}","{i}")',
+            "Name": f"Policy {i}",
+            "Enabled": i % 2 == 0,
+            "Category": ["Apps", "Security"][i % 2],
+            "Modified": f"2024-01-{i + 1:02d} 09:00:00",
+        }
+        for i in range(6)
+    ]
+    rows.append({"ID": "", "Name": "Late", "Site": "Main"})
+
+    path = tmp_path / "sandbox-policies-export.parquet"
+    writer = write_rows(path, rows, "parquet")
+    assert writer.rows_written == 7
+    assert writer.dropped_columns == []  # Site is in the first row group
+    assert writer.widened_columns == []
+
+    table = pq.read_table(path)
+    assert table.schema.field("ID").type == pa.int64()
+    assert table.schema.field("Enabled").type == pa.bool_()
+    assert table.schema.field("Modified").type == pa.timestamp("us")
+    assert pa.types.is_dictionary(table.schema.field("Category").type)
+    assert table.column("ID").to_pylist() == [0, 1, 2, 3, 4, 5, None]
+    assert table.column("Site").to_pylist()[-1] == "Main"
+
+
+def test_later_row_groups_widen_schema(tmp_path):
+    """Test values that do not fit the inferred type widen it to string"""
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    from lib.exports.parquet_writer import ParquetStreamWriter
+
+    path = tmp_path / "scripts.parquet"
+    with open(path, "wb") as stream:
+        with ParquetStreamWriter(stream, row_group_size=2) as writer:
+            writer.write_rows(
+                [
+                    {"ID": 1, "Name": "a.sh", "Enabled": True},
+                    {"ID": 2, "Name": "b.sh", "Enabled": False},
+                    {"ID": "n/a", "Name": "c.sh", "Enabled": "yes", "Notes": "new"},
+                ]
+            )
+    assert writer.widened_columns == ["ID", "Enabled"]
+    assert writer.dropped_columns == []
+
+    table = pq.read_table(path)
+    assert table.schema.field("ID").type == pa.string()
+    assert table.column("ID").to_pylist() == ["1", "2", "n/a"]
+    assert table.column("Enabled").to_pylist() == ["True", "False", "yes"]
+    assert table.column("Notes").to_pylist() == [None, None, "new"]
+
+
+def test_given_fieldnames_are_kept(tmp_path):
+    """Test columns outside the given fieldnames are left out, like CSV"""
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    path = tmp_path / "computers.parquet"
+    rows = [{"ID": 1, "Name": "mac", "Serial": "C02"}]
+    writer = write_rows(path, rows, "parquet", ["ID", "Name"])
+    assert writer.dropped_columns == ["Serial"]
+    assert pq.read_table(path).column_names == ["ID", "Name"]
+
+
+def test_empty_export_is_valid_parquet(tmp_path):
+    """Test an export without rows still writes a readable file"""
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    path = tmp_path / "empty.parquet"
+    assert write_rows(path, [], "parquet", ["ID", "Name"]).rows_written == 0
+    table = pq.read_table(path)
+    assert table.num_rows == 0
+    assert table.column_names == ["ID", "Name"]
+
+    bare = tmp_path / "bare.parquet"
+    write_rows(bare, [], "parquet")
+    assert pq.read_table(bare).num_columns == 0
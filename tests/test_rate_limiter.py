@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Tests for TokenBucketRateLimiter and throttle handling"""
+
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.core.http.http_client import JamfHttpClient
+from src.core.http.rate_limiter import TokenBucketRateLimiter, parse_retry_after
+from src.core.http.retry import RetryPolicy
+
+
+class _ThrottlingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    throttle_remaining = 0
+
+    def do_GET(self):
+        cls = type(self)
+        if cls.throttle_remaining > 0:
+            cls.throttle_remaining -= 1
+            body = b"slow down"
+            self.send_response(429)
+            self.send_header("Retry-After", "0")
+        else:
+            body = b'{"ok": true}'
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ThrottlingHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_parse_retry_after():
+    """Test Retry-After seconds and HTTP-date forms"""
+    assert parse_retry_after("5") == 5.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert 0 <= parse_retry_after(formatdate(time.time() + 10, usegmt=True)) <= 10
+
+
+def test_burst_then_throttle():
+    """Test requests beyond the burst wait for tokens"""
+    limiter = TokenBucketRateLimiter(requests_per_minute=600, burst_size=3)
+    assert sum(limiter.acquire() for _ in range(3)) == 0
+
+    started = time.monotonic()
+    limiter.acquire()
+    assert time.monotonic() - started >= 0.05
+    assert limiter.get_stats()["requests"] == 4
+
+
+def test_throttled_response_halves_rate():
+    """Test a 429 lowers the adaptive rate and pauses for Retry-After"""
+    limiter = TokenBucketRateLimiter(requests_per_minute=600, burst_size=5)
+    assert limiter.on_throttled(0.1) == 0.1
+    assert limiter.rate == pytest.approx(5.0)
+
+    started = time.monotonic()
+    limiter.acquire()
+    assert time.monotonic() - started >= 0.09
+
+
+def test_client_resends_after_429(server_url):
+    """Test the client honours Retry-After and resends throttled requests"""
+    _ThrottlingHandler.throttle_remaining = 2
+    client = JamfHttpClient(
+        limiter_factory=lambda: TokenBucketRateLimiter(requests_per_minute=6000)
+    )
+
+    result = client.api_request("GET", f"{server_url}/api/v1/computers", "token")
+    assert result == {"ok": True}
+
+    stats = client.get_rate_limit_stats()
+    host_stats = next(iter(stats.values()))
+    assert host_stats["throttled_responses"] == 2
+    assert host_stats["requests"] == 3
+    client.close()
+
+
+def test_throttling_is_retried_in_one_layer(server_url):
+    """Test a persistently throttled request is not also retried by RetryPolicy"""
+    _ThrottlingHandler.throttle_remaining = 100
+    client = JamfHttpClient(
+        limiter_factory=lambda: TokenBucketRateLimiter(requests_per_minute=6000),
+        retry_policy=RetryPolicy(max_retries=3, retry_delay=0.01),
+        max_throttle_retries=2,
+    )
+
+    response = client.send("GET", f"{server_url}/api/v1/computers")
+    assert response.status == 429
+    host_stats = next(iter(client.get_rate_limit_stats().values()))
+    assert host_stats["requests"] == 3  # Not (3 + 1) * (2 + 1)
+    _ThrottlingHandler.throttle_remaining = 0
+    client.close()
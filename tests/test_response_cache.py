@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Tests for ResponseCache and cached GETs"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.core.http.http_client import JamfHttpClient
+from src.core.http.response_cache import (
+    CACHE_STATUS_HEADER,
+    ResponseCache,
+    credential_scope,
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    full_responses = 0
+    not_modified = 0
+
+    def do_GET(self):
+        cls = type(self)
+        if self.path.startswith("/api/"):
+            if self.headers.get("If-None-Match") == '"v1"':
+                cls.not_modified += 1
+                self.send_response(304)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            body = b'{"results": [1, 2, 3]}'
+            self.send_response(200)
+            self.send_header("ETag", '"v1"')
+        else:
+            body = b'{"policies": []}'
+            self.send_response(200)
+        cls.full_responses += 1
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_PUT(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.send_response(201)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    _Handler.full_responses = 0
+    _Handler.not_modified = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_etag_revalidation(server_url, tmp_path):
+    """Test responses with an ETag are revalidated with If-None-Match"""
+    client = JamfHttpClient(response_cache=ResponseCache(str(tmp_path)))
+    url = f"{server_url}/api/v1/policies"
+
+    first = client.send("GET", url)
+    second = client.send("GET", url)
+
+    assert first.body == second.body
+    assert second.header(CACHE_STATUS_HEADER) == "revalidated"
+    assert _Handler.full_responses == 1
+    assert _Handler.not_modified == 1
+    client.close()
+
+
+def test_ttl_without_validators_persists(server_url, tmp_path):
+    """Test opted-in Classic responses are served from disk within the TTL"""
+    url = f"{server_url}/JSSResource/policies"
+    cache = ResponseCache(str(tmp_path), ttl_serving=True)
+    client = JamfHttpClient(response_cache=cache)
+    client.api_request("GET", url, "t")
+    client.close()
+
+    # A new process-equivalent client reads the same cache directory
+    cache = ResponseCache(str(tmp_path), ttl_serving=True)
+    client = JamfHttpClient(response_cache=cache)
+    assert client.api_request("GET", url, "t") == {"policies": []}
+    assert _Handler.full_responses == 1
+
+    # Another account never sees these entries
+    client.api_request("GET", url, "other-token")
+    assert _Handler.full_responses == 2
+
+    expired_cache = ResponseCache(str(tmp_path), list_ttl=0, ttl_serving=True)
+    expired = JamfHttpClient(response_cache=expired_cache)
+    expired.api_request("GET", url, "t")
+    assert _Handler.full_responses == 3
+    client.close()
+    expired.close()
+
+
+def test_entries_outlive_token_refreshes(server_url, tmp_path):
+    """Test entries are scoped to the account, so a new token still hits"""
+    url = f"{server_url}/JSSResource/policies"
+    alice = credential_scope("sandbox", server_url, "alice")
+    cache = ResponseCache(str(tmp_path), ttl_serving=True)
+    client = JamfHttpClient(response_cache=cache)
+    client.api_request("GET", url, "token-1", cache_scope=alice)
+    client.api_request("GET", url, "token-2", cache_scope=alice)
+    assert _Handler.full_responses == 1
+
+    bob = credential_scope("sandbox", server_url, "bob")
+    client.api_request("GET", url, "token-2", cache_scope=bob)
+    assert _Handler.full_responses == 2
+    client.close()
+
+
+def test_revalidates_only_by_default(server_url, tmp_path):
+    """Test responses without validators are neither served nor kept by default"""
+    cache = ResponseCache(str(tmp_path))
+    client = JamfHttpClient(response_cache=cache)
+    for _ in range(2):
+        client.send("GET", f"{server_url}/JSSResource/policies")
+    assert _Handler.full_responses == 2
+    assert cache.get_stats()["entries"] == 0
+    client.close()
+
+
+def test_write_invalidates_collection(server_url, tmp_path):
+    """Test a PUT drops cached responses for its collection"""
+    cache = ResponseCache(str(tmp_path), ttl_serving=True)
+    client = JamfHttpClient(response_cache=cache)
+    client.send("GET", f"{server_url}/JSSResource/policies")
+    client.send("GET", f"{server_url}/JSSResource/policies/id/5")
+    assert cache.get_stats()["entries"] == 2
+
+    client.send("PUT", f"{server_url}/JSSResource/policies/id/5", b"<policy/>")
+    assert cache.get_stats()["entries"] == 0
+    client.close()
+
+
+def test_ttl_for_detail_endpoints():
+    """Test object detail URLs use the detail TTL"""
+    cache = ResponseCache(list_ttl=300, detail_ttl=1800)
+    assert cache.ttl_for("https://x/JSSResource/policies/id/5") == 1800
+    assert cache.ttl_for("https://x/api/v1/computers-inventory-detail/12") == 1800
+    assert cache.ttl_for("https://x/api/v1/policies?page=0") == 300
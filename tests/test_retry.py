@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Tests for RetryPolicy and client retries"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.core.http.http_client import JamfHttpClient
+from src.core.http.retry import RetryPolicy
+
+
+class _FlakyHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    failures_remaining = 0
+    requests = 0
+
+    def _respond(self):
+        cls = type(self)
+        cls.requests += 1
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if cls.failures_remaining > 0:
+            cls.failures_remaining -= 1
+            body = b"bad gateway"
+            self.send_response(502)
+        else:
+            body = b'{"ok": true}'
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _respond
+    do_POST = _respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    _FlakyHandler.requests = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FlakyHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _client():
+    return JamfHttpClient(retry_policy=RetryPolicy(max_retries=3, retry_delay=0.01))
+
+
+def test_delay_grows_exponentially():
+    """Test backoff doubles per attempt within the jitter range"""
+    policy = RetryPolicy(retry_delay=1, max_delay=30)
+    for attempt, ceiling in [(1, 1), (2, 2), (3, 4), (10, 30)]:
+        delay = policy.get_delay(attempt)
+        assert ceiling / 2 <= delay <= ceiling
+    assert policy.get_delay(1, retry_after=5) == 5
+
+
+def test_idempotency():
+    """Test POST is only retried when opted in"""
+    policy = RetryPolicy()
+    assert policy.allows("GET")
+    assert policy.allows("delete")
+    assert not policy.allows("POST")
+    assert policy.allows("POST", retry=True)
+    assert not policy.allows("GET", retry=False)
+    assert not RetryPolicy(max_retries=0).allows("GET")
+
+
+def test_get_retried_until_success(server_url):
+    """Test a transient 502 is retried transparently"""
+    _FlakyHandler.failures_remaining = 2
+    client = _client()
+    assert client.api_request("GET", f"{server_url}/api/v1/policies", "t") == {"ok": True}
+    assert _FlakyHandler.requests == 3
+    client.close()
+
+
+def test_post_not_retried_by_default(server_url):
+    """Test POST fails fast unless retry=True"""
+    _FlakyHandler.failures_remaining = 1
+    client = _client()
+    with pytest.raises(Exception, match="502"):
+        client.api_request("POST", f"{server_url}/api/v1/policies", "t", {"a": 1})
+    assert _FlakyHandler.requests == 1
+
+    _FlakyHandler.failures_remaining = 1
+    result = client.api_request(
+        "POST", f"{server_url}/api/v1/policies", "t", {"a": 1}, retry=True
+    )
+    assert result == {"ok": True}
+    client.close()
+
+
+def test_connection_errors_retried():
+    """Test transport errors give up after max_retries"""
+    client = JamfHttpClient(retry_policy=RetryPolicy(max_retries=2, retry_delay=0.01))
+    calls = []
+
+    def refuse(*args, **kwargs):
+        calls.append(args)
+        raise ConnectionRefusedError("refused")
+
+    client.pool.request = refuse
+    with pytest.raises(Exception, match="refused"):
+        client.api_request("GET", "http://127.0.0.1:9/api", "t")
+    assert len(calls) == 3
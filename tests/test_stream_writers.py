@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Tests for the streaming export writers"""
+
+import csv
+import io
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from lib.exports.stream_writers import (  # noqa: E402
+    CSVStreamWriter,
+    peek_rows,
+    write_rows,
+)
+
+
+def _rows(count, fail_at=None):
+    for i in range(count):
+        if i == fail_at:
+            raise ConnectionError("network dropped")
+        yield {"ID": i, "Name": f"item-{i}", "Enabled": i % 2 == 0}
+
+
+def test_json_and_ndjson_match_buffered_output(tmp_path):
+    """Test streamed JSON matches json.dumps(indent=2) and NDJSON is line-based"""
+    rows = list(_rows(3))
+
+    write_rows(tmp_path / "out.json", iter(rows), "json")
+    assert (tmp_path / "out.json").read_text() == json.dumps(rows, indent=2)
+
+    write_rows(tmp_path / "empty.json", iter([]), "json")
+    assert json.loads((tmp_path / "empty.json").read_text()) == []
+
+    writer = write_rows(tmp_path / "sub" / "out.ndjson", iter(rows), "ndjson")
+    lines = (tmp_path / "sub" / "out.ndjson").read_text().splitlines()
+    assert writer.rows_written == 3
+    assert [json.loads(line) for line in lines] == rows
+
+
+def test_csv_discovers_columns_from_first_rows():
+    """Test the CSV header is the union of sampled columns and stays stable"""
+    stream = io.StringIO()
+    with CSVStreamWriter(stream, sample_size=2) as writer:
+        writer.write({"ID": 1, "Name": "a"})
+        writer.write({"ID": 2, "Name": "b", "Detail": "x"})  # Detail call worked
+        writer.write({"ID": 3, "Late": "y"})  # Header already written
+
+    stream.seek(0)
+    rows = list(csv.DictReader(stream))
+    assert list(rows[0]) == ["ID", "Name", "Detail"]
+    assert rows[2] == {"ID": "3", "Name": "", "Detail": ""}
+    assert writer.dropped_columns == ["Late"]
+
+    stream = io.StringIO()
+    with CSVStreamWriter(stream, fieldnames=["Name"]) as writer:
+        writer.write({"ID": 1, "Name": "a"})
+        assert stream.getvalue() == "Name\r\na\r\n"  # Written immediately
+
+
+@pytest.mark.parametrize("format", ["csv", "json", "ndjson"])
+def test_interrupted_export_keeps_finished_rows(tmp_path, format):
+    """Test rows written before a failure survive in a readable file"""
+    path = tmp_path / f"out.{format}"
+    with pytest.raises(ConnectionError):
+        write_rows(path, _rows(10, fail_at=7), format)
+
+    text = path.read_text()
+    if format == "csv":
+        rows = list(csv.DictReader(io.StringIO(text)))
+    elif format == "json":
+        rows = json.loads(text)
+    else:
+        rows = [json.loads(line) for line in text.splitlines()]
+    assert len(rows) == 7
+
+
+def test_peek_rows_keeps_every_row():
+    """Test peeking at the head of a generator does not consume it"""
+    head, rows = peek_rows(_rows(5), count=2)
+    assert [row["ID"] for row in head] == [0, 1]
+    assert [row["ID"] for row in rows] == [0, 1, 2, 3, 4]
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Tests for TokenProvider"""
+
+import threading
+import time
+
+from src.core.auth.login_types import AuthCredentials, AuthResult, AuthStatus
+from src.core.auth.token_cache import SharedTokenCache
+from src.core.auth.token_provider import TokenProvider, get_expiry_timestamp
+
+
+class _SlowTokenManager:
+    def __init__(self, delay=0.2):
+        self.delay = delay
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def refresh_token(self, credentials):
+        return AuthResult(success=False, status=AuthStatus.INVALID)
+
+    def request_new_token(self, credentials):
+        with self._lock:
+            self.requests += 1
+        time.sleep(self.delay)
+        return AuthResult(
+            success=True,
+            status=AuthStatus.AUTHENTICATED,
+            token="fresh",
+            expires_at=str(int(time.time()) + 3600),
+        )
+
+
+class _Holder:
+    def __init__(self, token, expires_in):
+        self.credentials = AuthCredentials(
+            url="https://jamf",
+            client_id="id",
+            client_secret="secret",
+            token=token,
+            token_expires=str(int(time.time()) + expires_in),
+        )
+
+    def get(self):
+        return self.credentials
+
+    def save(self, credentials, result):
+        self.credentials = AuthCredentials(
+            url=credentials.url,
+            client_id=credentials.client_id,
+            client_secret=credentials.client_secret,
+            token=result.token,
+            token_expires=result.expires_at,
+        )
+
+
+def test_get_expiry_timestamp():
+    """Test Unix and ISO expiry parsing"""
+    assert get_expiry_timestamp("1700000000") == 1700000000.0
+    assert get_expiry_timestamp("2030-01-01T00:00:00+00:00") == 1893456000.0
+    assert get_expiry_timestamp(None) is None
+    assert get_expiry_timestamp("garbage") is None
+
+
+def test_concurrent_refresh_is_single_flight():
+    """Test threads finding an expired token share one refresh"""
+    holder = _Holder("old", expires_in=-10)
+    manager = _SlowTokenManager()
+    provider = TokenProvider(manager, holder.get, holder.save)
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(provider.get_token()))
+        for _ in range(10)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert manager.requests == 1
+    assert all(result.token == "fresh" for result in results)
+
+
+def test_proactive_refresh_does_not_block():
+    """Test a token close to expiry is returned while refreshing in background"""
+    holder = _Holder("old", expires_in=300 + 60)
+    manager = _SlowTokenManager(delay=0.3)
+    provider = TokenProvider(manager, holder.get, holder.save)
+
+    started = time.time()
+    result = provider.get_token()
+    assert result.token == "old"
+    assert time.time() - started < 0.2
+
+    deadline = time.time() + 2
+    while holder.credentials.token != "fresh" and time.time() < deadline:
+        time.sleep(0.05)
+    assert holder.credentials.token == "fresh"
+    assert manager.requests == 1
+
+
+def test_shared_cache_reused_across_processes(tmp_path):
+    """Test a token issued to one process is adopted by another"""
+    first_holder = _Holder("old", expires_in=-10)
+    second_holder = _Holder("old", expires_in=-10)
+    first_manager = _SlowTokenManager(delay=0)
+    second_manager = _SlowTokenManager(delay=0)
+
+    first = TokenProvider(
+        first_manager,
+        first_holder.get,
+        first_holder.save,
+        shared_cache=SharedTokenCache("sandbox", str(tmp_path)),
+    )
+    second = TokenProvider(
+        second_manager,
+        second_holder.get,
+        second_holder.save,
+        shared_cache=SharedTokenCache("sandbox", str(tmp_path)),
+    )
+
+    assert first.get_token().token == "fresh"
+    assert second.get_token().token == "fresh"
+    assert first_manager.requests == 1
+    assert second_manager.requests == 0